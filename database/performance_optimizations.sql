@@ -73,45 +73,214 @@ CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_search_history_analytics
 CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_search_history_term_type 
     ON search_history(search_term, search_type, searched_at);
 
--- Optimize the property_current_view with materialized view for better performance
+-- property_current_view: properties joined to an incrementally maintained
+-- summary of each property's latest tax and sale values.
+--
+-- Triggers on tax_history and sales_history queue the APNs they touch in
+-- property_refresh_queue; refresh_property_latest_values() recomputes the
+-- summary for queued (or explicitly given) APNs only. Property columns are
+-- always read live, so only the latest_* values can lag behind, and the
+-- queue depth / oldest entry give the staleness of the view.
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_matviews WHERE matviewname = 'property_current_view') THEN
+        DROP MATERIALIZED VIEW property_current_view;
+    END IF;
+END $$;
 DROP VIEW IF EXISTS property_current_view;
 
-CREATE MATERIALIZED VIEW property_current_view AS
-SELECT 
+CREATE TABLE IF NOT EXISTS property_latest_values (
+    apn VARCHAR(20) PRIMARY KEY REFERENCES properties(apn) ON DELETE CASCADE,
+    latest_tax_year INTEGER,
+    latest_assessed_value NUMERIC(12,2),
+    latest_tax_amount NUMERIC(10,2),
+    latest_sale_date DATE,
+    latest_sale_price NUMERIC(12,2),
+    refreshed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_property_latest_values_assessed
+    ON property_latest_values(latest_assessed_value)
+    WHERE latest_assessed_value IS NOT NULL;
+
+CREATE TABLE IF NOT EXISTS property_refresh_queue (
+    apn VARCHAR(20) PRIMARY KEY,
+    touched_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_property_refresh_queue_touched
+    ON property_refresh_queue(touched_at);
+
+CREATE TABLE IF NOT EXISTS property_view_refresh_state (
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    last_refresh_at TIMESTAMP,
+    last_refreshed_count INTEGER DEFAULT 0,
+    last_full_rebuild_at TIMESTAMP
+);
+INSERT INTO property_view_refresh_state (id) VALUES (TRUE) ON CONFLICT DO NOTHING;
+
+CREATE OR REPLACE VIEW property_current_view AS
+SELECT
     p.*,
-    t.tax_year as latest_tax_year,
-    t.assessed_value as latest_assessed_value,
-    t.tax_amount as latest_tax_amount,
-    s.sale_date as latest_sale_date,
-    s.sale_price as latest_sale_price
+    lv.latest_tax_year,
+    lv.latest_assessed_value,
+    lv.latest_tax_amount,
+    lv.latest_sale_date,
+    lv.latest_sale_price
 FROM properties p
-LEFT JOIN LATERAL (
-    SELECT tax_year, assessed_value, tax_amount 
-    FROM tax_history 
-    WHERE apn = p.apn 
-    ORDER BY tax_year DESC 
-    LIMIT 1
-) t ON true
-LEFT JOIN LATERAL (
-    SELECT sale_date, sale_price
-    FROM sales_history 
-    WHERE apn = p.apn 
-    ORDER BY sale_date DESC 
-    LIMIT 1
-) s ON true;
-
--- Create indexes on the materialized view
-CREATE UNIQUE INDEX idx_property_current_view_apn ON property_current_view(apn);
-CREATE INDEX idx_property_current_view_owner ON property_current_view USING gin(owner_name gin_trgm_ops);
-CREATE INDEX idx_property_current_view_address ON property_current_view USING gin(property_address gin_trgm_ops);
-CREATE INDEX idx_property_current_view_year ON property_current_view(year_built) WHERE year_built IS NOT NULL;
-CREATE INDEX idx_property_current_view_value ON property_current_view(latest_assessed_value) WHERE latest_assessed_value IS NOT NULL;
-
--- Function to refresh the materialized view
+LEFT JOIN property_latest_values lv ON lv.apn = p.apn;
+
+-- Statement-level triggers: one queue write per statement, so bulk loads stay cheap.
+-- Conflicting queue rows are locked (no-op update) rather than skipped, so a
+-- concurrent refresh cannot drop an APN whose new history is not yet visible.
+CREATE OR REPLACE FUNCTION enqueue_property_refresh()
+RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO property_refresh_queue (apn)
+        SELECT DISTINCT apn FROM new_rows WHERE apn IS NOT NULL
+        ON CONFLICT (apn) DO UPDATE SET touched_at = property_refresh_queue.touched_at;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        INSERT INTO property_refresh_queue (apn)
+        SELECT DISTINCT apn FROM old_rows WHERE apn IS NOT NULL
+        ON CONFLICT (apn) DO UPDATE SET touched_at = property_refresh_queue.touched_at;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_tax_history_refresh_ins ON tax_history;
+DROP TRIGGER IF EXISTS trg_tax_history_refresh_upd ON tax_history;
+DROP TRIGGER IF EXISTS trg_tax_history_refresh_del ON tax_history;
+CREATE TRIGGER trg_tax_history_refresh_ins AFTER INSERT ON tax_history
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION enqueue_property_refresh();
+CREATE TRIGGER trg_tax_history_refresh_upd AFTER UPDATE ON tax_history
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION enqueue_property_refresh();
+CREATE TRIGGER trg_tax_history_refresh_del AFTER DELETE ON tax_history
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION enqueue_property_refresh();
+
+DROP TRIGGER IF EXISTS trg_sales_history_refresh_ins ON sales_history;
+DROP TRIGGER IF EXISTS trg_sales_history_refresh_upd ON sales_history;
+DROP TRIGGER IF EXISTS trg_sales_history_refresh_del ON sales_history;
+CREATE TRIGGER trg_sales_history_refresh_ins AFTER INSERT ON sales_history
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION enqueue_property_refresh();
+CREATE TRIGGER trg_sales_history_refresh_upd AFTER UPDATE ON sales_history
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION enqueue_property_refresh();
+CREATE TRIGGER trg_sales_history_refresh_del AFTER DELETE ON sales_history
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION enqueue_property_refresh();
+
+-- Recompute latest values for the given APNs, or for queued APNs when none are
+-- given (oldest first, at most max_apns). Returns the number of APNs refreshed.
+CREATE OR REPLACE FUNCTION refresh_property_latest_values(
+    target_apns VARCHAR[] DEFAULT NULL,
+    max_apns INTEGER DEFAULT NULL
+)
+RETURNS INTEGER AS $$
+DECLARE
+    refreshed_count INTEGER;
+BEGIN
+    CREATE TEMP TABLE IF NOT EXISTS _refresh_targets (apn VARCHAR(20) PRIMARY KEY)
+        ON COMMIT DROP;
+    TRUNCATE _refresh_targets;
+
+    IF target_apns IS NULL THEN
+        WITH claimed AS (
+            DELETE FROM property_refresh_queue q
+            WHERE q.apn IN (
+                SELECT apn FROM property_refresh_queue
+                ORDER BY touched_at
+                LIMIT max_apns
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING q.apn
+        )
+        INSERT INTO _refresh_targets SELECT apn FROM claimed;
+    ELSE
+        INSERT INTO _refresh_targets
+        SELECT DISTINCT a FROM unnest(target_apns) AS a WHERE a IS NOT NULL;
+        DELETE FROM property_refresh_queue WHERE apn = ANY(target_apns);
+    END IF;
+
+    -- Properties with no history left lose their summary row
+    DELETE FROM property_latest_values lv
+    USING _refresh_targets tg
+    WHERE lv.apn = tg.apn
+      AND NOT EXISTS (SELECT 1 FROM tax_history WHERE apn = tg.apn)
+      AND NOT EXISTS (SELECT 1 FROM sales_history WHERE apn = tg.apn);
+
+    INSERT INTO property_latest_values (
+        apn, latest_tax_year, latest_assessed_value, latest_tax_amount,
+        latest_sale_date, latest_sale_price, refreshed_at
+    )
+    SELECT tg.apn, t.tax_year, t.assessed_value, t.tax_amount,
+           s.sale_date, s.sale_price, CURRENT_TIMESTAMP
+    FROM _refresh_targets tg
+    JOIN properties p ON p.apn = tg.apn
+    LEFT JOIN LATERAL (
+        SELECT tax_year, assessed_value, tax_amount
+        FROM tax_history
+        WHERE apn = tg.apn
+        ORDER BY tax_year DESC
+        LIMIT 1
+    ) t ON true
+    LEFT JOIN LATERAL (
+        SELECT sale_date, sale_price
+        FROM sales_history
+        WHERE apn = tg.apn
+        ORDER BY sale_date DESC
+        LIMIT 1
+    ) s ON true
+    WHERE t.tax_year IS NOT NULL OR s.sale_date IS NOT NULL
+    ON CONFLICT (apn) DO UPDATE SET
+        latest_tax_year = EXCLUDED.latest_tax_year,
+        latest_assessed_value = EXCLUDED.latest_assessed_value,
+        latest_tax_amount = EXCLUDED.latest_tax_amount,
+        latest_sale_date = EXCLUDED.latest_sale_date,
+        latest_sale_price = EXCLUDED.latest_sale_price,
+        refreshed_at = EXCLUDED.refreshed_at;
+
+    SELECT COUNT(*) INTO refreshed_count FROM _refresh_targets;
+
+    UPDATE property_view_refresh_state
+    SET last_refresh_at = CURRENT_TIMESTAMP,
+        last_refreshed_count = refreshed_count;
+
+    RETURN refreshed_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Full rebuild, e.g. after restoring tables or loading data with triggers disabled
+CREATE OR REPLACE FUNCTION rebuild_property_latest_values()
+RETURNS INTEGER AS $$
+DECLARE
+    refreshed_count INTEGER;
+BEGIN
+    INSERT INTO property_refresh_queue (apn)
+    SELECT apn FROM tax_history UNION SELECT apn FROM sales_history
+    ON CONFLICT (apn) DO NOTHING;
+
+    DELETE FROM property_latest_values lv
+    WHERE NOT EXISTS (SELECT 1 FROM property_refresh_queue q WHERE q.apn = lv.apn);
+
+    refreshed_count := refresh_property_latest_values();
+
+    UPDATE property_view_refresh_state SET last_full_rebuild_at = CURRENT_TIMESTAMP;
+    RETURN refreshed_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Kept for existing callers: now refreshes only the APNs touched since the last refresh
 CREATE OR REPLACE FUNCTION refresh_property_current_view()
 RETURNS void AS $$
 BEGIN
-    REFRESH MATERIALIZED VIEW CONCURRENTLY property_current_view;
+    PERFORM refresh_property_latest_values();
 END;
 $$ LANGUAGE plpgsql;
 
@@ -125,10 +294,10 @@ BEGIN
     ANALYZE sales_history;
     ANALYZE search_history;
     
-    -- Refresh materialized view
+    -- Refresh latest values for APNs touched since the last refresh
     PERFORM refresh_property_current_view();
     
-    RAISE NOTICE 'Database statistics updated and materialized view refreshed';
+    RAISE NOTICE 'Database statistics updated and property_current_view refreshed';
 END;
 $$ LANGUAGE plpgsql;
 
@@ -249,8 +418,8 @@ GRANT ALL ON ALL TABLES IN SCHEMA public TO property_user;
 GRANT ALL ON ALL SEQUENCES IN SCHEMA public TO property_user;
 GRANT EXECUTE ON ALL FUNCTIONS IN SCHEMA public TO property_user;
 
--- Initial refresh of materialized view
-REFRESH MATERIALIZED VIEW property_current_view;
+-- Initial build of the latest-values summary behind property_current_view
+SELECT rebuild_property_latest_values();
 
 -- Update statistics
 SELECT update_search_statistics();
@@ -259,7 +428,7 @@ SELECT update_search_statistics();
 DO $$
 BEGIN
     RAISE NOTICE 'Performance optimizations completed successfully!';
-    RAISE NOTICE 'Indexes created, materialized view refreshed, and statistics updated.';
+    RAISE NOTICE 'Indexes created, property_current_view summary built, and statistics updated.';
     RAISE NOTICE 'Run "SELECT * FROM search_performance_summary;" to monitor search performance.';
 END;
 $$;
\ No newline at end of file
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Persistent API Response Cache Tool
+Warm, inspect and purge the on-disk API response cache shared by the GUI and
+batch scripts.
+
+Usage:
+    python scripts/api_cache.py inspect
+    python scripts/api_cache.py warm 10215009 10215010
+    python scripts/api_cache.py warm --file apns.txt --workers 4
+    python scripts/api_cache.py purge --expired
+    python scripts/api_cache.py purge --expired --max-entries 100000
+    python scripts/api_cache.py purge --category /valuations/
+    python scripts/api_cache.py purge --all
+"""
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.api_response_cache import SQLiteResponseCache
+
+DEFAULT_CACHE_PATH = PROJECT_ROOT / "cache" / "api_response_cache.sqlite3"
+
+
+def load_apns(args) -> list:
+    """Collect APNs from the command line and an optional file"""
+    apns = list(args.apns)
+    if args.file:
+        with open(args.file, "r") as f:
+            apns.extend(line.strip() for line in f if line.strip())
+    return list(dict.fromkeys(apns))
+
+
+def warm_cache(args) -> int:
+    """Fetch search and parcel endpoints for each APN into the persistent cache"""
+    from src.api_client_unified import UnifiedMaricopaAPIClient
+
+    apns = load_apns(args)
+    if not apns:
+        print("No APNs given - pass APNs as arguments or with --file")
+        return 1
+
+    client = UnifiedMaricopaAPIClient(persistent_cache_path=str(args.cache))
+
+    def warm_apn(apn):
+        client.search_by_apn(apn)
+        return client._get_detailed_property_data_threaded(apn)
+
+    start_time = time.time()
+    warmed = 0
+    try:
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            futures = {executor.submit(warm_apn, apn): apn for apn in apns}
+            for i, future in enumerate(as_completed(futures), 1):
+                apn = futures[future]
+                try:
+                    detailed = future.result()
+                    warmed += 1
+                    print(f"[{i}/{len(apns)}] {apn}: {len(detailed)} endpoints cached")
+                except Exception as e:
+                    print(f"[{i}/{len(apns)}] {apn}: failed - {e}")
+    finally:
+        stats = client.get_performance_stats()
+        client.close()
+
+    elapsed = time.time() - start_time
+    print(f"\nWarmed {warmed}/{len(apns)} APNs in {elapsed:.1f}s")
+    print(json.dumps(stats.get("response_cache", {}), indent=2, default=str))
+    return 0
+
+
+def inspect_cache(args) -> int:
+    """Print a per-endpoint summary of the cache contents"""
+    cache = SQLiteResponseCache(args.cache, sweep_interval=None)
+    try:
+        summary = cache.inspect()
+    finally:
+        cache.close()
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0
+
+    print(f"Cache file: {summary['path']} ({summary['file_bytes'] / 1024:.1f} KB)")
+    print(
+        f"Entries: {summary['entries']}, "
+        f"compressed payloads: {summary['compressed_bytes'] / 1024:.1f} KB"
+    )
+    print()
+    print(f"{'Endpoint':<25}{'Entries':>10}{'Expired':>10}{'KB':>12}{'Oldest (h)':>12}")
+    for category, info in summary["categories"].items():
+        oldest = info["oldest_age_seconds"]
+        print(
+            f"{category:<25}{info['entries']:>10}{info['expired']:>10}"
+            f"{info['compressed_bytes'] / 1024:>12.1f}"
+            f"{(oldest / 3600 if oldest is not None else 0):>12.1f}"
+        )
+    return 0
+
+
+def purge_cache(args) -> int:
+    """Remove expired entries, one endpoint category, or everything"""
+    if not (args.expired or args.category or args.all):
+        print("Nothing to purge - pass --expired, --category or --all")
+        return 1
+
+    cache = SQLiteResponseCache(
+        args.cache, max_entries=args.max_entries, sweep_interval=None
+    )
+    try:
+        if args.all:
+            removed = cache.clear()
+        elif args.expired and not args.category:
+            # Expired entries, then the oldest beyond --max-entries
+            removed = cache.purge_expired()
+        else:
+            removed = cache.purge(category=args.category, expired_only=args.expired)
+    finally:
+        cache.close()
+
+    print(f"Removed {removed} cache entries")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the persistent API response cache")
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=DEFAULT_CACHE_PATH,
+        help=f"Cache database file (default: {DEFAULT_CACHE_PATH})",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    warm_parser = subparsers.add_parser("warm", help="Pre-fetch APNs into the cache")
+    warm_parser.add_argument("apns", nargs="*", help="APNs to warm")
+    warm_parser.add_argument("--file", help="File with one APN per line")
+    warm_parser.add_argument("--workers", type=int, default=4)
+    warm_parser.set_defaults(func=warm_cache)
+
+    inspect_parser = subparsers.add_parser("inspect", help="Summarize cache contents")
+    inspect_parser.add_argument("--json", action="store_true", help="Print JSON")
+    inspect_parser.set_defaults(func=inspect_cache)
+
+    purge_parser = subparsers.add_parser("purge", help="Remove cache entries")
+    purge_parser.add_argument("--expired", action="store_true", help="Only expired entries")
+    purge_parser.add_argument("--category", help="Endpoint pattern, e.g. /valuations/")
+    purge_parser.add_argument("--all", action="store_true", help="Remove everything")
+    purge_parser.add_argument(
+        "--max-entries",
+        type=int,
+        help="With --expired, also trim to this many entries (oldest first)",
+    )
+    purge_parser.set_defaults(func=purge_cache)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
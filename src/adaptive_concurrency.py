@@ -0,0 +1,242 @@
+"""
+Adaptive Concurrency
+AIMD limiter that tunes how many requests a batch job keeps in flight from
+observed latency, error rate and rate limiting, instead of a fixed setting
+"""
+import logging
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_MARKERS = ("429", "rate limit", "too many requests")
+
+
+def is_rate_limit_error(error: Optional[BaseException]) -> bool:
+    """Whether an exception looks like an HTTP 429 / rate limit response"""
+    if error is None:
+        return False
+    text = str(error).lower()
+    return any(marker in text for marker in RATE_LIMIT_MARKERS)
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class AdaptiveConcurrencyLimiter:
+    """Additive-increase / multiplicative-decrease limit on in-flight requests
+
+    Samples are evaluated in windows of about one limit's worth of requests.
+    A window is congested when it saw a rate limit (its own 429s or new ones
+    on the shared AdaptiveRateLimiter), when its error rate is above
+    error_threshold, or when p50/p99 latency rose past the tolerances
+    relative to the baseline (lowest recent p50). Congestion multiplies the
+    limit by backoff; a clean window in which the limit was actually reached
+    raises it by one. Until the first congestion the limit doubles instead
+    (slow start), so the baseline is measured at low concurrency and the
+    limit still reaches the server's capacity quickly.
+
+    Congestion the rate limiter has not already reacted to (latency, errors
+    or 429s it never saw) also multiplies its request rate by backoff, so
+    fewer requests in flight are not simply replaced by more requests per
+    second.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 2,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        slow_start: bool = True,
+        backoff: float = 0.7,
+        latency_tolerance: float = 2.0,
+        tail_tolerance: float = 5.0,
+        error_threshold: float = 0.1,
+        min_window: int = 5,
+        rate_limiter=None,
+        host: Optional[str] = None,
+    ):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self._limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.tail_tolerance = tail_tolerance
+        self.error_threshold = error_threshold
+        self.min_window = min_window
+        self.rate_limiter = rate_limiter
+        self.host = host
+        self.slow_start = slow_start
+
+        self._condition = threading.Condition()
+        self.in_flight = 0
+        self._saturated = False
+
+        # Current window
+        self._latencies: List[float] = []
+        self._errors = 0
+        self._rate_limited = 0
+
+        # Lowest recent window p50, drifting up slowly so a server that got
+        # permanently slower does not pin the limit at the floor
+        self.baseline_latency: Optional[float] = None
+        self._seen_rate_limits = 0
+
+        self.increases = 0
+        self.decreases = 0
+        self.last_p50 = 0.0
+        self.last_p99 = 0.0
+        self.last_error_rate = 0.0
+        self.history = deque(maxlen=100)  # (time, limit) after each window
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def try_acquire(self) -> bool:
+        """Take an in-flight slot if one is free"""
+        with self._condition:
+            if self.in_flight >= self.limit:
+                self._saturated = True
+                return False
+            self.in_flight += 1
+            if self.in_flight >= self.limit:
+                self._saturated = True
+            return True
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Wait up to timeout for an in-flight slot"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self.in_flight >= self.limit:
+                self._saturated = True
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            self.in_flight += 1
+            if self.in_flight >= self.limit:
+                self._saturated = True
+            return True
+
+    def release(self):
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify()
+
+    def record(self, latency: float, success: bool = True, rate_limited: bool = False):
+        """Record one request attempt and adjust the limit once a window fills"""
+        with self._condition:
+            self._latencies.append(latency)
+            if not success:
+                self._errors += 1
+            if rate_limited:
+                self._rate_limited += 1
+            if len(self._latencies) >= max(self.limit, self.min_window):
+                self._adjust()
+
+    def _external_rate_limits(self) -> int:
+        """New rate limit events on the shared AdaptiveRateLimiter"""
+        if self.rate_limiter is None:
+            return 0
+        try:
+            stats = self.rate_limiter.get_stats()
+            host_stats = stats.get("hosts", {}).get(self.host) if self.host else None
+            stats = host_stats or stats
+        except Exception as e:
+            logger.debug(f"Could not read rate limiter stats: {e}")
+            return 0
+
+        # The rate limiter resets its counters every adjustment period
+        count = stats.get("rate_limit_count", 0)
+        new = count - self._seen_rate_limits
+        if new < 0:
+            new = count
+        self._seen_rate_limits = count
+        if stats.get("blocked_for_seconds", 0) > 0:
+            new = max(new, 1)
+        return new
+
+    def _slow_down_rate_limiter(self):
+        """Apply the multiplicative decrease to the shared request rate"""
+        if self.rate_limiter is None:
+            return
+        try:
+            self.rate_limiter.decrease_rate(self.backoff, host=self.host)
+        except Exception as e:
+            logger.debug(f"Could not slow down rate limiter: {e}")
+
+    def _adjust(self):
+        """Evaluate the finished window; caller holds the lock"""
+        ordered = sorted(self._latencies)
+        p50 = percentile(ordered, 0.5)
+        p99 = percentile(ordered, 0.99)
+        error_rate = self._errors / len(ordered)
+        external_rate_limits = self._external_rate_limits()
+        rate_limited = self._rate_limited + external_rate_limits
+
+        if self.baseline_latency is None or p50 < self.baseline_latency:
+            self.baseline_latency = p50
+        else:
+            self.baseline_latency += (p50 - self.baseline_latency) * 0.05
+        baseline = max(self.baseline_latency, 1e-6)
+
+        previous = self.limit
+        if (
+            rate_limited
+            or error_rate > self.error_threshold
+            or p50 > baseline * self.latency_tolerance
+            or p99 > baseline * self.tail_tolerance
+        ):
+            self.slow_start = False
+            self._limit = max(
+                float(self.min_limit), math.floor(self._limit * self.backoff)
+            )
+            # The rate limiter already slowed down for rate limits it recorded
+            if not external_rate_limits:
+                self._slow_down_rate_limiter()
+        elif self._saturated:
+            step = self._limit if self.slow_start else 1
+            self._limit = min(float(self.max_limit), self._limit + step)
+
+        if self.limit > previous:
+            self.increases += 1
+        elif self.limit < previous:
+            self.decreases += 1
+        if self.limit != previous:
+            logger.debug(
+                f"Concurrency limit {previous} -> {self.limit} "
+                f"(p50 {p50 * 1000:.0f}ms, p99 {p99 * 1000:.0f}ms, "
+                f"errors {error_rate:.0%}, rate limited {rate_limited})"
+            )
+            # Wake waiters if the limit went up
+            self._condition.notify_all()
+
+        self.last_p50, self.last_p99, self.last_error_rate = p50, p99, error_rate
+        self.history.append((time.time(), self.limit))
+        self._latencies = []
+        self._errors = 0
+        self._rate_limited = 0
+        self._saturated = self.in_flight >= self.limit
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                "limit": self.limit,
+                "in_flight": self.in_flight,
+                "min_limit": self.min_limit,
+                "max_limit": self.max_limit,
+                "slow_start": self.slow_start,
+                "increases": self.increases,
+                "decreases": self.decreases,
+                "p50_ms": self.last_p50 * 1000,
+                "p99_ms": self.last_p99 * 1000,
+                "baseline_ms": (self.baseline_latency or 0.0) * 1000,
+                "error_rate": self.last_error_rate,
+            }
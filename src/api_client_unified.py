@@ -10,23 +10,50 @@ Consolidated from 8 variants with best features from each:
 - Connection pool management
 """
 import asyncio
+import hashlib
 import json
 import logging
-import queue
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import CancelledError
+from concurrent.futures import Future as ConcurrentFuture
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures import as_completed
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
 from functools import lru_cache
 from threading import Lock, RLock, Semaphore
-from typing import Any, Dict, List, Optional, Tuple
-from urllib.parse import urljoin
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from urllib.parse import urljoin, urlparse
 
 import aiohttp
 import requests
 
+from .api_response_cache import (
+    LRUResponseCache,
+    ResponseCacheBackend,
+    SQLiteResponseCache,
+    TieredResponseCache,
+)
 from .logging_config import get_api_logger
+from .work_scheduler import (
+    Resource,
+    WorkScheduler,
+    get_work_scheduler,
+    priority_from_level,
+)
 
 logger = logging.getLogger(__name__)
 api_logger = get_api_logger(__name__)
@@ -73,116 +100,275 @@ class BatchAPIRequest:
         )
 
 
+# Per-parcel detail endpoints, fetched together for detailed property data
+DETAIL_ENDPOINTS = {
+    "valuations": "/parcel/{apn}/valuations/",
+    "residential_details": "/parcel/{apn}/residential-details/",
+    "improvements": "/parcel/{apn}/improvements/",
+    "sketches": "/parcel/{apn}/sketches/",
+    "mapids": "/parcel/{apn}/mapids/",
+}
+
+# Hosts with their own rate limit buckets
+ASSESSOR_HOST = "mcassessor.maricopa.gov"
+TREASURER_HOST = "treasurer.maricopa.gov"
+RECORDER_HOST = "recorder.maricopa.gov"
+
+# Initial request rates (req/s) per host; the scraped sites are slower and
+# more sensitive than the JSON API
+DEFAULT_HOST_RATES = {
+    ASSESSOR_HOST: 2.0,
+    TREASURER_HOST: 1.0,
+    RECORDER_HOST: 1.0,
+}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitTimeout(Exception):
+    """No rate limit token became available within the request timeout"""
+
+
+class TokenBucket:
+    """Token bucket state for a single host"""
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.time()
+        self.blocked_until = 0.0  # Set from Retry-After on 429
+
+        # Adaptive parameters
+        self.success_count = 0
+        self.error_count = 0
+        self.rate_limit_count = 0
+        self.last_rate_adjustment = time.time()
+
+        # Lifetime counters
+        self.acquired = 0
+        self.timeouts = 0
+        self.total_wait_time = 0.0
+    def refill(self, now: float):
+        time_passed = now - self.last_refill
+        self.tokens = min(self.capacity, self.tokens + time_passed * self.rate)
+        self.last_refill = now
+
+
 class AdaptiveRateLimiter:
-    """Intelligent rate limiter that adapts based on server responses"""
+    """Intelligent rate limiter that adapts based on server responses
+
+    Keeps a token bucket per host. acquire() and acquire_async() reserve a
+    token and sleep exactly until it is due (or until a Retry-After window
+    has passed), instead of polling. The timeout bounds the wait for a token
+    only; a Retry-After window is always waited out, so a long 429 pause
+    delays requests instead of failing them.
+    """
     def __init__(
         self,
         initial_rate: float = 2.0,
         min_rate: float = 0.5,
         max_rate: float = 5.0,
         burst_capacity: int = 10,
+        host_rates: Optional[Dict[str, float]] = None,
+        default_host: str = ASSESSOR_HOST,
     ):
 
-        self.current_rate = initial_rate
+        self.initial_rate = initial_rate
         self.min_rate = min_rate
         self.max_rate = max_rate
         self.burst_capacity = burst_capacity
+        self.default_host = default_host
+        self.host_rates = dict(DEFAULT_HOST_RATES if host_rates is None else host_rates)
+        self.host_rates[default_host] = initial_rate
 
-        self.tokens = burst_capacity
-        self.last_refill = time.time()
+        self.buckets: Dict[str, TokenBucket] = {}
         self.lock = Lock()
 
-        # Adaptive parameters
-        self.success_count = 0
-        self.error_count = 0
-        self.rate_limit_count = 0
-        self.last_rate_adjustment = time.time()
-
         logger.info(
             f"Adaptive rate limiter initialized - "
             f"Initial rate: {initial_rate} req/s, "
             f"Burst capacity: {burst_capacity}"
         )
-    def acquire(self, timeout: float = 10.0) -> bool:
-        """Acquire token with adaptive rate limiting"""
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            with self.lock:
-                now = time.time()
+    def _bucket(self, host: Optional[str]) -> TokenBucket:
+        """Get (or create) the bucket for a host; caller holds the lock"""
+        host = host or self.default_host
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            rate = self.host_rates.get(host, self.initial_rate)
+            bucket = TokenBucket(rate, self.burst_capacity)
+            self.buckets[host] = bucket
+        return bucket
+    def _reserve(self, host: Optional[str], timeout: float) -> Optional[float]:
+        """Reserve a token and return how long to wait for it, or None if the
+        wait for a token would exceed the timeout (nothing is reserved in that
+        case). Time spent in a Retry-After window does not count."""
+        with self.lock:
+            bucket = self._bucket(host)
+            now = time.time()
+            bucket.refill(now)
 
-                # Refill tokens
-                time_passed = now - self.last_refill
-                tokens_to_add = time_passed * self.current_rate
-                self.tokens = min(self.burst_capacity, self.tokens + tokens_to_add)
-                self.last_refill = now
+            # Tokens may go negative: each waiter reserves the next slot
+            token_wait = max(0.0, (1.0 - bucket.tokens) / bucket.rate)
+            blocked_wait = max(0.0, bucket.blocked_until - now)
+            wait_time = max(token_wait, blocked_wait)
 
-                if self.tokens >= 1.0:
-                    self.tokens -= 1.0
-                    return True
+            if wait_time - blocked_wait > timeout:
+                bucket.timeouts += 1
+                return None
 
-            time.sleep(0.1)  # Short pause before retry
+            bucket.tokens -= 1.0
+            bucket.acquired += 1
+            bucket.total_wait_time += wait_time
+            return wait_time
+    def _refund(self, host: Optional[str], wait_time: float):
+        """Return a reserved token that was never used"""
+        with self.lock:
+            bucket = self._bucket(host)
+            bucket.tokens = min(bucket.capacity, bucket.tokens + 1.0)
+            bucket.acquired -= 1
+            bucket.total_wait_time -= wait_time
+    def acquire(self, timeout: float = 10.0, host: Optional[str] = None) -> bool:
+        """Acquire token with adaptive rate limiting"""
+        wait_time = self._reserve(host, timeout)
+        if wait_time is None:
+            return False
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return True
 
-        return False
-    def record_success(self):
+    async def acquire_async(
+        self, timeout: float = 10.0, host: Optional[str] = None
+    ) -> bool:
+        """Acquire token without blocking the event loop"""
+        wait_time = self._reserve(host, timeout)
+        if wait_time is None:
+            return False
+        if wait_time > 0:
+            try:
+                await asyncio.sleep(wait_time)
+            except asyncio.CancelledError:
+                self._refund(host, wait_time)
+                raise
+        return True
+    def record_success(self, host: Optional[str] = None):
         """Record successful request for rate adaptation"""
         with self.lock:
-            self.success_count += 1
-            self._maybe_adjust_rate()
-    def record_error(self):
+            bucket = self._bucket(host)
+            bucket.success_count += 1
+            self._maybe_adjust_rate(bucket)
+    def record_error(self, host: Optional[str] = None):
         """Record failed request for rate adaptation"""
         with self.lock:
-            self.error_count += 1
-            self._maybe_adjust_rate()
-    def record_rate_limit(self):
-        """Record rate limit hit - decrease rate immediately"""
+            bucket = self._bucket(host)
+            bucket.error_count += 1
+            self._maybe_adjust_rate(bucket)
+    def record_rate_limit(
+        self, host: Optional[str] = None, retry_after: Optional[float] = None
+    ):
+        """Record rate limit hit - decrease rate immediately and honour Retry-After"""
         with self.lock:
-            self.rate_limit_count += 1
-            self._decrease_rate()
-    def _maybe_adjust_rate(self):
+            bucket = self._bucket(host)
+            bucket.rate_limit_count += 1
+            self._decrease_rate(bucket)
+            if retry_after:
+                bucket.blocked_until = max(
+                    bucket.blocked_until, time.time() + retry_after
+                )
+                logger.debug(
+                    f"Rate limited by {host or self.default_host}, pausing {retry_after:.1f}s"
+                )
+    def _maybe_adjust_rate(self, bucket: TokenBucket):
         """Adjust rate based on success/error ratio"""
         now = time.time()
 
         # Only adjust every 30 seconds
-        if now - self.last_rate_adjustment < 30:
+        if now - bucket.last_rate_adjustment < 30:
             return
 
-        total_requests = self.success_count + self.error_count
+        total_requests = bucket.success_count + bucket.error_count
         if total_requests < 10:  # Need sufficient data
             return
 
-        success_rate = self.success_count / total_requests
+        success_rate = bucket.success_count / total_requests
 
-        if success_rate > 0.95 and self.rate_limit_count == 0:
+        if success_rate > 0.95 and bucket.rate_limit_count == 0:
             # High success rate, try to increase rate
-            self.current_rate = min(self.max_rate, self.current_rate * 1.1)
-            logger.debug(f"Increased rate to {self.current_rate:.2f} req/s")
-        elif success_rate < 0.85 or self.rate_limit_count > 0:
+            bucket.refill(now)
+            bucket.rate = min(self.max_rate, bucket.rate * 1.1)
+            logger.debug(f"Increased rate to {bucket.rate:.2f} req/s")
+        elif success_rate < 0.85 or bucket.rate_limit_count > 0:
             # Low success rate or rate limits, decrease rate
-            self._decrease_rate()
+            self._decrease_rate(bucket)
 
         # Reset counters
-        self.success_count = 0
-        self.error_count = 0
-        self.rate_limit_count = 0
-        self.last_rate_adjustment = now
-    def _decrease_rate(self):
+        bucket.success_count = 0
+        bucket.error_count = 0
+        bucket.rate_limit_count = 0
+        bucket.last_rate_adjustment = now
+    def decrease_rate(self, factor: float = 0.8, host: Optional[str] = None):
+        """Multiply a host's rate by factor, e.g. when callers detect overload"""
+        with self.lock:
+            self._decrease_rate(self._bucket(host), factor)
+    def _decrease_rate(self, bucket: TokenBucket, factor: float = 0.8):
         """Decrease the current rate"""
-        self.current_rate = max(self.min_rate, self.current_rate * 0.8)
-        logger.debug(f"Decreased rate to {self.current_rate:.2f} req/s")
+        bucket.refill(time.time())
+        bucket.rate = max(self.min_rate, bucket.rate * factor)
+        logger.debug(f"Decreased rate to {bucket.rate:.2f} req/s")
+    @property
+    def current_rate(self) -> float:
+        """Current rate of the default host bucket"""
+        with self.lock:
+            return self._bucket(None).rate
+    @property
+    def tokens(self) -> float:
+        """Available tokens in the default host bucket"""
+        with self.lock:
+            bucket = self._bucket(None)
+            bucket.refill(time.time())
+            return bucket.tokens
+    def _bucket_stats(self, bucket: TokenBucket, now: float) -> Dict[str, Any]:
+        bucket.refill(now)
+        return {
+            "current_rate": bucket.rate,
+            "current_tokens": bucket.tokens,
+            "burst_capacity": bucket.capacity,
+            "blocked_for_seconds": max(0.0, bucket.blocked_until - now),
+            "success_count": bucket.success_count,
+            "error_count": bucket.error_count,
+            "rate_limit_count": bucket.rate_limit_count,
+            "acquired": bucket.acquired,
+            "timeouts": bucket.timeouts,
+            "average_wait_time": bucket.total_wait_time / max(bucket.acquired, 1),
+        }
     def get_stats(self) -> Dict[str, Any]:
         """Get current rate limiter statistics"""
         with self.lock:
-            return {
-                "current_rate": self.current_rate,
-                "min_rate": self.min_rate,
-                "max_rate": self.max_rate,
-                "current_tokens": self.tokens,
-                "burst_capacity": self.burst_capacity,
-                "success_count": self.success_count,
-                "error_count": self.error_count,
-                "rate_limit_count": self.rate_limit_count,
-            }
+            now = time.time()
+            stats = self._bucket_stats(self._bucket(None), now)
+            stats.update(
+                {
+                    "min_rate": self.min_rate,
+                    "max_rate": self.max_rate,
+                    "hosts": {
+                        host: self._bucket_stats(bucket, now)
+                        for host, bucket in self.buckets.items()
+                    },
+                }
+            )
+            return stats
 
 
 class ConnectionPoolManager:
@@ -203,6 +389,12 @@ class ConnectionPoolManager:
         self.session = None
         self.lock = Lock()
 
+        # Keep-alive counters, fed by aiohttp tracing
+        self.sessions_created = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.requests_started = 0
+
         logger.info(
             f"Connection pool manager initialized - "
             f"Max connections: {max_connections}, "
@@ -226,17 +418,49 @@ class ConnectionPoolManager:
             self._ensure_connector()  # Ensure connector is initialized
             timeout = aiohttp.ClientTimeout(total=self.timeout)
 
-            headers = {
-                "Accept": "application/json",
-                "User-Agent": None,  # API requires null user-agent
-            }
+            headers = {"Accept": "application/json"}
             if token:
                 headers["AUTHORIZATION"] = token
 
+            # API requires null user-agent; aiohttp rejects None header values,
+            # so the default header is suppressed instead
             self.session = aiohttp.ClientSession(
-                connector=self.connector, timeout=timeout, headers=headers
+                connector=self.connector,
+                timeout=timeout,
+                headers=headers,
+                skip_auto_headers=["User-Agent"],
+                trace_configs=[self._trace_config()],
             )
+            self.sessions_created += 1
         return self.session
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        """Count new versus reused connections for the pool stats"""
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, context, params):
+            self.requests_started += 1
+
+        async def on_connection_create_end(session, context, params):
+            self.connections_created += 1
+
+        async def on_connection_reuseconn(session, context, params):
+            self.connections_reused += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+    def get_stats(self) -> Dict[str, Any]:
+        """Connection pool usage statistics"""
+        connections = self.connections_created + self.connections_reused
+        return {
+            "sessions_created": self.sessions_created,
+            "requests_started": self.requests_started,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "reuse_rate_percent": (self.connections_reused / max(connections, 1))
+            * 100,
+        }
 
     async def close(self):
         """Close connection pool"""
@@ -246,6 +470,260 @@ class ConnectionPoolManager:
             await self.connector.close()
 
 
+class EventLoopThread:
+    """Long-lived asyncio event loop running in a daemon thread
+
+    Lets synchronous callers run coroutines on one persistent loop, so
+    loop-bound resources such as the aiohttp session and connector are reused
+    instead of being rebuilt by asyncio.run() on every call.
+    """
+    def __init__(self, name: str = "MaricopaAPILoop"):
+        self.name = name
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._lock = Lock()
+    def start(self) -> asyncio.AbstractEventLoop:
+        """Start the loop thread if it is not already running"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self.loop = asyncio.new_event_loop()
+                self._ready.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name=self.name, daemon=True
+                )
+                self._thread.start()
+                self._ready.wait()
+            return self.loop
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._ready.set)
+        self.loop.run_forever()
+
+        # Cancel anything still pending before closing the loop
+        pending = asyncio.all_tasks(self.loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            self.loop.run_until_complete(
+                asyncio.gather(*pending, return_exceptions=True)
+            )
+        self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+        self.loop.close()
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    def in_loop_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+    def submit(self, coro: Coroutine) -> ConcurrentFuture:
+        """Schedule a coroutine on the loop and return a concurrent Future"""
+        loop = self.start()
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+    def run(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the loop and wait for its result"""
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError(
+                "EventLoopThread.run() called from its own loop - await the coroutine instead"
+            )
+        return self.submit(coro).result(timeout)
+    def stop(self, timeout: float = 5.0):
+        """Stop the loop and wait for the thread to exit"""
+        with self._lock:
+            if self._thread is None:
+                return
+            if self._thread.is_alive():
+                self.loop.call_soon_threadsafe(self.loop.stop)
+                self._thread.join(timeout)
+            self._thread = None
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls that share a key
+
+    The first caller for a key (the leader) does the work; callers arriving
+    while it is in flight wait for and share its result. Threads and asyncio
+    tasks can wait on the same call since the shared result is a
+    concurrent.futures.Future.
+    """
+    def __init__(self):
+        self._calls: Dict[str, ConcurrentFuture] = {}
+        self._lock = Lock()
+        self.leaders = 0
+        self.coalesced = 0
+    def _join(self, key: str) -> Tuple[ConcurrentFuture, bool]:
+        """Return the in-flight future for a key and whether the caller leads"""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = ConcurrentFuture()
+            self._calls[key] = future
+            self.leaders += 1
+            return future, True
+    def _finish(self, key: str, future: ConcurrentFuture):
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Run fn once for all concurrent threaded callers of key"""
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                break
+            try:
+                return future.result()
+            except CancelledError:
+                # The leader was cancelled - take over the call
+                continue
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key, future)
+            future.set_exception(e)
+            raise
+        self._finish(key, future)
+        future.set_result(result)
+        return result
+
+    async def do_async(self, key: str, coro_fn: Callable[[], Coroutine]) -> Any:
+        """Await coro_fn() once for all concurrent callers of key"""
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                break
+            try:
+                # Shield so a cancelled waiter does not cancel the shared call
+                return await asyncio.shield(asyncio.wrap_future(future))
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The leader was cancelled - take over the call
+
+        try:
+            result = await coro_fn()
+        except asyncio.CancelledError:
+            self._finish(key, future)
+            future.cancel()
+            raise
+        except BaseException as e:
+            self._finish(key, future)
+            future.set_exception(e)
+            raise
+        self._finish(key, future)
+        future.set_result(result)
+        return result
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "leaders": self.leaders,
+                "coalesced_requests": self.coalesced,
+            }
+
+
+class FetchGraph:
+    """Dependency graph of async fetches
+
+    Every node starts as soon as the nodes it depends on have finished, and
+    receives their results as keyword arguments, so independent fetches
+    overlap instead of running stage by stage. A name is fetched once however
+    many stages or nodes ask for it. Dependencies must be added before their
+    dependents, which keeps the graph acyclic.
+    """
+    def __init__(self):
+        self._nodes: Dict[str, Tuple[Callable[..., Awaitable], Tuple[str, ...]]] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._started = False
+        self.started_at: Dict[str, float] = {}  # time.perf_counter() per node
+        self.timings: Dict[str, float] = {}
+    def add(
+        self,
+        name: str,
+        fetch: Callable[..., Awaitable],
+        depends_on: Sequence[str] = (),
+    ) -> "FetchGraph":
+        """Add a node; adding an existing name keeps the first node"""
+        if name in self._nodes:
+            return self
+        missing = [dep for dep in depends_on if dep not in self._nodes]
+        if missing:
+            raise ValueError(f"Fetch {name!r} depends on unknown fetches {missing}")
+        self._nodes[name] = (fetch, tuple(depends_on))
+        if self._started:
+            self._task(name)
+        return self
+    def __contains__(self, name: str) -> bool:
+        return name in self._nodes
+    def start(self):
+        """Start every node on the running event loop"""
+        self._started = True
+        for name in self._nodes:
+            self._task(name)
+    def _task(self, name: str) -> asyncio.Task:
+        task = self._tasks.get(name)
+        if task is None:
+            fetch, depends_on = self._nodes[name]
+            task = asyncio.ensure_future(self._run(name, fetch, depends_on))
+            self._tasks[name] = task
+        return task
+    async def _run(
+        self, name: str, fetch: Callable[..., Awaitable], depends_on: Tuple[str, ...]
+    ) -> Any:
+        inputs = {dep: await self.result(dep) for dep in depends_on}
+        start = self.started_at[name] = time.perf_counter()
+        try:
+            return await fetch(**inputs)
+        finally:
+            self.timings[name] = time.perf_counter() - start
+    async def result(self, name: str) -> Any:
+        """Wait for a node's result, re-raising its exception
+
+        Shielded, so a caller that times out does not cancel a fetch that
+        other nodes or stages still wait on.
+        """
+        return await asyncio.shield(self._task(name))
+    def cancel(self, name: str):
+        """Cancel a node whose result is no longer needed"""
+        task = self._tasks.get(name)
+        if task is not None and not task.done():
+            task.cancel()
+    def cancel_pending(self):
+        """Cancel nodes nobody waited for"""
+        for name in self._tasks:
+            self.cancel(name)
+
+
+class ScrapePathStats:
+    """Attempts, successes and latency per scraping path (e.g. http, browser)"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._paths: Dict[str, Dict[str, float]] = {}
+    def record(self, path: str, elapsed: float, success: bool):
+        with self._lock:
+            stats = self._paths.setdefault(
+                path,
+                {"attempts": 0, "successes": 0, "total_time": 0.0, "max_time": 0.0},
+            )
+            stats["attempts"] += 1
+            stats["successes"] += int(success)
+            stats["total_time"] += elapsed
+            stats["max_time"] = max(stats["max_time"], elapsed)
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {
+                path: {
+                    "attempts": stats["attempts"],
+                    "successes": stats["successes"],
+                    "avg_latency": stats["total_time"] / max(1, stats["attempts"]),
+                    "max_latency": stats["max_time"],
+                }
+                for path, stats in self._paths.items()
+            }
+
+
 class UnifiedMaricopaAPIClient:
     """
     Unified Maricopa County API Client
@@ -260,7 +738,13 @@ class UnifiedMaricopaAPIClient:
     - Thread safety
     - Performance optimizations
     """
-def __init__(self, config_manager=None):
+    def __init__(
+        self,
+        config_manager=None,
+        cache_backend: Optional[ResponseCacheBackend] = None,
+        persistent_cache_path: Optional[str] = None,
+        scheduler: Optional[WorkScheduler] = None,
+    ):
         logger.info("Initializing Unified Maricopa API Client")
 
         # Configuration
@@ -301,17 +785,60 @@ def __init__(self, config_manager=None):
             initial_rate=2.0, max_rate=5.0, burst_capacity=10
         )
 
-        # Thread pool for parallel operations
-        self.executor = ThreadPoolExecutor(
-            max_workers=10, thread_name_prefix="MaricopaAPI"
+        # Parallel work runs on the shared scheduler: endpoint calls under the
+        # assessor API budget, queued batch requests (which fan out into
+        # endpoint calls) as general work, browser fallbacks under the
+        # treasurer budget
+        self.scheduler = scheduler or get_work_scheduler()
+        self.executor = self.scheduler.executor_for(
+            Resource.ASSESSOR_API, max_workers=10
+        )
+        self._batch_executor = self.scheduler.executor_for(
+            Resource.GENERAL, max_workers=10
         )
+        self._fallback_executor = self.scheduler.executor_for(Resource.TREASURER)
+
+        # Persistent event loop for sync wrappers around the async methods
+        self._loop_thread = EventLoopThread()
+
+        # Concurrent identical requests share one in-flight call
+        self._inflight = SingleFlight()
+
+        # Treasurer lookups: HTTP fast path (created on first use), browser fallback
+        self._tax_http = None
+        self._tax_http_lock = threading.Lock()
+        self._tax_path_stats = ScrapePathStats()
+
+        # Caching system - bounded LRU by default, any ResponseCacheBackend can be plugged in
+        cache_config = self.config if config_manager else {}
+        if cache_backend is None:
+            cache_backend = LRUResponseCache(
+                max_entries=cache_config.get("cache_max_entries", 5000),
+                max_bytes=cache_config.get("cache_max_mb", 64) * 1024 * 1024,
+                default_ttl=cache_config.get("cache_ttl", 300.0),
+            )
 
-        # Caching system
-        self._cache = {}
+        # Optional persistent tier shared by the GUI and batch processes
+        persistent_cache_path = persistent_cache_path or cache_config.get(
+            "persistent_cache_path"
+        )
+        if persistent_cache_path:
+            try:
+                cache_backend = TieredResponseCache(
+                    cache_backend,
+                    SQLiteResponseCache(
+                        persistent_cache_path,
+                        max_entries=cache_config.get("persistent_cache_max_entries"),
+                    ),
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Persistent API cache unavailable at {persistent_cache_path}: {e}"
+                )
+        self._cache = cache_backend
         self._cache_lock = threading.Lock()
 
         # Batch processing
-        self.request_queue = queue.PriorityQueue()
         self.active_requests = {}
         self.completed_requests = {}
         self.requests_lock = RLock()
@@ -325,47 +852,26 @@ def __init__(self, config_manager=None):
         self.total_failed = 0
         self.stats_lock = Lock()
 
-        # Rate limiting for sync requests
-        self.last_request_time = 0
-        self.min_request_interval = 0.02  # 20ms between requests (optimized)
-
         logger.info("Unified Maricopa API Client initialized successfully")
-    def _rate_limit(self):
-        """Enforce rate limiting between API calls"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-
-        if time_since_last < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.3f}s")
-            time.sleep(sleep_time)
-
-        self.last_request_time = time.time()
     def _get_cache_key(self, endpoint: str, params: Dict = None) -> str:
-        """Generate cache key for request"""
+        """Generate cache key for request (stable across processes)"""
         params_str = json.dumps(params or {}, sort_keys=True)
-        return f"{endpoint}:{hash(params_str)}"
+        return f"{endpoint}:{hashlib.md5(params_str.encode()).hexdigest()}"
     def _get_cached_data(self, cache_key: str) -> Optional[Dict]:
         """Get data from cache if not expired"""
+        data = self._cache.get(cache_key)
+
         with self._cache_lock:
-            if cache_key in self._cache:
-                cache_entry = self._cache[cache_key]
-                if not cache_entry.is_expired():
-                    self.cache_hits += 1
-                    logger.debug(f"Cache hit for key: {cache_key}")
-                    return cache_entry.data
-                else:
-                    # Remove expired entry
-                    del self._cache[cache_key]
+            if data is not None:
+                self.cache_hits += 1
+                logger.debug(f"Cache hit for key: {cache_key}")
+                return data
 
-        self.cache_misses += 1
+            self.cache_misses += 1
         return None
-    def _cache_data(self, cache_key: str, data: Dict, ttl: float = 300.0):
-        """Cache response data"""
-        with self._cache_lock:
-            self._cache[cache_key] = PropertyDataCache(
-                data=data, timestamp=time.time(), ttl=ttl
-            )
+    def _cache_data(self, cache_key: str, data: Dict, ttl: Optional[float] = None):
+        """Cache response data; ttl defaults to the backend's per-endpoint TTL"""
+        self._cache.put(cache_key, data, ttl=ttl)
     def test_connection(self) -> bool:
         """Test if API connection is working"""
     try:
@@ -385,14 +891,35 @@ def __init__(self, config_manager=None):
         if cached_data is not None:
             return cached_data
 
-        self._rate_limit()
+        if retry_count:
+            return self._send_request(endpoint, params, cache_key, retry_count)
+
+        # Share one request among concurrent callers for the same key
+        return self._inflight.do(
+            cache_key, lambda: self._send_request(endpoint, params, cache_key)
+        )
+    def _send_request(
+        self, endpoint: str, params: Dict, cache_key: str, retry_count: int = 0
+    ) -> Optional[Dict]:
+        """Send an uncached HTTP request with retries"""
+        # A call that finished just before this one joined may have filled the
+        # cache; peek, since the caller already counted this lookup as a miss
+        if not retry_count:
+            cached_data = self._cache.peek(cache_key)
+            if cached_data is not None:
+                return cached_data
+
+        # Pace network requests on the same token buckets as the async path
+        if self.rate_limiter and not self.rate_limiter.acquire(timeout=self.timeout):
+            logger.warning(f"Rate limit timeout for endpoint: {endpoint}")
+            raise RateLimitTimeout(f"No rate limit token for {endpoint}")
 
         url = urljoin(self.base_url, endpoint)
         logger.debug(f"Making API request to: {url}")
 
         start_time = time.time()
 
-    try:
+        try:
             response = self.session.get(url, params=params, timeout=self.timeout)
 
             response_time = time.time() - start_time
@@ -404,8 +931,8 @@ def __init__(self, config_manager=None):
 
             if response.status_code == 200:
                 data = response.json()
-                # Cache successful responses for 5 minutes
-                self._cache_data(cache_key, data, ttl=300.0)
+                # Cache successful responses using the per-endpoint TTL
+                self._cache_data(cache_key, data)
 
                 if self.rate_limiter:
                     self.rate_limiter.record_success()
@@ -416,16 +943,18 @@ def __init__(self, config_manager=None):
 
                 return data
             elif response.status_code == 429:  # Rate limited
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
                 if self.rate_limiter:
-                    self.rate_limiter.record_rate_limit()
+                    self.rate_limiter.record_rate_limit(retry_after=retry_after)
 
                 if retry_count < self.max_retries:
-                    wait_time = 2**retry_count  # Exponential backoff
+                    # Honour Retry-After, otherwise exponential backoff
+                    wait_time = retry_after if retry_after is not None else 2**retry_count
                     logger.warning(
                         f"Rate limited, waiting {wait_time}s before retry (attempt {retry_count + 1})"
                     )
                     time.sleep(wait_time)
-                    return self._make_request(endpoint, params, retry_count + 1)
+                    return self._send_request(endpoint, params, cache_key, retry_count + 1)
                 else:
                     logger.error(f"Max retries exceeded for {url}")
                     return None
@@ -441,22 +970,22 @@ def __init__(self, config_manager=None):
                     self.rate_limiter.record_error()
                 return None
 
-    except requests.exceptions.Timeout:
+        except requests.exceptions.Timeout:
             logger.error(f"Request timeout for {url}")
             if retry_count < self.max_retries:
                 logger.info(f"Retrying after timeout (attempt {retry_count + 1})")
-                return self._make_request(endpoint, params, retry_count + 1)
+                return self._send_request(endpoint, params, cache_key, retry_count + 1)
 
             with self.stats_lock:
                 self.total_requests += 1
                 self.total_failed += 1
             return None
 
-    except requests.exceptions.RequestException as e:
+        except requests.exceptions.RequestException as e:
             logger.error(f"Request exception for {url}: {e}")
             if retry_count < self.max_retries:
                 logger.info(f"Retrying after exception (attempt {retry_count + 1})")
-                return self._make_request(endpoint, params, retry_count + 1)
+                return self._send_request(endpoint, params, cache_key, retry_count + 1)
 
             with self.stats_lock:
                 self.total_requests += 1
@@ -546,63 +1075,71 @@ def __init__(self, config_manager=None):
             f"SEARCH_ANALYTICS: address_search, results=0, limit={limit}, source=api_only"
         )
         return []
+    def _select_apn_result(self, response: Optional[Dict], apn: str) -> Optional[Dict]:
+        """Pick the exact APN match (or the first result) from a property search response"""
+        if not response or "Results" not in response or not response["Results"]:
+            return None
+
+        # Find exact APN match in results
+        normalized_apn = apn.replace("-", "").replace(".", "")
+        for result in response["Results"]:
+            if (
+                result.get("APN", "").replace("-", "").replace(".", "")
+                == normalized_apn
+            ):
+                return self._normalize_api_data(result)
+
+        # If no exact match, return first result
+        logger.info(f"Found similar property for APN: {apn} (via API)")
+        return self._normalize_api_data(response["Results"][0])
+    def _search_by_apn_web_fallback(self, apn: str) -> Optional[Dict]:
+        """Build a basic property record for an APN from treasurer web scraping"""
+        # Try to get tax data which often contains property info
+        tax_data = self._scrape_tax_data_sync(apn)
+        if not tax_data or not tax_data.get("owner_info"):
+            return None
+
+        owner_info = tax_data["owner_info"]
+
+        # Create basic property record from tax data
+        return {
+            "apn": apn,
+            "owner_name": owner_info.get("owner_name", ""),
+            "property_address": owner_info.get("property_address", ""),
+            "mailing_address": owner_info.get("mailing_address", ""),
+            "search_source": "web_scraping_tax",
+            "data_quality": "basic",
+        }
     def search_by_apn(self, apn: str) -> Optional[Dict]:
         """Search property by APN using real Maricopa API with web scraping fallback"""
         logger.info(f"Searching property by APN: {apn}")
 
         # Try API first
-    try:
+        try:
             params = {"q": apn}
             response = self._make_request("/search/property/", params)
 
-            if response and "Results" in response and len(response["Results"]) > 0:
-                # Find exact APN match in results
-                for result in response["Results"]:
-                    if result.get("APN", "").replace("-", "").replace(
-                        ".", ""
-                    ) == apn.replace("-", "").replace(".", ""):
-                        normalized_result = self._normalize_api_data(result)
-                        logger.info(f"Found property for APN: {apn} (via API)")
-                        logger.info(
-                            f"SEARCH_ANALYTICS: apn_search, results=1, apn={apn}, source=api"
-                        )
-                        return normalized_result
-
-                # If no exact match, return first result
-                if response["Results"]:
-                    normalized_result = self._normalize_api_data(response["Results"][0])
-                    logger.info(f"Found similar property for APN: {apn} (via API)")
-                    logger.info(
-                        f"SEARCH_ANALYTICS: apn_search, results=1, apn={apn}, source=api"
-                    )
-                    return normalized_result
+            normalized_result = self._select_apn_result(response, apn)
+            if normalized_result:
+                logger.info(f"Found property for APN: {apn} (via API)")
+                logger.info(
+                    f"SEARCH_ANALYTICS: apn_search, results=1, apn={apn}, source=api"
+                )
+                return normalized_result
 
             logger.warning(
                 f"No property found via API for APN: {apn}, trying web scraping fallback"
             )
 
-    except Exception as e:
+        except Exception as e:
             logger.warning(
                 f"API search failed for APN {apn}: {e}, trying web scraping fallback"
             )
 
         # Web scraping fallback - attempt to get basic property data
-    try:
-            # Try to get tax data which often contains property info
-            tax_data = self._scrape_tax_data_sync(apn)
-            if tax_data and tax_data.get("owner_info"):
-                owner_info = tax_data["owner_info"]
-
-                # Create basic property record from tax data
-                property_data = {
-                    "apn": apn,
-                    "owner_name": owner_info.get("owner_name", ""),
-                    "property_address": owner_info.get("property_address", ""),
-                    "mailing_address": owner_info.get("mailing_address", ""),
-                    "search_source": "web_scraping_tax",
-                    "data_quality": "basic",
-                }
-
+        try:
+            property_data = self._search_by_apn_web_fallback(apn)
+            if property_data:
                 logger.info(
                     f"Found basic property data for APN: {apn} (via web scraping)"
                 )
@@ -611,7 +1148,7 @@ def __init__(self, config_manager=None):
                 )
                 return property_data
 
-    except Exception as e:
+        except Exception as e:
             logger.error(f"Web scraping fallback failed for APN {apn}: {e}")
 
         logger.warning(f"No property found for APN: {apn} (tried API and web scraping)")
@@ -735,7 +1272,7 @@ def __init__(self, config_manager=None):
         """
         logger.info(f"Getting sales history for APN: {apn} (years: {years})")
 
-    try:
+        try:
             # Primary method: API-based sales history (not available yet in Maricopa API)
             # This placeholder allows for future API integration
             api_sales_data = None
@@ -761,48 +1298,172 @@ def __init__(self, config_manager=None):
                 )
                 return []
 
-    except Exception as e:
+        except Exception as e:
             logger.error(f"Error getting sales history for APN {apn}: {e}")
             # Return empty list rather than raising exception to maintain compatibility
             return []
-    def bulk_property_search(self, apns: List[str]) -> Dict[str, Dict]:
-        """Bulk search for multiple properties using individual API calls"""
-        logger.info(f"Starting bulk search for {len(apns)} properties")
+    def submit_async(self, coro: Coroutine) -> ConcurrentFuture:
+        """Schedule a coroutine on the client's persistent event loop
 
-        results = {}
+        Coroutines that use the async request methods must run on this loop,
+        which owns the pooled aiohttp session.
+        """
+        return self._loop_thread.submit(coro)
+    def run_async(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the client's persistent event loop and wait for it"""
+        return self._loop_thread.run(coro, timeout)
+    def bulk_property_search(
+        self, apns: List[str], concurrency: int = 10
+    ) -> Dict[str, Dict]:
+        """Bulk search for multiple properties
+
+        Runs bulk_property_search_async on the client's persistent event loop,
+        so the whole batch shares one loop and one aiohttp connection pool.
+        If interrupted, the properties found so far are returned. A
+        RateLimitTimeout is raised, not reported as missing properties.
+        """
+        logger.info(f"Starting bulk search for {len(apns)} properties")
 
-    try:
-            for i, apn in enumerate(apns):
-                logger.debug(f"Processing APN {i+1}/{len(apns)}: {apn}")
+        # The results dict only leaves the loop thread once it is finished
+        # with it, through this future, so it is never shared across threads
+        found: ConcurrentFuture = ConcurrentFuture()
 
-    try:
-                    property_data = self.search_by_apn(apn)
+        async def collect():
+            results = {}
+            try:
+                async for apn, property_data in self.bulk_property_search_async(
+                    apns, concurrency=concurrency, scrape_fallback=True
+                ):
                     if property_data:
                         results[apn] = property_data
-                        logger.debug(f"Found property for APN: {apn}")
-                    else:
-                        logger.debug(f"No property found for APN: {apn}")
-    except Exception as e:
+            finally:
+                found.set_result(results)
+
+        future = self._loop_thread.submit(collect())
+        try:
+            future.result()
+        except (KeyboardInterrupt, CancelledError):
+            future.cancel()
+            try:
+                # A search cancelled before it started found nothing
+                results = found.result(timeout=5.0)
+            except FuturesTimeoutError:
+                results = {}
+            logger.warning(
+                f"Bulk search cancelled - returning {len(results)} partial results"
+            )
+            return results
+        except Exception as e:
+            logger.error(f"Error in bulk property search for {len(apns)} APNs: {e}")
+            raise
+
+        return found.result()
+
+    async def search_by_apn_async(
+        self, apn: str, scrape_fallback: bool = False
+    ) -> Optional[Dict]:
+        """Async search by APN over the pooled aiohttp session
+
+        The web scraping fallback launches a browser, so it is opt-in here and
+        runs in the thread pool to keep the event loop responsive.
+        """
+        response = await self._make_async_request("/search/property/", {"q": apn})
+        normalized_result = self._select_apn_result(response, apn)
+        if normalized_result:
+            return normalized_result
+
+        if scrape_fallback:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._fallback_executor, self._search_by_apn_web_fallback, apn
+            )
+
+        return None
+
+    async def bulk_property_search_async(
+        self,
+        apns: List[str],
+        concurrency: int = 10,
+        scrape_fallback: bool = False,
+    ) -> AsyncIterator[Tuple[str, Optional[Dict]]]:
+        """Stream (apn, property_data) tuples as lookups complete
+
+        At most `concurrency` lookups are in flight at once, each one paced by
+        the rate limiter without blocking the event loop. property_data is None
+        for APNs that were not found. A RateLimitTimeout is raised rather than
+        reported as a miss. If the consumer stops iterating or the task is
+        cancelled, in-flight lookups are cancelled, and everything already
+        yielded remains valid as a partial result.
+        """
+        unique_apns = list(dict.fromkeys(apns))
+        total = len(unique_apns)
+        if not total:
+            return
+
+        pending = asyncio.Queue()
+        for apn in unique_apns:
+            pending.put_nowait(apn)
+
+        # Bounded so that a slow consumer applies backpressure to the workers
+        completed = asyncio.Queue(maxsize=concurrency * 2)
+
+        async def worker():
+            while True:
+                try:
+                    apn = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                try:
+                    property_data = await self.search_by_apn_async(
+                        apn, scrape_fallback=scrape_fallback
+                    )
+                except asyncio.CancelledError:
+                    raise
+                except RateLimitTimeout as e:
+                    # Not a miss: hand the error to the consumer to raise
+                    await completed.put((apn, e))
+                    return
+                except Exception as e:
                     logger.warning(f"Error searching APN {apn}: {e}")
-                    continue
+                    property_data = None
 
-                # Rate limiting - small delay between requests
-                if i < len(apns) - 1:
-                    time.sleep(0.02)  # Optimized delay
+                await completed.put((apn, property_data))
 
-            success_rate = (len(results) / len(apns)) * 100 if apns else 0
+        start_time = time.time()
+        workers = [
+            asyncio.create_task(worker(), name=f"bulk_search_worker_{i}")
+            for i in range(max(1, min(concurrency, total)))
+        ]
+
+        found = 0
+        processed = 0
+        try:
+            while processed < total:
+                apn, property_data = await completed.get()
+                if isinstance(property_data, RateLimitTimeout):
+                    logger.error(f"Rate limit timeout searching APN {apn}")
+                    raise property_data
+                processed += 1
+                if property_data:
+                    found += 1
+                yield apn, property_data
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+            elapsed = time.time() - start_time
+            success_rate = (found / total) * 100
             logger.info(
-                f"Bulk search completed: {len(results)}/{len(apns)} properties retrieved ({success_rate:.1f}% success rate)"
+                f"Bulk search {'completed' if processed == total else 'stopped'}: "
+                f"{found}/{total} properties retrieved in {elapsed:.1f}s "
+                f"({processed} processed, {success_rate:.1f}% success rate)"
             )
             logger.info(
-                f"SEARCH_ANALYTICS: bulk_search, requested={len(apns)}, returned={len(results)}, success_rate={success_rate:.1f}%"
+                f"SEARCH_ANALYTICS: bulk_search, requested={total}, processed={processed}, "
+                f"returned={found}, success_rate={success_rate:.1f}%, concurrency={concurrency}"
             )
-
-            return results
-
-    except Exception as e:
-            logger.error(f"Error in bulk property search for {len(apns)} APNs: {e}")
-            raise
     def validate_apn(self, apn: str) -> bool:
         """Validate if APN exists by searching for it"""
         logger.debug(f"Validating APN: {apn}")
@@ -847,10 +1508,33 @@ def __init__(self, config_manager=None):
         if cached_data is not None:
             return cached_data
 
+        # Share one request among concurrent callers (threads or tasks) for the same key
+        return await self._inflight.do_async(
+            cache_key, lambda: self._send_async_request(endpoint, params, cache_key)
+        )
+
+    async def _send_async_request(
+        self, endpoint: str, params: Dict, cache_key: str, retry_count: int = 0
+    ) -> Optional[Dict]:
+        """Send an uncached async HTTP request with retries"""
+        # A call that finished just before this one joined may have filled the
+        # cache; peek, since the caller already counted this lookup as a miss
+        if not retry_count:
+            cached_data = self._cache.peek(cache_key)
+            if cached_data is not None:
+                return cached_data
+
+        # Pace network requests without blocking the event loop
+        if self.rate_limiter and not await self.rate_limiter.acquire_async(
+            timeout=self.timeout
+        ):
+            logger.warning(f"Rate limit timeout for endpoint: {endpoint}")
+            raise RateLimitTimeout(f"No rate limit token for {endpoint}")
+
         start_time = time.time()
         url = urljoin(self.base_url, endpoint.lstrip("/"))
 
-    try:
+        try:
             session = await self.connection_pool.get_session(self.token)
             async with session.get(url, params=params) as response:
                 response_time = time.time() - start_time
@@ -862,13 +1546,30 @@ def __init__(self, config_manager=None):
 
                 if response.status == 200:
                     data = await response.json()
-                    # Cache successful responses for 5 minutes
-                    self._cache_data(cache_key, data, ttl=300.0)
+                    # Cache successful responses using the per-endpoint TTL
+                    self._cache_data(cache_key, data)
 
                     if self.rate_limiter:
                         self.rate_limiter.record_success()
 
                     return data
+                elif response.status == 429:
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    if retry_after is None:
+                        retry_after = float(2**retry_count)
+                    if self.rate_limiter:
+                        # Pauses the host bucket, so every in-flight worker waits
+                        self.rate_limiter.record_rate_limit(retry_after=retry_after)
+                    else:
+                        await asyncio.sleep(retry_after)
+                    if retry_count < self.max_retries:
+                        logger.warning(
+                            f"Rate limited on {endpoint}, retrying after {retry_after:.1f}s "
+                            f"(attempt {retry_count + 1})"
+                        )
+                    else:
+                        logger.error(f"Max retries exceeded for {endpoint}")
+                        return None
                 elif response.status == 404:
                     # Cache 404s for 1 minute to avoid repeated failed requests
                     self._cache_data(cache_key, {}, ttl=60.0)
@@ -881,78 +1582,89 @@ def __init__(self, config_manager=None):
                         self.rate_limiter.record_error()
                     return None
 
-    except asyncio.TimeoutError:
+        except asyncio.TimeoutError:
             logger.warning(f"Request timeout for endpoint: {endpoint}")
             if self.rate_limiter:
                 self.rate_limiter.record_error()
             return None
-    except Exception as e:
+        except Exception as e:
             logger.error(f"Request error for endpoint {endpoint}: {e}")
             if self.rate_limiter:
                 self.rate_limiter.record_error()
             return None
 
+        # Rate limited: retry once the host bucket's Retry-After window has passed
+        return await self._send_async_request(
+            endpoint, params, cache_key, retry_count + 1
+        )
+
     async def _get_detailed_property_data_parallel(self, apn: str) -> Dict[str, Any]:
         """Get comprehensive property data using parallel requests"""
         logger.info(f"Getting detailed property data (parallel) for APN: {apn}")
 
-        # Define all endpoints to fetch in parallel
-        endpoints = {
-            "valuations": f"/parcel/{apn}/valuations/",
-            "residential_details": f"/parcel/{apn}/residential-details/",
-            "improvements": f"/parcel/{apn}/improvements/",
-            "sketches": f"/parcel/{apn}/sketches/",
-            "mapids": f"/parcel/{apn}/mapids/",
-        }
+        start_time = time.time()
+        graph = FetchGraph()
+        self._add_detail_fetches(graph, apn)
+        graph.start()
+        try:
+            detailed_data = await self._collect_detail_fetches(graph)
+        finally:
+            graph.cancel_pending()
 
-        # Try to get owner name for rental details (if needed)
-    try:
-            basic_search = await self._make_async_request(
-                f"/search/property/", {"q": apn}
-            )
-            if basic_search and "Results" in basic_search and basic_search["Results"]:
-                for result in basic_search["Results"]:
-                    if "Ownership" in result:
-                        owner_name = result["Ownership"]
-                        endpoints["rental_details"] = (
-                            f"/parcel/{apn}/rental-details/{owner_name}/"
-                        )
-                        break
-    except Exception as e:
-            logger.debug(f"Could not determine owner name for rental details: {e}")
+        total_time = time.time() - start_time
+        logger.info(
+            f"Parallel data collection completed in {total_time:.3f}s for APN: {apn}"
+        )
 
-        # Execute all requests in parallel
-        start_time = time.time()
-        tasks = []
+        return detailed_data
+    def _add_detail_fetches(self, graph: FetchGraph, apn: str):
+        """Add the detail endpoint fetches for an APN to a fetch graph
 
-        for endpoint_name, endpoint_path in endpoints.items():
-            task = asyncio.create_task(
-                self._make_async_request(endpoint_path), name=endpoint_name
+        The endpoints start at once; only rental details waits, for the owner
+        name from the property search. The search node is shared with any
+        other fetch in the graph that needs it.
+        """
+        for name, path in DETAIL_ENDPOINTS.items():
+            graph.add(
+                name, lambda path=path: self._make_async_request(path.format(apn=apn))
             )
-            tasks.append((endpoint_name, task))
-
-        # Wait for all requests to complete
+        graph.add(
+            "search", lambda: self._make_async_request("/search/property/", {"q": apn})
+        )
+        graph.add(
+            "rental_details",
+            lambda search: self._fetch_rental_details(apn, search),
+            depends_on=["search"],
+        )
+    async def _fetch_rental_details(
+        self, apn: str, search: Optional[Dict]
+    ) -> Optional[Dict]:
+        """Rental details need the owner name from the property search"""
+        for result in (search or {}).get("Results") or []:
+            if "Ownership" in result:
+                owner_name = result["Ownership"]
+                return await self._make_async_request(
+                    f"/parcel/{apn}/rental-details/{owner_name}/"
+                )
+        logger.debug(f"Could not determine owner name for rental details: {apn}")
+        return None
+    async def _collect_detail_fetches(self, graph: FetchGraph) -> Dict[str, Any]:
+        """Wait for the detail fetches in a graph and keep those with data"""
         detailed_data = {}
-        for endpoint_name, task in tasks:
-    try:
-                response = await task
+        for endpoint_name in [*DETAIL_ENDPOINTS, "rental_details"]:
+            try:
+                response = await graph.result(endpoint_name)
                 if response:
                     detailed_data[endpoint_name] = response
                     logger.debug(f"Retrieved {endpoint_name} data")
                 else:
                     logger.debug(f"No data from {endpoint_name}")
-    except Exception as e:
+            except Exception as e:
                 logger.error(f"Error retrieving {endpoint_name}: {e}")
-
-        total_time = time.time() - start_time
-        logger.info(
-            f"Parallel data collection completed in {total_time:.3f}s for APN: {apn}"
-        )
-
         return detailed_data
     def get_detailed_property_data_fast(self, apn: str) -> Dict[str, Any]:
         """Synchronous wrapper for parallel detailed property data retrieval"""
-        return asyncio.run(self._get_detailed_property_data_parallel(apn))
+        return self._loop_thread.run(self._get_detailed_property_data_parallel(apn))
 
     async def _get_comprehensive_property_info_parallel(
         self, apn: str
@@ -1051,13 +1763,20 @@ def __init__(self, config_manager=None):
             return None
     def get_comprehensive_property_info_fast(self, apn: str) -> Optional[Dict]:
         """Synchronous wrapper for parallel comprehensive property info retrieval"""
-        return asyncio.run(self._get_comprehensive_property_info_parallel(apn))
+        return self._loop_thread.run(
+            self._get_comprehensive_property_info_parallel(apn)
+        )
 
     # ========================================================================
     # BATCH OPERATIONS
     # ========================================================================
     def submit_batch_requests(self, requests: List[BatchAPIRequest]) -> List[str]:
-        """Submit multiple API requests for batch processing"""
+        """Submit multiple API requests for batch processing
+
+        Requests go straight to the scheduler's GENERAL executor, highest
+        priority first, so they count against the shared budget and its
+        priority ordering without a queue thread of their own.
+        """
         request_ids = []
 
         with self.requests_lock:
@@ -1065,16 +1784,19 @@ def __init__(self, config_manager=None):
                 # Generate unique request ID if not provided
                 if not request.request_id:
                     request.request_id = f"{request.request_type}_{request.identifier}_{int(time.time())}"
-
-                # Add to priority queue
-                priority_tuple = (request.priority, time.time())
-                self.request_queue.put((priority_tuple, request))
                 request_ids.append(request.request_id)
 
-                logger.debug(f"Queued API request: {request.request_id}")
+            # Held while submitting, so a request that finishes at once is
+            # registered before it is moved to completed_requests
+            for request in sorted(requests, key=lambda request: request.priority):
+                future = self._batch_executor.submit_with_priority(
+                    priority_from_level(request.priority),
+                    self._execute_api_request,
+                    request,
+                )
+                self.active_requests[request.request_id] = (request, future)
 
-        # Start processing
-        self._process_request_queue()
+                logger.debug(f"Queued API request: {request.request_id}")
 
         logger.info(f"Submitted {len(requests)} batch API requests")
         return request_ids
@@ -1102,31 +1824,6 @@ def __init__(self, config_manager=None):
             requests.append(request)
 
         return self.submit_batch_requests(requests)
-    def _process_request_queue(self):
-        """Process queued requests in thread pool"""
-        self.executor.submit(self._queue_processor_worker)
-    def _queue_processor_worker(self):
-        """Background worker to process API request queue"""
-        while True:
-    try:
-                # Get next request with timeout
-    try:
-                    priority_tuple, request = self.request_queue.get(timeout=5.0)
-    except queue.Empty:
-                    break  # No more requests to process
-
-                # Submit request for execution
-                future = self.executor.submit(self._execute_api_request, request)
-
-                with self.requests_lock:
-                    self.active_requests[request.request_id] = (request, future)
-
-                # Brief pause to prevent overwhelming
-                time.sleep(0.05)
-
-    except Exception as e:
-                logger.error(f"Error in queue processor: {e}")
-                time.sleep(1.0)
     def _execute_api_request(self, request: BatchAPIRequest):
         """Execute a single API request with error handling and retries"""
         start_time = time.time()
@@ -1136,10 +1833,6 @@ def __init__(self, config_manager=None):
 
         for attempt in range(request.max_retries + 1):
     try:
-                # Rate limiting
-                if self.rate_limiter and not self.rate_limiter.acquire(timeout=10.0):
-                    raise TimeoutError("Rate limit timeout")
-
                 # Execute based on request type
                 if request.request_type == "search_by_apn":
                     result = self.search_by_apn(request.identifier)
@@ -1274,7 +1967,7 @@ def __init__(self, config_manager=None):
                 request, future = self.active_requests[request_id]
                 return {
                     "request_id": request_id,
-                    "status": "running",
+                    "status": "running" if request.started_at else "queued",
                     "request_type": request.request_type,
                     "identifier": request.identifier,
                     "started_at": (
@@ -1705,8 +2398,89 @@ def __init__(self, config_manager=None):
     except (ValueError, AttributeError):
             return None
     def _scrape_tax_data_sync(self, apn: str) -> Optional[Dict]:
-        """Synchronous wrapper for tax data scraping"""
-    try:
+        """Tax data for an APN: HTTP fast path first, browser only if it fails"""
+        try:
+            tax_data = self._scrape_tax_data_http(apn)
+        except Exception as e:
+            # Rate limited: the browser would only hit the same limit
+            logger.warning(f"Tax scraping for {apn} rate limited: {e}")
+            return None
+        if tax_data:
+            return tax_data
+
+        if self.rate_limiter and not self.rate_limiter.acquire(
+            timeout=self.timeout, host=TREASURER_HOST
+        ):
+            logger.warning(f"Rate limit timeout for tax scraping: {apn}")
+            return None
+
+        logger.info(f"Treasurer HTTP fast path failed for {apn}, using browser")
+        return self._scrape_tax_data_browser(apn)
+    def _get_tax_http_client(self):
+        with self._tax_http_lock:
+            if self._tax_http is None:
+                from tax_scraper import TreasurerHttpClient
+
+                self._tax_http = TreasurerHttpClient(timeout=min(self.timeout, 10))
+            return self._tax_http
+    def _scrape_tax_data_http(
+        self, apn: str, max_duration: Optional[float] = None
+    ) -> Optional[Dict]:
+        """Replay the treasurer parcel form over the pooled HTTP session
+
+        Every treasurer HTTP lookup goes through here, paced on the treasurer
+        rate limit bucket; max_duration bounds the wait for a token and the
+        lookup. Outcomes feed the bucket. RateLimitTimeout is raised if no
+        token comes in time, and TreasurerRateLimited on a 429, which also
+        pauses the bucket for the Retry-After window.
+        """
+        try:
+            from tax_scraper import TreasurerRateLimited
+
+            client = self._get_tax_http_client()
+        except ImportError as e:
+            logger.warning(f"Treasurer HTTP client not available: {e}")
+            return None
+
+        wait_start = time.time()
+        if self.rate_limiter and not self.rate_limiter.acquire(
+            timeout=self.timeout if max_duration is None else max_duration,
+            host=TREASURER_HOST,
+        ):
+            raise RateLimitTimeout(f"No rate limit token for treasurer lookup {apn}")
+
+        start_time = time.time()
+        if max_duration is not None:
+            # The token wait counts against the lookup's time budget
+            max_duration -= start_time - wait_start
+
+        tax_data = None
+        try:
+            tax_data = client.fetch_tax_data(
+                apn, max_duration=max_duration, raise_errors=True
+            )
+            if self.rate_limiter:
+                self.rate_limiter.record_success(host=TREASURER_HOST)
+        except TreasurerRateLimited as e:
+            if self.rate_limiter:
+                self.rate_limiter.record_rate_limit(
+                    host=TREASURER_HOST, retry_after=parse_retry_after(e.retry_after)
+                )
+            raise
+        except Exception as e:
+            logger.error(f"Error in treasurer HTTP lookup for {apn}: {e}")
+            if self.rate_limiter:
+                self.rate_limiter.record_error(host=TREASURER_HOST)
+        finally:
+            self._tax_path_stats.record(
+                "http", time.time() - start_time, tax_data is not None
+            )
+        return tax_data
+    def _scrape_tax_data_browser(self, apn: str) -> Optional[Dict]:
+        """Scrape tax data with a headless browser"""
+        start_time = time.time()
+        tax_data = None
+        try:
             from playwright.sync_api import sync_playwright
 
             from tax_scraper import MaricopaTaxScraper
@@ -1730,21 +2504,37 @@ def __init__(self, config_manager=None):
                 tax_data = scraper.scrape_tax_data_for_apn(apn, page)
 
                 browser.close()
+                if self.rate_limiter:
+                    self.rate_limiter.record_success(host=TREASURER_HOST)
+                if tax_data:
+                    tax_data["scrape_method"] = "browser"
                 return tax_data
 
-    except ImportError as e:
+        except ImportError as e:
             logger.warning(f"Playwright not available for tax scraping: {e}")
             return None
-    except Exception as e:
+        except Exception as e:
             logger.error(f"Error in tax data scraping for {apn}: {e}")
+            if self.rate_limiter:
+                self.rate_limiter.record_error(host=TREASURER_HOST)
             return None
+        finally:
+            self._tax_path_stats.record(
+                "browser", time.time() - start_time, tax_data is not None
+            )
     def _scrape_sales_data_sync(self, apn: str, years: int = 10) -> Optional[Dict]:
         """Synchronous wrapper for sales data scraping"""
-    try:
+        try:
             from playwright.sync_api import sync_playwright
 
             from recorder_scraper import MaricopaRecorderScraper
 
+            if self.rate_limiter and not self.rate_limiter.acquire(
+                timeout=self.timeout, host=RECORDER_HOST
+            ):
+                logger.warning(f"Rate limit timeout for sales scraping: {apn}")
+                return None
+
             with sync_playwright() as p:
                 browser = p.chromium.launch(
                     headless=True,
@@ -1764,13 +2554,17 @@ def __init__(self, config_manager=None):
                 recorder_data = scraper.scrape_document_data_for_apn(apn, page)
 
                 browser.close()
+                if self.rate_limiter:
+                    self.rate_limiter.record_success(host=RECORDER_HOST)
                 return recorder_data
 
-    except ImportError as e:
+        except ImportError as e:
             logger.warning(f"Playwright not available for sales scraping: {e}")
             return None
-    except Exception as e:
+        except Exception as e:
             logger.error(f"Error in sales data scraping for {apn}: {e}")
+            if self.rate_limiter:
+                self.rate_limiter.record_error(host=RECORDER_HOST)
             return None
 
     # ========================================================================
@@ -1988,9 +2782,14 @@ def __init__(self, config_manager=None):
             )
 
         with self.requests_lock:
-            active_count = len(self.active_requests)
+            # Submitted requests waiting for a worker have not started yet
+            pending_count = sum(
+                1
+                for request, _ in self.active_requests.values()
+                if request.started_at is None
+            )
+            active_count = len(self.active_requests) - pending_count
             completed_count = len(self.completed_requests)
-            pending_count = self.request_queue.qsize()
 
         stats = {
             "total_requests": self.total_requests,
@@ -2005,6 +2804,11 @@ def __init__(self, config_manager=None):
             )
             * 100,
             "cached_entries": len(self._cache),
+            "response_cache": self._cache.get_stats(),
+            "coalesced_requests": self._inflight.coalesced,
+            "single_flight": self._inflight.get_stats(),
+            "tax_scrape_paths": self._tax_path_stats.get_stats(),
+            "connection_pool": self.connection_pool.get_stats(),
             "active_requests": active_count,
             "completed_requests": completed_count,
             "pending_requests": pending_count,
@@ -2037,32 +2841,49 @@ def __init__(self, config_manager=None):
         return removed_count
     def close(self):
         """Close the HTTP sessions and cleanup resources"""
-    try:
+        try:
             if self.session:
                 self.session.close()
                 logger.info("Synchronous API client session closed successfully")
 
-            # Close async components
-            asyncio.run(self.connection_pool.close())
+            # Close async components on the loop that owns the session
+            if self._loop_thread.is_running:
+                self._loop_thread.run(self.connection_pool.close(), timeout=10)
+                self._loop_thread.stop()
+            else:
+                asyncio.run(self.connection_pool.close())
+
+            # Stop the response cache sweeper
+            self._cache.close()
 
-            # Shutdown executor
+            if self._tax_http is not None:
+                self._tax_http.close()
+
+            # Wait for this client's scheduled work
+            self._batch_executor.shutdown(wait=True)
+            self._fallback_executor.shutdown(wait=True)
             self.executor.shutdown(wait=True)
 
             logger.info("Unified API client closed successfully")
-    except Exception as e:
+        except Exception as e:
             logger.error(f"Error closing unified API client: {e}")
 
     async def async_close(self):
         """Async version of close for use in async contexts"""
-    try:
+        try:
             if self.session:
                 self.session.close()
 
             await self.connection_pool.close()
+            self._cache.close()
+            if not self._loop_thread.in_loop_thread():
+                self._loop_thread.stop()
+            self._batch_executor.shutdown(wait=True)
+            self._fallback_executor.shutdown(wait=True)
             self.executor.shutdown(wait=True)
 
             logger.info("Unified API client closed successfully (async)")
-    except Exception as e:
+        except Exception as e:
             logger.error(f"Error closing unified API client (async): {e}")
 
 
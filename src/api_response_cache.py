@@ -0,0 +1,741 @@
+"""
+API Response Cache
+Bounded, size-aware response cache backends for the unified API client
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Per-endpoint TTLs (seconds), matched by substring against the cache key.
+# Parcel detail endpoints change roughly once a year, searches more often.
+DEFAULT_ENDPOINT_TTLS = {
+    "/search/": 300.0,
+    "/valuations/": 3600.0,
+    "/residential-details/": 3600.0,
+    "/improvements/": 3600.0,
+    "/sketches/": 3600.0,
+    "/mapids/": 3600.0,
+    "/rental-details/": 3600.0,
+}
+
+# Persistent tier TTLs (seconds). Parcel data is refreshed by the county about
+# once a year, so a week on disk is safe; searches stay comparatively short.
+DEFAULT_PERSISTENT_ENDPOINT_TTLS = {
+    "/search/": 6 * 3600.0,
+    "/valuations/": 7 * 86400.0,
+    "/residential-details/": 7 * 86400.0,
+    "/improvements/": 7 * 86400.0,
+    "/sketches/": 7 * 86400.0,
+    "/mapids/": 7 * 86400.0,
+    "/rental-details/": 7 * 86400.0,
+}
+
+
+def resolve_endpoint_ttl(
+    key: str, endpoint_ttls: Dict[str, float], default_ttl: float
+) -> float:
+    """Get the TTL configured for the endpoint a cache key belongs to"""
+    for pattern, ttl in endpoint_ttls.items():
+        if pattern in key:
+            return ttl
+    return default_ttl
+
+
+def endpoint_category(key: str, endpoint_ttls: Dict[str, float]) -> str:
+    """Get the endpoint pattern a cache key belongs to, for reporting"""
+    for pattern in endpoint_ttls:
+        if pattern in key:
+            return pattern
+    return "other"
+
+
+@dataclass
+class ResponseCacheEntry:
+    """Cache entry for an API response with TTL and accounted size"""
+
+    data: Any
+    timestamp: float
+    ttl: float
+    size_bytes: int
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        return (now or time.time()) - self.timestamp > self.ttl
+
+
+class ResponseCacheBackend(ABC):
+    """Interface for pluggable API response cache backends"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Get live cached data, counting a hit or miss"""
+        pass
+
+    def peek(self, key: str) -> Optional[Any]:
+        """Get live cached data without counting a hit or miss"""
+        return self.get(key)
+
+    @abstractmethod
+    def put(self, key: str, data: Any, ttl: Optional[float] = None) -> None:
+        """Cache data under key for ttl seconds"""
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        """Remove one entry; False if it was not cached"""
+        pass
+
+    @abstractmethod
+    def clear(self) -> int:
+        """Remove every entry; returns the number removed"""
+        pass
+
+    @abstractmethod
+    def purge_expired(self) -> int:
+        """Remove expired entries; returns the number removed"""
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit, miss, size and eviction counters"""
+        pass
+
+    def close(self) -> None:
+        """Release backend resources (background threads, files)"""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+
+class LRUResponseCache(ResponseCacheBackend):
+    """Thread-safe LRU response cache bounded by entry count and byte budget
+
+    Entry sizes are measured once at insert time, so the byte budget is
+    enforced without re-serializing the cache. Expired entries are removed
+    on access and by an optional background sweeper thread.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 5000,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl: float = 300.0,
+        endpoint_ttls: Optional[Dict[str, float]] = None,
+        sweep_interval: Optional[float] = 60.0,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.endpoint_ttls = dict(
+            DEFAULT_ENDPOINT_TTLS if endpoint_ttls is None else endpoint_ttls
+        )
+
+        self._entries: "OrderedDict[str, ResponseCacheEntry]" = OrderedDict()
+        self._current_bytes = 0
+        self._lock = threading.RLock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.rejected = 0
+
+        # Background sweeper
+        self._stop_event = threading.Event()
+        self._sweeper = None
+        if sweep_interval:
+            self._sweeper = threading.Thread(
+                target=self._sweep_loop,
+                args=(sweep_interval,),
+                name="APIResponseCacheSweeper",
+                daemon=True,
+            )
+            self._sweeper.start()
+
+        logger.info(
+            f"LRU response cache initialized: max_entries={max_entries}, "
+            f"max_bytes={max_bytes}, default_ttl={default_ttl}s"
+        )
+
+    def resolve_ttl(self, key: str) -> float:
+        """Get the TTL configured for the endpoint a cache key belongs to"""
+        return resolve_endpoint_ttl(key, self.endpoint_ttls, self.default_ttl)
+
+    def _estimate_size(self, key: str, data: Any) -> int:
+        """Estimate the memory footprint of an entry from its JSON encoding"""
+        try:
+            payload_size = len(json.dumps(data, default=str))
+        except (TypeError, ValueError):
+            payload_size = len(str(data))
+        return payload_size + len(key)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._current_bytes -= entry.size_bytes
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get cached data, or None on miss or expiry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            if entry.is_expired():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            # Move to end (most recently used)
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.data
+
+    def peek(self, key: str) -> Optional[Any]:
+        """Get live cached data without touching stats or LRU order"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.is_expired():
+                return None
+            return entry.data
+
+    def put(self, key: str, data: Any, ttl: Optional[float] = None) -> None:
+        """Cache data, evicting least recently used entries to stay in budget"""
+        if ttl is None:
+            ttl = self.resolve_ttl(key)
+
+        size_bytes = self._estimate_size(key, data)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            # An entry larger than the whole budget would flush the cache
+            if size_bytes > self.max_bytes:
+                self.rejected += 1
+                logger.debug(f"Response too large to cache ({size_bytes} bytes): {key}")
+                return
+
+            while self._entries and (
+                len(self._entries) >= self.max_entries
+                or self._current_bytes + size_bytes > self.max_bytes
+            ):
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+            self._entries[key] = ResponseCacheEntry(
+                data=data, timestamp=time.time(), ttl=ttl, size_bytes=size_bytes
+            )
+            self._current_bytes += size_bytes
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+                return True
+            return False
+
+    def clear(self) -> int:
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self._current_bytes = 0
+            return count
+
+    def purge_expired(self) -> int:
+        """Remove all expired entries"""
+        now = time.time()
+        with self._lock:
+            expired_keys = [
+                key for key, entry in self._entries.items() if entry.is_expired(now)
+            ]
+            for key in expired_keys:
+                self._remove(key)
+            self.expirations += len(expired_keys)
+
+        if expired_keys:
+            logger.debug(f"Purged {len(expired_keys)} expired API cache entries")
+        return len(expired_keys)
+
+    def _sweep_loop(self, interval: float):
+        """Background thread to purge expired entries"""
+        while not self._stop_event.wait(interval):
+            try:
+                self.purge_expired()
+            except Exception as e:
+                logger.error(f"API cache sweep error: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": "lru",
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "bytes": self._current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) * 100 if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "rejected": self.rejected,
+            }
+
+    def close(self) -> None:
+        self._stop_event.set()
+        if self._sweeper and self._sweeper.is_alive():
+            self._sweeper.join(timeout=1.0)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries
+
+
+class SQLiteResponseCache(ResponseCacheBackend):
+    """Persistent API response cache stored in a SQLite database file
+
+    Payloads are stored as zlib-compressed JSON. The database runs in WAL mode
+    with a busy timeout, so several worker processes (GUI, batch scripts) can
+    read and write the same cache file concurrently. Each thread gets its own
+    connection. A background sweeper removes expired entries and trims the
+    cache to max_entries every sweep_interval seconds.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS api_response_cache (
+        cache_key TEXT PRIMARY KEY,
+        category TEXT NOT NULL,
+        payload BLOB NOT NULL,
+        size_bytes INTEGER NOT NULL,
+        created_at REAL NOT NULL,
+        expires_at REAL NOT NULL
+    )
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        default_ttl: float = 86400.0,
+        endpoint_ttls: Optional[Dict[str, float]] = None,
+        max_entries: Optional[int] = None,
+        compression_level: int = 6,
+        busy_timeout_ms: int = 5000,
+        sweep_interval: Optional[float] = 300.0,
+    ):
+        self.db_path = Path(db_path)
+        self.default_ttl = default_ttl
+        self.endpoint_ttls = dict(
+            DEFAULT_PERSISTENT_ENDPOINT_TTLS if endpoint_ttls is None else endpoint_ttls
+        )
+        self.max_entries = max_entries
+        self.compression_level = compression_level
+        self.busy_timeout_ms = busy_timeout_ms
+
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+
+        # Statistics (per process)
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.errors = 0
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as conn:
+            conn.execute(self.SCHEMA)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_api_response_cache_expires "
+                "ON api_response_cache(expires_at)"
+            )
+
+        # Background sweeper
+        self._stop_event = threading.Event()
+        self._sweeper = None
+        if sweep_interval:
+            self._sweeper = threading.Thread(
+                target=self._sweep_loop,
+                args=(sweep_interval,),
+                name="PersistentAPICacheSweeper",
+                daemon=True,
+            )
+            self._sweeper.start()
+
+        logger.info(f"Persistent API response cache opened: {self.db_path}")
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                str(self.db_path),
+                timeout=self.busy_timeout_ms / 1000.0,
+                isolation_level=None,  # autocommit; each statement is atomic
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _record(self, counter: str, amount: int = 1):
+        with self._stats_lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def resolve_ttl(self, key: str) -> float:
+        """Get the TTL configured for the endpoint a cache key belongs to"""
+        return resolve_endpoint_ttl(key, self.endpoint_ttls, self.default_ttl)
+
+    def _encode(self, data: Any) -> bytes:
+        return zlib.compress(
+            json.dumps(data, default=str).encode("utf-8"), self.compression_level
+        )
+
+    @staticmethod
+    def _decode(payload: bytes) -> Any:
+        return json.loads(zlib.decompress(payload).decode("utf-8"))
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get cached data, or None on miss or expiry"""
+        hit = self.get_with_expiry(key)
+        return hit[0] if hit is not None else None
+
+    def get_with_expiry(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Get (data, seconds_remaining) for a live entry, or None"""
+        try:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT payload, expires_at FROM api_response_cache WHERE cache_key = ?",
+                    (key,),
+                )
+                .fetchone()
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Persistent cache read failed for {key}: {e}")
+            self._record("errors")
+            self._record("misses")
+            return None
+
+        if row is None:
+            self._record("misses")
+            return None
+
+        payload, expires_at = row
+        now = time.time()
+        remaining = expires_at - now
+        if remaining < 0:
+            # Another process may have refreshed the entry since it was read
+            self._delete_if(key, "expires_at < ?", now)
+            self._record("expirations")
+            self._record("misses")
+            return None
+
+        try:
+            data = self._decode(payload)
+        except (zlib.error, ValueError) as e:
+            logger.warning(f"Discarding corrupt persistent cache entry {key}: {e}")
+            self._delete_if(key, "expires_at = ?", expires_at)
+            self._record("errors")
+            self._record("misses")
+            return None
+
+        self._record("hits")
+        return data, remaining
+
+    def peek(self, key: str) -> Optional[Any]:
+        """Get live cached data without counting a hit or miss"""
+        try:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT payload FROM api_response_cache "
+                    "WHERE cache_key = ? AND expires_at >= ?",
+                    (key, time.time()),
+                )
+                .fetchone()
+            )
+            return self._decode(row[0]) if row is not None else None
+        except (sqlite3.Error, zlib.error, ValueError) as e:
+            logger.warning(f"Persistent cache peek failed for {key}: {e}")
+            return None
+
+    def put(self, key: str, data: Any, ttl: Optional[float] = None) -> None:
+        """Store data; concurrent writers resolve with last-writer-wins"""
+        if ttl is None:
+            ttl = self.resolve_ttl(key)
+
+        now = time.time()
+        try:
+            payload = self._encode(data)
+            self._connection().execute(
+                """
+                INSERT OR REPLACE INTO api_response_cache
+                    (cache_key, category, payload, size_bytes, created_at, expires_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    key,
+                    endpoint_category(key, self.endpoint_ttls),
+                    sqlite3.Binary(payload),
+                    len(payload),
+                    now,
+                    now + ttl,
+                ),
+            )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Persistent cache write failed for {key}: {e}")
+            self._record("errors")
+
+    def delete(self, key: str) -> bool:
+        try:
+            cursor = self._connection().execute(
+                "DELETE FROM api_response_cache WHERE cache_key = ?", (key,)
+            )
+            return cursor.rowcount > 0
+        except sqlite3.Error as e:
+            logger.warning(f"Persistent cache delete failed for {key}: {e}")
+            return False
+
+    def _delete_if(self, key: str, condition: str, value: float) -> bool:
+        """Delete an entry only while it is still the version that was read"""
+        try:
+            cursor = self._connection().execute(
+                f"DELETE FROM api_response_cache WHERE cache_key = ? AND {condition}",
+                (key, value),
+            )
+            return cursor.rowcount > 0
+        except sqlite3.Error as e:
+            logger.warning(f"Persistent cache delete failed for {key}: {e}")
+            return False
+
+    def clear(self) -> int:
+        cursor = self._connection().execute("DELETE FROM api_response_cache")
+        return cursor.rowcount
+
+    def purge(self, category: Optional[str] = None, expired_only: bool = False) -> int:
+        """Remove entries, optionally only one endpoint category or only expired ones"""
+        clauses, params = [], []
+        if category:
+            clauses.append("category = ?")
+            params.append(category)
+        if expired_only:
+            clauses.append("expires_at < ?")
+            params.append(time.time())
+
+        sql = "DELETE FROM api_response_cache"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+
+        cursor = self._connection().execute(sql, params)
+        return cursor.rowcount
+
+    def purge_expired(self) -> int:
+        """Remove expired entries and trim to max_entries (oldest first)"""
+        removed = self.purge(expired_only=True)
+        self._record("expirations", removed)
+
+        if self.max_entries:
+            cursor = self._connection().execute(
+                """
+                DELETE FROM api_response_cache WHERE cache_key IN (
+                    SELECT cache_key FROM api_response_cache
+                    ORDER BY created_at DESC
+                    LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+            self._record("evictions", cursor.rowcount)
+            removed += cursor.rowcount
+
+        if removed:
+            logger.debug(f"Purged {removed} persistent API cache entries")
+        return removed
+
+    def _sweep_loop(self, interval: float):
+        """Background thread to purge expired entries and enforce max_entries"""
+        while not self._stop_event.wait(interval):
+            try:
+                self.purge_expired()
+            except sqlite3.Error as e:
+                logger.error(f"Persistent API cache sweep error: {e}")
+
+    def inspect(self) -> Dict[str, Any]:
+        """Summarize cache contents per endpoint category"""
+        now = time.time()
+        rows = (
+            self._connection()
+            .execute(
+                """
+                SELECT category,
+                       COUNT(*),
+                       COALESCE(SUM(size_bytes), 0),
+                       SUM(CASE WHEN expires_at < ? THEN 1 ELSE 0 END),
+                       MIN(created_at),
+                       MAX(created_at)
+                FROM api_response_cache
+                GROUP BY category
+                ORDER BY category
+                """,
+                (now,),
+            )
+            .fetchall()
+        )
+
+        categories = {
+            category: {
+                "entries": count,
+                "compressed_bytes": size,
+                "expired": expired or 0,
+                "oldest_age_seconds": now - oldest if oldest else None,
+                "newest_age_seconds": now - newest if newest else None,
+            }
+            for category, count, size, expired, oldest, newest in rows
+        }
+
+        return {
+            "path": str(self.db_path),
+            "file_bytes": (
+                os.path.getsize(self.db_path) if self.db_path.exists() else 0
+            ),
+            "entries": sum(c["entries"] for c in categories.values()),
+            "compressed_bytes": sum(c["compressed_bytes"] for c in categories.values()),
+            "categories": categories,
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        try:
+            entries, size = (
+                self._connection()
+                .execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM api_response_cache"
+                )
+                .fetchone()
+            )
+        except sqlite3.Error:
+            entries, size = None, None
+
+        with self._stats_lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": "sqlite",
+                "path": str(self.db_path),
+                "entries": entries,
+                "compressed_bytes": size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) * 100 if lookups else 0.0,
+                "expirations": self.expirations,
+                "evictions": self.evictions,
+                "errors": self.errors,
+            }
+
+    def close(self) -> None:
+        self._stop_event.set()
+        if self._sweeper and self._sweeper.is_alive():
+            self._sweeper.join(timeout=5.0)
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._connections.clear()
+        self._local = threading.local()
+
+    def __len__(self) -> int:
+        return self._connection().execute(
+            "SELECT COUNT(*) FROM api_response_cache"
+        ).fetchone()[0]
+
+
+class TieredResponseCache(ResponseCacheBackend):
+    """In-memory cache backed by a persistent tier shared across processes
+
+    Reads check memory first, then the persistent tier; persistent hits are
+    promoted into memory. Writes go to both tiers.
+    """
+
+    def __init__(
+        self, memory: ResponseCacheBackend, persistent: SQLiteResponseCache
+    ):
+        self.memory = memory
+        self.persistent = persistent
+
+    def get(self, key: str) -> Optional[Any]:
+        data = self.memory.get(key)
+        if data is not None:
+            return data
+
+        hit = self.persistent.get_with_expiry(key)
+        if hit is None:
+            return None
+
+        # Never keep the promoted copy longer than the persistent entry lives
+        data, remaining = hit
+        ttl = remaining
+        if hasattr(self.memory, "resolve_ttl"):
+            ttl = min(self.memory.resolve_ttl(key), remaining)
+        self.memory.put(key, data, ttl=ttl)
+        return data
+
+    def peek(self, key: str) -> Optional[Any]:
+        data = self.memory.peek(key)
+        if data is not None:
+            return data
+        return self.persistent.peek(key)
+
+    def put(self, key: str, data: Any, ttl: Optional[float] = None) -> None:
+        self.memory.put(key, data, ttl=ttl)
+        self.persistent.put(key, data, ttl=ttl)
+
+    def delete(self, key: str) -> bool:
+        in_memory = self.memory.delete(key)
+        on_disk = self.persistent.delete(key)
+        return in_memory or on_disk
+
+    def clear(self) -> int:
+        self.memory.clear()
+        return self.persistent.clear()
+
+    def purge_expired(self) -> int:
+        return self.memory.purge_expired() + self.persistent.purge_expired()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "tiered",
+            "memory": self.memory.get_stats(),
+            "persistent": self.persistent.get_stats(),
+        }
+
+    def close(self) -> None:
+        self.memory.close()
+        self.persistent.close()
+
+    def __len__(self) -> int:
+        return len(self.memory)
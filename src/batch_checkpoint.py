@@ -0,0 +1,299 @@
+"""
+Batch Job Checkpoints
+Durable progress records for batch search jobs so an interrupted run can be
+resumed without repeating completed requests
+"""
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Item states
+PENDING = "pending"
+DONE = "done"
+FAILED = "failed"
+
+
+class BatchCheckpointStore:
+    """Batch job state kept in a SQLite database file
+
+    Each job stores its settings plus one row per identifier with its state
+    (pending/done/failed), a JSON reference to the saved results (the APNs
+    written to the database) and the last error. Item updates are buffered
+    and written in one transaction per flush_size records or flush_interval
+    seconds, so checkpointing costs a commit per batch rather than per
+    request. A crash loses at most the unflushed tail, which is repeated on
+    resume.
+    """
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS batch_jobs (
+            job_id TEXT PRIMARY KEY,
+            search_type TEXT NOT NULL,
+            settings TEXT NOT NULL,
+            status TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS batch_job_items (
+            job_id TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            identifier TEXT NOT NULL,
+            state TEXT NOT NULL,
+            result_ref TEXT,
+            error TEXT,
+            retry_count INTEGER NOT NULL DEFAULT 0,
+            completed_at REAL,
+            PRIMARY KEY (job_id, identifier)
+        )
+        """,
+    )
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        flush_size: int = 200,
+        flush_interval: Optional[float] = 1.0,
+        busy_timeout_ms: int = 5000,
+    ):
+        self.db_path = Path(db_path)
+        self.flush_size = flush_size
+        self.busy_timeout_ms = busy_timeout_ms
+
+        self._conn_lock = threading.Lock()
+        self._buffer_lock = threading.Lock()
+        self._buffer: List[tuple] = []
+
+        # Statistics
+        self.flushes = 0
+        self.items_written = 0
+        self.errors = 0
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=busy_timeout_ms / 1000.0,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            for statement in self.SCHEMA:
+                self._conn.execute(statement)
+
+        # Background flusher for buffered item updates
+        self._stop_event = threading.Event()
+        self._flusher = None
+        if flush_interval:
+            self._flusher = threading.Thread(
+                target=self._flush_loop,
+                args=(flush_interval,),
+                name="BatchCheckpointFlusher",
+                daemon=True,
+            )
+            self._flusher.start()
+
+        logger.info(f"Batch checkpoint store opened: {self.db_path}")
+
+    def create_job(
+        self,
+        job_id: str,
+        search_type: str,
+        identifiers: List[str],
+        settings: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record a new job with every identifier pending"""
+        now = time.time()
+        with self._conn_lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO batch_jobs VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, search_type, json.dumps(settings or {}), PENDING, now, now),
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO batch_job_items "
+                "(job_id, position, identifier, state) VALUES (?, ?, ?, ?)",
+                (
+                    (job_id, position, identifier, PENDING)
+                    for position, identifier in enumerate(identifiers)
+                ),
+            )
+
+    def record(
+        self,
+        job_id: str,
+        identifier: str,
+        state: str,
+        result_ref: Optional[List[str]] = None,
+        error: Optional[str] = None,
+        retry_count: int = 0,
+    ) -> None:
+        """Buffer an item update; written on the next flush"""
+        update = (
+            state,
+            json.dumps(result_ref) if result_ref is not None else None,
+            error,
+            retry_count,
+            time.time() if state != PENDING else None,
+            job_id,
+            identifier,
+        )
+        with self._buffer_lock:
+            self._buffer.append(update)
+            full = len(self._buffer) >= self.flush_size
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write buffered item updates in a single transaction"""
+        with self._buffer_lock:
+            pending, self._buffer = self._buffer, []
+        if not pending:
+            return 0
+
+        try:
+            with self._conn_lock, self._conn:
+                self._conn.executemany(
+                    """
+                    UPDATE batch_job_items
+                    SET state = ?, result_ref = ?, error = ?, retry_count = ?,
+                        completed_at = ?
+                    WHERE job_id = ? AND identifier = ?
+                    """,
+                    pending,
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Batch checkpoint flush failed: {e}")
+            self.errors += 1
+            # Keep the updates for the next attempt
+            with self._buffer_lock:
+                self._buffer = pending + self._buffer
+            return 0
+
+        self.flushes += 1
+        self.items_written += len(pending)
+        return len(pending)
+
+    def _flush_loop(self, interval: float):
+        """Background thread to flush buffered updates"""
+        while not self._stop_event.wait(interval):
+            self.flush()
+
+    def set_status(self, job_id: str, status: str) -> None:
+        """Flush pending item updates and record the job status"""
+        self.flush()
+        try:
+            with self._conn_lock, self._conn:
+                self._conn.execute(
+                    "UPDATE batch_jobs SET status = ?, updated_at = ? WHERE job_id = ?",
+                    (status, time.time(), job_id),
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Failed to record status of batch job {job_id}: {e}")
+            self.errors += 1
+
+    def load_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Job settings, status and items in submission order, or None"""
+        self.flush()
+        with self._conn_lock:
+            job = self._conn.execute(
+                "SELECT search_type, settings, status, created_at FROM batch_jobs "
+                "WHERE job_id = ?",
+                (job_id,),
+            ).fetchone()
+            if job is None:
+                return None
+            rows = self._conn.execute(
+                """
+                SELECT identifier, state, result_ref, error, retry_count, completed_at
+                FROM batch_job_items WHERE job_id = ? ORDER BY position
+                """,
+                (job_id,),
+            ).fetchall()
+
+        search_type, settings, status, created_at = job
+        return {
+            "job_id": job_id,
+            "search_type": search_type,
+            "settings": json.loads(settings),
+            "status": status,
+            "created_at": created_at,
+            "items": [
+                {
+                    "identifier": row[0],
+                    "state": row[1],
+                    "result_ref": json.loads(row[2]) if row[2] else None,
+                    "error": row[3],
+                    "retry_count": row[4],
+                    "completed_at": row[5],
+                }
+                for row in rows
+            ],
+        }
+
+    def list_jobs(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Jobs with per-state item counts, newest first"""
+        self.flush()
+        query = """
+            SELECT j.job_id, j.search_type, j.status, j.updated_at,
+                   SUM(i.state = 'pending'), SUM(i.state = 'done'),
+                   SUM(i.state = 'failed')
+            FROM batch_jobs j LEFT JOIN batch_job_items i ON i.job_id = j.job_id
+        """
+        params: tuple = ()
+        if status:
+            query += " WHERE j.status = ?"
+            params = (status,)
+        query += " GROUP BY j.job_id ORDER BY j.updated_at DESC"
+
+        with self._conn_lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [
+            {
+                "job_id": row[0],
+                "search_type": row[1],
+                "status": row[2],
+                "updated_at": row[3],
+                "pending": row[4] or 0,
+                "done": row[5] or 0,
+                "failed": row[6] or 0,
+            }
+            for row in rows
+        ]
+
+    def delete_job(self, job_id: str) -> bool:
+        self.flush()
+        with self._conn_lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM batch_job_items WHERE job_id = ?", (job_id,)
+            )
+            cursor = self._conn.execute(
+                "DELETE FROM batch_jobs WHERE job_id = ?", (job_id,)
+            )
+        return cursor.rowcount > 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._buffer_lock:
+            buffered = len(self._buffer)
+        return {
+            "db_path": str(self.db_path),
+            "buffered_updates": buffered,
+            "flushes": self.flushes,
+            "items_written": self.items_written,
+            "errors": self.errors,
+        }
+
+    def close(self) -> None:
+        self._stop_event.set()
+        if self._flusher and self._flusher.is_alive():
+            self._flusher.join(timeout=1.0)
+        self.flush()
+        with self._conn_lock:
+            self._conn.close()
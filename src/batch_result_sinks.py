@@ -0,0 +1,101 @@
+"""
+Batch Result Sinks
+Destinations that batch search results are streamed into as each request
+completes, instead of being held in memory until the job ends
+"""
+import csv
+import json
+import logging
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class ResultSink(ABC):
+    """Destination for completed batch request entries
+
+    Entries are the dicts returned by BatchSearchEngine.get_job_results.
+    write() is called from the engine's worker threads, and the engine closes
+    the sink when the job finishes.
+    """
+
+    @abstractmethod
+    def write(self, entry: Dict[str, Any]) -> None:
+        """Write one completed entry"""
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class JsonLinesResultSink(ResultSink):
+    """Append each entry to a JSON lines file"""
+
+    def __init__(self, path: Union[str, Path], include_result: bool = True):
+        self.path = Path(path)
+        self.include_result = include_result
+        self.count = 0
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def write(self, entry: Dict[str, Any]) -> None:
+        if not self.include_result:
+            entry = {key: value for key, value in entry.items() if key != "result"}
+        line = json.dumps(entry, default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self.count += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class CsvResultSink(ResultSink):
+    """Append one CSV row per entry: status columns plus the saved APNs
+
+    The header is written only to a new or empty file, so a resumed job adds
+    to the rows of its earlier runs.
+    """
+
+    COLUMNS = [
+        "identifier",
+        "search_type",
+        "success",
+        "error",
+        "retry_count",
+        "completed_at",
+        "result_ref",
+    ]
+
+    def __init__(self, path: Union[str, Path], columns: Optional[List[str]] = None):
+        self.path = Path(path)
+        self.columns = columns or self.COLUMNS
+        self.count = 0
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        if self._file.tell() == 0:
+            self._writer.writerow(self.columns)
+
+    def write(self, entry: Dict[str, Any]) -> None:
+        row = []
+        for column in self.columns:
+            value = entry.get(column)
+            if isinstance(value, list):
+                value = ";".join(str(item) for item in value)
+            row.append("" if value is None else value)
+        with self._lock:
+            self._writer.writerow(row)
+            self.count += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
@@ -21,6 +21,10 @@ from PyQt5.QtCore import QObject, QThread, pyqtSignal
 from logging_config import get_logger, get_performance_logger
 
 # MIGRATED: from api_client import MaricopaAPIClient  # → from src.api_client_unified import UnifiedMaricopaAPIClient
+from src.adaptive_concurrency import AdaptiveConcurrencyLimiter, is_rate_limit_error
+from src.batch_checkpoint import DONE, FAILED, PENDING, BatchCheckpointStore
+from src.batch_result_sinks import ResultSink
+from src.work_scheduler import Resource, WorkScheduler, get_work_scheduler
 # MIGRATED: from database_manager import DatabaseManager  # → from src.threadsafe_database_manager import ThreadSafeDatabaseManager
 from src.api_client_unified import UnifiedMaricopaAPIClient
 from src.threadsafe_database_manager import ThreadSafeDatabaseManager
@@ -28,6 +32,9 @@ from src.threadsafe_database_manager import ThreadSafeDatabaseManager
 logger = get_logger(__name__)
 perf_logger = get_performance_logger(__name__)
 
+# Marks the end of a job's result stream
+_STREAM_END = object()
+
 
 class SearchMode(Enum):
     """Batch search execution modes"""
@@ -35,6 +42,7 @@ class SearchMode(Enum):
     PARALLEL = "parallel"  # Full parallel execution
     SEQUENTIAL = "sequential"  # One at a time
     HYBRID = "hybrid"  # Mixed approach based on load
+    ADAPTIVE = "adaptive"  # Concurrency tuned from latency, errors and 429s
 
 
 class BatchPriority(Enum):
@@ -60,6 +68,12 @@ class BatchSearchRequest:
     error: Optional[str] = None
     retry_count: int = 0
     max_retries: int = 3
+    job_id: Optional[str] = None
+    result_ref: Optional[List[str]] = None  # APNs saved for a checkpointed result
+    @property
+    def succeeded(self) -> bool:
+        """Result available now or saved by an earlier run of the job"""
+        return self.result is not None or self.result_ref is not None
     def __hash__(self):
         return hash((self.identifier, self.search_type))
     def __eq__(self, other):
@@ -87,6 +101,17 @@ class BatchSearchJob:
     completed_at: Optional[datetime] = None
     progress: float = 0.0
     status: str = "pending"
+    # Streaming delivery: completed entries go to the sink and/or a bounded
+    # queue read by iter_job_results; without retain_results the full result
+    # is dropped once delivered and only its APN references are kept
+    result_sink: Optional[ResultSink] = None
+    result_stream: Optional[queue.Queue] = None
+    retain_results: bool = True
+    # Progress callbacks fire at most once per interval (seconds)
+    progress_interval: float = 0.5
+    last_progress_at: float = 0.0
+    # Set in ADAPTIVE mode
+    concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None
 
 
 class RateLimiter:
@@ -217,6 +242,9 @@ class BatchSearchEngine:
         web_scraper=None,
         max_concurrent_jobs: int = 3,
         max_concurrent_per_job: int = 5,
+        checkpoint_store: Optional[BatchCheckpointStore] = None,
+        checkpoint_path: Optional[str] = None,
+        scheduler: Optional[WorkScheduler] = None,
     ):
 
         logger.info("Initializing Batch Search Engine")
@@ -227,11 +255,13 @@ class BatchSearchEngine:
         self.max_concurrent_jobs = max_concurrent_jobs
         self.max_concurrent_per_job = max_concurrent_per_job
 
-        # Thread pool for batch operations
+        # Thread pool for job coordinators; the requests themselves run on the
+        # shared work scheduler, tagged with their job and priority
         self.executor = ThreadPoolExecutor(
             max_workers=max_concurrent_jobs * max_concurrent_per_job,
             thread_name_prefix="BatchSearch",
         )
+        self.scheduler = scheduler or get_work_scheduler()
 
         # Rate limiting and connection management
         self.rate_limiter = RateLimiter(
@@ -245,6 +275,18 @@ class BatchSearchEngine:
         self.jobs_lock = RLock()
         self.shutdown_event = Event()
 
+        # Optional durable job checkpoints so interrupted jobs can be resumed
+        self._owns_checkpoint_store = False
+        if checkpoint_store is None and checkpoint_path:
+            try:
+                checkpoint_store = BatchCheckpointStore(checkpoint_path)
+                self._owns_checkpoint_store = True
+            except Exception as e:
+                logger.warning(
+                    f"Batch checkpoints unavailable at {checkpoint_path}: {e}"
+                )
+        self.checkpoint_store = checkpoint_store
+
         # Performance tracking
         self.total_requests_processed = 0
         self.total_successful_requests = 0
@@ -269,6 +311,11 @@ class BatchSearchEngine:
         max_concurrent: int = None,
         timeout_per_request: float = 30.0,
         callback: Callable = None,
+        result_sink: Optional[ResultSink] = None,
+        stream_results: bool = False,
+        stream_buffer: int = 256,
+        retain_results: bool = True,
+        progress_interval: float = 0.5,
     ) -> str:
         """
         Submit a batch search job
@@ -281,6 +328,11 @@ class BatchSearchEngine:
             max_concurrent: Override default concurrency
             timeout_per_request: Timeout per individual request
             callback: Callback function for progress updates
+            result_sink: Sink each completed entry is written to; closed with the job
+            stream_results: Deliver entries through iter_job_results
+            stream_buffer: Entries buffered before workers wait for the consumer
+            retain_results: Keep full results for get_job_results
+            progress_interval: Minimum seconds between progress callbacks
 
         Returns:
             job_id for tracking the batch job
@@ -294,7 +346,10 @@ class BatchSearchEngine:
         for identifier in identifiers:
             if identifier and identifier not in seen:
                 request = BatchSearchRequest(
-                    identifier=identifier, search_type=search_type, priority=priority
+                    identifier=identifier,
+                    search_type=search_type,
+                    priority=priority,
+                    job_id=job_id,
                 )
                 requests.append(request)
                 seen.add(identifier)
@@ -310,16 +365,35 @@ class BatchSearchEngine:
             max_concurrent=max_concurrent or self.max_concurrent_per_job,
             timeout_per_request=timeout_per_request,
             callback=callback,
+            result_sink=result_sink,
+            result_stream=(
+                queue.Queue(maxsize=stream_buffer) if stream_results else None
+            ),
+            retain_results=retain_results,
+            progress_interval=progress_interval,
         )
 
-        # Store and start job
-        with self.jobs_lock:
-            self.active_jobs[job_id] = batch_job
-            self.job_futures[job_id] = []
+        if self.checkpoint_store:
+            try:
+                self.checkpoint_store.create_job(
+                    job_id,
+                    search_type,
+                    [request.identifier for request in requests],
+                    {
+                        "mode": mode.value,
+                        "priority": priority.value,
+                        "max_concurrent": batch_job.max_concurrent,
+                        "timeout_per_request": timeout_per_request,
+                        "stream_results": stream_results,
+                        "stream_buffer": stream_buffer,
+                        "retain_results": retain_results,
+                        "progress_interval": progress_interval,
+                    },
+                )
+            except Exception as e:
+                logger.warning(f"Failed to checkpoint batch job {job_id}: {e}")
 
-        # Submit job for execution
-        future = self.executor.submit(self._execute_batch_job, batch_job)
-        self.job_futures[job_id].append(future)
+        self._start_job(batch_job)
 
         logger.info(
             f"Submitted batch job {job_id}: {len(requests)} requests "
@@ -327,14 +401,259 @@ class BatchSearchEngine:
         )
 
         return job_id
+    def _start_job(self, batch_job: BatchSearchJob):
+        """Store a job and submit it for execution"""
+        job_id = batch_job.job_id
+        with self.jobs_lock:
+            self.active_jobs[job_id] = batch_job
+            # Submitted under the lock so a fast job cannot finish and drop
+            # its futures entry before the future is recorded
+            future = self.executor.submit(self._execute_batch_job, batch_job)
+            self.job_futures[job_id] = [future]
+    def resume_batch(
+        self,
+        job_id: str,
+        callback: Callable = None,
+        retry_failed: bool = True,
+        result_sink: Optional[ResultSink] = None,
+        stream_results: Optional[bool] = None,
+        stream_buffer: Optional[int] = None,
+        retain_results: Optional[bool] = None,
+        progress_interval: Optional[float] = None,
+    ) -> str:
+        """
+        Resume a checkpointed batch job, skipping requests already completed
+
+        Delivery options left as None fall back to the settings the job was
+        submitted with. Sinks are not checkpointed: pass one to keep writing
+        results, e.g. a CsvResultSink on the same path appends to it.
+
+        Args:
+            job_id: Job to resume, as returned by submit_batch_search
+            callback: Callback function for progress updates
+            retry_failed: Run requests that failed in earlier runs again
+            result_sink: Sink each newly completed entry is written to
+            stream_results: Deliver entries through iter_job_results
+            stream_buffer: Entries buffered before workers wait for the consumer
+            retain_results: Keep full results for get_job_results
+            progress_interval: Minimum seconds between progress callbacks
+
+        Returns:
+            job_id for tracking the batch job
+        """
+        with self.jobs_lock:
+            running = self.active_jobs.get(job_id)
+            if running and running.status in ("pending", "running"):
+                logger.info(f"Batch job {job_id} is already running")
+                return job_id
+
+        if not self.checkpoint_store:
+            raise ValueError("Batch checkpoints are not enabled")
+
+        checkpoint = self.checkpoint_store.load_job(job_id)
+        if checkpoint is None:
+            raise ValueError(f"No checkpoint found for batch job {job_id}")
+
+        settings = checkpoint["settings"]
+        priority = BatchPriority(settings.get("priority", BatchPriority.NORMAL.value))
+        if stream_results is None:
+            stream_results = settings.get("stream_results", False)
+        if stream_buffer is None:
+            stream_buffer = settings.get("stream_buffer", 256)
+        if retain_results is None:
+            retain_results = settings.get("retain_results", True)
+        if progress_interval is None:
+            progress_interval = settings.get("progress_interval", 0.5)
+        requests = []
+        skipped = 0
+        for item in checkpoint["items"]:
+            request = BatchSearchRequest(
+                identifier=item["identifier"],
+                search_type=checkpoint["search_type"],
+                priority=priority,
+                job_id=job_id,
+                retry_count=item["retry_count"],
+            )
+            finished = item["state"] == DONE or (
+                item["state"] == FAILED and not retry_failed
+            )
+            if finished:
+                request.completed_at = (
+                    datetime.fromtimestamp(item["completed_at"])
+                    if item["completed_at"]
+                    else datetime.now()
+                )
+                request.result_ref = item["result_ref"]
+                request.error = item["error"]
+                skipped += 1
+            requests.append(request)
+
+        batch_job = BatchSearchJob(
+            job_id=job_id,
+            requests=requests,
+            mode=SearchMode(settings.get("mode", SearchMode.HYBRID.value)),
+            max_concurrent=settings.get("max_concurrent", self.max_concurrent_per_job),
+            timeout_per_request=settings.get("timeout_per_request", 30.0),
+            callback=callback,
+            result_sink=result_sink,
+            result_stream=(
+                queue.Queue(maxsize=stream_buffer) if stream_results else None
+            ),
+            retain_results=retain_results,
+            progress_interval=progress_interval,
+        )
+        batch_job.progress = skipped / len(requests) * 100 if requests else 100.0
+        self._start_job(batch_job)
+
+        logger.info(
+            f"Resumed batch job {job_id}: {len(requests) - skipped} of "
+            f"{len(requests)} requests remaining"
+        )
+        return job_id
+    def _checkpoint_request(self, request: BatchSearchRequest):
+        """Queue a finished request's state for the next checkpoint flush"""
+        if not self.checkpoint_store or not request.job_id:
+            return
+
+        try:
+            self.checkpoint_store.record(
+                request.job_id,
+                request.identifier,
+                FAILED if request.error else DONE,
+                result_ref=request.result_ref,
+                error=request.error,
+                retry_count=request.retry_count,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to checkpoint {request.identifier}: {e}")
+    def _finish_request(self, request: BatchSearchRequest):
+        """Checkpoint a finished request and stream it to the job's consumers"""
+        result = request.result
+        if isinstance(result, dict):
+            request.result_ref = [result.get("apn") or request.identifier]
+        elif isinstance(result, list):
+            request.result_ref = [
+                item["apn"]
+                for item in result
+                if isinstance(item, dict) and item.get("apn")
+            ]
+
+        self._checkpoint_request(request)
+
+        with self.jobs_lock:
+            batch_job = self.active_jobs.get(request.job_id)
+        if batch_job is None:
+            return
+
+        if batch_job.result_sink or batch_job.result_stream:
+            entry = self._result_entry(request)
+            if batch_job.result_sink:
+                try:
+                    batch_job.result_sink.write(entry)
+                except Exception as e:
+                    logger.error(
+                        f"Result sink write failed for {request.identifier}: {e}"
+                    )
+            if batch_job.result_stream:
+                self._put_stream(batch_job, entry)
+
+        if not batch_job.retain_results:
+            request.result = None
+    def _put_stream(self, batch_job: BatchSearchJob, item: Any):
+        """Queue an item for the stream consumer, waiting while the buffer is full"""
+        while True:
+            try:
+                batch_job.result_stream.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                if not (
+                    self.shutdown_event.is_set() or batch_job.status == "cancelled"
+                ):
+                    continue
+                if item is not _STREAM_END:
+                    logger.warning(
+                        f"Dropping streamed result for {batch_job.job_id}: "
+                        f"consumer not reading"
+                    )
+                    return
+                # The end marker must always arrive or the consumer waits
+                # forever, so discard unread entries to make room for it
+                try:
+                    batch_job.result_stream.get_nowait()
+                except queue.Empty:
+                    pass
+    def _finish_delivery(self, batch_job: BatchSearchJob):
+        """Close the job's sink and end its result stream"""
+        if batch_job.result_sink:
+            try:
+                batch_job.result_sink.close()
+            except Exception as e:
+                logger.error(f"Error closing result sink for {batch_job.job_id}: {e}")
+        if batch_job.result_stream:
+            self._put_stream(batch_job, _STREAM_END)
+    def iter_job_results(self, job_id: str, timeout: Optional[float] = None):
+        """
+        Yield result entries of a streaming job as requests complete
+
+        The job must be submitted with stream_results=True. Its buffer is
+        bounded, so a slow consumer holds back the workers rather than
+        letting results pile up in memory.
+
+        Args:
+            job_id: Job to read
+            timeout: Maximum seconds to wait for the next entry
+        """
+        with self.jobs_lock:
+            batch_job = self.active_jobs.get(job_id)
+        if batch_job is None or batch_job.result_stream is None:
+            raise ValueError(f"Batch job {job_id} is not streaming results")
+
+        while True:
+            try:
+                entry = batch_job.result_stream.get(timeout=timeout)
+            except queue.Empty:
+                raise TimeoutError(
+                    f"No result from batch job {job_id} within {timeout} seconds"
+                )
+            if entry is _STREAM_END:
+                return
+            yield entry
+    def _notify_progress(self, batch_job: BatchSearchJob, force: bool = False):
+        """Invoke the progress callback, at most once per progress_interval"""
+        if not batch_job.callback:
+            return
+        now = time.monotonic()
+        if not force and now - batch_job.last_progress_at < batch_job.progress_interval:
+            return
+        batch_job.last_progress_at = now
+        try:
+            batch_job.callback(batch_job)
+        except Exception as e:
+            logger.error(f"Error in batch job callback: {e}")
+    def _checkpoint_status(self, job_id: str, status: str):
+        if not self.checkpoint_store:
+            return
+        try:
+            self.checkpoint_store.set_status(job_id, status)
+        except Exception as e:
+            logger.warning(f"Failed to checkpoint status of batch job {job_id}: {e}")
     def _execute_batch_job(self, batch_job: BatchSearchJob):
         """Execute a complete batch job"""
         job_id = batch_job.job_id
         start_time = time.time()
+        delivered = False
 
-    try:
+        try:
             batch_job.started_at = datetime.now()
             batch_job.status = "running"
+            self._checkpoint_status(job_id, "running")
+
+            # Requests restored as finished from a checkpoint are not re-run
+            restored = [
+                req for req in batch_job.requests if req.completed_at is not None
+            ]
+            restored_count = len(restored)
+            restored_successes = sum(1 for req in restored if req.succeeded)
 
             logger.info(
                 f"Executing batch job {job_id} with {len(batch_job.requests)} requests"
@@ -344,6 +663,8 @@ class BatchSearchEngine:
                 self._execute_sequential(batch_job)
             elif batch_job.mode == SearchMode.PARALLEL:
                 self._execute_parallel(batch_job)
+            elif batch_job.mode == SearchMode.ADAPTIVE:
+                self._execute_adaptive(batch_job)
             else:  # HYBRID
                 self._execute_hybrid(batch_job)
 
@@ -351,23 +672,37 @@ class BatchSearchEngine:
             completed_count = sum(
                 1 for req in batch_job.requests if req.completed_at is not None
             )
-            successful_count = sum(
-                1 for req in batch_job.requests if req.result is not None
-            )
+            successful_count = sum(1 for req in batch_job.requests if req.succeeded)
             error_count = sum(1 for req in batch_job.requests if req.error is not None)
 
-            batch_job.completed_at = datetime.now()
-            batch_job.status = "completed"
-            batch_job.progress = 100.0
-
             execution_time = time.time() - start_time
 
-            # Update global statistics
+            if self.shutdown_event.is_set() or batch_job.status == "cancelled":
+                # Leave the checkpoint resumable
+                logger.info(
+                    f"Batch job {job_id} stopped after {completed_count}/"
+                    f"{len(batch_job.requests)} requests"
+                )
+                if self.checkpoint_store:
+                    self.checkpoint_store.flush()
+                return
+
+            # Flush the sink before the job reports completed so readers of
+            # the status never see a partially written result file
+            self._finish_delivery(batch_job)
+            delivered = True
+
+            # Update global statistics with only the requests run this time
             with self.stats_lock:
-                self.total_requests_processed += len(batch_job.requests)
-                self.total_successful_requests += successful_count
+                self.total_requests_processed += len(batch_job.requests) - restored_count
+                self.total_successful_requests += successful_count - restored_successes
                 self.total_processing_time += execution_time
 
+            batch_job.completed_at = datetime.now()
+            batch_job.status = "completed"
+            batch_job.progress = 100.0
+            self._checkpoint_status(job_id, "completed")
+
             logger.info(
                 f"Batch job {job_id} completed in {execution_time:.2f}s - "
                 f"Processed: {completed_count}/{len(batch_job.requests)}, "
@@ -376,18 +711,18 @@ class BatchSearchEngine:
             )
 
             # Final callback
-            if batch_job.callback:
-    try:
-                    batch_job.callback(batch_job)
-    except Exception as e:
-                    logger.error(f"Error in batch job callback: {e}")
+            self._notify_progress(batch_job, force=True)
 
-    except Exception as e:
+        except Exception as e:
             batch_job.status = "failed"
+            self._checkpoint_status(job_id, "failed")
             logger.error(f"Batch job {job_id} failed: {e}")
             raise
 
-    finally:
+        finally:
+            if not delivered:
+                self._finish_delivery(batch_job)
+
             # Cleanup
             with self.jobs_lock:
                 if job_id in self.job_futures:
@@ -405,13 +740,18 @@ class BatchSearchEngine:
             # Update progress
             batch_job.progress = (i + 1) / len(batch_job.requests) * 100
 
-            if batch_job.callback:
-                batch_job.callback(batch_job)
+            self._notify_progress(batch_job)
     def _execute_parallel(self, batch_job: BatchSearchJob):
         """Execute batch job in full parallel mode"""
         logger.debug(f"Executing batch job {batch_job.job_id} in PARALLEL mode")
 
-        with ThreadPoolExecutor(max_workers=batch_job.max_concurrent) as executor:
+        priority = batch_job.requests[0].priority if batch_job.requests else None
+        with self.scheduler.executor_for(
+            Resource.GENERAL,
+            priority=priority,
+            job_id=batch_job.job_id,
+            max_workers=batch_job.max_concurrent,
+        ) as executor:
             # Submit all requests
             future_to_request = {}
             for request in batch_job.requests:
@@ -426,11 +766,74 @@ class BatchSearchEngine:
                 completed += 1
                 batch_job.progress = completed / len(batch_job.requests) * 100
 
-                if batch_job.callback:
-                    batch_job.callback(batch_job)
+                self._notify_progress(batch_job)
+
+                if self.shutdown_event.is_set():
+                    break
+    def _execute_adaptive(self, batch_job: BatchSearchJob):
+        """Execute batch job with in-flight requests tuned by an AIMD limiter"""
+        logger.debug(f"Executing batch job {batch_job.job_id} in ADAPTIVE mode")
+
+        # Finds its own limit (max_concurrent is not used) and also backs off
+        # on 429s and throttling seen by the API client's AdaptiveRateLimiter.
+        # Capped at the GENERAL budget: beyond it, extra requests only wait in
+        # the scheduler queue, which the measured latency does not include.
+        limiter = AdaptiveConcurrencyLimiter(
+            max_limit=self.scheduler.budget_for(Resource.GENERAL),
+            rate_limiter=getattr(self.api_client, "rate_limiter", None),
+        )
+        batch_job.concurrency_limiter = limiter
+
+        priority = batch_job.requests[0].priority if batch_job.requests else None
+        pending: Set[Future] = set()
+        completed = 0
+        with self.scheduler.executor_for(
+            Resource.GENERAL, priority=priority, job_id=batch_job.job_id
+        ) as executor:
+            for request in batch_job.requests:
+                acquired = False
+                while not acquired and not self.shutdown_event.is_set():
+                    acquired = limiter.acquire(timeout=0.2)
+                    completed = self._reap_finished(batch_job, pending, completed)
+                if not acquired:
+                    break
+                pending.add(
+                    executor.submit(self._execute_limited_request, request, limiter)
+                )
+
+            for future in as_completed(pending, timeout=batch_job.total_timeout):
+                completed += 1
+                batch_job.progress = completed / len(batch_job.requests) * 100
+
+                self._notify_progress(batch_job)
 
                 if self.shutdown_event.is_set():
                     break
+
+        logger.info(
+            f"Batch job {batch_job.job_id} adaptive concurrency: "
+            f"final limit {limiter.limit}, {limiter.increases} increases, "
+            f"{limiter.decreases} decreases"
+        )
+    def _reap_finished(
+        self, batch_job: BatchSearchJob, pending: Set[Future], completed: int
+    ) -> int:
+        """Drop finished futures from pending and report progress"""
+        done = {future for future in pending if future.done()}
+        if done:
+            pending -= done
+            completed += len(done)
+            batch_job.progress = completed / len(batch_job.requests) * 100
+            self._notify_progress(batch_job)
+        return completed
+    def _execute_limited_request(
+        self, request: BatchSearchRequest, limiter: AdaptiveConcurrencyLimiter
+    ):
+        """Execute a request holding one of the limiter's in-flight slots"""
+        try:
+            self._execute_single_request(request, concurrency=limiter)
+        finally:
+            limiter.release()
     def _execute_hybrid(self, batch_job: BatchSearchJob):
         """Execute batch job using hybrid approach"""
         logger.debug(f"Executing batch job {batch_job.job_id} in HYBRID mode")
@@ -456,35 +859,44 @@ class BatchSearchEngine:
         if high_priority:
             logger.debug(f"Processing {len(high_priority)} high priority requests")
             completed += self._execute_batch_subset(
-                high_priority, batch_job.max_concurrent
+                high_priority, batch_job.max_concurrent, batch_job.job_id
             )
             batch_job.progress = completed / total_requests * 100
-            if batch_job.callback:
-                batch_job.callback(batch_job)
+            self._notify_progress(batch_job)
 
         # Execute normal priority with reduced concurrency
         if normal_priority and not self.shutdown_event.is_set():
             logger.debug(f"Processing {len(normal_priority)} normal priority requests")
             concurrency = max(1, batch_job.max_concurrent // 2)
-            completed += self._execute_batch_subset(normal_priority, concurrency)
+            completed += self._execute_batch_subset(
+                normal_priority, concurrency, batch_job.job_id
+            )
             batch_job.progress = completed / total_requests * 100
-            if batch_job.callback:
-                batch_job.callback(batch_job)
+            self._notify_progress(batch_job)
 
         # Execute low priority with minimal concurrency
         if low_priority and not self.shutdown_event.is_set():
             logger.debug(f"Processing {len(low_priority)} low priority requests")
-            completed += self._execute_batch_subset(low_priority, 1)
+            completed += self._execute_batch_subset(
+                low_priority, 1, batch_job.job_id
+            )
             batch_job.progress = completed / total_requests * 100
-            if batch_job.callback:
-                batch_job.callback(batch_job)
+            self._notify_progress(batch_job)
     def _execute_batch_subset(
-        self, requests: List[BatchSearchRequest], max_workers: int
+        self,
+        requests: List[BatchSearchRequest],
+        max_workers: int,
+        job_id: Optional[str] = None,
     ) -> int:
         """Execute a subset of requests with specified concurrency"""
         completed_count = 0
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        with self.scheduler.executor_for(
+            Resource.GENERAL,
+            priority=requests[0].priority,
+            job_id=job_id,
+            max_workers=max_workers,
+        ) as executor:
             future_to_request = {}
             for request in requests:
                 future = executor.submit(self._execute_single_request, request)
@@ -498,26 +910,37 @@ class BatchSearchEngine:
                     break
 
         return completed_count
-    def _execute_single_request(self, request: BatchSearchRequest):
-        """Execute a single search request with error handling and retries"""
+    def _execute_single_request(
+        self,
+        request: BatchSearchRequest,
+        concurrency: Optional[AdaptiveConcurrencyLimiter] = None,
+    ):
+        """Execute a single search request with error handling and retries
+
+        With a concurrency limiter, each attempt's API call latency and
+        outcome is recorded on it.
+        """
+        if request.completed_at is not None:
+            return  # Completed in an earlier run of a resumed job
+
         request.started_at = datetime.now()
         logger.debug(
             f"Executing {request.search_type} search for: {request.identifier}"
         )
 
         for attempt in range(request.max_retries + 1):
-    try:
+            try:
                 if self.shutdown_event.is_set():
                     request.error = "Shutdown requested"
                     return
 
                 # Execute based on search type
                 if request.search_type == "apn":
-                    result = self._search_by_apn(request.identifier)
+                    result = self._search_by_apn(request.identifier, concurrency)
                 elif request.search_type == "address":
-                    result = self._search_by_address(request.identifier)
+                    result = self._search_by_address(request.identifier, concurrency)
                 elif request.search_type == "owner":
-                    result = self._search_by_owner(request.identifier)
+                    result = self._search_by_owner(request.identifier, concurrency)
                 else:
                     raise ValueError(f"Unsupported search type: {request.search_type}")
 
@@ -528,9 +951,10 @@ class BatchSearchEngine:
                 logger.debug(
                     f"Successfully completed {request.search_type} search for: {request.identifier}"
                 )
+                self._finish_request(request)
                 return
 
-    except Exception as e:
+            except Exception as e:
                 request.retry_count = attempt
                 error_msg = f"Attempt {attempt + 1} failed: {str(e)}"
 
@@ -543,15 +967,47 @@ class BatchSearchEngine:
                     logger.error(
                         f"Request failed after {request.max_retries + 1} attempts: {error_msg}"
                     )
-    def _search_by_apn(self, apn: str) -> Optional[Dict]:
+                    self._finish_request(request)
+    def _call_api(
+        self,
+        concurrency: Optional[AdaptiveConcurrencyLimiter],
+        method: Callable,
+        *args,
+        **kwargs,
+    ):
+        """Call an API client method, recording its latency on the limiter
+
+        Only the call itself is timed: waiting for a rate limiter token or
+        saving the result is not server latency and must not lower the limit.
+        """
+        if concurrency is None:
+            return method(*args, **kwargs)
+
+        start = time.monotonic()
+        try:
+            result = method(*args, **kwargs)
+        except Exception as e:
+            concurrency.record(
+                time.monotonic() - start,
+                success=False,
+                rate_limited=is_rate_limit_error(e),
+            )
+            raise
+        concurrency.record(time.monotonic() - start)
+        return result
+    def _search_by_apn(
+        self, apn: str, concurrency: Optional[AdaptiveConcurrencyLimiter] = None
+    ) -> Optional[Dict]:
         """Search for property by APN using fresh data collection"""
         # Always collect fresh data - no cache fallback
         if not self.rate_limiter.acquire_api_token():
             raise TimeoutError("Rate limit timeout for API call")
 
-    try:
+        try:
             # Get comprehensive property info with fresh data
-            result = self.api_client.get_comprehensive_property_info(apn)
+            result = self._call_api(
+                concurrency, self.api_client.get_comprehensive_property_info, apn
+            )
 
             if result:
                 # Save to database
@@ -565,16 +1021,20 @@ class BatchSearchEngine:
 
             return result
 
-    except Exception as e:
+        except Exception as e:
             logger.error(f"API search failed for APN {apn}: {e}")
             raise
-    def _search_by_address(self, address: str) -> List[Dict]:
+    def _search_by_address(
+        self, address: str, concurrency: Optional[AdaptiveConcurrencyLimiter] = None
+    ) -> List[Dict]:
         """Search for properties by address using fresh data"""
         if not self.rate_limiter.acquire_api_token():
             raise TimeoutError("Rate limit timeout for API call")
 
-    try:
-            results = self.api_client.search_by_address(address, limit=50)
+        try:
+            results = self._call_api(
+                concurrency, self.api_client.search_by_address, address, limit=50
+            )
 
             # Save all results to database
             connection = self.connection_pool.acquire_connection()
@@ -586,16 +1046,20 @@ class BatchSearchEngine:
 
             return results
 
-    except Exception as e:
+        except Exception as e:
             logger.error(f"API search failed for address {address}: {e}")
             raise
-    def _search_by_owner(self, owner_name: str) -> List[Dict]:
+    def _search_by_owner(
+        self, owner_name: str, concurrency: Optional[AdaptiveConcurrencyLimiter] = None
+    ) -> List[Dict]:
         """Search for properties by owner name using fresh data"""
         if not self.rate_limiter.acquire_api_token():
             raise TimeoutError("Rate limit timeout for API call")
 
-    try:
-            results = self.api_client.search_by_owner(owner_name, limit=50)
+        try:
+            results = self._call_api(
+                concurrency, self.api_client.search_by_owner, owner_name, limit=50
+            )
 
             # Save all results to database
             connection = self.connection_pool.acquire_connection()
@@ -607,7 +1071,7 @@ class BatchSearchEngine:
 
             return results
 
-    except Exception as e:
+        except Exception as e:
             logger.error(f"API search failed for owner {owner_name}: {e}")
             raise
     def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
@@ -621,7 +1085,7 @@ class BatchSearchEngine:
             completed_count = sum(
                 1 for req in job.requests if req.completed_at is not None
             )
-            successful_count = sum(1 for req in job.requests if req.result is not None)
+            successful_count = sum(1 for req in job.requests if req.succeeded)
             error_count = sum(1 for req in job.requests if req.error is not None)
 
             return {
@@ -638,6 +1102,11 @@ class BatchSearchEngine:
                 ),
                 "mode": job.mode.value,
                 "max_concurrent": job.max_concurrent,
+                "concurrency": (
+                    job.concurrency_limiter.get_stats()
+                    if job.concurrency_limiter
+                    else None
+                ),
             }
     def get_job_results(self, job_id: str) -> Optional[List[Dict]]:
         """Get results from completed batch job"""
@@ -649,26 +1118,26 @@ class BatchSearchEngine:
             results = []
 
             for request in job.requests:
-                result_entry = {
-                    "identifier": request.identifier,
-                    "search_type": request.search_type,
-                    "priority": request.priority.value,
-                    "started_at": (
-                        request.started_at.isoformat() if request.started_at else None
-                    ),
-                    "completed_at": (
-                        request.completed_at.isoformat()
-                        if request.completed_at
-                        else None
-                    ),
-                    "success": request.result is not None,
-                    "error": request.error,
-                    "retry_count": request.retry_count,
-                    "result": request.result,
-                }
-                results.append(result_entry)
+                results.append(self._result_entry(request))
 
             return results
+    def _result_entry(self, request: BatchSearchRequest) -> Dict[str, Any]:
+        return {
+            "identifier": request.identifier,
+            "search_type": request.search_type,
+            "priority": request.priority.value,
+            "started_at": (
+                request.started_at.isoformat() if request.started_at else None
+            ),
+            "completed_at": (
+                request.completed_at.isoformat() if request.completed_at else None
+            ),
+            "success": request.succeeded,
+            "error": request.error,
+            "retry_count": request.retry_count,
+            "result": request.result,
+            "result_ref": request.result_ref,
+        }
     def cancel_job(self, job_id: str) -> bool:
         """Cancel a running batch job"""
         with self.jobs_lock:
@@ -676,6 +1145,8 @@ class BatchSearchEngine:
                 return False
 
             job = self.active_jobs[job_id]
+            if job.status in ("pending", "running"):
+                self._checkpoint_status(job_id, "cancelled")
             job.status = "cancelled"
 
             # Cancel associated futures
@@ -709,6 +1180,9 @@ class BatchSearchEngine:
                 "api_calls_per_second": self.rate_limiter.api_calls_per_second,
                 "scraper_calls_per_second": self.rate_limiter.scraper_calls_per_second,
             },
+            "checkpoints": (
+                self.checkpoint_store.get_stats() if self.checkpoint_store else None
+            ),
         }
     def cleanup_completed_jobs(self, max_age_hours: int = 24):
         """Clean up old completed jobs"""
@@ -746,6 +1220,13 @@ class BatchSearchEngine:
         # Shutdown thread pool
         self.executor.shutdown(wait=True)
 
+        # Interrupted jobs stay resumable from their last checkpoint
+        if self.checkpoint_store:
+            if self._owns_checkpoint_store:
+                self.checkpoint_store.close()
+            else:
+                self.checkpoint_store.flush()
+
         logger.info("Batch search engine shutdown completed")
 
 
@@ -27,6 +27,7 @@ from batch_processing_manager import (
     BatchProcessingManager,
     ProcessingMode,
 )
+from src.batch_result_sinks import ResultSink
 from batch_search_engine import BatchPriority, BatchSearchEngine, SearchMode
 from logging_config import get_logger, get_performance_logger
 
@@ -114,6 +115,9 @@ class BatchSearchIntegrationManager:
         self.active_jobs: Dict[str, Any] = {}
         self.completed_jobs: Dict[str, BatchSearchSummary] = {}
         self.jobs_lock = RLock()
+        # Seconds a monitor waits for a streamed result before re-checking
+        # that its engine job is still running
+        self.stream_poll_timeout = 5.0
 
         # Performance metrics
         self.total_jobs_processed = 0
@@ -130,6 +134,8 @@ class BatchSearchIntegrationManager:
         max_concurrent: int = 3,
         enable_background_collection: bool = True,
         progress_callback: Callable = None,
+        result_sink: Optional[ResultSink] = None,
+        retain_results: bool = True,
     ) -> str:
         """
         Execute comprehensive batch search operation
@@ -141,6 +147,9 @@ class BatchSearchIntegrationManager:
             max_concurrent: Max parallel searches (1-10)
             enable_background_collection: Enable data collection after search
             progress_callback: Function to call for progress updates
+            result_sink: Sink that basic search results are streamed into
+            retain_results: Keep full result data in the job summary; when
+                False only identifiers and status are kept in memory
 
         Returns:
             job_id for tracking the operation
@@ -163,6 +172,8 @@ class BatchSearchIntegrationManager:
             "search_type": search_type,
             "max_concurrent": max_concurrent,
             "enable_background_collection": enable_background_collection,
+            "result_sink": result_sink,
+            "retain_results": retain_results,
             "start_time": start_time,
             "status": "running",
             "progress": 0.0,
@@ -209,6 +220,9 @@ class BatchSearchIntegrationManager:
             callback=lambda batch_job: self._update_job_progress(
                 job_id, batch_job, progress_callback
             ),
+            result_sink=job_info["result_sink"],
+            stream_results=True,
+            retain_results=job_info["retain_results"],
         )
 
         job_info["engine_job_id"] = engine_job_id
@@ -309,35 +323,42 @@ class BatchSearchIntegrationManager:
         job_info: Dict,
         progress_callback: Callable,
     ):
-        """Monitor basic search completion"""
-    try:
+        """Monitor basic search completion, consuming results as they stream in"""
+        try:
+            results = []
+            collected_apns = []
             while True:
-                status = self.batch_search_engine.get_job_status(engine_job_id)
-                if not status or status["status"] in [
-                    "completed",
-                    "failed",
-                    "cancelled",
-                ]:
+                try:
+                    for entry in self.batch_search_engine.iter_job_results(
+                        engine_job_id, timeout=self.stream_poll_timeout
+                    ):
+                        result = self._engine_entry_to_result(
+                            entry, job_info["search_type"]
+                        )
+                        if result.success and entry.get("result_ref"):
+                            collected_apns.extend(entry["result_ref"])
+                        if not job_info["retain_results"]:
+                            result.result_data = None
+                        results.append(result)
                     break
-                time.sleep(1.0)
+                except TimeoutError:
+                    # A completed job has already queued its end marker
+                    status = self.batch_search_engine.get_job_status(engine_job_id)
+                    if not status or status["status"] in ("failed", "cancelled"):
+                        break
 
+            status = self.batch_search_engine.get_job_status(engine_job_id)
             if status and status["status"] == "completed":
-                # Get results
-                raw_results = self.batch_search_engine.get_job_results(engine_job_id)
-                results = self._process_engine_results(
-                    raw_results, job_info["search_type"]
-                )
-
                 # Trigger background collection if enabled
-                if job_info["enable_background_collection"] and results:
-                    self._trigger_background_collection(results)
+                if job_info["enable_background_collection"] and collected_apns:
+                    self._collect_in_background(collected_apns)
 
                 self._complete_job(job_id, results, progress_callback)
             else:
                 error_msg = f"Search job failed with status: {status.get('status', 'unknown') if status else 'not found'}"
                 self._fail_job(job_id, error_msg, progress_callback)
 
-    except Exception as e:
+        except Exception as e:
             logger.error(
                 f"Error monitoring basic search completion for job {job_id}: {e}"
             )
@@ -458,19 +479,22 @@ class BatchSearchIntegrationManager:
             return results
 
         for raw_result in raw_results:
-            result = BatchSearchResult(
-                identifier=raw_result.get("identifier", ""),
-                search_type=search_type,
-                success=raw_result.get("success", False),
-                result_data=raw_result.get("result"),
-                error_message=raw_result.get("error"),
-                processing_time=0.0,  # Would need to calculate from timing data
-                api_calls_used=1 if raw_result.get("success") else 0,
-                data_sources_used=["api"] if raw_result.get("success") else [],
-            )
-            results.append(result)
+            results.append(self._engine_entry_to_result(raw_result, search_type))
 
         return results
+    def _engine_entry_to_result(
+        self, raw_result: Dict, search_type: str
+    ) -> BatchSearchResult:
+        return BatchSearchResult(
+            identifier=raw_result.get("identifier", ""),
+            search_type=search_type,
+            success=raw_result.get("success", False),
+            result_data=raw_result.get("result"),
+            error_message=raw_result.get("error"),
+            processing_time=0.0,  # Would need to calculate from timing data
+            api_calls_used=1 if raw_result.get("success") else 0,
+            data_sources_used=["api"] if raw_result.get("success") else [],
+        )
     def _process_comprehensive_results(
         self, raw_results: Dict, search_type: str
     ) -> List[BatchSearchResult]:
@@ -575,6 +599,12 @@ class BatchSearchIntegrationManager:
                             if apn:
                                 apns.append(apn)
 
+        self._collect_in_background(apns)
+    def _collect_in_background(self, apns: List[str]):
+        """Hand APNs to the background collection manager"""
+        if not self.background_manager:
+            return
+
         if apns:
             logger.info(f"Triggering background collection for {len(apns)} properties")
     try:
@@ -0,0 +1,201 @@
+"""
+Durable Collection Queue
+Work queue on the data_collection_status table, so any number of collector
+processes (GUI or headless) can drain one backlog without duplicating work
+"""
+import logging
+import os
+import random
+import socket
+import threading
+import uuid
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def retry_delay(
+    attempts: int, base: float = 30.0, cap: float = 3600.0, jitter: float = 0.2
+) -> float:
+    """Seconds before a job that has failed attempts times is retried
+
+    Exponential backoff from base, capped at cap, with up to jitter of the
+    delay taken off at random so failures from one outage spread out.
+    """
+    delay = min(cap, base * 2 ** max(0, attempts - 1))
+    return delay * (1 - jitter * random.random())
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class DurableCollectionQueue:
+    """One worker's handle on the database-backed collection queue
+
+    Claims lease APNs to this worker for lease_seconds; a heartbeat thread
+    renews held leases every lease_seconds / 3, so a lease only runs out
+    when the worker dies or hangs, after which any worker may claim the APN
+    again. Failed APNs are retried with exponential backoff until they have
+    been attempted max_attempts times. Acks and nacks are fenced on the
+    lease, so a worker that lost its lease cannot overwrite the result of
+    the worker that took the APN over.
+    """
+
+    def __init__(
+        self,
+        db_manager,
+        worker_id: Optional[str] = None,
+        lease_seconds: float = 300.0,
+        max_attempts: int = 5,
+        retry_base: float = 30.0,
+        retry_cap: float = 3600.0,
+    ):
+        self.db_manager = db_manager
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_cap = retry_cap
+
+        self._held = {}  # apn -> attempts, for leases this worker holds
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._heartbeat = None
+
+        # Counters
+        self.claimed = 0
+        self.acked = 0
+        self.retried = 0
+        self.failed = 0
+        self.leases_lost = 0
+        self.renew_errors = 0
+
+    def put(self, apn: str, priority: int = 2) -> bool:
+        """Queue an APN; lower priority values are claimed first"""
+        return self.put_many([apn], priority) > 0
+
+    def put_many(self, apns: List[str], priority: int = 2) -> int:
+        return self.db_manager.enqueue_collection(apns, priority)
+
+    def claim(self, limit: int = 1) -> List[Dict[str, Any]]:
+        """Lease up to limit APNs; rows with apn, priority and attempts"""
+        rows = self.db_manager.claim_collection_jobs(
+            self.worker_id, limit, self.lease_seconds, self.max_attempts
+        )
+        if rows:
+            with self._lock:
+                for row in rows:
+                    self._held[row["apn"]] = row["attempts"]
+                self.claimed += len(rows)
+            self._ensure_heartbeat()
+        return rows
+
+    def ack(self, apn: str) -> bool:
+        """Mark a claimed APN completed"""
+        with self._lock:
+            self._held.pop(apn, None)
+        completed = self.db_manager.complete_collection_job(apn, self.worker_id)
+        with self._lock:
+            if completed:
+                self.acked += 1
+            else:
+                self.leases_lost += 1
+        return completed
+
+    def nack(self, apn: str, error: str) -> Optional[str]:
+        """Release a claimed APN for retry, or fail it when out of attempts
+
+        Returns the APN's new status ('queued' or 'failed'), or None if the
+        lease had already been lost.
+        """
+        with self._lock:
+            attempts = self._held.pop(apn, 1)
+        status = self.db_manager.fail_collection_job(
+            apn,
+            self.worker_id,
+            error,
+            retry_delay(attempts, self.retry_base, self.retry_cap),
+            self.max_attempts,
+        )
+        with self._lock:
+            if status == "queued":
+                self.retried += 1
+            elif status == "failed":
+                self.failed += 1
+            else:
+                self.leases_lost += 1
+        return status
+
+    def held(self) -> List[str]:
+        with self._lock:
+            return list(self._held)
+
+    def _ensure_heartbeat(self):
+        with self._lock:
+            if self._heartbeat is not None or self._stop.is_set():
+                return
+            self._heartbeat = threading.Thread(
+                target=self._heartbeat_loop,
+                name=f"lease-heartbeat-{self.worker_id}",
+                daemon=True,
+            )
+            self._heartbeat.start()
+
+    def _heartbeat_loop(self):
+        while not self._stop.wait(self.lease_seconds / 3):
+            try:
+                self.renew_leases()
+            except Exception as e:
+                with self._lock:
+                    self.renew_errors += 1
+                logger.error(f"{self.worker_id} failed to renew leases: {e}")
+
+    def renew_leases(self) -> List[str]:
+        """Extend every held lease; drops (and returns) the ones lost
+
+        A failed renewal drops nothing: the leases are kept and the next
+        heartbeat tries again. APNs acked or nacked while the renewal was in
+        flight are not counted as lost.
+        """
+        held = self.held()
+        if not held:
+            return []
+        kept = self.db_manager.extend_collection_leases(
+            self.worker_id, held, self.lease_seconds
+        )
+        if kept is None:
+            with self._lock:
+                self.renew_errors += 1
+            logger.warning(f"{self.worker_id} could not renew its leases")
+            return []
+        kept = set(kept)
+        with self._lock:
+            lost = [apn for apn in held if apn not in kept and apn in self._held]
+            for apn in lost:
+                del self._held[apn]
+            self.leases_lost += len(lost)
+        if lost:
+            logger.warning(f"{self.worker_id} lost leases on {len(lost)} APNs")
+        return lost
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = {
+                "worker_id": self.worker_id,
+                "held_leases": len(self._held),
+                "claimed": self.claimed,
+                "acked": self.acked,
+                "retried": self.retried,
+                "failed": self.failed,
+                "leases_lost": self.leases_lost,
+                "renew_errors": self.renew_errors,
+            }
+        stats["queue"] = self.db_manager.get_collection_queue_stats()
+        return stats
+
+    def close(self):
+        """Stop renewing leases; unfinished APNs return once they expire"""
+        self._stop.set()
+        if self._heartbeat is not None:
+            self._heartbeat.join(timeout=5)
@@ -15,16 +15,21 @@ Key Features:
 - Comprehensive error handling
 - Full backward compatibility
 """
+import base64
+import io
 import json
 import logging
 import time
 import traceback
+import uuid
 from contextlib import contextmanager
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from threading import Lock, RLock
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import psycopg2
+import psycopg2.extensions
+from psycopg2 import errorcodes
 from psycopg2.extras import Json, RealDictCursor, execute_batch
 from psycopg2.pool import ThreadedConnectionPool
 
@@ -35,6 +40,212 @@ logger = get_logger(__name__)
 perf_logger = get_performance_logger(__name__)
 
 
+# Column layout for the COPY-based bulk ingest path. "key" is the conflict
+# target, "merge" columns use the same COALESCE semantics as the per-row
+# upserts, and "touch" columns are set to CURRENT_TIMESTAMP on write.
+BULK_INGEST_TABLES = {
+    "properties": {
+        "key": ["apn"],
+        "merge": [
+            "owner_name",
+            "property_address",
+            "mailing_address",
+            "legal_description",
+            "land_use_code",
+            "year_built",
+            "living_area_sqft",
+            "lot_size_sqft",
+            "bedrooms",
+            "bathrooms",
+            "pool",
+            "garage_spaces",
+            "raw_data",
+        ],
+        "insert_touch": ["created_at", "last_updated"],
+        "update_touch": ["last_updated"],
+        "requires_property": False,
+    },
+    "tax_history": {
+        "key": ["apn", "tax_year"],
+        "merge": [
+            "assessed_value",
+            "limited_value",
+            "tax_amount",
+            "payment_status",
+            "last_payment_date",
+            "raw_data",
+        ],
+        "insert_touch": ["created_at"],
+        "update_touch": [],
+        "requires_property": True,
+    },
+    "sales_history": {
+        "key": ["apn", "sale_date", "recording_number"],
+        "merge": ["sale_price", "seller_name", "buyer_name", "deed_type"],
+        "insert_touch": ["created_at"],
+        "update_touch": [],
+        "requires_property": True,
+    },
+}
+
+_COPY_ESCAPES = str.maketrans(
+    {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"}
+)
+
+
+def copy_text_value(value: Any) -> str:
+    """Encode a Python value as a field in PostgreSQL COPY text format"""
+    if value is None:
+        return "\\N"
+    if isinstance(value, Json):
+        value = value.adapted
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value, default=str)
+    elif isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    else:
+        value = str(value)
+    return value.translate(_COPY_ESCAPES)
+
+
+class CopyTextStream(io.TextIOBase):
+    """File-like reader that encodes rows into COPY text on demand
+
+    Pulls at most max_rows rows from the shared iterator, so a generator of
+    any length can be loaded in fixed-size COPY batches with flat memory.
+    """
+
+    def __init__(
+        self, rows: Iterator[Dict[str, Any]], columns: List[str], max_rows: int
+    ):
+        self._rows = rows
+        self._columns = columns
+        self._max_rows = max_rows
+        self._buffer = ""
+        self.row_count = 0
+        self.skipped = 0
+        self.exhausted = False
+
+    def readable(self) -> bool:
+        return True
+
+    def _next_line(self) -> Optional[str]:
+        while self.row_count < self._max_rows:
+            try:
+                row = next(self._rows)
+            except StopIteration:
+                self.exhausted = True
+                return None
+            if not row or not row.get("apn"):
+                self.skipped += 1
+                continue
+            self.row_count += 1
+            # Trailing sequence number lets the merge keep the latest duplicate
+            fields = [copy_text_value(row.get(column)) for column in self._columns]
+            fields.append(str(self.row_count))
+            return "\t".join(fields) + "\n"
+        return None
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) < size:
+            line = self._next_line()
+            if line is None:
+                break
+            self._buffer += line
+        if size < 0:
+            chunk, self._buffer = self._buffer, ""
+        else:
+            chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+
+
+# Columns searchable through the ranked trigram search (both carry pg_trgm GIN
+# indexes: idx_properties_owner / idx_properties_address)
+RANKED_SEARCH_COLUMNS = {
+    "owner": "owner_name",
+    "address": "property_address",
+}
+DEFAULT_SIMILARITY_THRESHOLD = 0.3
+
+
+def encode_search_cursor(field: str, term: str, score: float, apn: str) -> str:
+    """Encode the last row of a search page as an opaque cursor token"""
+    payload = json.dumps({"f": field, "q": term, "s": score, "a": apn})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_search_cursor(token: str, field: str, term: str) -> Tuple[float, str]:
+    """Decode a cursor token into (score, apn) for the same field and term"""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        score, apn = float(payload["s"]), str(payload["a"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid search cursor: {token}") from e
+    if payload.get("f") != field or payload.get("q") != term:
+        raise ValueError("Search cursor belongs to a different search")
+    return score, apn
+
+class StreamRecord:
+    """Lightweight row record with attribute, key and dict-style access"""
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    def keys(self) -> Tuple[str, ...]:
+        return self.__slots__
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+_record_types: Dict[Tuple[str, Tuple[str, ...]], type] = {}
+
+
+def record_type(name: str, fields: Tuple[str, ...]) -> type:
+    """Get (or create) a __slots__ record class for a result column layout"""
+    key = (name, fields)
+    cls = _record_types.get(key)
+    if cls is None:
+
+        def __init__(self, *values):
+            for field, value in zip(fields, values):
+                setattr(self, field, value)
+
+        cls = type(name, (StreamRecord,), {"__slots__": fields, "__init__": __init__})
+        _record_types[key] = cls
+    return cls
+
+# Columns iter_properties() can filter on
+STREAMABLE_PROPERTY_COLUMNS = frozenset(
+    ["apn"]
+    + BULK_INGEST_TABLES["properties"]["merge"]
+    + [
+        "last_updated",
+        "created_at",
+        "latest_tax_year",
+        "latest_assessed_value",
+        "latest_tax_amount",
+        "latest_sale_date",
+        "latest_sale_price",
+    ]
+)
+
 class UnifiedDatabaseManager:
     """
     Unified database manager with thread-safe operations and performance monitoring
@@ -74,6 +285,9 @@ def __init__(self, config_manager, min_connections=5, max_connections=20):
         self._connection_pool = None
         self.pool = None  # Alias for backward compatibility
 
+        # Cleared if the schema has no incremental property_current_view refresh
+        self._incremental_view_refresh = True
+
         # Performance tracking
         self._operation_stats = {
             "inserts": {"count": 0, "total_time": 0.0, "errors": 0},
@@ -363,77 +577,208 @@ def __init__(self, config_manager, min_connections=5, max_connections=20):
     def search_properties_by_owner(
         self, owner_name: str, limit: int = 100
     ) -> List[Dict]:
-        """Search properties by owner name with performance tracking"""
-        logger.info(f"Searching properties by owner: {owner_name} (limit: {limit})")
-        start_time = time.time()
-
-    try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-
-                sql = """
-                SELECT * FROM property_current_view
-                WHERE owner_name ILIKE %s
-                ORDER BY owner_name
-                LIMIT %s
-                """
-
-                cursor.execute(sql, (f"%{owner_name}%", limit))
-                results = [dict(row) for row in cursor.fetchall()]
-
-                duration = time.time() - start_time
-                self._record_operation_stats("selects", duration)
-
-                logger.info(f"Found {len(results)} properties for owner: {owner_name}")
-                logger.debug(
-                    f"DB_ANALYTICS: owner_search, query_time={duration:.3f}s, results={len(results)}, limit={limit}"
-                )
-
-                return results
-
-    except Exception as e:
-            duration = time.time() - start_time
-            self._record_operation_stats("selects", duration, error=True)
-            log_exception(logger, e, f"searching properties by owner: {owner_name}")
-            return []
+        """Search properties by owner name, best matches first"""
+        results, _ = self.search_properties_ranked("owner", owner_name, limit)
+        return results
 
     @perf_logger.log_database_operation("search", "properties", None)
     def search_properties_by_address(
         self, address: str, limit: int = 100
     ) -> List[Dict]:
-        """Search properties by address with performance tracking"""
-        logger.info(f"Searching properties by address: {address} (limit: {limit})")
+        """Search properties by address, best matches first"""
+        results, _ = self.search_properties_ranked("address", address, limit)
+        return results
+    def _build_ranked_search_sql(self, column: str, browse: bool, paged: bool) -> str:
+        """Build the trigram-ranked keyset query for a search column"""
+        if browse:
+            # No term to rank by - page through everything in APN order
+            score = "1.0::real"
+            where = "TRUE"
+        else:
+            # <% uses the pg_trgm GIN index with word_similarity_threshold
+            # (doubled for psycopg2 parameter formatting)
+            score = f"word_similarity(%(term)s, {column})"
+            where = f"%(term)s <%% {column}"
+
+        if paged:
+            where += (
+                f" AND ({score} < %(last_score)s::real"
+                f" OR ({score} = %(last_score)s::real AND apn > %(last_apn)s))"
+            )
+
+        return f"""
+        SELECT *, {score} AS match_score
+        FROM property_current_view
+        WHERE {where}
+        ORDER BY match_score DESC, apn
+        LIMIT %(limit)s
+        """
+    def search_properties_ranked(
+        self,
+        field: str,
+        term: str,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """Trigram-ranked, keyset-paginated owner/address search
+
+        Returns one page of results ordered by word similarity to the term,
+        and a cursor token for the next page (None on the last page).
+        """
+        if field not in RANKED_SEARCH_COLUMNS:
+            raise ValueError(f"Unsupported search field: {field}")
+        column = RANKED_SEARCH_COLUMNS[field]
+        term = (term or "").strip()
+        params = {"term": term, "limit": limit}
+        if cursor:
+            params["last_score"], params["last_apn"] = decode_search_cursor(
+                cursor, field, term
+            )
+
+        logger.info(f"Searching properties by {field}: {term} (limit: {limit})")
         start_time = time.time()
 
-    try:
+        try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-
-                sql = """
-                SELECT * FROM property_current_view
-                WHERE property_address ILIKE %s
-                ORDER BY property_address
-                LIMIT %s
-                """
+                db_cursor = conn.cursor()
 
-                cursor.execute(sql, (f"%{address}%", limit))
-                results = [dict(row) for row in cursor.fetchall()]
+                # Transaction-local threshold for the <% index condition
+                db_cursor.execute(
+                    "SELECT set_config('pg_trgm.word_similarity_threshold', %s, true)",
+                    (str(threshold),),
+                )
+                db_cursor.execute(
+                    self._build_ranked_search_sql(column, not term, bool(cursor)),
+                    params,
+                )
+                results = [dict(row) for row in db_cursor.fetchall()]
 
-                duration = time.time() - start_time
-                self._record_operation_stats("selects", duration)
+            duration = time.time() - start_time
+            self._record_operation_stats("selects", duration)
 
-                logger.info(f"Found {len(results)} properties for address: {address}")
-                logger.debug(
-                    f"DB_ANALYTICS: address_search, query_time={duration:.3f}s, results={len(results)}, limit={limit}"
+            next_cursor = None
+            if len(results) == limit:
+                last = results[-1]
+                next_cursor = encode_search_cursor(
+                    field, term, float(last["match_score"]), last["apn"]
                 )
 
-                return results
+            logger.info(f"Found {len(results)} properties for {field}: {term}")
+            logger.debug(
+                f"DB_ANALYTICS: {field}_search, query_time={duration:.3f}s, results={len(results)}, "
+                f"limit={limit}, paged={bool(cursor)}, threshold={threshold}"
+            )
+            return results, next_cursor
 
-    except Exception as e:
+        except Exception as e:
             duration = time.time() - start_time
             self._record_operation_stats("selects", duration, error=True)
-            log_exception(logger, e, f"searching properties by address: {address}")
-            return []
+            log_exception(logger, e, f"searching properties by {field}: {term}")
+            return [], None
+    def search_properties_by_owner_page(
+        self, owner_name: str, limit: int = 100, cursor: Optional[str] = None
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """One page of ranked owner search results and the next page's cursor"""
+        return self.search_properties_ranked("owner", owner_name, limit, cursor)
+    def search_properties_by_address_page(
+        self, address: str, limit: int = 100, cursor: Optional[str] = None
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """One page of ranked address search results and the next page's cursor"""
+        return self.search_properties_ranked("address", address, limit, cursor)
+
+    # =======================
+    # STREAMING READS
+    # =======================
+    def _iter_query(
+        self, name: str, sql: str, params: Any, batch_size: int
+    ) -> Iterator[StreamRecord]:
+        """Stream a query through a named server-side cursor as __slots__ records
+
+        Only batch_size rows are held client-side at a time. The connection
+        stays checked out until the generator is exhausted or closed.
+        """
+        start_time = time.time()
+        row_count = 0
+        error = False
+
+        try:
+            with self.get_connection() as conn:
+                # Plain tuple cursor instead of the pool's RealDictCursor
+                with conn.cursor(
+                    name=f"{name}_{uuid.uuid4().hex[:12]}",
+                    cursor_factory=psycopg2.extensions.cursor,
+                ) as cursor:
+                    cursor.itersize = batch_size
+                    cursor.execute(sql, params)
+
+                    record_cls = None
+                    for row in cursor:
+                        if record_cls is None:
+                            fields = tuple(column[0] for column in cursor.description)
+                            record_cls = record_type(
+                                f"{name.title().replace('_', '')}Record", fields
+                            )
+                        row_count += 1
+                        yield record_cls(*row)
+
+        except Exception as e:
+            error = True
+            logger.error(f"Error streaming {name}: {e}")
+            raise
+        finally:
+            duration = time.time() - start_time
+            self._record_operation_stats("selects", duration, error=error)
+            logger.debug(
+                f"DB_ANALYTICS: {name}, query_time={duration:.3f}s, rows={row_count}, itersize={batch_size}"
+            )
+    def iter_properties(
+        self, filters: Optional[Dict[str, Any]] = None, batch_size: int = 2000
+    ) -> Iterator[StreamRecord]:
+        """Stream properties (with latest tax/sale values) in APN order
+
+        filters maps property_current_view columns to a value, a list of
+        values, or None for IS NULL.
+        """
+        conditions = []
+        params = []
+        for column, value in (filters or {}).items():
+            if column not in STREAMABLE_PROPERTY_COLUMNS:
+                raise ValueError(f"Cannot filter properties on column: {column}")
+            if value is None:
+                conditions.append(f"{column} IS NULL")
+            elif isinstance(value, (list, tuple, set)):
+                conditions.append(f"{column} = ANY(%s)")
+                params.append(list(value))
+            else:
+                conditions.append(f"{column} = %s")
+                params.append(value)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        sql = f"SELECT * FROM property_current_view {where} ORDER BY apn"
+        return self._iter_query("iter_properties", sql, params, batch_size)
+    def iter_tax_history(
+        self, apns: Optional[Iterable[str]] = None, batch_size: int = 5000
+    ) -> Iterator[StreamRecord]:
+        """Stream tax history for the given APNs (or all) ordered by APN and year"""
+        if apns is None:
+            sql = "SELECT * FROM tax_history ORDER BY apn, tax_year DESC"
+            params = None
+        else:
+            sql = "SELECT * FROM tax_history WHERE apn = ANY(%s) ORDER BY apn, tax_year DESC"
+            params = (list(apns),)
+        return self._iter_query("iter_tax_history", sql, params, batch_size)
+    def iter_sales_history(
+        self, apns: Optional[Iterable[str]] = None, batch_size: int = 5000
+    ) -> Iterator[StreamRecord]:
+        """Stream sales history for the given APNs (or all) ordered by APN and date"""
+        if apns is None:
+            sql = "SELECT * FROM sales_history ORDER BY apn, sale_date DESC"
+            params = None
+        else:
+            sql = "SELECT * FROM sales_history WHERE apn = ANY(%s) ORDER BY apn, sale_date DESC"
+            params = (list(apns),)
+        return self._iter_query("iter_sales_history", sql, params, batch_size)
 
     # =======================
     # TAX HISTORY OPERATIONS
@@ -705,13 +1050,157 @@ def __init__(self, config_manager, min_connections=5, max_connections=20):
         return inserted_count
 
     # =======================
+    # BULK INGESTION (COPY)
+    # =======================
+    def _build_bulk_ingest_sql(self, table: str) -> Tuple[str, str, str]:
+        """Build staging, COPY and merge statements for a BULK_INGEST_TABLES entry"""
+        spec = BULK_INGEST_TABLES[table]
+        columns = spec["key"] + spec["merge"]
+        staging = f"_ingest_{table}"
+
+        create_sql = f"""
+        CREATE TEMP TABLE IF NOT EXISTS {staging} ON COMMIT DELETE ROWS AS
+        SELECT {", ".join(columns)}, 0::bigint AS seq FROM {table} WITH NO DATA
+        """
+        copy_sql = f"COPY {staging} ({', '.join(columns)}, seq) FROM STDIN"
+
+        # Collapse duplicate keys within a batch to the latest non-null value
+        # per column, matching what the per-row upserts would do in sequence
+        merged = [
+            f"(array_agg(s.{column} ORDER BY s.seq DESC) "
+            f"FILTER (WHERE s.{column} IS NOT NULL))[1]"
+            for column in spec["merge"]
+        ]
+        touch_values = ["CURRENT_TIMESTAMP"] * len(spec["insert_touch"])
+        updates = [
+            f"{column} = COALESCE(EXCLUDED.{column}, {table}.{column})"
+            for column in spec["merge"]
+        ] + [f"{column} = CURRENT_TIMESTAMP" for column in spec["update_touch"]]
+        where = (
+            "WHERE EXISTS (SELECT 1 FROM properties p WHERE p.apn = s.apn)"
+            if spec["requires_property"]
+            else ""
+        )
+
+        merge_sql = f"""
+        INSERT INTO {table} ({", ".join(columns + spec["insert_touch"])})
+        SELECT {", ".join([f"s.{key}" for key in spec["key"]] + merged + touch_values)}
+        FROM {staging} s
+        {where}
+        GROUP BY {", ".join(f"s.{key}" for key in spec["key"])}
+        ON CONFLICT ({", ".join(spec["key"])}) DO UPDATE SET
+            {", ".join(updates)}
+        """
+        return create_sql, copy_sql, merge_sql
+    def bulk_ingest(
+        self,
+        table: str,
+        rows: Iterable[Dict[str, Any]],
+        batch_size: int = 50000,
+        refresh_view: bool = True,
+    ) -> int:
+        """Stream rows into a table via COPY FROM STDIN and a set-based upsert
+
+        Rows are loaded batch_size at a time into a temporary staging table and
+        merged with the same COALESCE semantics as the per-row insert methods.
+        Each batch is committed on its own. Returns the number of rows written.
+        With refresh_view, the APNs touched by history rows are refreshed in
+        property_current_view once loading finishes.
+        """
+        if table not in BULK_INGEST_TABLES:
+            raise ValueError(f"Bulk ingest not supported for table: {table}")
+
+        create_sql, copy_sql, merge_sql = self._build_bulk_ingest_sql(table)
+        columns = BULK_INGEST_TABLES[table]["key"] + BULK_INGEST_TABLES[table]["merge"]
+        row_iter = iter(rows)
+
+        start_time = time.time()
+        total_rows = 0
+        total_written = 0
+        total_skipped = 0
+
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(create_sql)
+
+                while True:
+                    stream = CopyTextStream(row_iter, columns, batch_size)
+                    cursor.copy_expert(copy_sql, stream)
+                    total_skipped += stream.skipped
+
+                    if stream.row_count:
+                        cursor.execute(merge_sql)
+                        total_rows += stream.row_count
+                        total_written += cursor.rowcount
+                    conn.commit()
+
+                    if stream.exhausted:
+                        break
+
+            duration = time.time() - start_time
+            self._record_operation_stats("inserts", duration)
+
+            if (
+                refresh_view
+                and total_written
+                and BULK_INGEST_TABLES[table]["requires_property"]
+            ):
+                self.refresh_property_current_view()
+
+            logger.info(
+                f"Bulk ingested {total_written} {table} rows from {total_rows} input rows "
+                f"in {duration:.2f}s ({total_rows / max(duration, 1e-6):.0f} rows/s)"
+            )
+            if total_skipped:
+                logger.warning(f"Skipped {total_skipped} {table} rows without an APN")
+            if total_rows > total_written:
+                logger.debug(
+                    f"{total_rows - total_written} {table} rows were duplicates "
+                    f"or referenced unknown properties"
+                )
+            return total_written
+
+        except Exception as e:
+            duration = time.time() - start_time
+            self._record_operation_stats("inserts", duration, error=True)
+            logger.error(
+                f"Error in bulk {table} ingest after {total_written} committed rows: {e}"
+            )
+            logger.debug(traceback.format_exc())
+            return total_written
+    def bulk_ingest_properties(
+        self,
+        properties: Iterable[Dict[str, Any]],
+        batch_size: int = 50000,
+        refresh_view: bool = True,
+    ) -> int:
+        """COPY-based bulk upsert of property records"""
+        return self.bulk_ingest("properties", properties, batch_size, refresh_view)
+    def bulk_ingest_tax_history(
+        self,
+        tax_records: Iterable[Dict[str, Any]],
+        batch_size: int = 50000,
+        refresh_view: bool = True,
+    ) -> int:
+        """COPY-based bulk upsert of tax history records for known properties"""
+        return self.bulk_ingest("tax_history", tax_records, batch_size, refresh_view)
+    def bulk_ingest_sales_history(
+        self,
+        sales_records: Iterable[Dict[str, Any]],
+        batch_size: int = 50000,
+        refresh_view: bool = True,
+    ) -> int:
+        """COPY-based bulk upsert of sales history records for known properties"""
+        return self.bulk_ingest("sales_history", sales_records, batch_size, refresh_view)
+    # =======================
     # DATA COLLECTION STATUS OPERATIONS
     # =======================
     def get_data_collection_status(self, apn: str) -> Dict[str, Any]:
         """Get comprehensive data collection status for an APN"""
         start_time = time.time()
 
-    try:
+        try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
 
@@ -781,7 +1270,7 @@ def __init__(self, config_manager, min_connections=5, max_connections=20):
                         "needs_sales_collection": True,
                     }
 
-    except Exception as e:
+        except Exception as e:
             duration = time.time() - start_time
             self._record_operation_stats("selects", duration, error=True)
             logger.error(f"Error getting data collection status for {apn}: {e}")
@@ -792,6 +1281,72 @@ def __init__(self, config_manager, min_connections=5, max_connections=20):
                 "needs_tax_collection": True,
                 "needs_sales_collection": True,
             }
+    def get_collection_status_bulk(
+        self, apns: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get data collection status for a whole result set in a single query
+
+        Returns a mapping of APN -> status dict containing tax/sales record
+        counts, latest tax year, latest sale date, property last_updated and
+        the data_collection_status value. APNs with no stored data are still
+        present in the mapping with zero counts.
+        """
+        unique_apns = [apn for apn in dict.fromkeys(apns) if apn]
+        if not unique_apns:
+            return {}
+
+        start_time = time.time()
+
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+
+                sql = """
+                SELECT
+                    req.apn,
+                    (p.apn IS NOT NULL) as exists,
+                    p.last_updated,
+                    COALESCE(t.tax_count, 0) as tax_records_count,
+                    COALESCE(s.sales_count, 0) as sales_records_count,
+                    t.latest_tax_year,
+                    s.latest_sale_date,
+                    dcs.status as collection_status
+                FROM unnest(%s::varchar[]) AS req(apn)
+                LEFT JOIN properties p ON p.apn = req.apn
+                LEFT JOIN (
+                    SELECT apn, COUNT(*) as tax_count, MAX(tax_year) as latest_tax_year
+                    FROM tax_history
+                    WHERE apn = ANY(%s::varchar[])
+                    GROUP BY apn
+                ) t ON t.apn = req.apn
+                LEFT JOIN (
+                    SELECT apn, COUNT(*) as sales_count, MAX(sale_date) as latest_sale_date
+                    FROM sales_history
+                    WHERE apn = ANY(%s::varchar[])
+                    GROUP BY apn
+                ) s ON s.apn = req.apn
+                LEFT JOIN data_collection_status dcs ON dcs.apn = req.apn
+                """
+
+                cursor.execute(sql, (unique_apns, unique_apns, unique_apns))
+                results = {row["apn"]: dict(row) for row in cursor.fetchall()}
+
+                duration = time.time() - start_time
+                self._record_operation_stats("selects", duration)
+
+                logger.debug(
+                    f"DB_ANALYTICS: bulk_collection_status, query_time={duration:.3f}s, apns={len(unique_apns)}"
+                )
+
+                return results
+
+        except Exception as e:
+            duration = time.time() - start_time
+            self._record_operation_stats("selects", duration, error=True)
+            logger.error(
+                f"Error getting bulk collection status for {len(unique_apns)} APNs: {e}"
+            )
+            return {}
     def get_apns_needing_collection(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get APNs that need data collection, prioritized by search frequency"""
         start_time = time.time()
@@ -891,7 +1446,7 @@ def __init__(self, config_manager, min_connections=5, max_connections=20):
         self, apn: str, success: bool, error_message: Optional[str] = None
     ) -> bool:
         """Mark an APN collection as completed"""
-    try:
+        try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
 
@@ -909,11 +1464,301 @@ def __init__(self, config_manager, min_connections=5, max_connections=20):
                 cursor.execute(sql, (apn, status, error_message, status, error_message))
                 conn.commit()
 
-                return True
+            # Serve the freshly collected history without waiting for a refresh
+            if success:
+                self.refresh_property_current_view([apn])
+            return True
 
-    except Exception as e:
+        except Exception as e:
             logger.error(f"Error marking collection completed for {apn}: {e}")
             return False
+    # =======================
+    # DURABLE COLLECTION QUEUE
+    # =======================
+    # data_collection_status doubles as a work queue shared by every collector
+    # process: 'queued' rows are claimed with FOR UPDATE SKIP LOCKED under a
+    # lease, and an 'in_progress' row whose lease has expired (its worker died
+    # or stalled) becomes claimable again. Rows marked in progress without a
+    # lease (mark_collection_in_progress, or rows from before the queue
+    # columns existed) count as expired, so they are never stuck.
+    def enqueue_collection(self, apns: List[str], priority: int = 2) -> int:
+        """Queue APNs for collection; lower priority values are claimed first
+
+        APNs already queued keep their place but take the higher priority;
+        APNs in progress are left alone. Returns the number of rows queued
+        or updated.
+        """
+        unique_apns = [apn for apn in dict.fromkeys(apns) if apn]
+        if not unique_apns:
+            return 0
+
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+
+                sql = """
+                INSERT INTO data_collection_status
+                    (apn, status, priority, attempts, available_at, enqueued_at)
+                SELECT apn, 'queued', %s, 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+                FROM unnest(%s::varchar[]) AS req(apn)
+                ON CONFLICT (apn) DO UPDATE SET
+                    status = 'queued',
+                    priority = CASE
+                        WHEN data_collection_status.status = 'queued'
+                        THEN LEAST(data_collection_status.priority, EXCLUDED.priority)
+                        ELSE EXCLUDED.priority
+                    END,
+                    attempts = CASE
+                        WHEN data_collection_status.status = 'queued'
+                        THEN data_collection_status.attempts
+                        ELSE 0
+                    END,
+                    available_at = CASE
+                        WHEN data_collection_status.status = 'queued'
+                        THEN data_collection_status.available_at
+                        ELSE CURRENT_TIMESTAMP
+                    END,
+                    enqueued_at = COALESCE(
+                        CASE WHEN data_collection_status.status = 'queued'
+                        THEN data_collection_status.enqueued_at END,
+                        CURRENT_TIMESTAMP
+                    ),
+                    error_message = NULL
+                WHERE data_collection_status.status <> 'in_progress'
+                OR data_collection_status.lease_expires_at IS NULL
+                """
+
+                cursor.execute(sql, (priority, unique_apns))
+                queued = cursor.rowcount
+                conn.commit()
+
+                logger.debug(f"Queued {queued} APNs for collection")
+                return queued
+
+        except Exception as e:
+            logger.error(f"Error queueing {len(unique_apns)} APNs for collection: {e}")
+            return 0
+    def claim_collection_jobs(
+        self,
+        worker_id: str,
+        limit: int = 1,
+        lease_seconds: float = 300.0,
+        max_attempts: int = 5,
+    ) -> List[Dict[str, Any]]:
+        """Lease up to limit ready APNs to a worker, highest priority first
+
+        Rows locked by a concurrent claim are skipped rather than waited on,
+        so any number of workers can claim at once without handing out the
+        same APN twice. Expired leases on rows out of attempts are failed
+        instead of being handed out again.
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute(
+                    """
+                    UPDATE data_collection_status SET
+                        status = 'failed',
+                        completed_at = CURRENT_TIMESTAMP,
+                        leased_by = NULL,
+                        lease_expires_at = NULL,
+                        error_message = COALESCE(error_message, 'lease expired')
+                    WHERE status = 'in_progress'
+                    AND (
+                        lease_expires_at IS NULL
+                        OR lease_expires_at < CURRENT_TIMESTAMP
+                    )
+                    AND attempts >= %s
+                    """,
+                    (max_attempts,),
+                )
+
+                sql = """
+                WITH ready AS (
+                    SELECT apn
+                    FROM data_collection_status
+                    WHERE (status = 'queued' AND available_at <= CURRENT_TIMESTAMP)
+                    OR (
+                        status = 'in_progress'
+                        AND (
+                            lease_expires_at IS NULL
+                            OR lease_expires_at < CURRENT_TIMESTAMP
+                        )
+                    )
+                    ORDER BY priority, available_at
+                    LIMIT %s
+                    FOR UPDATE SKIP LOCKED
+                )
+                UPDATE data_collection_status dcs SET
+                    status = 'in_progress',
+                    leased_by = %s,
+                    lease_expires_at = CURRENT_TIMESTAMP + make_interval(secs => %s),
+                    started_at = CURRENT_TIMESTAMP,
+                    attempts = dcs.attempts + 1
+                FROM ready
+                WHERE dcs.apn = ready.apn
+                RETURNING dcs.apn, dcs.priority, dcs.attempts, dcs.lease_expires_at
+                """
+
+                cursor.execute(sql, (limit, worker_id, lease_seconds))
+                claimed = [dict(row) for row in cursor.fetchall()]
+                conn.commit()
+
+                if claimed:
+                    logger.debug(f"Worker {worker_id} claimed {len(claimed)} APNs")
+                return claimed
+
+        except Exception as e:
+            logger.error(f"Error claiming collection jobs for {worker_id}: {e}")
+            return []
+    def extend_collection_leases(
+        self, worker_id: str, apns: List[str], lease_seconds: float = 300.0
+    ) -> Optional[List[str]]:
+        """Renew a worker's leases; returns the APNs it still holds
+
+        Returns None when the renewal itself failed, since then nothing is
+        known about which leases are still held.
+        """
+        if not apns:
+            return []
+
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+
+                sql = """
+                UPDATE data_collection_status SET
+                    lease_expires_at = CURRENT_TIMESTAMP + make_interval(secs => %s)
+                WHERE apn = ANY(%s::varchar[])
+                AND status = 'in_progress'
+                AND leased_by = %s
+                RETURNING apn
+                """
+
+                cursor.execute(sql, (lease_seconds, list(apns), worker_id))
+                held = [row["apn"] for row in cursor.fetchall()]
+                conn.commit()
+                return held
+
+        except Exception as e:
+            logger.error(f"Error extending collection leases for {worker_id}: {e}")
+            return None
+    def complete_collection_job(self, apn: str, worker_id: str) -> bool:
+        """Mark a leased APN completed; False if the lease was lost"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+
+                sql = """
+                UPDATE data_collection_status SET
+                    status = 'completed',
+                    completed_at = CURRENT_TIMESTAMP,
+                    leased_by = NULL,
+                    lease_expires_at = NULL,
+                    error_message = NULL
+                WHERE apn = %s AND status = 'in_progress' AND leased_by = %s
+                """
+
+                cursor.execute(sql, (apn, worker_id))
+                completed = cursor.rowcount == 1
+                conn.commit()
+
+            if completed:
+                self.refresh_property_current_view([apn])
+            else:
+                logger.warning(f"Lease on {apn} was lost before {worker_id} finished")
+            return completed
+
+        except Exception as e:
+            logger.error(f"Error completing collection job for {apn}: {e}")
+            return False
+    def fail_collection_job(
+        self,
+        apn: str,
+        worker_id: str,
+        error_message: str,
+        retry_delay: float,
+        max_attempts: int = 5,
+    ) -> Optional[str]:
+        """Release a failed lease for retry after retry_delay seconds
+
+        Once the APN has used max_attempts it is marked failed instead.
+        Returns the new status, or None if the lease was lost.
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+
+                sql = """
+                UPDATE data_collection_status SET
+                    status = CASE WHEN attempts < %s THEN 'queued' ELSE 'failed' END,
+                    available_at = CURRENT_TIMESTAMP + make_interval(secs => %s),
+                    completed_at = CASE
+                        WHEN attempts < %s THEN NULL ELSE CURRENT_TIMESTAMP
+                    END,
+                    leased_by = NULL,
+                    lease_expires_at = NULL,
+                    error_message = %s
+                WHERE apn = %s AND status = 'in_progress' AND leased_by = %s
+                RETURNING status
+                """
+
+                cursor.execute(
+                    sql,
+                    (
+                        max_attempts,
+                        retry_delay,
+                        max_attempts,
+                        error_message,
+                        apn,
+                        worker_id,
+                    ),
+                )
+                row = cursor.fetchone()
+                conn.commit()
+                return row["status"] if row else None
+
+        except Exception as e:
+            logger.error(f"Error failing collection job for {apn}: {e}")
+            return None
+    def get_collection_queue_stats(self) -> Dict[str, Any]:
+        """Counts of queued, ready, leased, expired, completed and failed APNs"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+
+                sql = """
+                SELECT
+                    COUNT(*) FILTER (WHERE status = 'queued') AS queued,
+                    COUNT(*) FILTER (
+                        WHERE status = 'queued' AND available_at <= CURRENT_TIMESTAMP
+                    ) AS ready,
+                    COUNT(*) FILTER (
+                        WHERE status = 'in_progress'
+                        AND lease_expires_at >= CURRENT_TIMESTAMP
+                    ) AS leased,
+                    COUNT(*) FILTER (
+                        WHERE status = 'in_progress'
+                        AND (
+                            lease_expires_at IS NULL
+                            OR lease_expires_at < CURRENT_TIMESTAMP
+                        )
+                    ) AS expired_leases,
+                    COUNT(*) FILTER (WHERE status = 'completed') AS completed,
+                    COUNT(*) FILTER (WHERE status = 'failed') AS failed,
+                    MIN(enqueued_at) FILTER (
+                        WHERE status = 'queued'
+                    ) AS oldest_queued_at
+                FROM data_collection_status
+                """
+
+                cursor.execute(sql)
+                return dict(cursor.fetchone())
+
+        except Exception as e:
+            logger.error(f"Error getting collection queue stats: {e}")
+            return {}
 
     # =======================
     # ANALYTICS OPERATIONS
@@ -1047,6 +1892,86 @@ def __init__(self, config_manager, min_connections=5, max_connections=20):
 
             return stats
 
+    # =======================
+    # PROPERTY VIEW REFRESH
+    # =======================
+    def refresh_property_current_view(
+        self, apns: Optional[List[str]] = None, max_apns: Optional[int] = None
+    ) -> int:
+        """Refresh latest tax/sale values for the given APNs, or for APNs touched since the last refresh"""
+        if not self._incremental_view_refresh:
+            return 0
+
+        start_time = time.time()
+
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT refresh_property_latest_values(%s::varchar[], %s) AS refreshed",
+                    (list(apns) if apns is not None else None, max_apns),
+                )
+                refreshed = cursor.fetchone()["refreshed"]
+                conn.commit()
+
+            duration = time.time() - start_time
+            self._record_operation_stats("updates", duration)
+            logger.debug(
+                f"DB_ANALYTICS: Refreshed property_current_view for {refreshed} APNs in {duration:.3f}s"
+            )
+            return refreshed
+
+        except psycopg2.Error as e:
+            duration = time.time() - start_time
+            self._record_operation_stats("updates", duration, error=True)
+            if e.pgcode in (errorcodes.UNDEFINED_FUNCTION, errorcodes.UNDEFINED_TABLE):
+                # Schema predates database/performance_optimizations.sql incremental refresh
+                self._incremental_view_refresh = False
+                logger.warning(
+                    "Incremental property_current_view refresh not installed - "
+                    "run database/performance_optimizations.sql"
+                )
+            else:
+                logger.error(f"Error refreshing property_current_view: {e}")
+            return 0
+    def get_property_view_staleness(self) -> Dict[str, Any]:
+        """How far property_current_view's latest tax/sale values lag behind the history tables"""
+        start_time = time.time()
+
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT
+                        (SELECT COUNT(*) FROM property_refresh_queue) AS pending_apns,
+                        (SELECT MIN(touched_at) FROM property_refresh_queue) AS oldest_pending_at,
+                        EXTRACT(EPOCH FROM CURRENT_TIMESTAMP - (
+                            SELECT MIN(touched_at) FROM property_refresh_queue
+                        )) AS staleness_seconds,
+                        rs.last_refresh_at,
+                        rs.last_refreshed_count,
+                        rs.last_full_rebuild_at
+                    FROM property_view_refresh_state rs
+                    """
+                )
+                row = cursor.fetchone()
+
+            duration = time.time() - start_time
+            self._record_operation_stats("selects", duration)
+
+            if not row:
+                return {}
+            staleness = dict(row)
+            staleness["staleness_seconds"] = float(staleness["staleness_seconds"] or 0.0)
+            return staleness
+
+        except Exception as e:
+            duration = time.time() - start_time
+            self._record_operation_stats("selects", duration, error=True)
+            logger.error(f"Error getting property_current_view staleness: {e}")
+            return {}
+
     # =======================
     # VALIDATION AND UTILITY METHODS
     # =======================
@@ -1161,7 +2086,7 @@ def __init__(self, config_manager, min_connections=5, max_connections=20):
         return is_valid, errors
     def _ensure_tables_exist(self):
         """Ensure all required tables exist"""
-    try:
+        try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
 
@@ -1195,10 +2120,39 @@ def __init__(self, config_manager, min_connections=5, max_connections=20):
                 """
                 )
 
+                # Work queue columns (see DURABLE COLLECTION QUEUE)
+                cursor.execute(
+                    """
+                    ALTER TABLE data_collection_status
+                        ADD COLUMN IF NOT EXISTS priority INTEGER NOT NULL DEFAULT 2,
+                        ADD COLUMN IF NOT EXISTS attempts INTEGER NOT NULL DEFAULT 0,
+                        ADD COLUMN IF NOT EXISTS available_at TIMESTAMP,
+                        ADD COLUMN IF NOT EXISTS enqueued_at TIMESTAMP,
+                        ADD COLUMN IF NOT EXISTS leased_by VARCHAR(100),
+                        ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP
+                """
+                )
+
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_collection_status_queue
+                    ON data_collection_status(priority, available_at)
+                    WHERE status = 'queued'
+                """
+                )
+
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_collection_status_leases
+                    ON data_collection_status(lease_expires_at)
+                    WHERE status = 'in_progress'
+                """
+                )
+
                 conn.commit()
                 logger.debug("Database schema verification completed")
 
-    except Exception as e:
+        except Exception as e:
             logger.error(f"Error ensuring tables exist: {e}")
     def close(self):
         """Close the database connection pool"""
@@ -49,6 +49,7 @@ from PyQt5.QtGui import (
     QRadialGradient,
 )
 from PyQt5.QtWidgets import (
+    QAbstractItemView,
     QAction,
     QApplication,
     QButtonGroup,
@@ -82,6 +83,7 @@ from PyQt5.QtWidgets import (
     QSpinBox,
     QSplitter,
     QStatusBar,
+    QTableView,
     QTableWidget,
     QTableWidgetItem,
     QTabWidget,
@@ -105,6 +107,13 @@ except ImportError:
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
 from src.background_data_collector import BackgroundDataCollectionManager, JobPriority
 from src.batch_processing_manager import BatchProcessingManager
+from src.gui.results_table_model import (
+    ColumnarResultStore,
+    PropertyResultsModel,
+    PropertyResultsProxyModel,
+    sample_column_widths,
+    status_state,
+)
 
 # MIGRATED: from config_manager import ConfigManager  # → from src.enhanced_config_manager import EnhancedConfigManager
 # MIGRATED: from database_manager import DatabaseManager  # → from src.threadsafe_database_manager import ThreadSafeDatabaseManager
@@ -234,13 +243,85 @@ class BackupManager:
 
 
 class DataValidator:
-    """Placeholder data validator"""
+    """Validates stored data by streaming each table through server-side cursors"""
+
+    # Issues reported per category; the sweep still covers every row
+    MAX_ISSUES_PER_CATEGORY = 500
+    # Rows checked between progress reports
+    PROGRESS_INTERVAL = 1000
     def __init__(self, db_manager):
         self.db_manager = db_manager
-    def validate_all_data(self):
-        """Validate all database data"""
-        # Return mock validation results
-        return {"properties": [], "tax_records": [], "sales_records": []}
+    def validate_all_data(self, progress_callback=None):
+        """Validate all database data
+
+        progress_callback, if given, is called with (category, rows checked)
+        every PROGRESS_INTERVAL rows and when each category is finished.
+        """
+        results = {"properties": [], "tax_records": [], "sales_records": []}
+        if not hasattr(self.db_manager, "iter_properties"):
+            return results
+
+        checked = 0
+        for checked, record in enumerate(self.db_manager.iter_properties(), 1):
+            is_valid, errors = self.db_manager.validate_property_data(record)
+            if not is_valid:
+                self._add_issues(results["properties"], record.apn, errors)
+            self._report_progress(progress_callback, "properties", checked)
+        self._report_progress(progress_callback, "properties", checked, done=True)
+
+        checked = 0
+        for checked, record in enumerate(self.db_manager.iter_tax_history(), 1):
+            errors = []
+            if record.assessed_value is not None and record.assessed_value < 0:
+                errors.append(f"Negative assessed value: {record.assessed_value}")
+            if record.tax_amount is not None and record.tax_amount < 0:
+                errors.append(f"Negative tax amount: {record.tax_amount}")
+            self._add_issues(
+                results["tax_records"], f"{record.apn} ({record.tax_year})", errors
+            )
+            self._report_progress(progress_callback, "tax_records", checked)
+        self._report_progress(progress_callback, "tax_records", checked, done=True)
+
+        checked = 0
+        for checked, record in enumerate(self.db_manager.iter_sales_history(), 1):
+            errors = []
+            if record.sale_price is not None and record.sale_price <= 0:
+                errors.append(f"Non-positive sale price: {record.sale_price}")
+            if record.sale_date is None:
+                errors.append("Missing sale date")
+            self._add_issues(results["sales_records"], record.apn, errors)
+            self._report_progress(progress_callback, "sales_records", checked)
+        self._report_progress(progress_callback, "sales_records", checked, done=True)
+
+        return results
+    def _report_progress(self, progress_callback, category, checked, done=False):
+        if progress_callback and (done or checked % self.PROGRESS_INTERVAL == 0):
+            progress_callback(category, checked)
+    def _add_issues(self, issues, label, errors):
+        for error in errors:
+            if len(issues) >= self.MAX_ISSUES_PER_CATEGORY:
+                return
+            issues.append(f"{label}: {error}")
+
+
+class DataValidationWorker(QThread):
+    """Runs DataValidator.validate_all_data off the GUI thread"""
+
+    progress_updated = Signal(str, int)  # category, rows checked
+    validation_completed = Signal(dict)  # validation results
+    error_occurred = Signal(str)
+    def __init__(self, data_validator):
+        super().__init__()
+        self.data_validator = data_validator
+    def run(self):
+        try:
+            results = self.data_validator.validate_all_data(
+                progress_callback=self.progress_updated.emit
+            )
+            self.validation_completed.emit(results)
+        except Exception as e:
+            logger.error(f"Validation failed: {e}")
+            self.error_occurred.emit(str(e))
 
 
 class PropertyDetailsWidget(QWidget):
@@ -477,9 +558,10 @@ class DataValidationWidget(QWidget):
         layout.addWidget(self.issues_list)
 
         # Validate button
-        validate_btn = QPushButton("Run Validation")
-        validate_btn.clicked.connect(self.run_validation)
-        layout.addWidget(validate_btn)
+        self.validate_btn = QPushButton("Run Validation")
+        self.validate_btn.clicked.connect(self.run_validation)
+        layout.addWidget(self.validate_btn)
+        self.validation_worker = None
     def update_results(self, validation_results):
         """Update validation results display"""
         self.issues_list.clear()
@@ -498,12 +580,31 @@ class DataValidationWidget(QWidget):
             self.validation_label.setText(f"⚠ {total_issues} issues found")
             self.validation_label.setStyleSheet("color: orange;")
     def run_validation(self):
-        """Run data validation"""
-    try:
-            results = self.data_validator.validate_all_data()
-            self.update_results(results)
-    except Exception as e:
-            logger.error(f"Validation failed: {e}")
+        """Run data validation in a background thread"""
+        if self.validation_worker and self.validation_worker.isRunning():
+            return
+
+        self.validate_btn.setEnabled(False)
+        self.validation_label.setText("Validating...")
+        self.validation_label.setStyleSheet("")
+
+        self.validation_worker = DataValidationWorker(self.data_validator)
+        self.validation_worker.progress_updated.connect(self.show_progress)
+        self.validation_worker.validation_completed.connect(self.update_results)
+        self.validation_worker.error_occurred.connect(self.show_error)
+        self.validation_worker.finished.connect(
+            lambda: self.validate_btn.setEnabled(True)
+        )
+        self.validation_worker.start()
+    def show_progress(self, category, checked):
+        """Show how far a running validation has got"""
+        self.validation_label.setText(
+            f"Validating {category.replace('_', ' ')}... {checked:,} checked"
+        )
+    def show_error(self, error_message):
+        """Show a validation failure"""
+        self.validation_label.setText(f"Validation failed: {error_message}")
+        self.validation_label.setStyleSheet("color: red;")
 
 
 # Placeholder dialog classes
@@ -1078,6 +1179,8 @@ class EnhancedMainWindow(QMainWindow):
 
         # UI components
         self.results_table = None
+        self.results_model = None
+        self.results_proxy = None
         self.search_input = None
         self.status_bar = None
         self.notification_area = None
@@ -1089,6 +1192,7 @@ class EnhancedMainWindow(QMainWindow):
         self.current_search_thread = None
         self.progress_dialog = None
         self.collection_dialog = None
+        self.validation_worker = None
 
         # Initialize database first
         self.init_database()
@@ -1329,8 +1433,18 @@ class EnhancedMainWindow(QMainWindow):
         self.search_progress.setVisible(False)
         layout.addWidget(self.search_progress)
 
-        # Results table
-        self.results_table = QTableWidget()
+        # Results filter - applied through the proxy model
+        self.results_filter = QLineEdit()
+        self.results_filter.setPlaceholderText("Filter results by APN, address or owner...")
+        self.results_filter.setClearButtonEnabled(True)
+        layout.addWidget(self.results_filter)
+
+        # Results table - model/view over a columnar result store
+        self.results_model = PropertyResultsModel(self)
+        self.results_proxy = PropertyResultsProxyModel(self)
+        self.results_proxy.setSourceModel(self.results_model)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_proxy)
         self.setup_results_table()
         layout.addWidget(self.results_table)
 
@@ -1439,33 +1553,18 @@ class EnhancedMainWindow(QMainWindow):
         return tab
     def setup_results_table(self):
         """Set up the enhanced results table"""
-        # Define columns
-        columns = [
-            "APN",
-            "Address",
-            "Owner",
-            "Property Type",
-            "Year Built",
-            "Square Feet",
-            "Bedrooms",
-            "Bathrooms",
-            "Market Value",
-            "Assessed Value",
-            "Last Sale Date",
-            "Last Sale Amount",
-            "Data Status",
-            "Last Updated",
-        ]
-
-        self.results_table.setColumnCount(len(columns))
-        self.results_table.setHorizontalHeaderLabels(columns)
-
         # Configure table properties
         self.results_table.setAlternatingRowColors(True)
-        self.results_table.setSelectionBehavior(
-            QTableWidget.SelectionBehavior.SelectRows
-        )
+        self.results_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.results_table.setSortingEnabled(True)
+        self.results_table.sortByColumn(-1, Qt.AscendingOrder)
+
+        # Fixed row height so the view never measures rows
+        vertical_header = self.results_table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(
+            self.results_table.fontMetrics().height() + 8
+        )
 
         # Enable context menu
         self.results_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -1474,15 +1573,18 @@ class EnhancedMainWindow(QMainWindow):
         )
 
         # Connect selection change
-        self.results_table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.results_table.selectionModel().selectionChanged.connect(
+            self.on_selection_changed
+        )
+
+        self.results_filter.textChanged.connect(self.filter_results)
 
         # Set column widths
         header = self.results_table.horizontalHeader()
         for i, width in enumerate(
             [100, 200, 150, 120, 80, 80, 80, 80, 100, 100, 100, 120, 100, 100]
         ):
-            if i < len(columns):
-                header.resizeSection(i, width)
+            header.resizeSection(i, width)
     def setup_menu_bar(self):
         """Set up the enhanced menu bar"""
         menubar = self.menuBar()
@@ -1735,6 +1837,9 @@ class EnhancedMainWindow(QMainWindow):
                 self.on_collection_finished
             )
             self.background_manager.error_occurred.connect(self.handle_background_error)
+            self.background_manager.job_completed.connect(
+                self.on_collection_job_completed
+            )
 
         # Search engine signals (if any)
         # Add more signal connections as needed
@@ -1908,164 +2013,164 @@ class EnhancedMainWindow(QMainWindow):
             QMessageBox.critical(self, "Search Error", f"Search failed: {str(e)}")
     def populate_results_table(self, results: List[Dict[str, Any]]):
         """Populate the results table with enhanced data"""
-    try:
-            self.results_table.setRowCount(len(results))
-
-            for row, property_data in enumerate(results):
-                # Basic property information
-                self.results_table.setItem(
-                    row, 0, QTableWidgetItem(str(property_data.get("apn", "")))
-                )
-                self.results_table.setItem(
-                    row, 1, QTableWidgetItem(str(property_data.get("address", "")))
-                )
-                self.results_table.setItem(
-                    row, 2, QTableWidgetItem(str(property_data.get("owner_name", "")))
-                )
-                self.results_table.setItem(
-                    row,
-                    3,
-                    QTableWidgetItem(str(property_data.get("property_type", ""))),
-                )
-                self.results_table.setItem(
-                    row, 4, QTableWidgetItem(str(property_data.get("year_built", "")))
+        try:
+            # Look up collection status for the whole result set at once
+            apns = [str(property_data.get("apn", "")) for property_data in results]
+            status_map = self._get_collection_status_map(apns)
+            collecting_apns = self._get_collecting_apns()
+
+            status_texts = []
+            status_states = []
+            last_updated = []
+            for apn in apns:
+                status_row = status_map.get(apn)
+                status_info = self._format_collection_status(
+                    status_row, apn in collecting_apns
                 )
+                status_texts.append(status_info["text"])
+                status_states.append(status_state(status_info))
+                last_updated.append(self._format_last_update_time(status_row))
 
-                # Property details
-                self.results_table.setItem(
-                    row, 5, QTableWidgetItem(str(property_data.get("square_feet", "")))
-                )
-                self.results_table.setItem(
-                    row, 6, QTableWidgetItem(str(property_data.get("bedrooms", "")))
-                )
-                self.results_table.setItem(
-                    row, 7, QTableWidgetItem(str(property_data.get("bathrooms", "")))
+            # Cells are formatted lazily by the model as they are painted
+            store = ColumnarResultStore.from_results(
+                results, status_texts, status_states, last_updated
+            )
+            self.results_model.set_store(store)
+            # Keep the column the user last sorted by
+            sort_header = self.results_table.horizontalHeader()
+            if sort_header.sortIndicatorSection() >= 0:
+                self.results_model.sort(
+                    sort_header.sortIndicatorSection(), sort_header.sortIndicatorOrder()
                 )
 
-                # Financial information
-                market_value = property_data.get("market_value", 0)
-                assessed_value = property_data.get("assessed_value", 0)
-                last_sale_amount = property_data.get("last_sale_amount", 0)
+        except Exception as e:
+            # Never leave a stale or half-built grid behind a silent failure
+            logger.error(f"Error populating results table: {e}")
+            self.results_model.clear()
+            self.results_summary.setText(f"Failed to display results: {e}")
+            return
 
-                self.results_table.setItem(
-                    row,
-                    8,
-                    QTableWidgetItem(f"${market_value:,}" if market_value else ""),
-                )
-                self.results_table.setItem(
-                    row,
-                    9,
-                    QTableWidgetItem(f"${assessed_value:,}" if assessed_value else ""),
-                )
+        # Update results summary
+        self.results_summary.setText(f"Showing {len(results)} results")
 
-                # Sales information
-                last_sale_date = property_data.get("last_sale_date", "")
-                self.results_table.setItem(
-                    row, 10, QTableWidgetItem(str(last_sale_date))
-                )
-                self.results_table.setItem(
-                    row,
-                    11,
-                    QTableWidgetItem(
-                        f"${last_sale_amount:,}" if last_sale_amount else ""
-                    ),
-                )
+        # Size columns from a sample of rows rather than every cell
+        header = self.results_table.horizontalHeader()
+        widths = sample_column_widths(
+            self.results_model, self.results_table.fontMetrics()
+        )
+        for column, width in enumerate(widths):
+            header.resizeSection(column, width)
+    def filter_results(self, text: str):
+        """Filter the results table by APN, address or owner"""
+        self.results_proxy.set_filter_text(text)
+        shown = self.results_proxy.rowCount()
+        total = self.results_model.rowCount()
+        if shown == total:
+            self.results_summary.setText(f"Showing {total} results")
+        else:
+            self.results_summary.setText(f"Showing {shown} of {total} results")
+    def _selected_result_rows(self) -> List[int]:
+        """Proxy rows of the selected results"""
+        selection_model = self.results_table.selectionModel()
+        if selection_model is None:
+            return []
+        return sorted(index.row() for index in selection_model.selectedRows())
+
+    def _get_collection_status_map(self, apns: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get data collection status for a list of APNs with a single database query"""
+        if not self.db_manager or not apns:
+            return {}
+
+        try:
+            return self.db_manager.get_collection_status_bulk(apns)
+        except Exception as e:
+            logger.error(f"Error checking data status for {len(apns)} APNs: {e}")
+            return {}
+
+    def _get_collecting_apns(self) -> set:
+        """Get the set of APNs the background manager is currently collecting"""
+        if not self.background_manager:
+            return set()
+
+        try:
+            bg_status = self.background_manager.get_collection_status()
+            active_jobs = bg_status.get("active_jobs", [])
+
+            # active_jobs may be a count rather than a list of job objects; in that
+            # case we can't determine specific APN status, so assume none
+            if isinstance(active_jobs, (list, tuple)):
+                return {
+                    job.get("apn", "") for job in active_jobs if isinstance(job, dict)
+                }
+        except Exception:
+            # If background manager methods fail, assume not collecting
+            pass
 
-                # Data collection status
-                apn = property_data.get("apn", "")
-                status_info = self._get_data_collection_status(apn)
-                status_item = QTableWidgetItem(status_info["text"])
+        return set()
 
-                # Color code status
-                if status_info["complete"]:
-                    status_item.setBackground(QColor(200, 255, 200))  # Light green
-                elif status_info["collecting"]:
-                    status_item.setBackground(QColor(255, 255, 200))  # Light yellow
-                else:
-                    status_item.setBackground(QColor(255, 200, 200))  # Light red
+    def _format_collection_status(
+        self, status_row: Optional[Dict[str, Any]], collecting: bool
+    ) -> Dict[str, Any]:
+        """Convert a bulk collection status row into table display status"""
+        if not self.db_manager:
+            return {"text": "No DB", "complete": False, "collecting": False}
 
-                self.results_table.setItem(row, 12, status_item)
+        if status_row is None:
+            status_row = {}
 
-                # Last update time
-                last_update = self._get_last_update_time(apn)
-                self.results_table.setItem(row, 13, QTableWidgetItem(last_update))
+        has_tax = (status_row.get("tax_records_count") or 0) > 0
+        has_sales = (status_row.get("sales_records_count") or 0) > 0
 
-    except Exception as e:
-            logger.error(f"Error populating results table: {e}")
+        if has_tax and has_sales:
+            return {"text": "Complete", "complete": True, "collecting": False}
+        elif collecting:
+            return {"text": "Collecting...", "complete": False, "collecting": True}
+        elif has_tax or has_sales:
+            return {"text": "Partial", "complete": False, "collecting": False}
+        else:
+            return {"text": "Queued", "complete": False, "collecting": False}
 
-        # Update results summary
-        self.results_summary.setText(f"Showing {len(results)} results")
+    def on_collection_job_completed(self, apn: str, result: Dict[str, Any]):
+        """Refresh the status cells of a displayed result once it is collected"""
+        row = self.results_model.row_for_apn(apn) if self.results_model else None
+        if row is None:
+            return
+        status_row = self._get_collection_status_map([apn]).get(apn)
+        status_info = self._format_collection_status(status_row, False)
+        self.results_model.update_status(
+            row,
+            status_info["text"],
+            status_state(status_info),
+            self._format_last_update_time(status_row),
+        )
+    def _format_last_update_time(self, status_row: Optional[Dict[str, Any]]) -> str:
+        """Format the last_updated timestamp from a bulk collection status row"""
+        if not status_row or not status_row.get("exists"):
+            return "Never"
+
+        last_updated = status_row.get("last_updated")
+        if isinstance(last_updated, datetime):
+            return last_updated.strftime("%Y-%m-%d %H:%M")
+        return str(last_updated) if last_updated else "Unknown"
 
-        # Auto-resize columns
-        self.results_table.resizeColumnsToContents()
     def _get_data_collection_status(self, apn: str) -> Dict[str, Any]:
         """Get data collection status for an APN"""
-    try:
-            # If no database manager, return default status
-            if not self.db_manager:
-                return {"text": "No DB", "complete": False, "collecting": False}
-
-            # Try to get tax and sales records
-    try:
-                tax_records = self.db_manager.get_tax_history(apn)
-                sales_records = self.db_manager.get_sales_history(apn)
-    except:
-                # If methods don't exist, return unknown status
-                return {"text": "Unknown", "complete": False, "collecting": False}
-
-            # Ensure we have lists to work with
-            if not isinstance(tax_records, list):
-                tax_records = []
-            if not isinstance(sales_records, list):
-                sales_records = []
-
-            has_tax = len(tax_records) > 0
-            has_sales = len(sales_records) > 0
-
-            # Check if collection is in progress
-            collecting = False
-            if self.background_manager:
-    try:
-                    bg_status = self.background_manager.get_collection_status()
-                    active_jobs = bg_status.get("active_jobs", [])
-
-                    # Handle case where active_jobs might be an integer (count) or a list (job objects)
-                    if isinstance(active_jobs, (list, tuple)):
-                        # active_jobs is a list/tuple of job objects
-                        collecting = apn in [
-                            job.get("apn", "")
-                            for job in active_jobs
-                            if isinstance(job, dict)
-                        ]
-                    elif isinstance(active_jobs, int) and active_jobs > 0:
-                        # active_jobs is a count - we can't determine specific APN status
-                        # but we know jobs are running, so assume this APN might be collecting
-                        # This is a fallback - ideally we'd have better job tracking
-                        collecting = False  # Conservative approach: don't assume this APN is being collected
-    except:
-                    # If background manager methods fail, assume not collecting
-                    collecting = False
-
-            if has_tax and has_sales:
-                return {"text": "Complete", "complete": True, "collecting": False}
-            elif collecting:
-                return {"text": "Collecting...", "complete": False, "collecting": True}
-            elif has_tax or has_sales:
-                return {"text": "Partial", "complete": False, "collecting": False}
-            else:
-                return {"text": "Queued", "complete": False, "collecting": False}
-
-    except Exception as e:
+        try:
+            status_map = self._get_collection_status_map([apn])
+            return self._format_collection_status(
+                status_map.get(apn), apn in self._get_collecting_apns()
+            )
+        except Exception as e:
             logger.error(f"Error checking data status for {apn}: {e}")
             return {"text": "Unknown", "complete": False, "collecting": False}
+
     def _get_last_update_time(self, apn: str) -> str:
         """Get last update time for an APN"""
-    try:
-            # This would need to be implemented in the database manager
-            # For now, return a placeholder
-            return "Recent"
-    except:
-                return "Unknown"
+        try:
+            status_map = self._get_collection_status_map([apn])
+            return self._format_last_update_time(status_map.get(apn))
+        except Exception:
+            return "Unknown"
     def handle_search_error(self, error_message: str):
         """Handle search errors gracefully"""
         logger.error(f"Search error: {error_message}")
@@ -2163,20 +2268,25 @@ class EnhancedMainWindow(QMainWindow):
         self.collection_dialog.show()
     def auto_collect_missing_data(self):
         """Automatically collect missing data for current results"""
-    try:
+        try:
             if not hasattr(self, "last_search_results") or not self.last_search_results:
                 self.notification_area.show_message(
                     "No search results to collect data for", "warning"
                 )
                 return
 
+            apns = [
+                property_data.get("apn")
+                for property_data in self.last_search_results
+                if property_data.get("apn")
+            ]
+            status_map = self._get_collection_status_map(apns)
+
             missing_data_apns = []
-            for property_data in self.last_search_results:
-                apn = property_data.get("apn")
-                if apn:
-                    status = self._get_data_collection_status(apn)
-                    if not status["complete"]:
-                        missing_data_apns.append(apn)
+            for apn in apns:
+                status = self._format_collection_status(status_map.get(apn), False)
+                if not status["complete"]:
+                    missing_data_apns.append(apn)
 
             if missing_data_apns:
                 # Start collection for APNs with missing data
@@ -2194,7 +2304,7 @@ class EnhancedMainWindow(QMainWindow):
                     "All properties have complete data", "info"
                 )
 
-    except Exception as e:
+        except Exception as e:
             logger.error(f"Auto-collect failed: {e}")
             self.notification_area.show_message(
                 f"Auto-collect failed: {str(e)}", "error"
@@ -2202,17 +2312,11 @@ class EnhancedMainWindow(QMainWindow):
     def get_selected_apns(self) -> List[str]:
         """Get APNs from selected table rows"""
         selected_apns = []
-    try:
-            selected_rows = set()
-            for item in self.results_table.selectedItems():
-                selected_rows.add(item.row())
+        try:
+            for row in self._selected_result_rows():
+                selected_apns.append(self.results_proxy.apn_at(row))
 
-            for row in selected_rows:
-                apn_item = self.results_table.item(row, 0)  # APN is in first column
-                if apn_item:
-                    selected_apns.append(apn_item.text())
-
-    except Exception as e:
+        except Exception as e:
             logger.error(f"Failed to get selected APNs: {e}")
 
         return selected_apns
@@ -2569,17 +2673,13 @@ import traceback
         self.search_input.selectAll()
     def on_selection_changed(self):
         """Handle table selection changes"""
-    try:
-            selected_rows = set()
-            for item in self.results_table.selectedItems():
-                selected_rows.add(item.row())
+        try:
+            selected_rows = self._selected_result_rows()
 
             if len(selected_rows) == 1:
                 # Single selection - show property details
-                row = list(selected_rows)[0]
-                apn_item = self.results_table.item(row, 0)
-                if apn_item:
-                    apn = apn_item.text()
+                apn = self.results_proxy.apn_at(selected_rows[0])
+                if apn:
                     self.property_details.load_property_data(apn)
 
             # Update status message
@@ -2588,21 +2688,22 @@ import traceback
             else:
                 self.status_bar.showMessage("Ready")
 
-    except Exception as e:
+        except Exception as e:
             logger.error(f"Selection change error: {e}")
     def show_results_context_menu(self, position):
         """Show context menu for results table"""
-    try:
-            item = self.results_table.itemAt(position)
-            if not item:
+        try:
+            index = self.results_table.indexAt(position)
+            if not index.isValid():
                 return
+            row = index.row()
 
             menu = QMenu()
 
             # View details action
             view_action = menu.addAction("View Details")
             view_action.triggered.connect(
-                lambda: self.view_property_details(item.row())
+                lambda: self.view_property_details(row)
             )
 
             # Collection actions
@@ -2618,7 +2719,7 @@ import traceback
                 # Add option to prioritize this collection
                 prioritize_action = menu.addAction("Prioritize Collection")
                 prioritize_action.triggered.connect(
-                    lambda: self.prioritize_collection(item.row())
+                    lambda: self.prioritize_collection(row)
                 )
 
             menu.addSeparator()
@@ -2628,16 +2729,15 @@ import traceback
             export_action.triggered.connect(self.export_selected_results)
 
             # Show menu
-            menu.exec(self.results_table.mapToGlobal(position))
+            menu.exec(self.results_table.viewport().mapToGlobal(position))
 
-    except Exception as e:
+        except Exception as e:
             logger.error(f"Context menu error: {e}")
     def view_property_details(self, row: int):
         """View detailed information for a property"""
-    try:
-            apn_item = self.results_table.item(row, 0)
-            if apn_item:
-                apn = apn_item.text()
+        try:
+            apn = self.results_proxy.apn_at(row)
+            if apn:
                 self.property_details.load_property_data(apn)
 
                 # Switch to property details tab
@@ -2646,7 +2746,7 @@ import traceback
                         self.main_tabs.setCurrentIndex(i)
                         break
 
-    except Exception as e:
+        except Exception as e:
             logger.error(f"Failed to view property details: {e}")
     def collect_selected_data(self):
         """Collect data for selected properties"""
@@ -2675,17 +2775,16 @@ import traceback
             logger.error(f"Failed to collect selected data: {e}")
     def prioritize_collection(self, row: int):
         """Prioritize collection for a specific property"""
-    try:
-            apn_item = self.results_table.item(row, 0)
-            if apn_item:
-                apn = apn_item.text()
+        try:
+            apn = self.results_proxy.apn_at(row)
+            if apn:
                 if hasattr(self.background_manager, "prioritize_job"):
                     self.background_manager.prioritize_job(apn)
                     self.notification_area.show_message(
                         f"Prioritized collection for {apn}", "info"
                     )
 
-    except Exception as e:
+        except Exception as e:
             logger.error(f"Failed to prioritize collection: {e}")
 
     # Dialog and window methods
@@ -2737,7 +2836,7 @@ import traceback
             )
     def export_selected_results(self):
         """Export selected results only"""
-    try:
+        try:
             selected_apns = self.get_selected_apns()
             if not selected_apns:
                 self.notification_area.show_message("No properties selected", "warning")
@@ -2745,6 +2844,7 @@ import traceback
 
             # Filter results to selected APNs
             if hasattr(self, "last_search_results"):
+                selected_apns = set(selected_apns)
                 selected_results = [
                     result
                     for result in self.last_search_results
@@ -2758,7 +2858,7 @@ import traceback
                     "No results available for export", "warning"
                 )
 
-    except Exception as e:
+        except Exception as e:
             logger.error(f"Failed to export selected results: {e}")
     def show_settings(self):
         """Show settings dialog"""
@@ -2883,16 +2983,33 @@ Current Status:
                 self, "Error", f"Failed to open backup dialog: {str(e)}"
             )
     def validate_data(self):
-        """Run data validation"""
-    try:
-            # Show progress
-            self.status_progress.setVisible(True)
-            self.status_progress.setRange(0, 0)
-            self.status_bar.showMessage("Validating data...")
+        """Run data validation in a background thread"""
+        if self.validation_worker and self.validation_worker.isRunning():
+            self.notification_area.show_message(
+                "Data validation is already running", "info"
+            )
+            return
 
-            # Run validation
-            validation_results = self.data_validator.validate_all_data()
+        # Show progress; the row count is not known up front
+        self.status_progress.setVisible(True)
+        self.status_progress.setRange(0, 0)
+        self.status_bar.showMessage("Validating data...")
 
+        self.validation_worker = DataValidationWorker(self.data_validator)
+        self.validation_worker.progress_updated.connect(self.on_validation_progress)
+        self.validation_worker.validation_completed.connect(
+            self.on_validation_completed
+        )
+        self.validation_worker.error_occurred.connect(self.on_validation_error)
+        self.validation_worker.start()
+    def on_validation_progress(self, category: str, checked: int):
+        """Report validation progress in the status bar"""
+        self.status_bar.showMessage(
+            f"Validating {category.replace('_', ' ')}... {checked:,} rows checked"
+        )
+    def on_validation_completed(self, validation_results: Dict[str, Any]):
+        """Show the results of a finished validation run"""
+        try:
             # Hide progress
             self.status_progress.setVisible(False)
             self.status_bar.showMessage("Validation complete")
@@ -2911,10 +3028,17 @@ Current Status:
                     f"Data validation found {total_issues} issues", "warning"
                 )
 
-    except Exception as e:
+        except Exception as e:
             self.status_progress.setVisible(False)
             logger.error(f"Data validation failed: {e}")
             self.notification_area.show_message(f"Validation failed: {str(e)}", "error")
+    def on_validation_error(self, error_message: str):
+        """Handle a validation run that failed in its worker thread"""
+        self.status_progress.setVisible(False)
+        self.status_bar.showMessage("Validation failed")
+        self.notification_area.show_message(
+            f"Validation failed: {error_message}", "error"
+        )
     def import_data(self):
         """Import data from external source"""
     try:
@@ -0,0 +1,322 @@
+#!/usr/bin/env python
+"""
+Search Results Table Model
+Model/view backing for the search results grid: a columnar result store, a
+QAbstractTableModel that formats cells lazily in data(), and a proxy model
+for sorting and filtering.
+"""
+import logging
+import math
+from array import array
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Set
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, QSortFilterProxyModel, Qt
+from PyQt5.QtGui import QColor, QFontMetrics
+
+logger = logging.getLogger(__name__)
+
+# (header, result key, kind) - kind selects storage and formatting
+RESULT_COLUMNS = [
+    ("APN", "apn", "text"),
+    ("Address", "address", "text"),
+    ("Owner", "owner_name", "text"),
+    ("Property Type", "property_type", "text"),
+    ("Year Built", "year_built", "number"),
+    ("Square Feet", "square_feet", "number"),
+    ("Bedrooms", "bedrooms", "number"),
+    ("Bathrooms", "bathrooms", "number"),
+    ("Market Value", "market_value", "currency"),
+    ("Assessed Value", "assessed_value", "currency"),
+    ("Last Sale Date", "last_sale_date", "text"),
+    ("Last Sale Amount", "last_sale_amount", "currency"),
+    ("Data Status", "data_status", "status"),
+    ("Last Updated", "last_updated", "text"),
+]
+
+APN_COLUMN = 0
+STATUS_COLUMN = 12
+LAST_UPDATED_COLUMN = 13
+
+# Columns the text filter matches against
+FILTER_COLUMNS = (0, 1, 2)
+
+STATUS_COLORS = {
+    "complete": QColor(200, 255, 200),  # Light green
+    "collecting": QColor(255, 255, 200),  # Light yellow
+    "missing": QColor(255, 200, 200),  # Light red
+}
+
+
+def status_state(status_info: Dict[str, Any]) -> int:
+    """Status cell color state: 2 = complete, 1 = collecting, 0 = missing"""
+    if status_info["complete"]:
+        return 2
+    if status_info["collecting"]:
+        return 1
+    return 0
+
+
+def _to_number(value: Any) -> float:
+    """Convert a result value to a float, NaN when missing or not numeric"""
+    if value is None or value == "":
+        return math.nan
+    try:
+        return float(str(value).replace("$", "").replace(",", ""))
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _to_text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+class ColumnarResultStore:
+    """Search results held column by column
+
+    Numeric columns are packed into float arrays (NaN for missing values) and
+    repeated strings such as status and property type are interned, so a
+    large result set costs a few lists instead of a dict and 14 table items
+    per row.
+    """
+
+    def __init__(self):
+        self.row_count = 0
+        self.columns: List[Any] = [
+            self._empty_column(kind) for _, _, kind in RESULT_COLUMNS
+        ]
+        # Status column: 0 = missing/partial, 1 = collecting, 2 = complete
+        self.status_state = array("b")
+
+    @staticmethod
+    def _empty_column(kind: str):
+        return array("d") if kind in ("number", "currency") else []
+
+    @classmethod
+    def from_results(
+        cls,
+        results: List[Dict[str, Any]],
+        status_texts: Optional[List[str]] = None,
+        status_states: Optional[List[int]] = None,
+        last_updated: Optional[List[str]] = None,
+    ) -> "ColumnarResultStore":
+        store = cls()
+        intern_cache: Dict[str, str] = {}
+        for column, (_, key, kind) in enumerate(RESULT_COLUMNS):
+            values = store.columns[column]
+            if column == STATUS_COLUMN:
+                source = status_texts or [""] * len(results)
+                values.extend(intern_cache.setdefault(text, text) for text in source)
+            elif column == LAST_UPDATED_COLUMN:
+                values.extend(last_updated or [""] * len(results))
+            elif kind in ("number", "currency"):
+                values.extend(_to_number(result.get(key)) for result in results)
+            elif key == "property_type":
+                for result in results:
+                    text = _to_text(result.get(key))
+                    values.append(intern_cache.setdefault(text, text))
+            else:
+                values.extend(_to_text(result.get(key)) for result in results)
+
+        store.status_state.extend(status_states or [0] * len(results))
+        store.row_count = len(results)
+        return store
+
+    def sort_order(self, column: int, descending: bool = False) -> List[int]:
+        """Row permutation that sorts the store by one column
+
+        Missing numbers sort below every real value, and the sort is stable.
+        """
+        values = self.columns[column]
+        rows = range(self.row_count)
+        if isinstance(values, array) and values.typecode == "d":
+            missing = [row for row in rows if math.isnan(values[row])]
+            present = sorted(
+                (row for row in rows if not math.isnan(values[row])),
+                key=values.__getitem__,
+                reverse=descending,
+            )
+            return present + missing if descending else missing + present
+        if column == STATUS_COLUMN:
+            key = self.status_state.__getitem__
+        else:
+            key = values.__getitem__
+        return sorted(rows, key=key, reverse=descending)
+
+    def reorder(self, order: List[int]):
+        """Permute every column into the given row order"""
+        for column, values in enumerate(self.columns):
+            reordered = [values[row] for row in order]
+            self.columns[column] = (
+                array("d", reordered) if isinstance(values, array) else reordered
+            )
+        self.status_state = array("b", [self.status_state[row] for row in order])
+
+    def raw(self, row: int, column: int) -> Any:
+        return self.columns[column][row]
+
+    def display(self, row: int, column: int) -> str:
+        """Format one cell for display"""
+        value = self.columns[column][row]
+        kind = RESULT_COLUMNS[column][2]
+        if kind == "currency":
+            return f"${value:,.0f}" if value and not math.isnan(value) else ""
+        if kind == "number":
+            if math.isnan(value):
+                return ""
+            return str(int(value)) if value.is_integer() else f"{value:g}"
+        return value
+
+
+class PropertyResultsModel(QAbstractTableModel):
+    """Table model over a ColumnarResultStore; cells are formatted on demand"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.store = ColumnarResultStore()
+
+    def set_store(self, store: ColumnarResultStore):
+        self.beginResetModel()
+        self.store = store
+        self.endResetModel()
+
+    def clear(self):
+        self.set_store(ColumnarResultStore())
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self.store.row_count
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(RESULT_COLUMNS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+
+        if role == Qt.DisplayRole:
+            return self.store.display(row, column)
+        if role == Qt.BackgroundRole and column == STATUS_COLUMN:
+            state = self.store.status_state[row]
+            if state == 2:
+                return STATUS_COLORS["complete"]
+            if state == 1:
+                return STATUS_COLORS["collecting"]
+            return STATUS_COLORS["missing"]
+        if role == Qt.TextAlignmentRole and RESULT_COLUMNS[column][2] in (
+            "number",
+            "currency",
+        ):
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole) -> Any:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return RESULT_COLUMNS[section][0]
+        return super().headerData(section, orientation, role)
+
+    def sort(self, column: int, order=Qt.AscendingOrder):
+        """Sort the store in place rather than through per-cell comparisons"""
+        if column < 0 or not self.store.row_count:
+            return
+        self.layoutAboutToBeChanged.emit()
+        new_order = self.store.sort_order(column, order == Qt.DescendingOrder)
+        self.store.reorder(new_order)
+
+        # Keep selections and the current index on the same records
+        old_to_new = {old_row: new_row for new_row, old_row in enumerate(new_order)}
+        persistent = self.persistentIndexList()
+        self.changePersistentIndexList(
+            persistent,
+            [
+                self.index(old_to_new[index.row()], index.column())
+                for index in persistent
+            ],
+        )
+        self.layoutChanged.emit()
+
+    def apn_at(self, row: int) -> str:
+        return self.store.columns[APN_COLUMN][row]
+
+    def row_for_apn(self, apn: str) -> Optional[int]:
+        try:
+            return self.store.columns[APN_COLUMN].index(apn)
+        except ValueError:
+            return None
+
+    def update_status(self, row: int, text: str, state: int, last_updated: str):
+        """Update the collection status cells of one row"""
+        self.store.columns[STATUS_COLUMN][row] = text
+        self.store.columns[LAST_UPDATED_COLUMN][row] = last_updated
+        self.store.status_state[row] = state
+        self.dataChanged.emit(
+            self.index(row, STATUS_COLUMN), self.index(row, LAST_UPDATED_COLUMN)
+        )
+
+
+class PropertyResultsProxyModel(QSortFilterProxyModel):
+    """Filters on APN/address/owner text; sorting is delegated to the source
+
+    QSortFilterProxyModel's own sort calls back into Python for every
+    comparison, which takes seconds at 100k rows. Forwarding sort() to the
+    source model keeps it to one key sort over a column array.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._filter_text = ""
+        self.setDynamicSortFilter(False)
+
+    def sort(self, column: int, order=Qt.AscendingOrder):
+        source = self.sourceModel()
+        if source is not None:
+            source.sort(column, order)
+
+    def set_filter_text(self, text: str):
+        self._filter_text = text.strip().lower()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if not self._filter_text:
+            return True
+        # Read the store directly rather than going through data()
+        columns = self.sourceModel().store.columns
+        return any(
+            self._filter_text in columns[column][source_row].lower()
+            for column in FILTER_COLUMNS
+        )
+
+    def apn_at(self, proxy_row: int) -> str:
+        source_row = self.mapToSource(self.index(proxy_row, APN_COLUMN)).row()
+        return self.sourceModel().apn_at(source_row)
+
+
+def sample_column_widths(
+    model: PropertyResultsModel,
+    font_metrics: QFontMetrics,
+    sample_size: int = 200,
+    padding: int = 24,
+    max_width: int = 400,
+) -> List[int]:
+    """Column widths from the header and an evenly spaced sample of rows
+
+    Measures at most sample_size rows instead of every cell, which is what
+    makes resizeColumnsToContents() slow on large result sets.
+    """
+    row_count = model.rowCount()
+    step = max(1, row_count // sample_size) if row_count else 1
+    sample_rows = range(0, row_count, step)
+
+    widths = []
+    for column, (header, _, _) in enumerate(RESULT_COLUMNS):
+        width = font_metrics.horizontalAdvance(header)
+        for row in sample_rows:
+            width = max(
+                width, font_metrics.horizontalAdvance(model.store.display(row, column))
+            )
+        widths.append(min(width + padding, max_width))
+    return widths
@@ -0,0 +1,196 @@
+"""
+Hedged Requests
+Starts a backup source (e.g. a web scraper) when the primary source (the
+API) has not answered by its recent p90 latency; the first good answer wins
+and the other call is cancelled
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from .adaptive_concurrency import percentile
+
+logger = logging.getLogger(__name__)
+
+PRIMARY = "primary"
+HEDGE = "hedge"
+
+
+class HedgePolicy:
+    """Hedging policy and outcome metrics for one primary/backup pair
+
+    The hedge delay is the given percentile of recent primary answer times,
+    clamped to [min_delay, max_delay], or initial_delay until min_samples
+    answers have been seen. A primary that answers in time with nothing
+    useful falls back to the backup immediately. A primary that loses to the
+    hedge is cancelled before its latency is known; the time it had run by
+    then is sampled as a lower bound, so slow primaries keep pulling the
+    delay up instead of dropping out of the window.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        quantile: float = 0.9,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.05,
+        max_delay: float = 5.0,
+        window: int = 200,
+        min_samples: int = 10,
+    ):
+        self.name = name
+        self.quantile = quantile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+        # Outcome counters
+        self.requests = 0
+        self.hedged = 0  # backup started while the primary was in flight
+        self.hedge_wins = 0
+        self.fallbacks = 0  # primary answered in time, but not usefully
+        self.fallback_wins = 0
+        self.primary_wins = 0
+        self.no_answer = 0
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait on the primary before starting the backup"""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                delay = self.initial_delay
+            else:
+                delay = percentile(sorted(self._latencies), self.quantile)
+        return min(self.max_delay, max(self.min_delay, delay))
+
+    def record_latency(self, latency: float):
+        with self._lock:
+            self._latencies.append(latency)
+
+    def _count(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    async def run(
+        self,
+        primary: Callable[[], Awaitable],
+        backup: Callable[[], Awaitable],
+        accept: Callable[[Any], bool] = bool,
+        started_at: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> Tuple[Any, Optional[str]]:
+        """Return the first accepted answer and its source (primary or hedge)
+
+        started_at is the time.perf_counter() value at which the primary was
+        started, if it was already running; the hedge delay counts from
+        there. Returns (None, None) if neither source answers usefully within
+        timeout.
+        """
+        self._count("requests")
+        try:
+            return await asyncio.wait_for(
+                self._race(primary, backup, accept, started_at), timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"{self.name}: no answer within {timeout:.1f}s")
+            self._count("no_answer")
+            return None, None
+
+    async def _race(
+        self,
+        primary: Callable[[], Awaitable],
+        backup: Callable[[], Awaitable],
+        accept: Callable[[Any], bool],
+        started_at: Optional[float],
+    ) -> Tuple[Any, Optional[str]]:
+        started_at = time.perf_counter() if started_at is None else started_at
+        primary_task = asyncio.ensure_future(primary())
+        backup_task = None
+        try:
+            waited = time.perf_counter() - started_at
+            await asyncio.wait(
+                {primary_task}, timeout=max(0.0, self.hedge_delay() - waited)
+            )
+
+            if primary_task.done():
+                answer = self._answer(primary_task)
+                self.record_latency(time.perf_counter() - started_at)
+                if accept(answer):
+                    self._count("primary_wins")
+                    return answer, PRIMARY
+
+                # Answered in time with nothing useful - fall back outright
+                self._count("fallbacks")
+                backup_task = asyncio.ensure_future(backup())
+                await asyncio.wait({backup_task})
+                answer = self._answer(backup_task)
+                if accept(answer):
+                    self._count("fallback_wins")
+                    return answer, HEDGE
+                self._count("no_answer")
+                return None, None
+
+            # Primary is slow - race it against the backup
+            self._count("hedged")
+            logger.debug(f"{self.name}: hedging after {waited:.2f}s+")
+            backup_task = asyncio.ensure_future(backup())
+            pending = {primary_task, backup_task}
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    answer = self._answer(task)
+                    if task is primary_task:
+                        self.record_latency(time.perf_counter() - started_at)
+                    if accept(answer):
+                        if task is backup_task:
+                            self._count("hedge_wins")
+                            return answer, HEDGE
+                        self._count("primary_wins")
+                        return answer, PRIMARY
+
+            self._count("no_answer")
+            return None, None
+        finally:
+            if not primary_task.done():
+                self.record_latency(time.perf_counter() - started_at)
+            # Cancel the loser (or both, on timeout)
+            for task in (primary_task, backup_task):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    def _answer(self, task: asyncio.Future) -> Any:
+        """A finished task's result, or None if it failed"""
+        if task.cancelled():
+            return None
+        error = task.exception()
+        if error is not None:
+            logger.debug(f"{self.name}: source failed: {error}")
+            return None
+        return task.result()
+
+    def get_stats(self) -> Dict[str, Any]:
+        hedge_delay = self.hedge_delay()
+        with self._lock:
+            requests = max(self.requests, 1)
+            return {
+                "requests": self.requests,
+                "hedge_delay_ms": hedge_delay * 1000,
+                "hedged": self.hedged,
+                "hedge_rate_percent": self.hedged / requests * 100,
+                "hedge_wins": self.hedge_wins,
+                "hedge_win_rate_percent": (
+                    self.hedge_wins / max(self.hedged, 1) * 100
+                ),
+                "fallbacks": self.fallbacks,
+                "fallback_wins": self.fallback_wins,
+                "primary_wins": self.primary_wins,
+                "no_answer": self.no_answer,
+                "samples": len(self._latencies),
+            }
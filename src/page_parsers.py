@@ -0,0 +1,460 @@
+"""
+Page Parsers
+Offline parsers for Maricopa County Treasurer and Recorder result pages.
+
+Pages are tokenized once with the standard library HTML parser into a small
+element tree, so extraction is a linear walk instead of repeated DOTALL regex
+passes over the whole page. The parsers take raw HTML (str or bytes) and do
+not depend on Playwright or Selenium, so they work on saved pages too.
+"""
+import logging
+import re
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+VOID_TAGS = frozenset(
+    "area base br col embed hr img input link meta param source track wbr".split()
+)
+SKIP_TEXT_TAGS = frozenset(["script", "style", "noscript", "template"])
+ROW_TAGS = frozenset(["tr", "row"])
+CELL_TAGS = frozenset(["td", "th", "cell", "gridcell", "columnheader"])
+
+# Tags closed implicitly when a sibling of the same kind opens
+_IMPLICIT_CLOSE = {
+    "td": ("td", "th"),
+    "th": ("td", "th"),
+    "tr": ("tr", "td", "th"),
+    "li": ("li",),
+    "p": ("p",),
+    "option": ("option",),
+}
+
+MONEY_RE = re.compile(r"\$?\s*(\d[\d,]*(?:\.\d+)?)")
+YEAR_RE = re.compile(r"^\d{4}$")
+PAYMENT_STATUS_RE = re.compile(r"\b(paid|unpaid)\b", re.IGNORECASE)
+DOCUMENT_NUMBER_RE = re.compile(r"\d{4}-\d{6,8}")
+DATE_RE = re.compile(r"\d{1,2}/\d{1,2}/\d{4}")
+DOCUMENT_TYPE_RE = re.compile(r"^[A-Za-z][A-Za-z\s]*$")
+CHARSET_RE = re.compile(rb"charset=[\"']?([\w-]+)", re.IGNORECASE)
+WHITESPACE_RE = re.compile(r"\s+")
+
+# How many text nodes after a label are searched for its value
+LABEL_LOOKAHEAD = 6
+
+MAX_DOCUMENTS = 50
+
+HtmlSource = Union[str, bytes, "ParsedPage"]
+
+
+class Element:
+    """Element node: tag, attributes, children (elements or text) and order"""
+
+    __slots__ = ("tag", "attrs", "children", "parent", "position")
+
+    def __init__(
+        self, tag: str, attrs: Dict[str, Optional[str]], parent, position: int
+    ):
+        self.tag = tag
+        self.attrs = attrs
+        self.children: List[Union["Element", str]] = []
+        self.parent = parent
+        self.position = position
+
+    def iter(self, tags=None) -> Iterator["Element"]:
+        """Descendant elements in document order, optionally filtered by tag"""
+        stack = list(reversed([c for c in self.children if isinstance(c, Element)]))
+        while stack:
+            element = stack.pop()
+            if tags is None or element.tag in tags:
+                yield element
+            stack.extend(
+                reversed([c for c in element.children if isinstance(c, Element)])
+            )
+
+    def text_lines(self) -> List[str]:
+        """Non-empty text nodes below this element, whitespace collapsed"""
+        lines = []
+        stack = list(reversed(self.children))
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Element):
+                stack.extend(reversed(node.children))
+            else:
+                lines.append(node)
+        return lines
+
+    def text(self) -> str:
+        return " ".join(self.text_lines())
+
+    def rows(self) -> List["Element"]:
+        """Rows belonging to this table, not to tables nested inside it"""
+        rows = []
+        stack = list(reversed([c for c in self.children if isinstance(c, Element)]))
+        while stack:
+            element = stack.pop()
+            if element.tag in ROW_TAGS:
+                rows.append(element)
+            elif element.tag != "table":
+                stack.extend(
+                    reversed([c for c in element.children if isinstance(c, Element)])
+                )
+        return rows
+
+    def cells(self) -> List[str]:
+        """Text of each cell in a row; "" for empty cells"""
+        return [
+            child.text()
+            for child in self.children
+            if isinstance(child, Element) and child.tag in CELL_TAGS
+        ]
+
+    def __repr__(self):
+        return f"<{self.tag} at {self.position}>"
+
+
+class ParsedPage:
+    """A tokenized page: the element tree plus document-order indexes"""
+
+    def __init__(
+        self, root: Element, elements: List[Element], texts: List[Tuple[int, str]]
+    ):
+        self.root = root
+        # Elements in start-tag order; element.position indexes this list
+        self.elements = elements
+        # (number of elements started before the text, text) in document order
+        self.texts = texts
+
+    def find_label(self, label: str) -> Optional[int]:
+        """Index into texts of the first text node containing label"""
+        needle = label.lower()
+        for index, (_, text) in enumerate(self.texts):
+            if needle in text.lower():
+                return index
+        return None
+
+    def lines_after_label(self, label: str) -> List[str]:
+        """Text lines of the first element with text that starts after label
+
+        Handles label/value pairs laid out as adjacent cells, definition
+        lists or sibling containers.
+        """
+        index = self.find_label(label)
+        if index is None:
+            return []
+        start = self.texts[index][0]
+        for element in self.elements[start:]:
+            lines = element.text_lines()
+            if lines:
+                return lines
+        return []
+
+    def money_after_label(self, label: str) -> Optional[float]:
+        """First amount in the label's own text or the few text nodes after it"""
+        index = self.find_label(label)
+        if index is None:
+            return None
+        text = self.texts[index][1]
+        remainder = text[text.lower().index(label.lower()) + len(label):]
+        candidates = [remainder] + [
+            t for _, t in self.texts[index + 1:index + 1 + LABEL_LOOKAHEAD]
+        ]
+        for candidate in candidates:
+            match = MONEY_RE.search(candidate)
+            if match:
+                return _to_amount(match.group(1))
+        return None
+
+    def tables(self) -> List[Element]:
+        return list(self.root.iter(("table",)))
+
+    def rows(self) -> List[Element]:
+        return list(self.root.iter(ROW_TAGS))
+
+
+class _TreeBuilder(HTMLParser):
+    """Builds an Element tree, tolerating unclosed and stray end tags"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Element("#document", {}, None, -1)
+        self.elements: List[Element] = []
+        self.texts: List[Tuple[int, str]] = []
+        self._stack = [self.root]
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        closes = _IMPLICIT_CLOSE.get(tag)
+        if closes and self._stack[-1].tag in closes:
+            self._close(self._stack[-1].tag)
+            # A new row also closes the row holding an unclosed cell
+            if tag == "tr" and self._stack[-1].tag == "tr":
+                self._close("tr")
+
+        parent = self._stack[-1]
+        element = Element(tag, dict(attrs), parent, len(self.elements))
+        parent.children.append(element)
+        self.elements.append(element)
+        if tag in VOID_TAGS:
+            return
+        self._stack.append(element)
+        if tag in SKIP_TEXT_TAGS:
+            self._skip_depth += 1
+
+    def handle_startendtag(self, tag, attrs):
+        parent = self._stack[-1]
+        element = Element(tag, dict(attrs), parent, len(self.elements))
+        parent.children.append(element)
+        self.elements.append(element)
+
+    def handle_endtag(self, tag):
+        if tag in VOID_TAGS:
+            return
+        self._close(tag)
+
+    def _close(self, tag):
+        # Ignore end tags with no matching open element
+        for depth in range(len(self._stack) - 1, 0, -1):
+            if self._stack[depth].tag == tag:
+                for element in self._stack[depth:]:
+                    if element.tag in SKIP_TEXT_TAGS:
+                        self._skip_depth -= 1
+                del self._stack[depth:]
+                return
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        text = WHITESPACE_RE.sub(" ", data).strip()
+        if text:
+            self._stack[-1].children.append(text)
+            self.texts.append((len(self.elements), text))
+
+
+def decode_html(html: Union[str, bytes]) -> str:
+    """Decode raw page bytes using the declared charset, falling back to UTF-8"""
+    if isinstance(html, str):
+        return html
+    match = CHARSET_RE.search(html[:2048])
+    encoding = match.group(1).decode("ascii") if match else "utf-8"
+    try:
+        return html.decode(encoding, errors="replace")
+    except LookupError:
+        return html.decode("utf-8", errors="replace")
+
+
+def parse_html(html: HtmlSource) -> ParsedPage:
+    """Tokenize a page once; already parsed pages are returned unchanged"""
+    if isinstance(html, ParsedPage):
+        return html
+    builder = _TreeBuilder()
+    builder.feed(decode_html(html))
+    builder.close()
+    return ParsedPage(builder.root, builder.elements, builder.texts)
+
+
+def load_page(path: Union[str, Path]) -> ParsedPage:
+    """Parse a saved page from disk"""
+    return parse_html(Path(path).read_bytes())
+
+
+def _to_amount(value: str) -> Optional[float]:
+    try:
+        return float(value.replace(",", "").replace("$", "").strip())
+    except ValueError:
+        return None
+
+
+# --- Treasurer (tax) pages ---
+
+
+def parse_owner_info(html: HtmlSource) -> Dict[str, str]:
+    """Owner name, mailing address and situs address from a treasurer page"""
+    page = parse_html(html)
+    owner_info = {}
+
+    mailing_lines = page.lines_after_label("Current Mailing Name & Address")
+    if mailing_lines:
+        owner_info["owner_name"] = mailing_lines[0]
+        if len(mailing_lines) > 1:
+            owner_info["mailing_address"] = ", ".join(mailing_lines[1:])
+
+    property_lines = page.lines_after_label("Property (Situs) Address")
+    if property_lines:
+        owner_info["property_address"] = ", ".join(property_lines)
+
+    return owner_info
+
+
+def parse_current_tax(html: HtmlSource) -> Dict[str, Any]:
+    """Assessed tax, tax paid, total due and payment status for the current year"""
+    page = parse_html(html)
+    current_tax = {}
+
+    for key, label in (
+        ("assessed_tax", "Assessed Tax:"),
+        ("tax_paid", "Tax Paid:"),
+        ("total_due", "Total Due:"),
+    ):
+        amount = page.money_after_label(label)
+        if amount is not None:
+            current_tax[key] = amount
+
+    current_tax["payment_status"] = (
+        "UNPAID" if current_tax.get("total_due", 0) > 0 else "PAID"
+    )
+    return current_tax
+
+
+def _row_values(row: Element) -> List[str]:
+    cells = row.cells()
+    return cells if cells else row.text_lines()
+
+
+def parse_tax_history(html: HtmlSource) -> List[Dict[str, Any]]:
+    """Tax year rows (year, status, assessed tax, amount due), newest first"""
+    page = parse_html(html)
+    tax_history = []
+
+    for row in page.rows():
+        values = _row_values(row)
+        year_index = next(
+            (i for i, value in enumerate(values) if YEAR_RE.match(value)), None
+        )
+        if year_index is None:
+            continue
+        status_index = next(
+            (
+                i
+                for i in range(year_index + 1, len(values))
+                if PAYMENT_STATUS_RE.search(values[i])
+            ),
+            None,
+        )
+        if status_index is None:
+            continue
+        amounts = [
+            _to_amount(value)
+            for value in values[status_index + 1:]
+            if "$" in value and MONEY_RE.search(value)
+        ]
+        amounts = [amount for amount in amounts if amount is not None]
+        if len(amounts) < 2:
+            continue
+
+        status = PAYMENT_STATUS_RE.search(values[status_index]).group(1).upper()
+        assessed_tax, amount_due = amounts[0], amounts[1]
+        tax_history.append(
+            {
+                "tax_year": int(values[year_index]),
+                "payment_status": status,
+                "assessed_tax": assessed_tax,
+                "amount_due": amount_due,
+                "tax_paid": assessed_tax if status == "PAID" else 0.0,
+            }
+        )
+
+    return sorted(tax_history, key=lambda x: x["tax_year"], reverse=True)
+
+
+def parse_tax_page(html: HtmlSource) -> Dict[str, Any]:
+    """All tax sections of a treasurer page, parsed from one tokenization"""
+    page = parse_html(html)
+    return {
+        "owner_info": parse_owner_info(page),
+        "current_tax": parse_current_tax(page),
+        "tax_history": parse_tax_history(page),
+        "scrape_source": "treasurer.maricopa.gov",
+    }
+
+
+# --- Recorder (document) pages ---
+
+
+def _document_from_row(values: List[str], parse_date) -> Optional[Dict[str, Any]]:
+    """Document record from a row with a recording number, date and type"""
+    number_index = next(
+        (i for i, value in enumerate(values) if DOCUMENT_NUMBER_RE.search(value)), None
+    )
+    if number_index is None:
+        return None
+    date_index = next(
+        (
+            i
+            for i in range(number_index + 1, len(values))
+            if DATE_RE.search(values[i])
+        ),
+        None,
+    )
+    if date_index is None:
+        return None
+    type_index = next(
+        (
+            i
+            for i in range(date_index + 1, len(values))
+            if DOCUMENT_TYPE_RE.match(values[i])
+        ),
+        None,
+    )
+    if type_index is None:
+        return None
+
+    return {
+        "document_number": DOCUMENT_NUMBER_RE.search(values[number_index]).group(0),
+        "date": parse_date(DATE_RE.search(values[date_index]).group(0)),
+        "document_type": values[type_index].strip(),
+        "description": values[type_index + 1] if type_index + 1 < len(values) else "",
+        "raw_data": tuple(values),
+    }
+
+
+def parse_recorder_documents_generic(
+    html: HtmlSource, parse_date
+) -> List[Dict[str, Any]]:
+    """Fallback: first table whose data rows have at least three cells"""
+    page = parse_html(html)
+    documents = []
+
+    for table in page.tables():
+        for row in table.rows()[1:]:  # Skip header row
+            cells = row.cells()
+            if len(cells) < 3:
+                continue
+            documents.append(
+                {
+                    "document_number": cells[0],
+                    "date": parse_date(cells[1]),
+                    "document_type": cells[2],
+                    "description": cells[3] if len(cells) > 3 else "",
+                    "raw_data": cells,
+                }
+            )
+        if documents:  # Found documents in this table
+            break
+
+    return documents
+
+
+def parse_recorder_documents(
+    html: HtmlSource, parse_date=None
+) -> List[Dict[str, Any]]:
+    """Recorded documents from a recorder search results page
+
+    parse_date normalizes the date column; by default dates are returned as
+    they appear on the page.
+    """
+    parse_date = parse_date or (lambda value: value)
+    page = parse_html(html)
+
+    documents = []
+    for row in page.rows():
+        document = _document_from_row(_row_values(row), parse_date)
+        if document:
+            documents.append(document)
+
+    if not documents:
+        documents = parse_recorder_documents_generic(page, parse_date)
+
+    return documents[:MAX_DOCUMENTS]
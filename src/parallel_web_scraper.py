@@ -9,7 +9,8 @@ import logging
 import queue
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import as_completed
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -45,12 +46,28 @@ except ImportError:
     WebDriverException = Exception
     SELENIUM_AVAILABLE = False
 
+# Optional psutil for measuring browser memory
+try:
+    import psutil
+
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    psutil = None
+    PSUTIL_AVAILABLE = False
+
 from PyQt5.QtCore import QThread, pyqtSignal
 
 from logging_config import get_logger, get_performance_logger
 from recorder_scraper import MaricopaRecorderScraper
 from tax_scraper import MaricopaTaxScraper
 
+from src.work_scheduler import (
+    Resource,
+    WorkScheduler,
+    get_work_scheduler,
+    priority_from_level,
+)
+
 logger = get_logger(__name__)
 perf_logger = get_performance_logger(__name__)
 
@@ -65,6 +82,16 @@ class ScrapingTask(Enum):
     OWNER_PROPERTIES = "owner_properties"
 
 
+# Scheduler budget each task type counts against
+TASK_RESOURCES = {
+    ScrapingTask.PROPERTY_DETAILS: Resource.ASSESSOR_API,
+    ScrapingTask.TAX_INFORMATION: Resource.TREASURER,
+    ScrapingTask.SALES_HISTORY: Resource.RECORDER,
+    ScrapingTask.DOCUMENT_RECORDS: Resource.RECORDER,
+    ScrapingTask.OWNER_PROPERTIES: Resource.ASSESSOR_API,
+}
+
+
 @dataclass
 class ScrapingRequest:
     """Individual scraping request"""
@@ -88,17 +115,61 @@ class ScrapingRequest:
         return self.task_type == other.task_type and self.identifier == other.identifier
 
 
+@dataclass
+class PooledBrowser:
+    """Bookkeeping for one browser owned by the pool"""
+
+    driver: Any
+    created_at: float = field(default_factory=time.monotonic)
+    uses: int = 0
+    checked_out_at: Optional[float] = None
+
+
+def process_tree_rss_mb(driver) -> Optional[float]:
+    """Resident memory of a driver's service process and the browsers under it"""
+    if not PSUTIL_AVAILABLE:
+        return None
+    process = getattr(getattr(driver, "service", None), "process", None)
+    pid = getattr(process, "pid", None)
+    if not pid:
+        return None
+
+    try:
+        root = psutil.Process(pid)
+        total = 0
+        for proc in [root] + root.children(recursive=True):
+            try:
+                total += proc.memory_info().rss
+            except psutil.Error:
+                continue
+        return total / (1024 * 1024)
+    except psutil.Error:
+        return None
+
+
 class BrowserPool:
-    """Pool of browser instances for parallel scraping"""
+    """Pool of browser instances for parallel scraping
+
+    Browsers are recycled after max_uses_per_browser checkouts or once their
+    process tree grows past max_rss_mb, so long runs do not accumulate Chrome
+    memory leaks. A maintenance thread health-checks idle browsers, replaces
+    crashed ones and keeps at least min_idle browsers warm.
+    """
     def __init__(
         self,
         chrome_driver_path: str,
         pool_size: int = 4,
         headless: bool = True,
         user_agent_rotation: bool = True,
+        min_idle: int = 2,
+        max_uses_per_browser: int = 50,
+        max_rss_mb: Optional[float] = 1024.0,
+        health_check_interval: Optional[float] = 15.0,
+        browser_factory: Optional[Callable[[], Any]] = None,
+        memory_probe: Optional[Callable[[Any], Optional[float]]] = None,
     ):
 
-        if not SELENIUM_AVAILABLE:
+        if browser_factory is None and not SELENIUM_AVAILABLE:
             raise ImportError(
                 "Selenium is required for BrowserPool but is not installed. Install with: pip install selenium"
             )
@@ -107,11 +178,31 @@ class BrowserPool:
         self.pool_size = pool_size
         self.headless = headless
         self.user_agent_rotation = user_agent_rotation
+        self.min_idle = min(min_idle, pool_size)
+        self.max_uses_per_browser = max_uses_per_browser
+        self.max_rss_mb = max_rss_mb
+        self.browser_factory = browser_factory
+        self.memory_probe = memory_probe or process_tree_rss_mb
 
         self.browser_queue = queue.Queue(maxsize=pool_size)
         self.active_browsers = set()
         self.lock = RLock()
+        # Browsers alive or being created; only changed while holding the lock
         self.total_browsers = 0
+        self._browsers: Dict[int, PooledBrowser] = {}
+        self._closed = False
+        self._stop_event = Event()
+        self._wake_event = Event()
+
+        # Metrics
+        self._started_at = time.monotonic()
+        self._wait_times = deque(maxlen=1000)
+        self._busy_seconds = 0.0
+        self.acquisitions = 0
+        self.acquire_timeouts = 0
+        self.created_browsers = 0
+        self.recycled_browsers = 0
+        self.crashed_browsers = 0
 
         # User agent rotation for avoiding detection
         self.user_agents = [
@@ -126,23 +217,26 @@ class BrowserPool:
         # Initialize pool with some browsers
         self._initialize_pool()
 
+        # Background health checks and replacement of crashed browsers
+        self._maintenance_thread = None
+        if health_check_interval:
+            self._maintenance_thread = threading.Thread(
+                target=self._maintenance_loop,
+                args=(health_check_interval,),
+                name="BrowserPoolMaintenance",
+                daemon=True,
+            )
+            self._maintenance_thread.start()
+
         logger.info(
-            f"Browser pool initialized with {pool_size} browsers (headless: {headless})"
+            f"Browser pool initialized with {pool_size} browsers (headless: {headless}, "
+            f"min idle: {self.min_idle}, max uses: {max_uses_per_browser}, "
+            f"max RSS: {max_rss_mb} MB)"
         )
     def _initialize_pool(self):
-        """Pre-create some browser instances"""
-        initial_count = min(2, self.pool_size)  # Start with 2 browsers
-
-        for _ in range(initial_count):
-    try:
-                browser = self._create_browser()
-                self.browser_queue.put(browser, block=False)
-                self.total_browsers += 1
-                logger.debug("Pre-created browser instance")
-    except Exception as e:
-                logger.warning(f"Failed to pre-create browser: {e}")
-                break
-    def _create_browser(self) -> webdriver.Chrome:
+        """Pre-create browsers up to the idle floor"""
+        self._fill_to_floor()
+    def _create_browser(self) -> "webdriver.Chrome":
         """Create a new Chrome browser instance"""
         options = Options()
 
@@ -162,11 +256,12 @@ class BrowserPool:
 
         # User agent rotation
         if self.user_agent_rotation:
-            user_agent = self.user_agents[
-                self.current_user_agent_index % len(self.user_agents)
-            ]
+            with self.lock:
+                user_agent = self.user_agents[
+                    self.current_user_agent_index % len(self.user_agents)
+                ]
+                self.current_user_agent_index += 1
             options.add_argument(f"--user-agent={user_agent}")
-            self.current_user_agent_index += 1
 
         # Additional stealth measures
         prefs = {
@@ -176,7 +271,7 @@ class BrowserPool:
         }
         options.add_experimental_option("prefs", prefs)
 
-    try:
+        try:
             service = Service(self.chrome_driver_path)
             driver = webdriver.Chrome(service=service, options=options)
 
@@ -195,109 +290,271 @@ class BrowserPool:
 
             return driver
 
-    except Exception as e:
+        except Exception as e:
             logger.error(f"Failed to create browser: {e}")
             raise
-    def acquire_browser(self, timeout: float = 10.0) -> webdriver.Chrome:
-        """Get a browser from the pool"""
-        start_time = time.time()
+    def _spawn_browser(self):
+        """Create and register a browser if the pool has capacity, else None
 
-        while time.time() - start_time < timeout:
-    try:
-                # Try to get existing browser
-                browser = self.browser_queue.get(timeout=1.0)
-
-                # Verify browser is still responsive
-    try:
-                    browser.current_url  # Simple check
-                    with self.lock:
-                        self.active_browsers.add(browser)
-                    return browser
-    except Exception as e:
-                    logger.warning(f"Browser not responsive, creating new one: {e}")
-    try:
-                        browser.quit()
-    except:
-            pass
+        The slot is reserved under the lock but the (slow) browser start
+        happens outside it.
+        """
+        with self.lock:
+            if self._closed or self.total_browsers >= self.pool_size:
+                return None
+            self.total_browsers += 1
+
+        try:
+            if self.browser_factory is not None:
+                browser = self.browser_factory()
+            else:
+                browser = self._create_browser()
+        except Exception as e:
+            with self.lock:
+                self.total_browsers -= 1
+            logger.error(f"Failed to create browser: {e}")
+            return None
 
-    except queue.Empty:
-                pass
+        with self.lock:
+            self.created_browsers += 1
+            if not self._closed:
+                self._browsers[id(browser)] = PooledBrowser(browser)
+                return browser
+            # Pool closed while this browser was starting
+            self.total_browsers -= 1
+
+        browser.quit()
+        return None
+    def _discard_browser(self, browser, crashed: bool = False):
+        """Remove a browser from the pool and quit it"""
+        with self.lock:
+            record = self._browsers.pop(id(browser), None)
+            self.active_browsers.discard(browser)
+            if record is not None:
+                self.total_browsers -= 1
+                if record.checked_out_at is not None:
+                    self._busy_seconds += time.monotonic() - record.checked_out_at
+                if crashed:
+                    self.crashed_browsers += 1
+                else:
+                    self.recycled_browsers += 1
+
+        try:
+            browser.quit()
+        except Exception as e:
+            logger.debug(f"Error quitting browser: {e}")
+
+        # Let the maintenance thread restore the idle floor
+        if not self._closed:
+            self._wake_event.set()
+    def _is_alive(self, browser) -> bool:
+        try:
+            browser.current_url  # Simple check
+            return True
+        except Exception:
+            return False
+    def _recycle_reason(self, record: PooledBrowser) -> Optional[str]:
+        """Why a browser should be retired rather than reused, if it should"""
+        if self.max_uses_per_browser and record.uses >= self.max_uses_per_browser:
+            return f"{record.uses} uses"
+        if self.max_rss_mb:
+            rss_mb = self.memory_probe(record.driver)
+            if rss_mb is not None and rss_mb > self.max_rss_mb:
+                return f"{rss_mb:.0f} MB RSS"
+        return None
+    def _fill_to_floor(self) -> int:
+        """Create idle browsers until min_idle are waiting, within capacity"""
+        created = 0
+        while self.browser_queue.qsize() < self.min_idle:
+            browser = self._spawn_browser()
+            if browser is None:
+                break
+            try:
+                self.browser_queue.put(browser, block=False)
+                created += 1
+                logger.debug("Pre-created browser instance")
+            except queue.Full:
+                self._discard_browser(browser)
+                break
+        return created
+    def _maintenance_loop(self, interval: float):
+        """Background thread: health-check idle browsers and refill the pool"""
+        while not self._stop_event.is_set():
+            self._wake_event.wait(interval)
+            self._wake_event.clear()
+            if self._stop_event.is_set():
+                break
+            try:
+                self.run_maintenance()
+            except Exception as e:
+                logger.error(f"Browser pool maintenance error: {e}")
+    def run_maintenance(self) -> Dict[str, int]:
+        """Replace dead or bloated idle browsers and refill to the idle floor"""
+        idle = []
+        while True:
+            try:
+                idle.append(self.browser_queue.get(block=False))
+            except queue.Empty:
+                break
 
-            # Create new browser if pool is empty and we haven't hit limit
+        replaced = 0
+        for browser in idle:
             with self.lock:
-                if self.total_browsers < self.pool_size:
-    try:
-                        browser = self._create_browser()
-                        self.total_browsers += 1
-                        self.active_browsers.add(browser)
-                        return browser
-    except Exception as e:
-                        logger.error(f"Failed to create browser on demand: {e}")
+                record = self._browsers.get(id(browser))
+            if record is None or not self._is_alive(browser):
+                logger.warning("Replacing crashed browser from pool")
+                self._discard_browser(browser, crashed=True)
+                replaced += 1
+                continue
+            reason = self._recycle_reason(record)
+            if reason:
+                logger.info(f"Recycling idle browser after {reason}")
+                self._discard_browser(browser)
+                replaced += 1
+                continue
+            self.browser_queue.put(browser, block=False)
+
+        created = self._fill_to_floor()
+        return {"checked": len(idle), "replaced": replaced, "created": created}
+    def acquire_browser(self, timeout: float = 10.0) -> "webdriver.Chrome":
+        """Get a browser from the pool"""
+        start_time = time.monotonic()
+        deadline = start_time + timeout
+
+        while not self._closed:
+            try:
+                browser = self.browser_queue.get(block=False)
+            except queue.Empty:
+                # Create new browser if pool is empty and we haven't hit limit
+                browser = self._spawn_browser()
+                if browser is None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    # Wake periodically: a discarded browser frees capacity
+                    # without anything being queued
+                    try:
+                        browser = self.browser_queue.get(timeout=min(remaining, 0.05))
+                    except queue.Empty:
                         continue
 
-            time.sleep(0.5)  # Brief wait before retry
+            # Verify browser is still responsive
+            if not self._is_alive(browser):
+                logger.warning("Browser not responsive, replacing it")
+                self._discard_browser(browser, crashed=True)
+                continue
+
+            wait_time = time.monotonic() - start_time
+            with self.lock:
+                record = self._browsers.get(id(browser))
+                if record is not None:
+                    record.checked_out_at = time.monotonic()
+                self.active_browsers.add(browser)
+                self.acquisitions += 1
+                self._wait_times.append(wait_time)
+            return browser
 
+        with self.lock:
+            self.acquire_timeouts += 1
         raise TimeoutError(f"Could not acquire browser within {timeout} seconds")
-    def release_browser(self, browser: webdriver.Chrome):
-        """Return browser to pool"""
+    def release_browser(self, browser: "webdriver.Chrome"):
+        """Return browser to pool, recycling it if it is worn out"""
         if not browser:
             return
 
         with self.lock:
             self.active_browsers.discard(browser)
+            record = self._browsers.get(id(browser))
+            if record is not None:
+                record.uses += 1
+                if record.checked_out_at is not None:
+                    self._busy_seconds += time.monotonic() - record.checked_out_at
+                    record.checked_out_at = None
+
+        if record is None or self._closed:
+            self._discard_browser(browser)
+            return
 
-    try:
-                # Basic cleanup
-                browser.delete_all_cookies()
-                browser.execute_script("window.localStorage.clear();")
-                browser.execute_script("window.sessionStorage.clear();")
-
-                # Check if pool has space
-                if self.browser_queue.qsize() < self.pool_size:
-                    self.browser_queue.put(browser, block=False)
-                else:
-                    # Pool is full, close this browser
-                    browser.quit()
-                    self.total_browsers -= 1
+        reason = self._recycle_reason(record)
+        if reason:
+            logger.info(f"Recycling browser after {reason}")
+            self._discard_browser(browser)
+            return
 
-    except Exception as e:
-                logger.warning(f"Error returning browser to pool: {e}")
-    try:
-                    browser.quit()
-                    self.total_browsers -= 1
-    except:
-            pass
+        try:
+            # Basic cleanup
+            browser.delete_all_cookies()
+            browser.execute_script("window.localStorage.clear();")
+            browser.execute_script("window.sessionStorage.clear();")
+        except Exception as e:
+            logger.warning(f"Error returning browser to pool: {e}")
+            self._discard_browser(browser, crashed=True)
+            return
+
+        try:
+            self.browser_queue.put(browser, block=False)
+        except queue.Full:
+            # Pool is full, close this browser
+            self._discard_browser(browser)
     def close_all(self):
         """Close all browsers in pool"""
         logger.info("Closing all browsers in pool")
 
+        with self.lock:
+            self._closed = True
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._maintenance_thread and self._maintenance_thread.is_alive():
+            self._maintenance_thread.join(timeout=5.0)
+
         # Close browsers in queue
-        while not self.browser_queue.empty():
-    try:
-                browser = self.browser_queue.get(timeout=1.0)
-                browser.quit()
-    except:
-            pass
+        while True:
+            try:
+                browser = self.browser_queue.get(block=False)
+            except queue.Empty:
+                break
+            self._discard_browser(browser)
 
         # Close active browsers
         with self.lock:
-            for browser in list(self.active_browsers):
-    try:
-                    browser.quit()
-    except:
-            pass
-            self.active_browsers.clear()
-            self.total_browsers = 0
+            active = list(self.active_browsers)
+        for browser in active:
+            self._discard_browser(browser)
 
         logger.info("All browsers closed")
-    def get_pool_status(self) -> Dict[str, int]:
-        """Get current pool status"""
+    def get_pool_status(self) -> Dict[str, Any]:
+        """Get current pool status, wait times and utilization"""
         with self.lock:
+            now = time.monotonic()
+            waits = sorted(self._wait_times)
+            busy_seconds = self._busy_seconds + sum(
+                now - record.checked_out_at
+                for record in self._browsers.values()
+                if record.checked_out_at is not None
+            )
+            capacity_seconds = self.pool_size * (now - self._started_at)
             return {
                 "total_browsers": self.total_browsers,
                 "available_browsers": self.browser_queue.qsize(),
                 "active_browsers": len(self.active_browsers),
                 "pool_size": self.pool_size,
+                "min_idle": self.min_idle,
+                "utilization_percent": len(self.active_browsers) / self.pool_size * 100,
+                "busy_time_percent": (
+                    busy_seconds / capacity_seconds * 100 if capacity_seconds else 0.0
+                ),
+                "acquisitions": self.acquisitions,
+                "acquire_timeouts": self.acquire_timeouts,
+                "avg_acquire_wait_ms": (
+                    sum(waits) / len(waits) * 1000 if waits else 0.0
+                ),
+                "p95_acquire_wait_ms": (
+                    waits[int(len(waits) * 0.95)] * 1000 if waits else 0.0
+                ),
+                "max_acquire_wait_ms": waits[-1] * 1000 if waits else 0.0,
+                "created_browsers": self.created_browsers,
+                "recycled_browsers": self.recycled_browsers,
+                "crashed_browsers": self.crashed_browsers,
             }
 
 
@@ -309,6 +566,7 @@ class ParallelWebScraperManager:
         max_concurrent_scrapers: int = 4,
         enable_tax_scraping: bool = True,
         enable_recorder_scraping: bool = True,
+        scheduler: Optional[WorkScheduler] = None,
     ):
 
         logger.info("Initializing Parallel Web Scraper Manager")
@@ -328,12 +586,24 @@ class ParallelWebScraperManager:
             pool_size=max_concurrent_scrapers + 2,  # Extra browsers for overhead
             headless=self.config.get("headless", True),
             user_agent_rotation=True,
+            min_idle=self.config.get("browser_min_idle", 2),
+            max_uses_per_browser=self.config.get("browser_max_uses", 50),
+            max_rss_mb=self.config.get("browser_max_rss_mb", 1024.0),
         )
 
-        # Thread pool for scraping operations
-        self.executor = ThreadPoolExecutor(
-            max_workers=max_concurrent_scrapers, thread_name_prefix="WebScraper"
-        )
+        # Scraping runs on the shared scheduler under the budget of the site
+        # each task hits; the request processor has its own thread. A task
+        # takes a scraper slot (scraping_semaphore) before it is submitted, so
+        # at most max_concurrent_scrapers tasks wait on the browser pool and
+        # none holds a site budget slot while waiting for a scraper
+        self.scheduler = scheduler or get_work_scheduler()
+        self.executors = {
+            resource: self.scheduler.executor_for(
+                resource, max_workers=max_concurrent_scrapers
+            )
+            for resource in set(TASK_RESOURCES.values())
+        }
+        self._processor_thread = None
 
         # Request management
         self.pending_requests = queue.PriorityQueue()
@@ -388,25 +658,45 @@ class ParallelWebScraperManager:
         logger.info(f"Submitted {len(requests)} scraping requests")
         return request_ids
     def _process_pending_requests(self):
-        """Process pending requests in thread pool"""
-        # Submit processing task to executor
-        self.executor.submit(self._request_processor_worker)
+        """Start the request processor thread if not already running"""
+        with self.requests_lock:
+            if self._processor_thread and self._processor_thread.is_alive():
+                return
+            self._processor_thread = threading.Thread(
+                target=self._request_processor_worker,
+                name="WebScraperQueue",
+                daemon=True,
+            )
+            self._processor_thread.start()
     def _request_processor_worker(self):
         """Background worker to process scraping requests"""
         while not self.shutdown_event.is_set():
-    try:
+            # Take a scraper slot first, so the highest-priority pending
+            # request is the one that gets it
+            if not self.scraping_semaphore.acquire(timeout=1.0):
+                continue
+            slot_handed_off = False
+
+            try:
                 # Get next request with timeout
-    try:
+                try:
                     priority_tuple, request_id, request = self.pending_requests.get(
                         timeout=5.0
                     )
-    except queue.Empty:
+                except queue.Empty:
+                    self.scraping_semaphore.release()
                     continue
 
                 # Execute request with rate limiting
-                future = self.executor.submit(
-                    self._execute_scraping_request, request_id, request
+                executor = self.executors[TASK_RESOURCES[request.task_type]]
+                future = executor.submit_with_priority(
+                    priority_from_level(request.priority),
+                    self._execute_scraping_request,
+                    request_id,
+                    request,
                 )
+                slot_handed_off = True
+                future.add_done_callback(lambda _: self.scraping_semaphore.release())
 
                 with self.requests_lock:
                     self.active_requests[request_id] = (request, future)
@@ -414,7 +704,9 @@ class ParallelWebScraperManager:
                 # Don't overwhelm - brief pause
                 time.sleep(0.1)
 
-    except Exception as e:
+            except Exception as e:
+                if not slot_handed_off:
+                    self.scraping_semaphore.release()
                 logger.error(f"Error in request processor: {e}")
                 time.sleep(1.0)
     def _execute_scraping_request(self, request_id: str, request: ScrapingRequest):
@@ -424,70 +716,69 @@ class ParallelWebScraperManager:
 
         logger.debug(f"Executing scraping request: {request_id}")
 
-        # Rate limiting
-        with self.scraping_semaphore:
-            self._apply_rate_limit(request.task_type)
-
-            browser = None
-    try:
-                # Acquire browser
-                browser = self.browser_pool.acquire_browser(timeout=15.0)
-
-                # Execute based on task type
-                if request.task_type == ScrapingTask.TAX_INFORMATION:
-                    result = self._scrape_tax_information(browser, request.identifier)
-                elif request.task_type == ScrapingTask.SALES_HISTORY:
-                    result = self._scrape_sales_history(browser, request.identifier)
-                elif request.task_type == ScrapingTask.DOCUMENT_RECORDS:
-                    result = self._scrape_document_records(browser, request.identifier)
-                elif request.task_type == ScrapingTask.PROPERTY_DETAILS:
-                    result = self._scrape_property_details(browser, request.identifier)
-                elif request.task_type == ScrapingTask.OWNER_PROPERTIES:
-                    result = self._scrape_owner_properties(browser, request.identifier)
-                else:
-                    raise ValueError(f"Unsupported task type: {request.task_type}")
-
-                request.result = result
-                request.completed_at = datetime.now()
-
-                # Update statistics
-                processing_time = time.time() - start_time
-                with self.stats_lock:
-                    self.total_scraped += 1
-                    self.total_successful += 1
-                    total_time = (
-                        self.average_scraping_time * (self.total_scraped - 1)
-                        + processing_time
-                    )
-                    self.average_scraping_time = total_time / self.total_scraped
-
-                logger.info(
-                    f"Scraping request completed successfully: {request_id} in {processing_time:.2f}s"
+        # Rate limiting (the scraper slot was taken at submission)
+        self._apply_rate_limit(request.task_type)
+
+        browser = None
+        try:
+            # Acquire browser
+            browser = self.browser_pool.acquire_browser(timeout=15.0)
+
+            # Execute based on task type
+            if request.task_type == ScrapingTask.TAX_INFORMATION:
+                result = self._scrape_tax_information(browser, request.identifier)
+            elif request.task_type == ScrapingTask.SALES_HISTORY:
+                result = self._scrape_sales_history(browser, request.identifier)
+            elif request.task_type == ScrapingTask.DOCUMENT_RECORDS:
+                result = self._scrape_document_records(browser, request.identifier)
+            elif request.task_type == ScrapingTask.PROPERTY_DETAILS:
+                result = self._scrape_property_details(browser, request.identifier)
+            elif request.task_type == ScrapingTask.OWNER_PROPERTIES:
+                result = self._scrape_owner_properties(browser, request.identifier)
+            else:
+                raise ValueError(f"Unsupported task type: {request.task_type}")
+
+            request.result = result
+            request.completed_at = datetime.now()
+
+            # Update statistics
+            processing_time = time.time() - start_time
+            with self.stats_lock:
+                self.total_scraped += 1
+                self.total_successful += 1
+                total_time = (
+                    self.average_scraping_time * (self.total_scraped - 1)
+                    + processing_time
                 )
+                self.average_scraping_time = total_time / self.total_scraped
 
-    except Exception as e:
-                request.error = str(e)
-                request.completed_at = datetime.now()
+            logger.info(
+                f"Scraping request completed successfully: {request_id} in {processing_time:.2f}s"
+            )
 
-                processing_time = time.time() - start_time
-                with self.stats_lock:
-                    self.total_scraped += 1
-                    self.total_failed += 1
+        except Exception as e:
+            request.error = str(e)
+            request.completed_at = datetime.now()
 
-                logger.error(
-                    f"Scraping request failed: {request_id} after {processing_time:.2f}s - {e}"
-                )
+            processing_time = time.time() - start_time
+            with self.stats_lock:
+                self.total_scraped += 1
+                self.total_failed += 1
 
-    finally:
-                # Release browser back to pool
-                if browser:
-                    self.browser_pool.release_browser(browser)
+            logger.error(
+                f"Scraping request failed: {request_id} after {processing_time:.2f}s - {e}"
+            )
 
-                # Move from active to completed
-                with self.requests_lock:
-                    if request_id in self.active_requests:
-                        del self.active_requests[request_id]
-                    self.completed_requests[request_id] = request
+        finally:
+            # Release browser back to pool
+            if browser:
+                self.browser_pool.release_browser(browser)
+
+            # Move from active to completed
+            with self.requests_lock:
+                if request_id in self.active_requests:
+                    del self.active_requests[request_id]
+                self.completed_requests[request_id] = request
     def _apply_rate_limit(self, task_type: ScrapingTask):
         """Apply rate limiting based on task type"""
         # Determine target domain
@@ -510,7 +801,7 @@ class ParallelWebScraperManager:
 
         self.last_request_times[domain] = time.time()
     def _scrape_tax_information(
-        self, browser: webdriver.Chrome, apn: str
+        self, browser: "webdriver.Chrome", apn: str
     ) -> Dict[str, Any]:
         """Scrape tax information using tax scraper"""
         if not self.enable_tax_scraping:
@@ -536,7 +827,7 @@ class ParallelWebScraperManager:
             logger.error(f"Tax scraping failed for APN {apn}: {e}")
             raise
     def _scrape_sales_history(
-        self, browser: webdriver.Chrome, apn: str
+        self, browser: "webdriver.Chrome", apn: str
     ) -> Dict[str, Any]:
         """Scrape sales history from recorder's office"""
         if not self.enable_recorder_scraping:
@@ -562,7 +853,7 @@ class ParallelWebScraperManager:
             logger.error(f"Sales history scraping failed for APN {apn}: {e}")
             raise
     def _scrape_document_records(
-        self, browser: webdriver.Chrome, apn: str
+        self, browser: "webdriver.Chrome", apn: str
     ) -> Dict[str, Any]:
         """Scrape document records from recorder's office"""
         if not self.enable_recorder_scraping:
@@ -590,7 +881,7 @@ class ParallelWebScraperManager:
             logger.error(f"Document records scraping failed for APN {apn}: {e}")
             raise
     def _scrape_property_details(
-        self, browser: webdriver.Chrome, apn: str
+        self, browser: "webdriver.Chrome", apn: str
     ) -> Dict[str, Any]:
         """Scrape detailed property information"""
     try:
@@ -641,7 +932,7 @@ class ParallelWebScraperManager:
             logger.error(f"Property details scraping failed for APN {apn}: {e}")
             raise
     def _scrape_owner_properties(
-        self, browser: webdriver.Chrome, owner_name: str
+        self, browser: "webdriver.Chrome", owner_name: str
     ) -> Dict[str, Any]:
         """Scrape all properties owned by a specific owner"""
     try:
@@ -791,8 +1082,11 @@ class ParallelWebScraperManager:
 
         self.shutdown_event.set()
 
-        # Shutdown executor
-        self.executor.shutdown(wait=True)
+        # Wait for the processor and this manager's scheduled scraping
+        if self._processor_thread:
+            self._processor_thread.join(timeout=10.0)
+        for executor in self.executors.values():
+            executor.shutdown(wait=True)
 
         # Close browser pool
         self.browser_pool.close_all()
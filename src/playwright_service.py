@@ -10,6 +10,8 @@ import logging
 import os
 import tempfile
 import time
+from collections import deque
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -47,6 +49,24 @@ class BrowserConfig:
     proxy: Optional[Dict[str, str]] = None
 
 
+# Resource types and hosts aborted when resource blocking is enabled; none of
+# them carry property data
+BLOCKED_RESOURCE_TYPES = frozenset(["image", "font", "media"])
+BLOCKED_URL_PATTERNS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "facebook.net",
+    "hotjar.com",
+    "newrelic.com",
+    "nr-data.net",
+    "clarity.ms",
+)
+
+# Per-request timings kept for get_performance_stats()
+TIMING_HISTORY = 1000
+
+
 @dataclass
 class ScrapingResult:
     """Result from browser automation operation"""
@@ -61,20 +81,51 @@ class ScrapingResult:
 
 
 class BrowserPool:
-    """Manages a pool of browser instances for efficient resource usage"""
+    """Manages a pool of browser instances for efficient resource usage
+
+    page() lends out warm pages, each in its own context, capped at
+    pages_per_browser per browser type. Healthy pages go back to the pool
+    instead of being closed, so repeated lookups skip context and page
+    start-up. With block_resources, every context aborts images, fonts,
+    media and analytics requests.
+    """
 
     def __init__(
-        self, max_browsers: int = 3, browser_configs: List[BrowserConfig] = None
+        self,
+        max_browsers: int = 3,
+        browser_configs: List[BrowserConfig] = None,
+        pages_per_browser: int = 4,
+        block_resources: bool = False,
     ):
         self.max_browsers = max_browsers
         self.browser_configs = browser_configs or [BrowserConfig()]
+        self.pages_per_browser = pages_per_browser
+        self.block_resources = block_resources
         self.active_browsers: Dict[str, Browser] = {}
         self.browser_contexts: Dict[str, List[BrowserContext]] = {}
-        self.lock = Lock()
+        self.lock = asyncio.Lock()
+        self._playwright = None
+
+        self._idle_pages: Dict[str, List[Page]] = {}
+        self._page_slots: Dict[str, asyncio.Semaphore] = {}
+        self.pool_stats = {
+            "pages_created": 0,
+            "pages_reused": 0,
+            "pages_discarded": 0,
+            "blocked_requests": 0,
+            "acquires": 0,
+            "acquire_wait_time": 0.0,
+        }
 
         if not PLAYWRIGHT_AVAILABLE:
             logger.warning("Playwright not available - browser automation disabled")
 
+    def _config(self, browser_type: str) -> BrowserConfig:
+        return next(
+            (c for c in self.browser_configs if c.browser_type == browser_type),
+            BrowserConfig(browser_type=browser_type),
+        )
+
     async def get_browser(self, browser_type: str = "chromium") -> Optional[Browser]:
         """Get or create a browser instance"""
         if not PLAYWRIGHT_AVAILABLE:
@@ -87,13 +138,12 @@ class BrowserPool:
                     oldest_key = next(iter(self.active_browsers))
                     await self.close_browser(oldest_key)
 
-                config = next(
-                    (c for c in self.browser_configs if c.browser_type == browser_type),
-                    BrowserConfig(browser_type=browser_type),
-                )
+                config = self._config(browser_type)
 
-                playwright = await async_playwright().start()
-                browser_launcher = getattr(playwright, browser_type)
+                # One driver process serves every browser type
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                browser_launcher = getattr(self._playwright, browser_type)
 
                 browser = await browser_launcher.launch(
                     headless=config.headless, slow_mo=config.slow_mo, proxy=config.proxy
@@ -114,10 +164,7 @@ class BrowserPool:
         if not browser:
             return None
 
-        config = next(
-            (c for c in self.browser_configs if c.browser_type == browser_type),
-            BrowserConfig(browser_type=browser_type),
-        )
+        config = self._config(browser_type)
 
         context = await browser.new_context(
             viewport=config.viewport, user_agent=config.user_agent
@@ -126,12 +173,96 @@ class BrowserPool:
         # Set default timeout
         context.set_default_timeout(config.timeout)
 
+        if self.block_resources:
+            await context.route("**/*", self._route_request)
+
         self.browser_contexts[browser_type].append(context)
         return context
 
+    async def _route_request(self, route):
+        """Abort requests that cannot contain property data"""
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+            pattern in request.url for pattern in BLOCKED_URL_PATTERNS
+        ):
+            self.pool_stats["blocked_requests"] += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    @asynccontextmanager
+    async def page(self, browser_type: str = "chromium"):
+        """Borrow a warm page; yields None when no browser is available
+
+        The page returns to the pool when the block exits normally and is
+        discarded with its context when it raises.
+        """
+        slots = self._page_slots.setdefault(
+            browser_type, asyncio.Semaphore(self.pages_per_browser)
+        )
+        wait_start = time.time()
+        await slots.acquire()
+        self.pool_stats["acquires"] += 1
+        self.pool_stats["acquire_wait_time"] += time.time() - wait_start
+
+        page = None
+        healthy = False
+        try:
+            page = await self._checkout_page(browser_type)
+            yield page
+            healthy = True
+        finally:
+            if page is not None:
+                await self._return_page(browser_type, page, healthy)
+            slots.release()
+
+    async def _checkout_page(self, browser_type: str) -> Optional[Page]:
+        idle = self._idle_pages.setdefault(browser_type, [])
+        while idle:
+            page = idle.pop()
+            if not page.is_closed():
+                self.pool_stats["pages_reused"] += 1
+                return page
+
+        context = await self.get_context(browser_type)
+        if not context:
+            return None
+        page = await context.new_page()
+        self.pool_stats["pages_created"] += 1
+        return page
+
+    async def _return_page(self, browser_type: str, page: Page, healthy: bool):
+        if healthy and not page.is_closed() and browser_type in self.active_browsers:
+            self._idle_pages.setdefault(browser_type, []).append(page)
+            return
+
+        self.pool_stats["pages_discarded"] += 1
+        context = page.context
+        try:
+            await context.close()
+        except Exception as e:
+            logger.debug(f"Error closing discarded {browser_type} context: {e}")
+        contexts = self.browser_contexts.get(browser_type, [])
+        if context in contexts:
+            contexts.remove(context)
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        acquires = self.pool_stats["acquires"]
+        return {
+            **self.pool_stats,
+            "avg_acquire_wait": self.pool_stats["acquire_wait_time"] / max(1, acquires),
+            "idle_pages": {
+                browser_type: len(pages)
+                for browser_type, pages in self._idle_pages.items()
+            },
+            "active_browsers": list(self.active_browsers),
+        }
+
     async def close_browser(self, browser_type: str):
         """Close a specific browser and its contexts"""
         if browser_type in self.active_browsers:
+            self._idle_pages.pop(browser_type, None)
+
             # Close all contexts first
             if browser_type in self.browser_contexts:
                 for context in self.browser_contexts[browser_type]:
@@ -149,6 +280,10 @@ class BrowserPool:
         for browser_type in list(self.active_browsers.keys()):
             await self.close_browser(browser_type)
 
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
 
 class PlaywrightService:
     """
@@ -161,9 +296,22 @@ class PlaywrightService:
         browser_configs: List[BrowserConfig] = None,
         screenshot_dir: str = None,
         max_browsers: int = 3,
+        throughput_mode: bool = False,
+        pages_per_browser: int = 4,
     ):
-
-        self.browser_pool = BrowserPool(max_browsers, browser_configs)
+        """
+        Args:
+            throughput_mode: Block images/fonts/media/analytics, reuse warm
+                pages and stop waiting for network idle, for batch lookups
+            pages_per_browser: Concurrent pages per browser type
+        """
+        self.throughput_mode = throughput_mode
+        self.browser_pool = BrowserPool(
+            max_browsers,
+            browser_configs,
+            pages_per_browser=pages_per_browser,
+            block_resources=throughput_mode,
+        )
         self.screenshot_dir = (
             Path(screenshot_dir)
             if screenshot_dir
@@ -178,9 +326,12 @@ class PlaywrightService:
             "failed_requests": 0,
             "average_response_time": 0.0,
         }
+        # Per-request phase timings in seconds (acquire, navigation, extraction, total)
+        self.request_timings = deque(maxlen=TIMING_HISTORY)
 
         logger.info(
-            f"Playwright service initialized - Available: {PLAYWRIGHT_AVAILABLE}"
+            f"Playwright service initialized - Available: {PLAYWRIGHT_AVAILABLE}, "
+            f"throughput mode: {throughput_mode}"
         )
         logger.info(f"Screenshot directory: {self.screenshot_dir}")
 
@@ -188,7 +339,7 @@ class PlaywrightService:
         self,
         identifier: str,
         search_type: str = "apn",
-        capture_screenshots: bool = True,
+        capture_screenshots: bool = False,
         browser_type: str = "chromium",
     ) -> ScrapingResult:
         """
@@ -212,43 +363,46 @@ class PlaywrightService:
                 execution_time=time.time() - start_time,
             )
 
+        timings = {}
         try:
-            context = await self.browser_pool.get_context(browser_type)
-            if not context:
-                return ScrapingResult(
-                    success=False,
-                    error=f"Could not create {browser_type} browser context",
-                    execution_time=time.time() - start_time,
+            async with self.browser_pool.page(browser_type) as page:
+                timings["acquire"] = time.time() - start_time
+                if page is None:
+                    return ScrapingResult(
+                        success=False,
+                        error=f"Could not create {browser_type} browser context",
+                        execution_time=time.time() - start_time,
+                    )
+
+                # Navigate to property search page. Extraction waits for the
+                # property selectors, so throughput mode does not wait for the
+                # network to go idle.
+                search_url = self._build_search_url(identifier, search_type)
+                wait_until = (
+                    "domcontentloaded" if self.throughput_mode else "networkidle"
                 )
+                phase_start = time.time()
+                await page.goto(search_url, wait_until=wait_until)
+                timings["navigation"] = time.time() - phase_start
 
-            page = await context.new_page()
-
-            # Navigate to property search page
-            search_url = self._build_search_url(identifier, search_type)
-            await page.goto(search_url, wait_until="networkidle")
+                # Extract property data
+                phase_start = time.time()
+                property_data = await self._extract_property_data(page, search_type)
+                timings["extraction"] = time.time() - phase_start
 
-            # Wait for dynamic content to load
-            await page.wait_for_load_state("domcontentloaded")
-            await asyncio.sleep(2)  # Additional wait for JavaScript
+                # Capture screenshots if requested
+                screenshots = []
+                if capture_screenshots:
+                    screenshots = await self._capture_property_screenshots(
+                        page, identifier
+                    )
 
-            # Extract property data
-            property_data = await self._extract_property_data(page, search_type)
-
-            # Capture screenshots if requested
-            screenshots = []
-            if capture_screenshots:
-                screenshots = await self._capture_property_screenshots(page, identifier)
-
-            # Get performance metrics
-            performance_metrics = await self._get_performance_metrics(page)
-
-            await page.close()
+                # Get performance metrics
+                performance_metrics = await self._get_performance_metrics(page)
 
             execution_time = time.time() - start_time
-
-            # Update stats
-            self.performance_stats["total_requests"] += 1
-            self.performance_stats["successful_requests"] += 1
+            timings["total"] = execution_time
+            self._record_request(True, timings)
 
             return ScrapingResult(
                 success=True,
@@ -261,10 +415,8 @@ class PlaywrightService:
 
         except Exception as e:
             execution_time = time.time() - start_time
-
-            # Update stats
-            self.performance_stats["total_requests"] += 1
-            self.performance_stats["failed_requests"] += 1
+            timings["total"] = execution_time
+            self._record_request(False, timings)
 
             logger.error(f"Playwright search failed for {identifier}: {str(e)}")
 
@@ -275,6 +427,32 @@ class PlaywrightService:
                 browser_used=browser_type,
             )
 
+    def _record_request(self, success: bool, timings: Dict[str, float]):
+        """Update request counters and keep the per-phase timings"""
+        stats = self.performance_stats
+        stats["total_requests"] += 1
+        stats["successful_requests" if success else "failed_requests"] += 1
+        stats["average_response_time"] += (
+            timings["total"] - stats["average_response_time"]
+        ) / stats["total_requests"]
+        self.request_timings.append(timings)
+
+    def _timing_summary(self) -> Dict[str, Dict[str, float]]:
+        """Count, mean, p50, p95 and max per request phase"""
+        summary = {}
+        for phase in ("acquire", "navigation", "extraction", "total"):
+            values = sorted(t[phase] for t in self.request_timings if phase in t)
+            if not values:
+                continue
+            summary[phase] = {
+                "count": len(values),
+                "avg": sum(values) / len(values),
+                "p50": values[len(values) // 2],
+                "p95": values[min(len(values) - 1, int(len(values) * 0.95))],
+                "max": values[-1],
+            }
+        return summary
+
     def _build_search_url(self, identifier: str, search_type: str) -> str:
         """Build appropriate search URL based on search type"""
         base_url = "https://mcassessor.maricopa.gov"
@@ -469,32 +647,28 @@ class PlaywrightService:
             )
 
         try:
-            context = await self.browser_pool.get_context(browser_type)
-            if not context:
-                return ScrapingResult(
-                    success=False,
-                    error=f"Could not create {browser_type} browser context",
+            async with self.browser_pool.page(browser_type) as page:
+                if page is None:
+                    return ScrapingResult(
+                        success=False,
+                        error=f"Could not create {browser_type} browser context",
+                    )
+
+                # Navigate to advanced search page
+                advanced_search_url = "https://mcassessor.maricopa.gov/advanced-search"
+                await page.goto(advanced_search_url, wait_until="networkidle")
+
+                # Fill out search form
+                await self._fill_search_form(page, search_criteria)
+
+                # Submit search
+                await page.click(
+                    'input[type="submit"], button[type="submit"], .search-button'
                 )
+                await page.wait_for_load_state("networkidle")
 
-            page = await context.new_page()
-
-            # Navigate to advanced search page
-            advanced_search_url = "https://mcassessor.maricopa.gov/advanced-search"
-            await page.goto(advanced_search_url, wait_until="networkidle")
-
-            # Fill out search form
-            await self._fill_search_form(page, search_criteria)
-
-            # Submit search
-            await page.click(
-                'input[type="submit"], button[type="submit"], .search-button'
-            )
-            await page.wait_for_load_state("networkidle")
-
-            # Extract results
-            results = await self._extract_search_results(page)
-
-            await page.close()
+                # Extract results
+                results = await self._extract_search_results(page)
 
             execution_time = time.time() - start_time
 
@@ -636,6 +810,9 @@ class PlaywrightService:
             "success_rate": success_rate,
             "failure_rate": failure_rate,
             "playwright_available": PLAYWRIGHT_AVAILABLE,
+            "throughput_mode": self.throughput_mode,
+            "timings": self._timing_summary(),
+            "browser_pool": self.browser_pool.get_pool_stats(),
         }
 
     async def cleanup(self):
@@ -9,6 +9,11 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from logging_config import get_logger
+from page_parsers import (
+    HtmlSource,
+    parse_recorder_documents,
+    parse_recorder_documents_generic,
+)
 
 logger = get_logger(__name__)
 
@@ -222,101 +227,21 @@ class MaricopaRecorderScraper:
             "scrape_date": datetime.now().isoformat(),
             "extraction_status": "failed",
         }
-    def _parse_document_table(self, content: str) -> List[Dict[str, Any]]:
+    def _parse_document_table(self, content: HtmlSource) -> List[Dict[str, Any]]:
         """Parse document information from HTML table"""
-        documents = []
-
-    try:
-            # Look for table rows with document data
-            # Common patterns for recorder document tables
-            row_patterns = [
-                r"<tr[^>]*>.*?(\d{4}-\d{6,8}).*?(\d{1,2}/\d{1,2}/\d{4}).*?([A-Z\s]+).*?([^<\n]*?).*?</tr>",
-                r"<tr[^>]*>.*?(\w+\s*\d+).*?(\d{1,2}/\d{1,2}/\d{4}).*?([A-Z\s]+).*?</tr>",
-            ]
-
-            for pattern in row_patterns:
-                matches = re.findall(pattern, content, re.DOTALL | re.IGNORECASE)
-
-                for match in matches:
-                    if len(match) >= 3:
-                        document = {
-                            "document_number": match[0].strip(),
-                            "date": self._parse_date(match[1].strip()),
-                            "document_type": match[2].strip(),
-                            "description": match[3].strip() if len(match) > 3 else "",
-                            "raw_data": match,
-                        }
-
-                        # Extract additional details if available
-                        if len(match) > 4:
-                            document["additional_info"] = match[4].strip()
-
-                        documents.append(document)
-
-                if (
-                    documents
-                ):  # If we found documents with this pattern, stop trying others
-                    break
-
-            # Alternative: Parse using more generic table extraction
-            if not documents:
-                documents = self._generic_table_parse(content)
-
-    except Exception as e:
+        try:
+            # Falls back to generic table parsing when no row has a recording number
+            return parse_recorder_documents(content, parse_date=self._parse_date)
+        except Exception as e:
             logger.error(f"Error parsing document table: {e}")
-
-        return documents[:50]  # Limit to 50 most recent documents
-    def _generic_table_parse(self, content: str) -> List[Dict[str, Any]]:
+            return []
+    def _generic_table_parse(self, content: HtmlSource) -> List[Dict[str, Any]]:
         """Generic table parsing as fallback"""
-        documents = []
-
-    try:
-            # Find table data cells and try to extract document info
-            td_pattern = r"<td[^>]*>(.*?)</td>"
-            table_sections = re.findall(
-                r"<table[^>]*>(.*?)</table>", content, re.DOTALL | re.IGNORECASE
-            )
-
-            for table in table_sections:
-                rows = re.findall(
-                    r"<tr[^>]*>(.*?)</tr>", table, re.DOTALL | re.IGNORECASE
-                )
-
-                for row in rows[1:]:  # Skip header row
-                    cells = re.findall(td_pattern, row, re.DOTALL)
-
-                    if len(cells) >= 3:
-                        # Clean cell content
-                        clean_cells = [
-                            re.sub(r"<[^>]+>", "", cell).strip() for cell in cells
-                        ]
-
-                        # Try to identify document info
-                        document = {
-                            "document_number": clean_cells[0],
-                            "date": (
-                                self._parse_date(clean_cells[1])
-                                if len(clean_cells) > 1
-                                else None
-                            ),
-                            "document_type": (
-                                clean_cells[2] if len(clean_cells) > 2 else "UNKNOWN"
-                            ),
-                            "description": (
-                                clean_cells[3] if len(clean_cells) > 3 else ""
-                            ),
-                            "raw_data": clean_cells,
-                        }
-
-                        documents.append(document)
-
-                if documents:  # Found documents in this table
-                    break
-
-    except Exception as e:
+        try:
+            return parse_recorder_documents_generic(content, self._parse_date)
+        except Exception as e:
             logger.error(f"Error in generic table parse: {e}")
-
-        return documents
+            return []
     def _extract_sales_from_documents(
         self, documents: List[Dict]
     ) -> List[Dict[str, Any]]:
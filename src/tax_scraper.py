@@ -2,13 +2,41 @@
 """
 Maricopa County Treasurer Tax Data Scraper
 """
-import re
+import threading
+import time
 from typing import Any, Dict, List, Optional
 
+import requests
+from requests.adapters import HTTPAdapter
+
 from logging_config import get_logger
+from page_parsers import (
+    HtmlSource,
+    parse_current_tax,
+    parse_html,
+    parse_owner_info,
+    parse_tax_history,
+    parse_tax_page,
+)
 
 logger = get_logger(__name__)
 
+# Parcel search form replayed by the HTTP fast path
+TREASURER_FORM_URL = "https://treasurer.maricopa.gov/parcel/default.aspx"
+TREASURER_SUBMIT_TARGET = "ctl00$cphMainContent$btnSubmit"
+PARCEL_FIELD_IDS = (
+    "txtParcelNumBook",
+    "txtParcelNumMap",
+    "txtParcelNumItem",
+    "txtParcelNumSplit",
+)
+# ASP.NET view state is reused between lookups for this long (seconds)
+FORM_STATE_TTL = 600.0
+TREASURER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) MaricopaPropertySearch",
+    "Accept": "text/html,application/xhtml+xml",
+}
+
 
 class MaricopaTaxScraper:
     """Scrape tax data from Maricopa County Treasurer website using browser automation"""
@@ -131,9 +159,9 @@ def _parse_apn(self, apn: str) -> Optional[List[str]]:
 
 def _extract_tax_data_from_page(self, page) -> Optional[Dict[str, Any]]:
         """Extract tax data from the loaded treasurer page"""
-try:
-            # Get page content
-            content = page.content()
+        try:
+            # Tokenize the page once and share it between the extractors
+            content = parse_html(page.content())
 
             # Extract owner information
             owner_info = self._extract_owner_info(content)
@@ -151,124 +179,33 @@ try:
                 "scrape_source": "treasurer.maricopa.gov",
             }
 
-except Exception as e:
+        except Exception as e:
             logger.error(f"Error extracting tax data from page: {e}")
             return None
 
-def _extract_owner_info(self, content: str) -> Dict[str, str]:
+    def _extract_owner_info(self, content: HtmlSource) -> Dict[str, str]:
         """Extract owner name and addresses from page content"""
-        owner_info = {}
-
-try:
-            # Extract owner name and mailing address
-            mailing_pattern = (
-                r"Current Mailing Name & Address.*?<generic[^>]*>(.*?)</generic>"
-            )
-            mailing_match = re.search(
-                mailing_pattern, content, re.DOTALL | re.IGNORECASE
-            )
-            if mailing_match:
-                mailing_text = mailing_match.group(1)
-                lines = [
-                    line.strip()
-                    for line in mailing_text.split("<text>")
-                    if line.strip()
-                ]
-                if lines:
-                    owner_info["owner_name"] = lines[0].replace("</text>", "").strip()
-                    if len(lines) > 1:
-                        address_parts = [
-                            line.replace("</text>", "").strip() for line in lines[1:]
-                        ]
-                        owner_info["mailing_address"] = ", ".join(address_parts)
-
-            # Extract property address
-            property_pattern = (
-                r"Property \(Situs\) Address.*?<generic[^>]*>(.*?)</generic>"
-            )
-            property_match = re.search(
-                property_pattern, content, re.DOTALL | re.IGNORECASE
-            )
-            if property_match:
-                property_text = property_match.group(1)
-                lines = [
-                    line.strip()
-                    for line in property_text.split("<text>")
-                    if line.strip()
-                ]
-                address_parts = [line.replace("</text>", "").strip() for line in lines]
-                owner_info["property_address"] = ", ".join(address_parts)
-
-except Exception as e:
+        try:
+            return parse_owner_info(content)
+        except Exception as e:
             logger.error(f"Error extracting owner info: {e}")
+            return {}
 
-        return owner_info
-
-def _extract_current_tax_info(self, content: str) -> Dict[str, Any]:
+    def _extract_current_tax_info(self, content: HtmlSource) -> Dict[str, Any]:
         """Extract current year tax information"""
-        current_tax = {}
-
-try:
-            # Extract assessed tax amount
-            assessed_pattern = r'"Assessed Tax:".*?<generic[^>]*>[\s]*\$?([\d,]+\.?\d*)'
-            assessed_match = re.search(assessed_pattern, content, re.IGNORECASE)
-            if assessed_match:
-                current_tax["assessed_tax"] = float(
-                    assessed_match.group(1).replace(",", "")
-                )
-
-            # Extract tax paid amount
-            paid_pattern = r'"Tax Paid:".*?<generic[^>]*>[\s]*\$?([\d,]+\.?\d*)'
-            paid_match = re.search(paid_pattern, content, re.IGNORECASE)
-            if paid_match:
-                current_tax["tax_paid"] = float(paid_match.group(1).replace(",", ""))
-
-            # Extract total due
-            due_pattern = r'"Total Due:".*?<[^>]*>[\s]*\$?([\d,]+\.?\d*)'
-            due_match = re.search(due_pattern, content, re.IGNORECASE)
-            if due_match:
-                current_tax["total_due"] = float(due_match.group(1).replace(",", ""))
-
-            # Determine payment status
-            if current_tax.get("total_due", 0) > 0:
-                current_tax["payment_status"] = "UNPAID"
-            else:
-                current_tax["payment_status"] = "PAID"
-
-except Exception as e:
+        try:
+            return parse_current_tax(content)
+        except Exception as e:
             logger.error(f"Error extracting current tax info: {e}")
+            return {}
 
-        return current_tax
-
-def _extract_tax_history_table(self, content: str) -> List[Dict[str, Any]]:
+    def _extract_tax_history_table(self, content: HtmlSource) -> List[Dict[str, Any]]:
         """Extract historical tax data from the tax years table"""
-        tax_history = []
-
-try:
-            # Find tax years table rows
-            row_pattern = r"<row[^>]*>.*?(\d{4}).*?(Paid|Unpaid).*?\$([\d,]+\.?\d*).*?\$([\d,]+\.?\d*).*?</row>"
-            rows = re.findall(row_pattern, content, re.DOTALL | re.IGNORECASE)
-
-            for row in rows:
-                tax_year, status, assessed_tax, amount_due = row
-                tax_history.append(
-                    {
-                        "tax_year": int(tax_year),
-                        "payment_status": status.upper(),
-                        "assessed_tax": float(assessed_tax.replace(",", "")),
-                        "amount_due": float(amount_due.replace(",", "")),
-                        "tax_paid": (
-                            float(assessed_tax.replace(",", ""))
-                            if status.upper() == "PAID"
-                            else 0.0
-                        ),
-                    }
-                )
-
-except Exception as e:
+        try:
+            return parse_tax_history(content)
+        except Exception as e:
             logger.error(f"Error extracting tax history: {e}")
-
-        return sorted(tax_history, key=lambda x: x["tax_year"], reverse=True)
+            return []
 
 def format_tax_data_for_database(self, tax_data: Dict[str, Any]) -> Dict[str, Any]:
         """Format scraped tax data for database storage"""
@@ -308,3 +245,177 @@ def format_tax_data_for_database(self, tax_data: Dict[str, Any]) -> Dict[str, An
             formatted["tax_history_records"] = tax_data["tax_history"]
 
         return formatted
+
+
+def extract_form_state(html: HtmlSource) -> Dict[str, Any]:
+    """Hidden fields, parcel input names and submit target of the search form"""
+    page = parse_html(html)
+    hidden = {}
+    parcel_fields = list(PARCEL_FIELD_IDS)
+    submit_target = TREASURER_SUBMIT_TARGET
+
+    for element in page.root.iter(("input",)):
+        name = element.attrs.get("name")
+        if not name:
+            continue
+        element_id = element.attrs.get("id") or name
+        if (element.attrs.get("type") or "").lower() == "hidden":
+            hidden[name] = element.attrs.get("value") or ""
+        for index, field_id in enumerate(PARCEL_FIELD_IDS):
+            if element_id.endswith(field_id):
+                parcel_fields[index] = name
+        if element_id.endswith("btnSubmit"):
+            submit_target = name
+
+    return {
+        "hidden": hidden,
+        "parcel_fields": parcel_fields,
+        "submit_target": submit_target,
+    }
+
+
+class TreasurerRateLimited(requests.HTTPError):
+    """The treasurer site answered 429 Too Many Requests
+
+    retry_after is the raw Retry-After header, or None if it was not sent.
+    """
+
+    def __init__(self, retry_after: Optional[str] = None):
+        super().__init__("Rate limited by the treasurer site")
+        self.retry_after = retry_after
+
+
+def raise_for_rate_limit(response) -> None:
+    """Raise TreasurerRateLimited for a 429 response"""
+    if response.status_code == 429:
+        raise TreasurerRateLimited(response.headers.get("Retry-After"))
+
+
+class TreasurerHttpClient:
+    """Browser-free treasurer lookups by replaying the parcel search form
+
+    The parcel page is an ASP.NET form: its hidden state fields are fetched
+    once and reused, so each lookup is a single POST of the four parcel
+    segments on a pooled session. Responses go through the same extractors
+    as the browser path. A 429 is raised as TreasurerRateLimited so callers
+    can honour its Retry-After.
+    """
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        timeout: float = 10.0,
+        form_url: str = TREASURER_FORM_URL,
+        form_state_ttl: float = FORM_STATE_TTL,
+        pool_size: int = 10,
+    ):
+        self.form_url = form_url
+        self.timeout = timeout
+        self.form_state_ttl = form_state_ttl
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(TREASURER_HEADERS)
+        self.session = session
+        self._scraper = MaricopaTaxScraper()
+        self._form_lock = threading.Lock()
+        self._form_state: Optional[Dict[str, Any]] = None
+        self._form_loaded_at = 0.0
+
+    def _request_timeout(self, deadline: Optional[float]) -> float:
+        """Per-request timeout, cut short to finish by deadline (monotonic)"""
+        if deadline is None:
+            return self.timeout
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise requests.Timeout("Treasurer lookup deadline exceeded")
+        return min(self.timeout, remaining)
+
+    def _load_form_state(
+        self, force: bool = False, deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Cached form state, refetched after form_state_ttl or when forced"""
+        lock_timeout = -1 if deadline is None else self._request_timeout(deadline)
+        if not self._form_lock.acquire(timeout=lock_timeout):
+            raise requests.Timeout("Timed out waiting for treasurer form state")
+        try:
+            age = time.monotonic() - self._form_loaded_at
+            if self._form_state and age < self.form_state_ttl and not force:
+                return self._form_state
+            response = self.session.get(
+                self.form_url, timeout=self._request_timeout(deadline)
+            )
+            raise_for_rate_limit(response)
+            response.raise_for_status()
+            self._form_state = extract_form_state(response.content)
+            self._form_loaded_at = time.monotonic()
+            return self._form_state
+        finally:
+            self._form_lock.release()
+
+    def fetch_tax_data(
+        self,
+        apn: str,
+        max_duration: Optional[float] = None,
+        raise_errors: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """Tax data for one APN, or None when the fast path cannot provide it
+
+        max_duration bounds the whole lookup, including a form state refresh
+        and retry; each request's timeout is shortened to fit within it.
+        TreasurerRateLimited is always raised; other request errors are only
+        raised with raise_errors, so callers can tell failures from misses.
+        """
+        apn_parts = self._scraper._parse_apn(apn)
+        if not apn_parts:
+            return None
+        deadline = None
+        if max_duration is not None:
+            deadline = time.monotonic() + max_duration
+
+        try:
+            for attempt in range(2):
+                # An empty result with cached state usually means it expired
+                form_state = self._load_form_state(
+                    force=attempt > 0, deadline=deadline
+                )
+                payload = dict(form_state["hidden"])
+                payload.update(zip(form_state["parcel_fields"], apn_parts))
+                payload["__EVENTTARGET"] = form_state["submit_target"]
+                payload["__EVENTARGUMENT"] = ""
+
+                response = self.session.post(
+                    self.form_url,
+                    data=payload,
+                    timeout=self._request_timeout(deadline),
+                )
+                raise_for_rate_limit(response)
+                response.raise_for_status()
+
+                tax_data = parse_tax_page(response.content)
+                if tax_data["owner_info"] or tax_data["tax_history"]:
+                    tax_data["apn"] = apn
+                    tax_data["scrape_method"] = "http"
+                    return tax_data
+
+            logger.info(f"Treasurer HTTP lookup returned no tax data for APN: {apn}")
+            return None
+
+        except TreasurerRateLimited:
+            logger.warning(f"Treasurer HTTP lookup rate limited for APN {apn}")
+            raise
+        except requests.RequestException as e:
+            logger.warning(f"Treasurer HTTP lookup failed for APN {apn}: {e}")
+            if raise_errors:
+                raise
+            return None
+        except Exception as e:
+            logger.error(f"Error parsing treasurer response for APN {apn}: {e}")
+            return None
+
+    def close(self):
+        if self._owns_session:
+            self.session.close()
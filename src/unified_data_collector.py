@@ -13,12 +13,14 @@ import json
 import logging
 import re
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import zlib
+from collections import OrderedDict
+from concurrent.futures import as_completed, wait
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from queue import Empty, PriorityQueue, Queue
-from threading import Event, Lock
+from threading import Event, Lock, Semaphore
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from PyQt5.QtCore import QObject, QThread, QTimer, pyqtSignal
@@ -33,8 +35,10 @@ except ImportError:
     logger = logging.getLogger(__name__)
     logger.warning("Playwright not available - web scraping fallback will be disabled")
 
-from .api_client_unified import UnifiedMaricopaAPIClient
+from .api_client_unified import FetchGraph, UnifiedMaricopaAPIClient
+from .hedged_requests import HEDGE, PRIMARY, HedgePolicy
 from .logging_config import get_logger, get_performance_logger
+from .work_scheduler import Resource, WorkScheduler, get_work_scheduler
 
 logger = get_logger(__name__)
 perf_logger = get_performance_logger(__name__)
@@ -130,61 +134,186 @@ class DataCollectionStats:
         }
 
 
+@dataclass
+class CachedCollection:
+    """A cached collection result, held as-is or as compressed JSON"""
+
+    data: Optional[Dict]
+    timestamp: float
+    last_access: float
+    raw_bytes: int  # size of the JSON encoding
+    size_bytes: int  # bytes counted against the budget
+    compressed: Optional[bytes] = None
+
+
 class DataCollectionCache:
-    """Enhanced in-memory cache for data collection results with metrics"""
-    def __init__(self, ttl_hours: int = 24):
-        self.cache = {}
+    """Memory-bounded LRU cache for data collection results with metrics
+
+    Entry sizes are measured once at insert time and kept as a running
+    total, so enforcing the byte budget and reporting stats are O(1).
+    Entries not read for compress_after seconds are stored as zlib-compressed
+    JSON by compress_cold() and decompressed on their next hit.
+    """
+    def __init__(
+        self,
+        ttl_hours: int = 24,
+        max_bytes: int = 64 * 1024 * 1024,
+        compress_after: Optional[float] = 600.0,
+        compression_level: int = 6,
+    ):
+        self.cache: "OrderedDict[str, CachedCollection]" = OrderedDict()
         self.ttl_seconds = ttl_hours * 3600
+        self.max_bytes = max_bytes
+        self.compress_after = compress_after
+        self.compression_level = compression_level
         self.lock = Lock()
         self.hit_count = 0
         self.miss_count = 0
+        self.eviction_count = 0
+        self.current_bytes = 0
+        self.compressed_entries = 0
+        self.compression_saved_bytes = 0
+    def _remove(self, apn: str):
+        item = self.cache.pop(apn)
+        self.current_bytes -= item.size_bytes
+        if item.compressed is not None:
+            self.compressed_entries -= 1
+            self.compression_saved_bytes -= item.raw_bytes - item.size_bytes
+    def _decompress(self, item: CachedCollection):
+        """Restore a cold entry to its in-memory form (lock held)"""
+        item.data = json.loads(zlib.decompress(item.compressed).decode("utf-8"))
+        item.compressed = None
+        self.current_bytes += item.raw_bytes - item.size_bytes
+        self.compressed_entries -= 1
+        self.compression_saved_bytes -= item.raw_bytes - item.size_bytes
+        item.size_bytes = item.raw_bytes
+    def _evict_lru(self, incoming_bytes: int = 0):
+        """Evict least recently used entries until incoming_bytes fit (lock held)"""
+        while self.cache and self.current_bytes + incoming_bytes > self.max_bytes:
+            self._remove(next(iter(self.cache)))
+            self.eviction_count += 1
     def get_cached_data(self, apn: str) -> Optional[Dict]:
         """Get cached data if available and fresh"""
         with self.lock:
-            if apn in self.cache:
-                cached_item = self.cache[apn]
-                age = time.time() - cached_item["timestamp"]
+            item = self.cache.get(apn)
+            if item is not None:
+                now = time.time()
+                age = now - item.timestamp
 
                 if age < self.ttl_seconds:
                     self.hit_count += 1
+                    self.cache.move_to_end(apn)
+                    item.last_access = now
+                    if item.compressed is not None:
+                        # Back to full size; evict older entries to make room
+                        self._decompress(item)
+                        self._evict_lru()
                     logger.debug(f"Cache hit for APN {apn} (age: {age:.0f}s)")
-                    return cached_item["data"]
+                    return item.data
                 else:
                     # Expired, remove from cache
-                    del self.cache[apn]
+                    self._remove(apn)
                     logger.debug(f"Cache expired for APN {apn} (age: {age:.0f}s)")
 
             self.miss_count += 1
             return None
     def cache_data(self, apn: str, data: Dict):
-        """Cache data for future use"""
+        """Cache data for future use, evicting least recently used entries"""
+        try:
+            raw_bytes = len(json.dumps(data, default=str)) + len(apn)
+        except (TypeError, ValueError):
+            raw_bytes = len(str(data)) + len(apn)
+
         with self.lock:
-            self.cache[apn] = {"data": data, "timestamp": time.time()}
+            if apn in self.cache:
+                self._remove(apn)
+
+            # An entry larger than the whole budget would flush the cache
+            if raw_bytes > self.max_bytes:
+                logger.debug(f"Result too large to cache ({raw_bytes} bytes): {apn}")
+                return
+
+            self._evict_lru(raw_bytes)
+
+            now = time.time()
+            self.cache[apn] = CachedCollection(
+                data=data,
+                timestamp=now,
+                last_access=now,
+                raw_bytes=raw_bytes,
+                size_bytes=raw_bytes,
+            )
+            self.current_bytes += raw_bytes
             logger.debug(f"Cached data for APN {apn}")
+    def compress_cold(self) -> int:
+        """Compress entries not read for compress_after seconds
+
+        Walks from the least recently used end and stops at the first warm
+        entry, so only cold entries are visited.
+        """
+        if not self.compress_after:
+            return 0
+
+        cutoff = time.time() - self.compress_after
+        compressed = 0
+        with self.lock:
+            for item in self.cache.values():
+                if item.last_access > cutoff:
+                    break
+                if item.compressed is not None:
+                    continue
+                try:
+                    blob = zlib.compress(
+                        json.dumps(item.data, default=str).encode("utf-8"),
+                        self.compression_level,
+                    )
+                except (TypeError, ValueError) as e:
+                    logger.debug(f"Cache entry not compressible: {e}")
+                    continue
+                if len(blob) >= item.size_bytes:
+                    continue
+
+                item.compressed = blob
+                item.data = None
+                self.current_bytes -= item.size_bytes - len(blob)
+                self.compression_saved_bytes += item.raw_bytes - len(blob)
+                item.size_bytes = len(blob)
+                self.compressed_entries += 1
+                compressed += 1
+
+        if compressed:
+            logger.debug(f"Compressed {compressed} cold cache entries")
+        return compressed
     def clear_expired(self):
-        """Remove expired cache entries"""
+        """Remove expired cache entries, then compress cold ones"""
         with self.lock:
             current_time = time.time()
             expired_apns = [
                 apn
                 for apn, item in self.cache.items()
-                if current_time - item["timestamp"] > self.ttl_seconds
+                if current_time - item.timestamp > self.ttl_seconds
             ]
 
             for apn in expired_apns:
-                del self.cache[apn]
+                self._remove(apn)
 
             if expired_apns:
                 logger.info(f"Cleared {len(expired_apns)} expired cache entries")
+
+        self.compress_cold()
     def get_cache_stats(self) -> Dict[str, Any]:
-        """Get cache statistics with hit rate"""
+        """Get cache statistics with hit rate (constant time)"""
         with self.lock:
             total_requests = self.hit_count + self.miss_count
             hit_rate = (self.hit_count / max(1, total_requests)) * 100
 
             return {
                 "total_entries": len(self.cache),
-                "cache_size_mb": len(json.dumps(self.cache)) / (1024 * 1024),
+                "cache_size_mb": self.current_bytes / (1024 * 1024),
+                "max_size_mb": self.max_bytes / (1024 * 1024),
+                "compressed_entries": self.compressed_entries,
+                "compression_saved_mb": self.compression_saved_bytes / (1024 * 1024),
+                "evictions": self.eviction_count,
                 "hit_count": self.hit_count,
                 "miss_count": self.miss_count,
                 "hit_rate_percent": hit_rate,
@@ -192,10 +321,44 @@ class DataCollectionCache:
 
 
 class WebScrapingFallback:
-    """Web scraping fallback for when API methods fail"""
-    def __init__(self):
+    """Web scraping fallback for when API methods fail
+
+    Treasurer HTTP lookups go through the API client, so they share its
+    treasurer session, rate limit bucket and scrape path stats.
+    """
+    def __init__(self, api_client: UnifiedMaricopaAPIClient):
         self.session_timeout = 30000
         self.available = PLAYWRIGHT_AVAILABLE
+        self.api_client = api_client
+        # Bounds a whole HTTP lookup (token wait, form refresh and retry
+        # included); the hedged tax fallback gives primary and backup 5 s
+        # together
+        self.http_timeout = 4.0
+        self._tax_http_executor = get_work_scheduler().executor_for(
+            Resource.TREASURER
+        )
+        self.path_stats = api_client._tax_path_stats
+    def _fetch_tax_records_http(self, apn: str) -> List[Dict]:
+        """Tax records via the treasurer HTTP fast path (runs in a worker thread)"""
+        try:
+            tax_data = self.api_client._scrape_tax_data_http(
+                apn, max_duration=self.http_timeout
+            )
+        except Exception as e:
+            logger.warning(f"Treasurer HTTP fast path rate limited for APN {apn}: {e}")
+            return []
+
+        return [
+            {
+                "tax_year": row["tax_year"],
+                "tax_amount": row["assessed_tax"],
+                "payment_status": row["payment_status"],
+                "assessed_value": None,
+                "limited_value": None,
+                "last_payment_date": None,
+            }
+            for row in (tax_data or {}).get("tax_history", [])
+        ]
 
     async def collect_tax_data_fallback(self, apn: str) -> Dict[str, Any]:
         """Collect tax data from treasurer.maricopa.gov as fallback"""
@@ -203,13 +366,27 @@ class WebScrapingFallback:
 
         result = {"tax_data_collected": False, "tax_records": [], "tax_errors": []}
 
+        # Fast path: replay the parcel form over HTTP, no browser needed
+        tax_records = await asyncio.get_running_loop().run_in_executor(
+            self._tax_http_executor, self._fetch_tax_records_http, apn
+        )
+        if tax_records:
+            result["tax_records"] = tax_records
+            result["tax_data_collected"] = True
+            result["collection_path"] = "http"
+            logger.info(
+                f"Collected {len(tax_records)} tax records via HTTP fast path for APN: {apn}"
+            )
+            return result
+
         if not self.available:
             error_msg = "Playwright not available - web scraping fallback disabled"
             logger.warning(error_msg)
             result["tax_errors"].append(error_msg)
             return result
 
-    try:
+        start_time = time.time()
+        try:
             async with async_playwright() as p:
                 browser = await p.chromium.launch(headless=True)
                 page = await browser.new_page()
@@ -254,11 +431,16 @@ class WebScrapingFallback:
 
                 await browser.close()
 
-    except Exception as e:
+        except Exception as e:
             error_msg = f"Error in web scraping tax data fallback: {str(e)}"
             logger.error(error_msg)
             result["tax_errors"].append(error_msg)
 
+        self.path_stats.record(
+            "browser", time.time() - start_time, result["tax_data_collected"]
+        )
+        if result["tax_data_collected"]:
+            result["collection_path"] = "browser"
         return result
 
     async def collect_sales_data_fallback(self, apn: str) -> Dict[str, Any]:
@@ -439,14 +621,42 @@ class BackgroundDataWorker(QThread):
     job_failed = pyqtSignal(str, str)  # APN, error
     progress_updated = pyqtSignal(int, int)  # completed, total
     status_updated = pyqtSignal(str)  # status message
-    def __init__(self, data_collector, max_concurrent_jobs: int = 3):
+    # Seconds to wait on shutdown for in-flight jobs and their database saves
+    DRAIN_TIMEOUT = 30.0
+    # Seconds between claims while the durable queue has nothing ready
+    POLL_INTERVAL = 2.0
+    def __init__(
+        self,
+        data_collector,
+        max_concurrent_jobs: int = 3,
+        durable_queue=None,
+        scheduler: Optional[WorkScheduler] = None,
+    ):
         super().__init__()
         self.data_collector = data_collector
         self.max_concurrent_jobs = max_concurrent_jobs
         self.job_queue = PriorityQueue()
+
+        # With a DurableCollectionQueue, jobs are queued in the database and
+        # claimed under a lease, so several workers can share one backlog;
+        # the caller owns the queue and closes it after stopping the worker
+        self.durable_queue = durable_queue
         self.active_jobs = {}  # apn -> job
         self.should_stop = Event()
-        self.executor = ThreadPoolExecutor(max_workers=max_concurrent_jobs)
+
+        # Collection jobs share the global scheduler with batch and API work:
+        # each job holds a GENERAL slot, at its JobPriority, while its
+        # coroutine runs on the API client's persistent event loop, so jobs
+        # also share the client's keep-alive connection pool. A local slot is
+        # taken before a job leaves the queue, which keeps queued jobs in
+        # priority order.
+        scheduler = scheduler or get_work_scheduler()
+        self.executor = scheduler.executor_for(
+            Resource.GENERAL, max_workers=max_concurrent_jobs
+        )
+        self._job_slots = Semaphore(max_concurrent_jobs)
+        self._inflight = set()
+        self._inflight_lock = Lock()
 
         # Statistics and caching
         self.stats = DataCollectionStats()
@@ -466,7 +676,7 @@ class BackgroundDataWorker(QThread):
         force_fresh: bool = False,
     ) -> bool:
         """Add a job to the queue"""
-    try:
+        try:
             # Check if job already exists for this APN (avoid duplicates)
             if apn in self.active_jobs:
                 logger.debug(f"Job already active for APN {apn}")
@@ -481,8 +691,15 @@ class BackgroundDataWorker(QThread):
                     self.job_completed.emit(apn, cached_data)
                     return True
 
-            job = DataCollectionJob(apn=apn, priority=priority, force_fresh=force_fresh)
-            self.job_queue.put(job)
+            if self.durable_queue is not None:
+                if not self.durable_queue.put(apn, priority.value):
+                    logger.debug(f"APN {apn} is already being collected")
+                    return False
+            else:
+                job = DataCollectionJob(
+                    apn=apn, priority=priority, force_fresh=force_fresh
+                )
+                self.job_queue.put(job)
             self.total_jobs_count += 1
             self.stats.jobs_submitted += 1
 
@@ -491,7 +708,7 @@ class BackgroundDataWorker(QThread):
             )
             return True
 
-    except Exception as e:
+        except Exception as e:
             logger.error(f"Failed to add job for APN {apn}: {e}")
             return False
     def run(self):
@@ -499,60 +716,105 @@ class BackgroundDataWorker(QThread):
         logger.info("Background data worker started")
         last_maintenance = time.time()
 
-    try:
+        try:
             while not self.should_stop.is_set():
-    try:
-                    # Get next job with timeout
-                    job = self.job_queue.get(timeout=1.0)
-
-                    # Process job
-                    self._process_job(job)
+                # Wait for a free slot (timeouts allow checking should_stop)
+                if not self._job_slots.acquire(timeout=1.0):
+                    continue
+                job = self._next_job()
+                if job is None:
+                    self._job_slots.release()
+                    continue
 
-                    # Periodic maintenance
-                    if time.time() - last_maintenance > 300:  # Every 5 minutes
-                        self._perform_maintenance(last_maintenance)
-                        last_maintenance = time.time()
+                # Process job
+                self._process_job(job)
 
-    except Empty:
-                    # Timeout - continue loop (allows checking should_stop)
-                    continue
+                # Periodic maintenance
+                if time.time() - last_maintenance > 300:  # Every 5 minutes
+                    self._perform_maintenance(last_maintenance)
+                    last_maintenance = time.time()
 
-    except Exception as e:
+        except Exception as e:
             logger.error(f"Worker thread error: {e}")
-    finally:
+        finally:
+            self._drain(self.DRAIN_TIMEOUT)
             logger.info("Background data worker stopped")
-            self.executor.shutdown(wait=True)
+    def _next_job(self) -> Optional[DataCollectionJob]:
+        """Next job from the local queue, or a lease from the durable queue"""
+        if self.durable_queue is None:
+            try:
+                return self.job_queue.get(timeout=1.0)
+            except Empty:
+                return None
+
+        try:
+            claimed = self.durable_queue.claim(limit=1)
+        except Exception as e:
+            logger.error(f"Failed to claim from durable collection queue: {e}")
+            claimed = []
+        if not claimed:
+            self.should_stop.wait(self.POLL_INTERVAL)
+            return None
+
+        row = claimed[0]
+        try:
+            priority = JobPriority(row["priority"])
+        except ValueError:
+            priority = JobPriority.NORMAL
+        return DataCollectionJob(apn=row["apn"], priority=priority, force_fresh=True)
+    def _drain(self, timeout: float):
+        """Wait for in-flight jobs and the database saves they scheduled"""
+        with self._inflight_lock:
+            inflight = list(self._inflight)
+        if inflight:
+            logger.info(f"Waiting for {len(inflight)} in-flight collection jobs")
+            _, not_done = wait(inflight, timeout=timeout)
+            if not_done:
+                logger.warning(
+                    f"{len(not_done)} collection jobs still running at shutdown"
+                )
+        if hasattr(self.data_collector, "wait_for_pending_saves"):
+            self.data_collector.wait_for_pending_saves(timeout)
     def _process_job(self, job: DataCollectionJob):
         """Process a single data collection job"""
         apn = job.apn
 
-    try:
+        try:
             self.active_jobs[apn] = job
             job.started_at = datetime.now()
 
             logger.info(f"Processing data collection job for APN {apn}")
             self.job_started.emit(apn)
 
-            # Submit to thread pool for actual collection
-            future = self.executor.submit(self._collect_data, job)
+            # Run the collection on the client's persistent event loop, under
+            # the scheduler's GENERAL budget
+            future = self.executor.submit_with_priority(
+                job.priority, self._run_on_loop, job
+            )
+            with self._inflight_lock:
+                self._inflight.add(future)
             future.add_done_callback(lambda f: self._handle_job_completion(job, f))
 
-    except Exception as e:
+        except Exception as e:
+            self._job_slots.release()
             error_msg = f"Failed to process job for APN {apn}: {str(e)}"
             logger.error(error_msg)
             self._handle_job_failure(job, error_msg)
-    def _collect_data(self, job: DataCollectionJob) -> Dict[str, Any]:
+    def _run_on_loop(self, job: DataCollectionJob) -> Dict[str, Any]:
+        """Scheduler task: run a job's coroutine on the client's event loop"""
+        return self.data_collector.api_client.submit_async(
+            self._collect_data(job)
+        ).result()
+    async def _collect_data(self, job: DataCollectionJob) -> Dict[str, Any]:
         """Collect data for a specific APN"""
         apn = job.apn
         start_time = time.time()
 
-    try:
+        try:
             logger.info(f"Starting data collection for APN {apn}")
 
             # Use the unified data collector
-            result = asyncio.run(
-                self.data_collector.collect_property_data_progressive(apn)
-            )
+            result = await self.data_collector.collect_property_data_progressive(apn)
 
             # Convert ProgressiveResults to dict if needed
             if hasattr(result, "__dict__"):
@@ -560,25 +822,29 @@ class BackgroundDataWorker(QThread):
             else:
                 result_dict = result
 
-            # Cache the result
-            self.cache.cache_data(apn, result_dict)
-
             processing_time = time.time() - start_time
             result_dict["processing_time"] = processing_time
 
+            # Cache the finished result, so its measured size stays accurate
+            self.cache.cache_data(apn, result_dict)
+
             logger.info(
                 f"Data collection completed for APN {apn} in {processing_time:.2f}s"
             )
             return result_dict
 
-    except Exception as e:
+        except Exception as e:
             processing_time = time.time() - start_time
             error_msg = f"Data collection failed for APN {apn}: {str(e)}"
             logger.error(error_msg)
 
             return {"apn": apn, "error": error_msg, "processing_time": processing_time}
     def _handle_job_completion(self, job: DataCollectionJob, future):
-        """Handle job completion in main thread"""
+        """Handle job completion and free its slot"""
+        with self._inflight_lock:
+            self._inflight.discard(future)
+        self._job_slots.release()
+
     try:
             result = future.result()
             job.result = result
@@ -608,6 +874,8 @@ class BackgroundDataWorker(QThread):
             self.stats.record_job_completion(result["processing_time"])
 
         self.jobs_completed_count += 1
+        if self.durable_queue is not None:
+            self._settle_lease(self.durable_queue.ack, apn)
 
         logger.info(f"Data collection successful for APN {apn}")
         self.job_completed.emit(apn, result)
@@ -622,10 +890,18 @@ class BackgroundDataWorker(QThread):
 
         # Update statistics
         self.stats.record_job_failure()
+        if self.durable_queue is not None:
+            self._settle_lease(self.durable_queue.nack, apn, error_msg)
 
         logger.error(f"Data collection failed for APN {apn}: {error_msg}")
         self.job_failed.emit(apn, error_msg)
         self._emit_progress_update()
+    def _settle_lease(self, settle: Callable, *args):
+        """Ack or nack a durable job; an unsettled lease simply expires"""
+        try:
+            settle(*args)
+        except Exception as e:
+            logger.error(f"Failed to settle durable collection job {args[0]}: {e}")
     def _emit_progress_update(self):
         """Emit progress update signal"""
         self.progress_updated.emit(self.jobs_completed_count, self.total_jobs_count)
@@ -633,6 +909,9 @@ class BackgroundDataWorker(QThread):
         """Perform periodic maintenance tasks"""
         current_time = time.time()
 
+        # Compress cold cache entries on every pass
+        self.cache.compress_cold()
+
         # Clean up cache every hour
         if current_time - last_cleanup_time > 3600:  # 1 hour
             self.cache.clear_expired()
@@ -653,7 +932,8 @@ class BackgroundDataWorker(QThread):
         """Stop the worker thread gracefully"""
         logger.info("Stopping background data worker...")
         self.should_stop.set()
-        self.wait(5000)  # Wait up to 5 seconds
+        # Leave time for in-flight jobs and their database saves to finish
+        self.wait(int((self.DRAIN_TIMEOUT + 5) * 1000))
 
         if self.isRunning():
             logger.warning("Worker thread did not stop gracefully, terminating...")
@@ -663,9 +943,13 @@ class BackgroundDataWorker(QThread):
         return {
             "pending_jobs": self.job_queue.qsize(),
             "active_jobs": len(self.active_jobs),
+            "in_flight_jobs": len(self._inflight),
             "completed_jobs": self.jobs_completed_count,
             "total_jobs": self.total_jobs_count,
             "worker_running": self.isRunning(),
+            "durable_leases": (
+                len(self.durable_queue.held()) if self.durable_queue else 0
+            ),
         }
 
 
@@ -685,8 +969,11 @@ def __init__(self, db_manager, config_manager):
         # Initialize high-performance API client
         self.api_client = UnifiedMaricopaAPIClient(config_manager)
 
-        # Initialize web scraping fallback
-        self.web_fallback = WebScrapingFallback()
+        # Initialize web scraping fallback, hedged against the API; hedging
+        # waits no longer than each API call's own timeout
+        self.web_fallback = WebScrapingFallback(self.api_client)
+        self.tax_hedge = HedgePolicy("tax", max_delay=1.0)
+        self.sales_hedge = HedgePolicy("sales", max_delay=1.5)
 
         # Performance tracking
         self.collection_stats = {
@@ -700,6 +987,12 @@ def __init__(self, db_manager, config_manager):
         # Background worker (optional)
         self.background_worker = None
 
+        # Database saves run under the shared scheduler's database budget and
+        # are tracked until they finish, independent of any event loop
+        self._db_executor = get_work_scheduler().executor_for(Resource.DATABASE)
+        self._pending_saves = set()
+        self._saves_lock = Lock()
+
         logger.info("Unified Data Collector initialized with all features")
 
     async def collect_property_data_progressive(
@@ -710,9 +1003,14 @@ def __init__(self, db_manager, config_manager):
         Stage 1: Basic property info (<1 second)
         Stage 2: Tax and valuation data with web fallback (<2 seconds)
         Stage 3: Sales and document history with web fallback (<3 seconds total)
+
+        No stage needs an earlier stage's payload, so every fetch starts at
+        once from a FetchGraph; stages are reported in order as their inputs
+        arrive, and the total approaches the slowest single fetch.
         """
         logger.info(f"Starting unified progressive data collection for APN: {apn}")
         start_time = time.time()
+        graph = self._build_fetch_graph(apn)
 
         results = ProgressiveResults(
             apn=apn,
@@ -723,10 +1021,12 @@ def __init__(self, db_manager, config_manager):
             errors=[],
         )
 
-try:
+        try:
+            graph.start()
+
             # STAGE 1: Basic property info (Target: <1 second)
             stage_start = time.time()
-            basic_data = await self._collect_basic_data_fast(apn)
+            basic_data = await self._collect_basic_data_fast(apn, graph)
             stage_time = time.time() - stage_start
 
             results.stage = "basic"
@@ -745,7 +1045,7 @@ try:
             # STAGE 2: Detailed property data with fallback (Target: <2 seconds total)
             stage_start = time.time()
             detailed_data = await self._collect_detailed_data_with_fallback(
-                apn, basic_data
+                apn, basic_data, graph
             )
             stage_time = time.time() - stage_start
 
@@ -765,7 +1065,7 @@ try:
             # STAGE 3: Extended data with comprehensive fallback (Target: <3 seconds total)
             stage_start = time.time()
             extended_data = await self._collect_extended_data_with_fallback(
-                apn, results.data
+                apn, results.data, graph
             )
             stage_time = time.time() - stage_start
 
@@ -782,8 +1082,8 @@ try:
                 f"Stage 3 (Extended) completed in {stage_time:.3f}s for APN: {apn}"
             )
 
-            # Save to database asynchronously (non-blocking)
-            asyncio.create_task(self._save_data_async(results.data))
+            # Save to database in the background (non-blocking)
+            self._schedule_save(results.data)
 
             # Update collection stats
             self._update_performance_stats(results.collection_time)
@@ -794,7 +1094,7 @@ try:
 
             return results
 
-except Exception as e:
+        except Exception as e:
             logger.error(
                 f"Error in unified progressive data collection for APN {apn}: {e}"
             )
@@ -802,12 +1102,29 @@ except Exception as e:
             results.collection_time = time.time() - start_time
             return results
 
-    async def _collect_basic_data_fast(self, apn: str) -> Dict[str, Any]:
+        finally:
+            # Drop fetches a failed or partial collection no longer needs
+            graph.cancel_pending()
+    def _build_fetch_graph(self, apn: str) -> FetchGraph:
+        """All fetches for one APN: basic info, detail endpoints, extended data"""
+        graph = FetchGraph()
+        graph.add(
+            "basic", lambda: self.api_client._make_async_request(f"/parcel/{apn}/")
+        )
+        self.api_client._add_detail_fetches(graph, apn)
+        graph.add("sales_history", lambda: self._get_sales_history_fast(apn))
+        graph.add("documents", lambda: self._get_documents_fast(apn))
+        graph.add("tax_info", lambda: self._get_tax_info_fast(apn))
+        return graph
+
+    async def _collect_basic_data_fast(
+        self, apn: str, graph: FetchGraph
+    ) -> Dict[str, Any]:
         """Stage 1: Collect basic property information quickly"""
         logger.debug(f"Collecting basic data for APN: {apn}")
 
         # Single fast API call for basic property info
-        basic_data = await self.api_client._make_async_request(f"/parcel/{apn}/")
+        basic_data = await graph.result("basic")
 
         if basic_data:
             return {
@@ -819,18 +1136,16 @@ except Exception as e:
             return {"data_collection_stage": "basic", "basic_data_available": False}
 
     async def _collect_detailed_data_with_fallback(
-        self, apn: str, basic_data: Dict
+        self, apn: str, basic_data: Dict, graph: FetchGraph
     ) -> Dict[str, Any]:
         """Stage 2: Collect detailed property data with comprehensive fallback"""
         logger.debug(f"Collecting detailed data with fallback for APN: {apn}")
 
         result = {"detailed_data_available": False, "data_collection_stage": "detailed"}
 
-try:
+        try:
             # Try API first
-            detailed_data = await self.api_client._get_detailed_property_data_parallel(
-                apn
-            )
+            detailed_data = await self.api_client._collect_detail_fetches(graph)
 
             if detailed_data:
                 result.update(detailed_data)
@@ -856,7 +1171,7 @@ try:
                     f"API failed for detailed data, continuing without fallback for APN: {apn}"
                 )
 
-except Exception as e:
+        except Exception as e:
             logger.error(f"Error collecting detailed data for APN {apn}: {e}")
             result["errors"] = result.get("errors", [])
             result["errors"].append(f"Detailed data error: {str(e)}")
@@ -864,9 +1179,14 @@ except Exception as e:
         return result
 
     async def _collect_extended_data_with_fallback(
-        self, apn: str, existing_data: Dict
+        self, apn: str, existing_data: Dict, graph: FetchGraph
     ) -> Dict[str, Any]:
-        """Stage 3: Collect extended data with comprehensive web scraping fallback"""
+        """Stage 3: Collect extended data with comprehensive web scraping fallback
+
+        Tax and sales each race the API against a web scraper, concurrently:
+        the scraper starts once the API is slower than its recent p90, or as
+        soon as the API answers with nothing. The first good answer wins.
+        """
         logger.debug(f"Collecting extended data with fallback for APN: {apn}")
 
         extended_data = {
@@ -875,127 +1195,83 @@ except Exception as e:
             "fallback_usage": [],
         }
 
-        # Define extended data tasks with API first, then fallback
-        api_tasks = []
-        fallback_tasks = []
-
-        # Sales history
+        # The API fetches have been running in the graph since collection
+        # started, so hedge delays count from their start
+        races = {}
         if "sales_history" not in existing_data:
-            api_tasks.append(
-                asyncio.create_task(
-                    self._get_sales_history_fast(apn), name="sales_history"
-                )
+            races["sales_history"] = self.sales_hedge.run(
+                lambda: graph.result("sales_history"),
+                lambda: self._scrape_sales_records(apn),
+                started_at=graph.started_at.get("sales_history"),
+                timeout=5.0,
             )
-
-        # Property documents
-        api_tasks.append(
-            asyncio.create_task(self._get_documents_fast(apn), name="documents")
-        )
-
-        # Tax information
         if "tax_records" not in existing_data:
-            api_tasks.append(
-                asyncio.create_task(self._get_tax_info_fast(apn), name="tax_info")
+            races["tax_info"] = self.tax_hedge.run(
+                lambda: graph.result("tax_info"),
+                lambda: self._scrape_tax_records(apn),
+                started_at=graph.started_at.get("tax_info"),
+                timeout=5.0,
             )
 
-        # Try API methods first
-        if api_tasks:
-try:
-                # Wait for API tasks with timeout
-                completed_tasks = await asyncio.wait_for(
-                    asyncio.gather(*api_tasks, return_exceptions=True), timeout=2.0
-                )
+        documents, *outcomes = await asyncio.gather(
+            asyncio.wait_for(graph.result("documents"), timeout=2.0),
+            *races.values(),
+            return_exceptions=True,
+        )
 
-                api_success = False
-                for i, result in enumerate(completed_tasks):
-                    task_name = api_tasks[i].get_name()
-                    if not isinstance(result, Exception) and result:
-                        extended_data[task_name] = result
-                        extended_data["extended_data_available"] = True
-                        api_success = True
-                        logger.debug(f"API extended data collected: {task_name}")
-                    else:
-                        logger.debug(
-                            f"API extended data failed: {task_name} - {result}"
-                        )
-
-                # If API completely failed for tax and sales, try web scraping fallback
-                if not api_success or (
-                    "tax_info" not in extended_data
-                    and "sales_history" not in extended_data
-                ):
-                    logger.info(
-                        f"API methods insufficient, trying web scraping fallback for APN: {apn}"
-                    )
-                    self.collection_stats["fallback_usage"]["api_failures"] += 1
+        if isinstance(documents, Exception):
+            logger.debug(f"API extended data failed: documents - {documents!r}")
+        elif documents:
+            extended_data["documents"] = documents
+            extended_data["extended_data_available"] = True
+            logger.debug("API extended data collected: documents")
+
+        api_failed = False
+        for name, outcome in zip(races, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Extended data error for {name}, APN {apn}: {outcome}")
+                api_failed = True
+                continue
+
+            records, source = outcome
+            if source != PRIMARY:
+                # The API lost the race or had nothing; stop waiting on it
+                graph.cancel(name)
+                api_failed = True
+            if source is None:
+                logger.debug(f"No extended data from any source: {name}")
+                continue
+
+            extended_data[name] = records
+            extended_data["extended_data_available"] = True
+            if source == HEDGE:
+                label = "tax" if name == "tax_info" else "sales"
+                extended_data["fallback_usage"].append(f"{label}_web_scraping")
+                self.collection_stats["fallback_usage"]["web_scraping"] += 1
+                logger.info(
+                    f"{label.title()} data collected via web scraping fallback for APN: {apn}"
+                )
+            else:
+                logger.debug(f"API extended data collected: {name}")
 
-                    # Web scraping fallback for tax data
-                    if "tax_info" not in extended_data:
-try:
-                            tax_fallback = await asyncio.wait_for(
-                                self.web_fallback.collect_tax_data_fallback(apn),
-                                timeout=5.0,
-                            )
-                            if tax_fallback.get("tax_data_collected"):
-                                extended_data["tax_info"] = tax_fallback["tax_records"]
-                                extended_data["extended_data_available"] = True
-                                extended_data["fallback_usage"].append(
-                                    "tax_web_scraping"
-                                )
-                                self.collection_stats["fallback_usage"][
-                                    "web_scraping"
-                                ] += 1
-                                logger.info(
-                                    f"Tax data collected via web scraping fallback for APN: {apn}"
-                                )
-except asyncio.TimeoutError:
-                            logger.warning(
-                                f"Tax web scraping fallback timed out for APN: {apn}"
-                            )
-except Exception as e:
-                            logger.error(
-                                f"Tax web scraping fallback error for APN {apn}: {e}"
-                            )
+        if api_failed:
+            self.collection_stats["fallback_usage"]["api_failures"] += 1
 
-                    # Web scraping fallback for sales data
-                    if "sales_history" not in extended_data:
-try:
-                            sales_fallback = await asyncio.wait_for(
-                                self.web_fallback.collect_sales_data_fallback(apn),
-                                timeout=5.0,
-                            )
-                            if sales_fallback.get("sales_data_collected"):
-                                extended_data["sales_history"] = sales_fallback[
-                                    "sales_records"
-                                ]
-                                extended_data["extended_data_available"] = True
-                                extended_data["fallback_usage"].append(
-                                    "sales_web_scraping"
-                                )
-                                self.collection_stats["fallback_usage"][
-                                    "web_scraping"
-                                ] += 1
-                                logger.info(
-                                    f"Sales data collected via web scraping fallback for APN: {apn}"
-                                )
-except asyncio.TimeoutError:
-                            logger.warning(
-                                f"Sales web scraping fallback timed out for APN: {apn}"
-                            )
-except Exception as e:
-                            logger.error(
-                                f"Sales web scraping fallback error for APN {apn}: {e}"
-                            )
+        return extended_data
 
-except asyncio.TimeoutError:
-                logger.warning(
-                    f"Extended data collection (API) timed out for APN: {apn}"
-                )
-                # Cancel remaining tasks
-                for task in api_tasks:
-                    task.cancel()
+    async def _scrape_tax_records(self, apn: str) -> Optional[List[Dict]]:
+        """Tax records from the treasurer web fallback, if it found any"""
+        fallback = await self.web_fallback.collect_tax_data_fallback(apn)
+        if fallback.get("tax_data_collected"):
+            return fallback["tax_records"]
+        return None
 
-        return extended_data
+    async def _scrape_sales_records(self, apn: str) -> Optional[List[Dict]]:
+        """Sales records from the recorder web fallback, if it found any"""
+        fallback = await self.web_fallback.collect_sales_data_fallback(apn)
+        if fallback.get("sales_data_collected"):
+            return fallback["sales_records"]
+        return None
 
     async def _get_sales_history_fast(self, apn: str) -> Optional[List[Dict]]:
         """Fast sales history collection with timeout"""
@@ -1066,17 +1342,45 @@ except Exception as e:
             "bathrooms": self._safe_float(res_details.get("Bathrooms")),
         }
 
-    async def _save_data_async(self, property_data: Dict):
-        """Asynchronous database save (non-blocking)"""
-    try:
-            # Run database save in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None, self.db_manager.save_comprehensive_property_data, property_data
+    def _schedule_save(self, property_data: Dict):
+        """Save property data on the database executor (non-blocking)
+
+        The save is a thread task rather than a loop task, so closing or
+        cancelling the event loop that scheduled it cannot drop it.
+        """
+        try:
+            future = self._db_executor.submit(
+                self.db_manager.save_comprehensive_property_data, property_data
             )
+        except Exception as e:
+            logger.error(f"Error scheduling property data save: {e}")
+            return
+
+        with self._saves_lock:
+            self._pending_saves.add(future)
+        future.add_done_callback(self._on_save_finished)
+    def _on_save_finished(self, future):
+        """Log the outcome of a background database save"""
+        with self._saves_lock:
+            self._pending_saves.discard(future)
+
+        if future.cancelled():
+            logger.warning("Property data save was cancelled")
+        elif future.exception():
+            logger.error(f"Error saving property data: {future.exception()}")
+        else:
             logger.debug("Property data saved to database")
-    except Exception as e:
-            logger.error(f"Error saving property data: {e}")
+    def wait_for_pending_saves(self, timeout: Optional[float] = None) -> bool:
+        """Block until scheduled database saves finish; False on timeout"""
+        with self._saves_lock:
+            pending = list(self._pending_saves)
+        if not pending:
+            return True
+
+        _, not_done = wait(pending, timeout=timeout)
+        if not_done:
+            logger.warning(f"{len(not_done)} property data saves still pending")
+        return not not_done
     def _update_performance_stats(self, collection_time: float):
         """Update performance statistics"""
         self.collection_stats["total_collections"] += 1
@@ -1120,8 +1424,10 @@ except Exception as e:
             f"Starting comprehensive multi-script data collection for APN: {apn}"
         )
 
-        # Run progressive collection synchronously
-        results = asyncio.run(self.collect_property_data_progressive(apn))
+        # Run progressive collection on the API client's persistent loop
+        results = self.api_client.run_async(
+            self.collect_property_data_progressive(apn)
+        )
 
         # Convert ProgressiveResults to comprehensive dict format
         comprehensive_results = {
@@ -1193,6 +1499,11 @@ except Exception as e:
             "api_performance": api_stats,
             "stage_performance": stage_averages,
             "fallback_performance": self.collection_stats["fallback_usage"],
+            "tax_fallback_paths": self.web_fallback.path_stats.get_stats(),
+            "hedging": {
+                "tax": self.tax_hedge.get_stats(),
+                "sales": self.sales_hedge.get_stats(),
+            },
             "performance_targets": {
                 "basic_target": 1.0,
                 "detailed_target": 2.0,
@@ -1201,13 +1512,17 @@ except Exception as e:
         }
     def collect_property_data_sync(self, apn: str, callback=None) -> ProgressiveResults:
         """Synchronous wrapper for progressive data collection"""
-        return asyncio.run(self.collect_property_data_progressive(apn, callback))
+        return self.api_client.run_async(
+            self.collect_property_data_progressive(apn, callback)
+        )
 
     async def close(self):
         """Clean up resources"""
         if self.background_worker:
             self.background_worker.stop_worker()
-        await self.api_client.close()
+        self.wait_for_pending_saves(timeout=30.0)
+        # Closes the pooled session on the loop that owns it
+        self.api_client.close()
     def __del__(self):
         """Cleanup when object is destroyed"""
         if hasattr(self, "api_client"):
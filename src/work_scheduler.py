@@ -0,0 +1,427 @@
+"""
+Work Scheduler
+One process-wide pool of worker threads shared by the API client, batch
+engines, background collection and scrapers, with a concurrency budget per
+external resource and priority classes
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, Future
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Optional, Set, Union
+
+logger = logging.getLogger(__name__)
+
+
+class Resource(Enum):
+    """Shared resources with their own concurrency budget"""
+
+    ASSESSOR_API = "assessor_api"
+    TREASURER = "treasurer"
+    RECORDER = "recorder"
+    DATABASE = "database"
+    GENERAL = "general"  # Composite work that fans out to the resources above
+
+
+# Maximum tasks running at once per resource
+DEFAULT_BUDGETS = {
+    Resource.ASSESSOR_API: 10,
+    Resource.TREASURER: 3,
+    Resource.RECORDER: 3,
+    Resource.DATABASE: 8,
+    Resource.GENERAL: 8,
+}
+
+# Priority classes, lowest value runs first. JobPriority and BatchPriority
+# members map onto these by name.
+CRITICAL = 0
+HIGH = 1
+NORMAL = 2
+LOW = 3
+PRIORITY_NAMES = {
+    "CRITICAL": CRITICAL,
+    "URGENT": CRITICAL,
+    "HIGH": HIGH,
+    "NORMAL": NORMAL,
+    "LOW": LOW,
+}
+PRIORITY_CLASSES = (CRITICAL, HIGH, NORMAL, LOW)
+
+WAIT_HISTORY = 1000
+
+
+def priority_class(priority: Union[int, Enum, None]) -> int:
+    """Map a JobPriority, BatchPriority or plain int onto a priority class"""
+    if priority is None:
+        return NORMAL
+    if isinstance(priority, Enum):
+        return PRIORITY_NAMES.get(priority.name, NORMAL)
+    return min(max(int(priority), CRITICAL), LOW)
+
+
+def priority_from_level(level: int) -> int:
+    """Map the 1-10 request priority (lower is more urgent) onto a class"""
+    if level <= 2:
+        return CRITICAL
+    if level <= 4:
+        return HIGH
+    if level <= 7:
+        return NORMAL
+    return LOW
+
+
+class _Task:
+    __slots__ = ("seq", "fn", "args", "kwargs", "future", "resource", "enqueued_at")
+
+    def __init__(self, seq, fn, args, kwargs, future, resource):
+        self.seq = seq
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.future = future
+        self.resource = resource
+        self.enqueued_at = time.monotonic()
+
+
+class _ResourceState:
+    """Queues and counters for one resource"""
+
+    def __init__(self, budget: int):
+        self.budget = budget
+        self.running = 0
+        # priority class -> job key -> FIFO of tasks; jobs are served round-robin
+        self.queues: Dict[int, "OrderedDict[Any, Deque[_Task]]"] = {
+            priority: OrderedDict() for priority in PRIORITY_CLASSES
+        }
+        self.queued = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.waits: Deque[float] = deque(maxlen=WAIT_HISTORY)
+        self.max_wait = 0.0
+
+    def head(self):
+        """(priority, seq) of the task this resource would run next, or None"""
+        for priority in PRIORITY_CLASSES:
+            jobs = self.queues[priority]
+            if jobs:
+                return priority, next(iter(jobs.values()))[0].seq
+        return None
+
+    def pop(self, priority: int) -> _Task:
+        jobs = self.queues[priority]
+        job_key, tasks = next(iter(jobs.items()))
+        task = tasks.popleft()
+        if tasks:
+            jobs.move_to_end(job_key)
+        else:
+            del jobs[job_key]
+        self.queued -= 1
+        return task
+
+
+class WorkScheduler:
+    """Priority scheduler over a shared set of worker threads
+
+    Tasks are tagged with a resource, a priority class and optionally a job.
+    A resource never runs more tasks than its budget; among runnable tasks
+    the highest priority class goes first, and within a class jobs take
+    turns so one large batch cannot starve the others. Threads are started
+    on demand up to the sum of the budgets, so every resource can always
+    fill its budget.
+
+    A task may block on work for another resource (a GENERAL batch request
+    waiting on ASSESSOR_API calls) but never on work for its own resource,
+    which could use up the budget with waiting tasks. Long-lived loops and
+    job coordinators that only wait belong on their own threads.
+    """
+
+    def __init__(
+        self,
+        budgets: Optional[Dict[Resource, int]] = None,
+        thread_name_prefix: str = "WorkScheduler",
+    ):
+        budgets = {**DEFAULT_BUDGETS, **(budgets or {})}
+        self._resources = {
+            resource: _ResourceState(max(1, budget))
+            for resource, budget in budgets.items()
+        }
+        self.max_threads = sum(state.budget for state in self._resources.values())
+        self.thread_name_prefix = thread_name_prefix
+
+        self._condition = threading.Condition()
+        self._threads: Set[threading.Thread] = set()
+        self._idle_threads = 0
+        self._seq = 0
+        self._shutdown = False
+
+        logger.info(
+            "Work scheduler initialized: "
+            + ", ".join(
+                f"{resource.value}={state.budget}"
+                for resource, state in self._resources.items()
+            )
+        )
+
+    def submit(
+        self,
+        fn: Callable,
+        *args,
+        resource: Resource = Resource.GENERAL,
+        priority: Union[int, Enum, None] = NORMAL,
+        job_id: Any = None,
+        **kwargs,
+    ) -> Future:
+        """Queue fn(*args, **kwargs) and return its Future"""
+        future = Future()
+        self._enqueue(fn, args, kwargs, future, resource, priority, job_id)
+        return future
+
+    def _enqueue(self, fn, args, kwargs, future, resource, priority, job_id):
+        priority = priority_class(priority)
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new work after shutdown")
+            state = self._resources[resource]
+            self._seq += 1
+            task = _Task(self._seq, fn, args, kwargs, future, resource)
+            state.queues[priority].setdefault(job_id, deque()).append(task)
+            state.queued += 1
+            state.submitted += 1
+
+            if self._idle_threads:
+                self._condition.notify()
+            elif len(self._threads) < self.max_threads:
+                thread = threading.Thread(
+                    target=self._worker,
+                    name=f"{self.thread_name_prefix}_{len(self._threads)}",
+                    daemon=True,
+                )
+                self._threads.add(thread)
+                thread.start()
+
+    def _next_task(self) -> Optional[_Task]:
+        """Best runnable task across resources with budget left; lock held"""
+        best_state, best_head = None, None
+        for state in self._resources.values():
+            if state.running >= state.budget or not state.queued:
+                continue
+            head = state.head()
+            if best_head is None or head < best_head:
+                best_state, best_head = state, head
+        if best_state is None:
+            return None
+        return best_state.pop(best_head[0])
+
+    def _worker(self):
+        while True:
+            with self._condition:
+                task = self._next_task()
+                while task is None:
+                    if self._shutdown:
+                        self._threads.discard(threading.current_thread())
+                        return
+                    self._idle_threads += 1
+                    self._condition.wait()
+                    self._idle_threads -= 1
+                    task = self._next_task()
+                state = self._resources[task.resource]
+                state.running += 1
+                wait = time.monotonic() - task.enqueued_at
+                state.waits.append(wait)
+                state.max_wait = max(state.max_wait, wait)
+
+            failed = False
+            if task.future.set_running_or_notify_cancel():
+                try:
+                    result = task.fn(*task.args, **task.kwargs)
+                except BaseException as e:
+                    failed = True
+                    task.future.set_exception(e)
+                else:
+                    task.future.set_result(result)
+            task = None  # Drop references to arguments and results
+
+            with self._condition:
+                state.running -= 1
+                state.completed += 1
+                if failed:
+                    state.failed += 1
+                # The freed slot may unblock work another thread is idling on
+                if self._idle_threads:
+                    self._condition.notify()
+
+    def budget_for(self, resource: Resource) -> int:
+        """Number of tasks that may run at once against a resource"""
+        return self._resources[resource].budget
+
+    def executor_for(
+        self,
+        resource: Resource,
+        priority: Union[int, Enum, None] = NORMAL,
+        job_id: Any = None,
+        max_workers: Optional[int] = None,
+    ) -> "SchedulerExecutor":
+        """Executor view that submits to this scheduler with fixed tags"""
+        return SchedulerExecutor(self, resource, priority, job_id, max_workers)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth, running tasks and wait times per resource"""
+        with self._condition:
+            resources = {}
+            for resource, state in self._resources.items():
+                waits = sorted(state.waits)
+                resources[resource.value] = {
+                    "budget": state.budget,
+                    "running": state.running,
+                    "queued": state.queued,
+                    "queued_by_priority": {
+                        priority: sum(len(tasks) for tasks in jobs.values())
+                        for priority, jobs in state.queues.items()
+                    },
+                    "queued_jobs": len(
+                        {job for jobs in state.queues.values() for job in jobs}
+                    ),
+                    "submitted": state.submitted,
+                    "completed": state.completed,
+                    "failed": state.failed,
+                    "avg_wait_ms": sum(waits) / len(waits) * 1000 if waits else 0.0,
+                    "p95_wait_ms": (
+                        waits[int(len(waits) * 0.95)] * 1000 if waits else 0.0
+                    ),
+                    "max_wait_ms": state.max_wait * 1000,
+                }
+            return {
+                "threads": len(self._threads),
+                "idle_threads": self._idle_threads,
+                "max_threads": self.max_threads,
+                "queued": sum(state.queued for state in self._resources.values()),
+                "resources": resources,
+            }
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False):
+        """Stop accepting work; queued tasks still run unless cancelled"""
+        with self._condition:
+            self._shutdown = True
+            if cancel_futures:
+                for state in self._resources.values():
+                    for jobs in state.queues.values():
+                        for tasks in jobs.values():
+                            for task in tasks:
+                                task.future.cancel()
+            threads = list(self._threads)
+            self._condition.notify_all()
+
+        if wait:
+            for thread in threads:
+                if thread is not threading.current_thread():
+                    thread.join()
+
+
+class SchedulerExecutor(Executor):
+    """concurrent.futures.Executor that runs its work on a WorkScheduler
+
+    Drop-in for the per-component ThreadPoolExecutors: max_workers caps how
+    many of this executor's tasks are queued on the scheduler at once, and
+    shutdown() only waits for this executor's own tasks.
+    """
+
+    def __init__(
+        self,
+        scheduler: WorkScheduler,
+        resource: Resource,
+        priority: Union[int, Enum, None] = NORMAL,
+        job_id: Any = None,
+        max_workers: Optional[int] = None,
+    ):
+        self.scheduler = scheduler
+        self.resource = resource
+        self.priority = priority
+        self.job_id = job_id if job_id is not None else id(self)
+        self.max_workers = max_workers
+
+        self._lock = threading.Lock()
+        self._pending: Deque[tuple] = deque()
+        self._in_flight = 0
+        self._outstanding: Set[Future] = set()
+        self._shutdown = False
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        return self.submit_with_priority(self.priority, fn, *args, **kwargs)
+
+    def submit_with_priority(self, priority, fn, /, *args, **kwargs) -> Future:
+        """Submit with a priority other than the executor's default"""
+        future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._outstanding.add(future)
+            if self.max_workers and self._in_flight >= self.max_workers:
+                self._pending.append((fn, args, kwargs, future, priority))
+                return future
+            self._in_flight += 1
+        self._dispatch(fn, args, kwargs, future, priority)
+        return future
+
+    def _dispatch(self, fn, args, kwargs, future, priority):
+        future.add_done_callback(self._on_done)
+        try:
+            self.scheduler._enqueue(
+                fn, args, kwargs, future, self.resource, priority, self.job_id
+            )
+        except RuntimeError as e:
+            future.set_exception(e)
+
+    def _on_done(self, future: Future):
+        with self._lock:
+            self._outstanding.discard(future)
+            self._in_flight -= 1
+            next_task = None
+            while self._pending:
+                candidate = self._pending.popleft()
+                if candidate[3].cancelled():
+                    self._outstanding.discard(candidate[3])
+                    continue
+                next_task = candidate
+                self._in_flight += 1
+                break
+        if next_task:
+            self._dispatch(*next_task)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                for _, _, _, future, _ in self._pending:
+                    future.cancel()
+                    self._outstanding.discard(future)
+                self._pending.clear()
+            outstanding = list(self._outstanding)
+        if wait:
+            for future in outstanding:
+                try:
+                    future.exception()
+                except BaseException:
+                    pass
+
+
+_scheduler: Optional[WorkScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_work_scheduler() -> WorkScheduler:
+    """The process-wide scheduler, created with default budgets on first use"""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = WorkScheduler()
+        return _scheduler
+
+
+def set_work_scheduler(scheduler: Optional[WorkScheduler]) -> None:
+    """Replace the process-wide scheduler, e.g. with configured budgets"""
+    global _scheduler
+    with _scheduler_lock:
+        _scheduler = scheduler
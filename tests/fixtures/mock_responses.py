@@ -489,16 +489,16 @@ mock_provider = MockResponseProvider()
 
 
 # Convenience functions
-    def get_mock_properties(count: int = 5) -> List[Dict[str, Any]]:
+def get_mock_properties(count: int = 5) -> List[Dict[str, Any]]:
     """Get mock property data"""
     generator = MockDataGenerator()
     return generator.generate_property_data(count)
-    def get_mock_search_response(
+def get_mock_search_response(
     scenario: str = "successful_search", **kwargs
 ) -> Dict[str, Any]:
     """Get mock search response"""
     return mock_provider.get_search_response(scenario, **kwargs)
-    def get_mock_property_details(apn: str, scenario: str = "normal") -> Dict[str, Any]:
+def get_mock_property_details(apn: str, scenario: str = "normal") -> Dict[str, Any]:
     """Get mock property details"""
     return mock_provider.get_property_details_response(apn, scenario)
 
@@ -0,0 +1,408 @@
+"""
+Stub Maricopa API server for reproducible load testing
+
+Local aiohttp server that answers the assessor API endpoints used by
+UnifiedMaricopaAPIClient (/search/property/ and /parcel/{apn}/...) from a
+large deterministic set of synthetic parcels, with configurable latency and
+injected server errors and 429s. Point the real client at ``base_url`` to
+benchmark it end to end without the live county API.
+
+Run standalone:
+    python tests/fixtures/stub_maricopa_server.py --port 8765 \\
+        --latency lognormal:0.08:0.5 --error-rate 0.01 --max-rps 50
+"""
+import argparse
+import asyncio
+import math
+import random
+import re
+import sys
+import threading
+import time
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from tests.fixtures.mock_responses import MockDataGenerator
+
+# Latency models take the request's Random and return seconds
+LatencyModel = Callable[[random.Random], float]
+
+PARCELS_PER_BOOK = 90 * 1000  # map numbers 10-99, parcels 000-999
+
+
+def fixed_latency(seconds: float) -> LatencyModel:
+    return lambda rng: seconds
+
+
+def uniform_latency(low: float, high: float) -> LatencyModel:
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal_latency(median: float, sigma: float = 0.5) -> LatencyModel:
+    """Long-tailed latency around a median, like a real upstream"""
+    if median <= 0:
+        return fixed_latency(0.0)
+    mu = math.log(median)
+    return lambda rng: rng.lognormvariate(mu, sigma)
+
+
+def parse_latency(spec: str) -> LatencyModel:
+    """Parse 'fixed:0.05', 'uniform:0.02:0.2' or 'lognormal:0.08:0.5'"""
+    kind, *values = spec.split(":")
+    numbers = [float(value) for value in values]
+    models = {
+        "fixed": fixed_latency,
+        "uniform": uniform_latency,
+        "lognormal": lognormal_latency,
+    }
+    if kind not in models:
+        raise ValueError(f"Unknown latency model: {kind}")
+    return models[kind](*numbers)
+
+
+class SyntheticParcels:
+    """Deterministic parcel records generated on demand from their index
+
+    Nothing is stored, so parcel_count can be in the millions. Vocabulary
+    comes from MockDataGenerator.
+    """
+
+    def __init__(self, parcel_count: int = 100_000, seed: int = 0):
+        self.parcel_count = parcel_count
+        self.seed = seed
+        self.vocabulary = MockDataGenerator()
+
+    def apn(self, index: int) -> str:
+        book = 100 + index // PARCELS_PER_BOOK
+        map_number = 10 + (index // 1000) % 90
+        return f"{book}-{map_number:02d}-{index % 1000:03d}"
+
+    def index_for(self, apn: str) -> Optional[int]:
+        digits = re.sub(r"[^0-9]", "", apn)
+        if len(digits) != 8:
+            return None
+        book, map_number, parcel = int(digits[:3]), int(digits[3:5]), int(digits[5:])
+        if book < 100 or map_number < 10:
+            return None
+        index = (book - 100) * PARCELS_PER_BOOK + (map_number - 10) * 1000 + parcel
+        return index if index < self.parcel_count else None
+
+    def _rng(self, index: int, salt: str = "") -> random.Random:
+        return random.Random(f"{self.seed}:{index}:{salt}")
+
+    def search_result(self, index: int) -> Dict[str, Any]:
+        rng = self._rng(index)
+        words = self.vocabulary
+        return {
+            "APN": self.apn(index),
+            "MCR": f"{rng.randint(100, 999)}-{rng.randint(10, 99)}",
+            "Ownership": rng.choice(words.owner_names),
+            "SitusAddress": (
+                f"{rng.randint(100, 9999)} {rng.choice(words.street_names)}"
+            ),
+            "SitusCity": rng.choice(words.cities),
+            "SitusZip": f"85{rng.randint(1, 399):03d}",
+            "PropertyType": rng.choice(words.property_types),
+            "RentalID": "",
+            "SubdivisonName": f"{rng.choice(words.street_names).split()[0]} ESTATES",
+            "SectionTownshipRange": f"{rng.randint(1, 36)} 2N 3E",
+        }
+
+    def valuations(self, index: int) -> List[Dict[str, Any]]:
+        rng = self._rng(index, "valuations")
+        full_cash = rng.randint(150_000, 900_000)
+        current_year = time.localtime().tm_year
+        records = []
+        for offset in range(5):
+            value = int(full_cash * (0.93**offset))
+            records.append(
+                {
+                    "TaxYear": str(current_year - offset),
+                    "FullCashValue": str(value),
+                    "LimitedPropertyValue": f"{int(value * 0.8):<12}",
+                    "LegalClassificationCode": "3   ",
+                    "LegalClassification": "PRIMARY RESIDENCE",
+                    "AssessmentRatioPercentage": "0.1000",
+                    "PEPropUseDesc": "Single Family Residential",
+                    "PropertyUseCode": "0131",
+                    "TaxAreaCode": f"{rng.randint(10000, 99999):06d}",
+                }
+            )
+        return records
+
+    def residential_details(self, index: int) -> Dict[str, Any]:
+        rng = self._rng(index, "residential")
+        return {
+            "ConstructionYear": str(rng.randint(1950, 2023)),
+            "LotSize": str(rng.randint(4000, 20000)),
+            "LivableSpace": str(rng.randint(800, 4500)),
+            "Pool": rng.random() < 0.3,
+            "ImprovementQualityGrade": rng.choice("ABCD"),
+            "ExteriorWalls": rng.choice(["Frame Stucco", "Masonry", "Block"]),
+            "RoofType": rng.choice(["Tile", "Shingle", "Built-up"]),
+            "BathFixtures": rng.randint(3, 12),
+            "NumberOfGarages": rng.randint(0, 3),
+            "ParkingDetails": [],
+        }
+
+    def improvements(self, index: int) -> List[Dict[str, Any]]:
+        rng = self._rng(index, "improvements")
+        return [
+            {
+                "ImprovementNumber": f"{number:06d}",
+                "ImprovementDescription": rng.choice(["Residence", "Garage", "Pool"]),
+                "ImprovementSquareFootage": str(rng.randint(200, 3000)),
+                "EffectiveAge": str(rng.randint(1, 60)),
+                "QualityRank": str(rng.randint(1, 5)),
+            }
+            for number in range(1, rng.randint(1, 3) + 1)
+        ]
+
+    def mapids(self, index: int) -> Dict[str, Any]:
+        file_name = re.sub(r"[^0-9]", "", self.apn(index))
+        entry = [{"FileName": file_name, "UpdateDate": "30-APR-08", "Url": ""}]
+        return {"Parcel Maps": entry, "MCR Maps": entry}
+
+    def matching(self, query: str, limit: int = 25) -> List[int]:
+        """Pseudo-random but stable result page for a free-text query"""
+        rng = random.Random(zlib.crc32(query.upper().encode()) ^ self.seed)
+        count = min(limit, self.parcel_count, rng.randint(0, limit))
+        return [rng.randrange(self.parcel_count) for _ in range(count)]
+
+
+class StubMaricopaServer:
+    """aiohttp stand-in for mcassessor.maricopa.gov/api
+
+    Args:
+        parcel_count: Size of the synthetic parcel set
+        latency: Model (or fixed seconds) applied to every request
+        endpoint_latency: Per-endpoint overrides, keyed by 'search',
+            'valuations', 'residential-details', 'improvements', 'sketches',
+            'mapids' or 'rental-details'
+        error_rate: Fraction of requests answered with HTTP 500
+        rate_limit_rate: Fraction of requests answered with HTTP 429
+        max_rps: Requests per second allowed before answering 429
+        retry_after: Retry-After seconds sent with 429s
+        seed: Seed for parcels, latency and injected failures
+    """
+
+    def __init__(
+        self,
+        parcel_count: int = 100_000,
+        latency: Union[float, LatencyModel] = 0.0,
+        endpoint_latency: Optional[Dict[str, Union[float, LatencyModel]]] = None,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        max_rps: Optional[float] = None,
+        retry_after: float = 1.0,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.parcels = SyntheticParcels(parcel_count, seed)
+        self.latency = self._latency_model(latency)
+        self.endpoint_latency = {
+            name: self._latency_model(model)
+            for name, model in (endpoint_latency or {}).items()
+        }
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.max_rps = max_rps
+        self.retry_after = retry_after
+        self.host = host
+        self.port = port
+
+        self._rng = random.Random(seed)
+        self._tokens = float(max_rps or 0)
+        self._last_refill = time.monotonic()
+
+        canned = MockDataGenerator().generate_api_responses()
+        self._server_error = canned["server_error"]
+        self._rate_limited = dict(canned["rate_limited"], retry_after=retry_after)
+
+        self.stats: Counter = Counter()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _latency_model(latency: Union[float, LatencyModel]) -> LatencyModel:
+        return latency if callable(latency) else fixed_latency(float(latency))
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/api"
+
+    def make_app(self) -> web.Application:
+        app = web.Application()
+        # The client joins endpoints onto its base URL both with and without
+        # the /api prefix, so serve both
+        for prefix in ("", "/api"):
+            app.router.add_get(f"{prefix}/search/property/", self._search)
+            app.router.add_get(
+                prefix + "/parcel/{apn}/rental-details/{owner}/", self._rental_details
+            )
+            app.router.add_get(prefix + "/parcel/{apn}/{section}/", self._parcel)
+        return app
+
+    async def _inject(self, endpoint: str) -> Optional[web.Response]:
+        """Apply latency, then any throttling or injected failure"""
+        self.stats["requests"] += 1
+        self.stats[f"endpoint:{endpoint}"] += 1
+
+        delay = self.endpoint_latency.get(endpoint, self.latency)(self._rng)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if self.max_rps:
+            now = time.monotonic()
+            self._tokens = min(
+                self.max_rps, self._tokens + (now - self._last_refill) * self.max_rps
+            )
+            self._last_refill = now
+            if self._tokens < 1.0:
+                return self._throttle()
+            self._tokens -= 1.0
+
+        roll = self._rng.random()
+        if roll < self.rate_limit_rate:
+            return self._throttle()
+        if roll < self.rate_limit_rate + self.error_rate:
+            self.stats["errors"] += 1
+            return web.json_response(self._server_error, status=500)
+        return None
+
+    def _throttle(self) -> web.Response:
+        self.stats["rate_limited"] += 1
+        return web.json_response(
+            self._rate_limited,
+            status=429,
+            headers={"Retry-After": f"{self.retry_after:g}"},
+        )
+
+    def _ok(self, body: Any) -> web.Response:
+        self.stats["ok"] += 1
+        return web.json_response(body)
+
+    def _not_found(self) -> web.Response:
+        self.stats["not_found"] += 1
+        return web.json_response({"error": "not_found"}, status=404)
+
+    async def _search(self, request: web.Request) -> web.Response:
+        failure = await self._inject("search")
+        if failure:
+            return failure
+
+        query = request.query.get("q", "")
+        index = self.parcels.index_for(query)
+        if index is not None:
+            indices = [index]
+        elif re.fullmatch(r"[0-9\-. ]+", query):
+            indices = []  # APN-shaped but outside the parcel set
+        else:
+            indices = self.parcels.matching(query)
+        results = [self.parcels.search_result(i) for i in indices]
+        return self._ok({"Results": results, "TotalPropertyCount": len(results)})
+
+    async def _parcel(self, request: web.Request) -> web.Response:
+        section = request.match_info["section"]
+        failure = await self._inject(section)
+        if failure:
+            return failure
+
+        index = self.parcels.index_for(request.match_info["apn"])
+        builders = {
+            "valuations": self.parcels.valuations,
+            "residential-details": self.parcels.residential_details,
+            "improvements": self.parcels.improvements,
+            "sketches": lambda index: {"TotalPages": 0, "Pages": []},
+            "mapids": self.parcels.mapids,
+        }
+        if index is None or section not in builders:
+            return self._not_found()
+        return self._ok(builders[section](index))
+
+    async def _rental_details(self, request: web.Request) -> web.Response:
+        failure = await self._inject("rental-details")
+        if failure:
+            return failure
+        if self.parcels.index_for(request.match_info["apn"]) is None:
+            return self._not_found()
+        return self._ok([])
+
+    def start(self) -> str:
+        """Serve from a background thread; returns the base URL"""
+        started = threading.Event()
+
+        def serve():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            self._runner = web.AppRunner(self.make_app(), access_log=None)
+            self._loop.run_until_complete(self._runner.setup())
+            site = web.TCPSite(self._runner, self.host, self.port)
+            self._loop.run_until_complete(site.start())
+            self.port = site._server.sockets[0].getsockname()[1]
+            started.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self._runner.cleanup())
+            self._loop.close()
+
+        self._thread = threading.Thread(
+            target=serve, name="StubMaricopaAPI", daemon=True
+        )
+        self._thread.start()
+        if not started.wait(10.0):
+            raise RuntimeError("Stub Maricopa API server did not start")
+        return self.base_url
+
+    def stop(self):
+        if self._loop and self._thread:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=10.0)
+        self._thread = None
+
+    def __enter__(self) -> "StubMaricopaServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--parcels", type=int, default=100_000)
+    parser.add_argument("--latency", default="fixed:0", help="e.g. lognormal:0.08:0.5")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--max-rps", type=float, default=None)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = StubMaricopaServer(
+        parcel_count=args.parcels,
+        latency=parse_latency(args.latency),
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        max_rps=args.max_rps,
+        retry_after=args.retry_after,
+        seed=args.seed,
+        host=args.host,
+        port=args.port,
+    )
+    print(f"Serving {args.parcels} synthetic parcels at {server.base_url}")
+    print(f"Example APN: {server.parcels.apn(0)}")
+    web.run_app(server.make_app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Durable collection queue against a live PostgreSQL database
+
+Runs the queue SQL of UnifiedDatabaseManager for real: concurrent claims
+through FOR UPDATE SKIP LOCKED, reclaiming an expired lease, fencing a
+worker whose lease was taken over, and rows left in progress without a
+lease. Rows use an XQUE- APN prefix and a priority below any real job, so
+claims pick them up first; they are removed afterwards.
+"""
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+APN_PREFIX = "XQUE-"
+TEST_PRIORITY = -1000
+
+
+@pytest.fixture(scope="module")
+def db_manager():
+    try:
+        from src.database_manager_unified import UnifiedDatabaseManager
+        from src.enhanced_config_manager import EnhancedConfigManager
+
+        manager = UnifiedDatabaseManager(EnhancedConfigManager())
+        if not manager.test_connection():
+            pytest.skip("PostgreSQL database not available")
+    except Exception as e:
+        pytest.skip(f"PostgreSQL database not available: {e}")
+
+    yield manager
+
+    _delete_test_rows(manager)
+    manager.close()
+
+
+@pytest.fixture(autouse=True)
+def clean_queue(db_manager):
+    _delete_test_rows(db_manager)
+    yield
+
+
+def _delete_test_rows(manager):
+    with manager.get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "DELETE FROM data_collection_status WHERE apn LIKE %s", (f"{APN_PREFIX}%",)
+        )
+        conn.commit()
+
+
+def _execute(manager, sql, params):
+    with manager.get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(sql, params)
+        conn.commit()
+
+
+def _row(manager, apn):
+    with manager.get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT * FROM data_collection_status WHERE apn = %s", (apn,))
+        return cursor.fetchone()
+
+
+def _expire_lease(manager, apn):
+    _execute(
+        manager,
+        """
+        UPDATE data_collection_status
+        SET lease_expires_at = CURRENT_TIMESTAMP - INTERVAL '1 second'
+        WHERE apn = %s
+        """,
+        (apn,),
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.database
+class TestCollectionQueuePostgres:
+    """Queue SQL checks against PostgreSQL"""
+
+    def test_concurrent_claimers_never_share_an_apn(self, db_manager):
+        apns = [f"{APN_PREFIX}{i:06d}" for i in range(40)]
+        assert db_manager.enqueue_collection(apns, TEST_PRIORITY) == len(apns)
+
+        # Four workers take exactly as many rows as were queued
+        barrier = threading.Barrier(4)
+        claimed = {}
+
+        def claim(worker_id):
+            barrier.wait()
+            rows = []
+            for _ in range(5):
+                rows += db_manager.claim_collection_jobs(worker_id, limit=2)
+            claimed[worker_id] = [row["apn"] for row in rows]
+
+        threads = [
+            threading.Thread(target=claim, args=(f"xque-worker-{i}",)) for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        all_claimed = [apn for rows in claimed.values() for apn in rows]
+        assert sorted(all_claimed) == apns
+        for worker_id, rows in claimed.items():
+            for apn in rows:
+                row = _row(db_manager, apn)
+                assert row["status"] == "in_progress"
+                assert row["leased_by"] == worker_id
+                assert row["attempts"] == 1
+
+    def test_expired_lease_is_reclaimed_and_stale_worker_fenced(self, db_manager):
+        apn = f"{APN_PREFIX}LEASE"
+        db_manager.enqueue_collection([apn], TEST_PRIORITY)
+        assert [row["apn"] for row in db_manager.claim_collection_jobs("stalled")] == [
+            apn
+        ]
+
+        assert db_manager.extend_collection_leases("stalled", [apn], 60) == [apn]
+        _expire_lease(db_manager, apn)
+        reclaimed = db_manager.claim_collection_jobs("healthy", limit=1)
+        assert [(row["apn"], row["attempts"]) for row in reclaimed] == [(apn, 2)]
+
+        # The stalled worker can neither renew, complete nor fail the job
+        assert db_manager.extend_collection_leases("stalled", [apn], 60) == []
+        assert not db_manager.complete_collection_job(apn, "stalled")
+        assert db_manager.fail_collection_job(apn, "stalled", "late", 0) is None
+        assert _row(db_manager, apn)["leased_by"] == "healthy"
+
+        assert db_manager.complete_collection_job(apn, "healthy")
+        assert _row(db_manager, apn)["status"] == "completed"
+
+    def test_failed_job_waits_for_retry_then_fails_out(self, db_manager):
+        apn = f"{APN_PREFIX}RETRY"
+        db_manager.enqueue_collection([apn], TEST_PRIORITY)
+        db_manager.claim_collection_jobs("w1", max_attempts=2)
+
+        assert db_manager.fail_collection_job(apn, "w1", "timeout", 3600, 2) == "queued"
+        row = _row(db_manager, apn)
+        assert row["leased_by"] is None and row["error_message"] == "timeout"
+        # Not ready again until its retry delay has passed
+        with db_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT available_at > CURRENT_TIMESTAMP AS waiting "
+                "FROM data_collection_status WHERE apn = %s",
+                (apn,),
+            )
+            assert cursor.fetchone()["waiting"]
+
+        _execute(
+            db_manager,
+            "UPDATE data_collection_status SET available_at = CURRENT_TIMESTAMP "
+            "WHERE apn = %s",
+            (apn,),
+        )
+        assert db_manager.claim_collection_jobs("w1", max_attempts=2)[0]["apn"] == apn
+        assert db_manager.fail_collection_job(apn, "w1", "timeout", 0, 2) == "failed"
+
+    def test_in_progress_row_without_lease_is_not_stuck(self, db_manager):
+        claimable = f"{APN_PREFIX}NOLEASE1"
+        requeued = f"{APN_PREFIX}NOLEASE2"
+        for apn in (claimable, requeued):
+            assert db_manager.mark_collection_in_progress(apn)
+            _execute(
+                db_manager,
+                "UPDATE data_collection_status SET priority = %s WHERE apn = %s",
+                (TEST_PRIORITY, apn),
+            )
+            assert _row(db_manager, apn)["lease_expires_at"] is None
+
+        assert db_manager.enqueue_collection([requeued], TEST_PRIORITY) == 1
+        assert _row(db_manager, requeued)["status"] == "queued"
+
+        claimed = db_manager.claim_collection_jobs("w1", limit=2)
+        assert sorted(row["apn"] for row in claimed) == [claimable, requeued]
@@ -0,0 +1,112 @@
+"""
+Ranked property search against a live PostgreSQL database
+
+Checks keyset paging through a large match set and uses EXPLAIN to confirm
+that the owner search is served by the pg_trgm GIN index rather than a
+sequential scan. Rows use an XPLN- APN prefix and are removed afterwards.
+"""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+APN_PREFIX = "XPLN-"
+ROW_COUNT = 20000
+MATCHING_ROWS = 250
+
+
+def _generate_properties():
+    for i in range(ROW_COUNT):
+        owner = f"RANKEDSEARCH FAMILY TRUST {i}" if i < MATCHING_ROWS else f"OWNER {i:06d} LLC"
+        yield {
+            "apn": f"{APN_PREFIX}{i:08d}",
+            "owner_name": owner,
+            "property_address": f"{i} W Missouri Ave, Phoenix, AZ 85013",
+        }
+
+
+@pytest.fixture(scope="module")
+def db_manager():
+    try:
+        from src.database_manager_unified import UnifiedDatabaseManager
+        from src.enhanced_config_manager import EnhancedConfigManager
+
+        manager = UnifiedDatabaseManager(EnhancedConfigManager())
+        if not manager.test_connection():
+            pytest.skip("PostgreSQL database not available")
+    except Exception as e:
+        pytest.skip(f"PostgreSQL database not available: {e}")
+
+    manager.bulk_ingest_properties(_generate_properties())
+    with manager.get_connection() as conn:
+        conn.cursor().execute("ANALYZE properties")
+        conn.commit()
+
+    yield manager
+
+    with manager.get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM properties WHERE apn LIKE %s", (f"{APN_PREFIX}%",))
+        conn.commit()
+    manager.close()
+
+
+def _plan_nodes(plan):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+@pytest.mark.integration
+@pytest.mark.database
+class TestRankedSearchExplain:
+    """EXPLAIN-backed checks for the ranked owner/address search"""
+
+    def test_owner_search_uses_trigram_index(self, db_manager):
+        sql = db_manager._build_ranked_search_sql("owner_name", browse=False, paged=False)
+
+        with db_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT set_config('pg_trgm.word_similarity_threshold', '0.3', true)"
+            )
+            cursor.execute(
+                "EXPLAIN (FORMAT JSON) " + sql, {"term": "RANKEDSEARCH", "limit": 50}
+            )
+            row = cursor.fetchone()
+            plan = row["QUERY PLAN"]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+
+        nodes = list(_plan_nodes(plan[0]["Plan"]))
+        index_names = {node.get("Index Name") for node in nodes}
+        scans_on_properties = {
+            node["Node Type"] for node in nodes if node.get("Relation Name") == "properties"
+        }
+
+        assert "idx_properties_owner" in index_names
+        assert "Seq Scan" not in scans_on_properties
+
+    def test_pages_through_all_matches_in_rank_order(self, db_manager):
+        seen = []
+        scores = []
+        cursor = None
+        while True:
+            page, cursor = db_manager.search_properties_by_owner_page(
+                "RANKEDSEARCH", limit=40, cursor=cursor
+            )
+            seen.extend(row["apn"] for row in page)
+            scores.extend(row["match_score"] for row in page)
+            if cursor is None:
+                break
+
+        assert len(seen) == len(set(seen)) == MATCHING_ROWS
+        assert scores == sorted(scores, reverse=True)
+
+    def test_best_match_comes_first(self, db_manager):
+        results = db_manager.search_properties_by_owner("RANKEDSEARCH FAMILY TRUST 7", limit=5)
+
+        assert results[0]["owner_name"] == "RANKEDSEARCH FAMILY TRUST 7"
@@ -0,0 +1,117 @@
+"""
+End-to-end API client benchmark against the local stub Maricopa API server
+
+Runs the real UnifiedMaricopaAPIClient (HTTP, retries, caching, thread
+pool) against tests/fixtures/stub_maricopa_server.py, so the numbers are
+reproducible offline. Latency, error and 429 settings mirror a loaded
+county API.
+"""
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from tests.fixtures.stub_maricopa_server import StubMaricopaServer, lognormal_latency
+
+
+class StubConfig:
+    def __init__(self, base_url):
+        self.base_url = base_url
+
+    def get_api_config(self):
+        return {
+            "base_url": self.base_url,
+            "token": "stub-token",
+            "timeout": 5,
+            "max_retries": 3,
+        }
+
+
+def make_client(base_url):
+    from src.api_client_unified import AdaptiveRateLimiter, UnifiedMaricopaAPIClient
+
+    client = UnifiedMaricopaAPIClient(StubConfig(base_url))
+    # Measure the client and server, not the politeness delays for the live API
+    client.min_request_interval = 0.0
+    client.rate_limiter = AdaptiveRateLimiter(
+        initial_rate=1000.0, max_rate=1000.0, burst_capacity=1000
+    )
+    return client
+
+
+def run_lookups(client, apns, workers):
+    def timed(apn):
+        start = time.perf_counter()
+        result = client.get_comprehensive_property_info(apn)
+        return result, time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        outcomes = list(pool.map(timed, apns))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for _, latency in outcomes)
+    return {
+        "results": [result for result, _ in outcomes],
+        "throughput": len(apns) / elapsed,
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95)],
+    }
+
+
+@pytest.mark.performance
+class TestAPIClientStubBenchmark:
+    """Comprehensive lookups through the real client against the stub server"""
+
+    def test_comprehensive_lookup_throughput(self):
+        with StubMaricopaServer(
+            parcel_count=100_000, latency=lognormal_latency(0.01, 0.5)
+        ) as server:
+            client = make_client(server.base_url)
+            apns = [server.parcels.apn(i * 997) for i in range(80)]
+            try:
+                stats = run_lookups(client, apns, workers=8)
+            finally:
+                client.close()
+
+        print(
+            f"\n{len(apns)} lookups: {stats['throughput']:.1f}/s, "
+            f"p50 {stats['p50'] * 1000:.0f}ms, p95 {stats['p95'] * 1000:.0f}ms, "
+            f"{server.stats['requests']} HTTP requests"
+        )
+        results = stats["results"]
+        assert all(result and result["apn"] in apns for result in results)
+        assert all(result.get("latest_assessed_value") for result in results)
+        # One search plus the detail endpoints per APN
+        assert server.stats["endpoint:search"] >= len(apns)
+        assert server.stats["endpoint:valuations"] == len(apns)
+
+    def test_lookups_recover_from_injected_rate_limits(self):
+        with StubMaricopaServer(
+            parcel_count=10_000,
+            latency=0.005,
+            rate_limit_rate=0.05,
+            retry_after=0.05,
+            seed=3,
+        ) as server:
+            client = make_client(server.base_url)
+            apns = [server.parcels.apn(i) for i in range(40)]
+            try:
+                stats = run_lookups(client, apns, workers=4)
+            finally:
+                client.close()
+
+        print(
+            f"\n{server.stats['rate_limited']} injected 429s, "
+            f"{stats['throughput']:.1f} lookups/s"
+        )
+        assert server.stats["rate_limited"] > 0
+        assert all(
+            result and result.get("latest_assessed_value")
+            for result in stats["results"]
+        )
@@ -0,0 +1,77 @@
+"""
+Batch result streaming memory benchmark
+
+Measures memory held by a finished batch job when results are streamed to a
+consumer and dropped (retain_results=False) against the default of keeping
+every full result until the job is cleaned up.
+"""
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+PAYLOAD_BYTES = 4096
+
+
+class FakeAPIClient:
+    def get_comprehensive_property_info(self, apn):
+        return {"apn": apn, "details": "x" * PAYLOAD_BYTES}
+
+
+class FakeDatabaseManager:
+    def get_connection(self):
+        return object()
+
+    def save_comprehensive_property_data(self, data):
+        return True
+
+
+def _retained_bytes_per_item(items, retain_results):
+    from src.batch_search_engine import BatchSearchEngine, RateLimiter, SearchMode
+
+    engine = BatchSearchEngine(
+        api_client=FakeAPIClient(), db_manager=FakeDatabaseManager()
+    )
+    engine.rate_limiter = RateLimiter(api_calls_per_second=1e6, burst_size=items)
+    apns = [f"{i:08d}" for i in range(items)]
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    job_id = engine.submit_batch_search(
+        apns,
+        "apn",
+        mode=SearchMode.SEQUENTIAL,
+        stream_results=True,
+        retain_results=retain_results,
+    )
+    consumed = sum(1 for _ in engine.iter_job_results(job_id, timeout=30.0))
+    while engine.get_job_status(job_id)["status"] != "completed":
+        time.sleep(0.01)
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    engine.shutdown()
+    assert consumed == items
+    return retained / items
+
+
+@pytest.mark.performance
+class TestBatchStreamingMemory:
+    """Memory held per item by streamed and retained batch jobs"""
+
+    def test_streamed_job_does_not_hold_results(self):
+        items = 2000
+        retained = _retained_bytes_per_item(items, retain_results=True)
+        streamed = _retained_bytes_per_item(items, retain_results=False)
+
+        print(
+            f"\n{items} items: retained {retained:.0f} B/item, "
+            f"streamed {streamed:.0f} B/item"
+        )
+        assert retained > PAYLOAD_BYTES
+        assert streamed < PAYLOAD_BYTES / 4
@@ -0,0 +1,138 @@
+"""
+Browser pool stress test
+
+Hammers the Selenium browser pool from many threads with stub drivers that
+leak memory on every use and occasionally crash, and checks that the pool
+never exceeds its size, recycles and replaces drivers, and quits every
+driver it created.
+"""
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from parallel_web_scraper import BrowserPool
+
+WORKERS = 16
+OPERATIONS_PER_WORKER = 150
+POOL_SIZE = 4
+
+
+class LeakyStubDriver:
+    """Stub driver whose memory grows per page and which can crash"""
+
+    def __init__(self):
+        self.rss_mb = 150.0
+        self.crashed = False
+        self.quit_called = False
+
+    @property
+    def current_url(self):
+        if self.crashed:
+            raise RuntimeError("chrome not reachable")
+        return "about:blank"
+
+    def get(self, url):
+        if self.crashed:
+            raise RuntimeError("chrome not reachable")
+        self.rss_mb += 40.0
+
+    def delete_all_cookies(self):
+        if self.crashed:
+            raise RuntimeError("chrome not reachable")
+
+    def execute_script(self, script):
+        if self.crashed:
+            raise RuntimeError("chrome not reachable")
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.mark.performance
+class TestBrowserPoolStress:
+    """Stress test for BrowserPool under concurrent load"""
+
+    def test_concurrent_acquire_release(self):
+        drivers = []
+        drivers_lock = threading.Lock()
+
+        def factory():
+            time.sleep(0.005)  # Browser start-up cost
+            driver = LeakyStubDriver()
+            with drivers_lock:
+                drivers.append(driver)
+            return driver
+
+        pool = BrowserPool(
+            "unused",
+            pool_size=POOL_SIZE,
+            min_idle=2,
+            max_uses_per_browser=25,
+            max_rss_mb=600.0,
+            health_check_interval=0.05,
+            browser_factory=factory,
+            memory_probe=lambda driver: driver.rss_mb,
+        )
+
+        errors = []
+        peak_total = [0]
+
+        def worker(seed):
+            rng = random.Random(seed)
+            for _ in range(OPERATIONS_PER_WORKER):
+                try:
+                    browser = pool.acquire_browser(timeout=10.0)
+                except TimeoutError as e:
+                    errors.append(e)
+                    continue
+                try:
+                    with pool.lock:
+                        peak_total[0] = max(peak_total[0], pool.total_browsers)
+                    browser.get("https://treasurer.maricopa.gov/")
+                    if rng.random() < 0.03:
+                        browser.crashed = True
+                    time.sleep(0.0005)
+                except RuntimeError:
+                    pass
+                finally:
+                    pool.release_browser(browser)
+
+        start_time = time.perf_counter()
+        threads = [
+            threading.Thread(target=worker, args=(seed,)) for seed in range(WORKERS)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start_time
+
+        status = pool.get_pool_status()
+        pool.close_all()
+
+        operations = WORKERS * OPERATIONS_PER_WORKER
+        print(
+            f"\n{operations} checkouts in {elapsed:.2f}s over {len(drivers)} drivers: "
+            f"avg wait {status['avg_acquire_wait_ms']:.1f}ms, "
+            f"p95 {status['p95_acquire_wait_ms']:.1f}ms, "
+            f"max {status['max_acquire_wait_ms']:.1f}ms, "
+            f"busy {status['busy_time_percent']:.0f}%, "
+            f"recycled {status['recycled_browsers']}, "
+            f"crashed {status['crashed_browsers']}"
+        )
+
+        assert not errors
+        assert status["acquisitions"] == operations
+        assert peak_total[0] <= POOL_SIZE
+        assert status["recycled_browsers"] > 0
+        assert status["crashed_browsers"] > 0
+        assert pool.created_browsers == len(drivers)
+        # Every driver the pool started has been quit, none leaked
+        assert all(driver.quit_called for driver in drivers)
+        assert pool.total_browsers == 0
@@ -0,0 +1,53 @@
+"""
+Micro-benchmark: DataCollectionCache stats stay constant-time as it grows
+"""
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.unified_data_collector import DataCollectionCache
+
+
+def fill(cache, count):
+    for i in range(len(cache.cache), count):
+        cache.cache_data(
+            f"{i:09d}",
+            {"apn": f"{i:09d}", "owner": "SMITH, JOHN", "valuations": [i] * 50},
+        )
+
+
+def time_stats(cache, calls=2000):
+    start = time.perf_counter()
+    for _ in range(calls):
+        cache.get_cache_stats()
+    return (time.perf_counter() - start) / calls
+
+
+@pytest.mark.performance
+class TestDataCollectionCacheBenchmark:
+    """Stats call cost at increasing cache sizes"""
+
+    def test_stats_cost_is_independent_of_cache_size(self):
+        cache = DataCollectionCache(max_bytes=512 * 1024 * 1024)
+        timings = {}
+        for size in (100, 1_000, 10_000, 50_000):
+            fill(cache, size)
+            timings[size] = time_stats(cache)
+
+        # What the old implementation paid per call at the largest size
+        start = time.perf_counter()
+        json.dumps({apn: item.data for apn, item in cache.cache.items()})
+        serialize = time.perf_counter() - start
+
+        print()
+        for size, per_call in timings.items():
+            print(f"{size:>6} entries: get_cache_stats {per_call * 1e6:.2f}us")
+        print(f"json.dumps of 50000 entries: {serialize * 1e3:.1f}ms")
+
+        assert timings[50_000] < timings[100] * 5
+        assert timings[50_000] < serialize / 100
@@ -0,0 +1,100 @@
+"""
+Page parser throughput benchmarks
+
+Reports pages/sec for the offline treasurer and recorder parsers over the
+fixture corpus, and compares the tax history parser with the regex it
+replaced on a large page where the regex backtracks.
+"""
+import re
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from page_parsers import parse_recorder_documents, parse_tax_history, parse_tax_page
+
+PAGES_DIR = Path(__file__).parent.parent / "fixtures" / "pages"
+
+# The tax history pattern used before the tree parser
+LEGACY_ROW_PATTERN = (
+    r"<row[^>]*>.*?(\d{4}).*?(Paid|Unpaid).*?\$([\d,]+\.?\d*).*?\$([\d,]+\.?\d*).*?</row>"
+)
+
+
+def _pages_per_second(parse, pages, min_seconds=0.5):
+    parsed = 0
+    start_time = time.perf_counter()
+    while time.perf_counter() - start_time < min_seconds:
+        for page in pages:
+            parse(page)
+            parsed += 1
+    return parsed / (time.perf_counter() - start_time)
+
+
+@pytest.mark.performance
+class TestPageParserThroughput:
+    """Pages/sec for the treasurer and recorder parsers"""
+
+    def test_treasurer_pages_per_second(self):
+        pages = [path.read_bytes() for path in sorted(PAGES_DIR.glob("treasurer_*.html"))]
+
+        rate = _pages_per_second(parse_tax_page, pages)
+
+        print(f"treasurer pages: {rate:,.0f} pages/sec")
+        assert rate > 200
+
+    def test_recorder_pages_per_second(self):
+        pages = [path.read_bytes() for path in sorted(PAGES_DIR.glob("recorder_*.html"))]
+
+        rate = _pages_per_second(parse_recorder_documents, pages)
+
+        print(f"recorder pages: {rate:,.0f} pages/sec")
+        assert rate > 200
+
+    @staticmethod
+    def _statusless_rows_page(rows):
+        """Rows with a year but no payment status: the legacy regex worst case"""
+        return "<table>" + "".join(
+            f"<row><cell>{2024 - i % 50}</cell><cell>Notice {i}</cell></row>"
+            for i in range(rows)
+        ) + "</table>"
+
+    def test_large_page_scales_linearly(self):
+        small = self._statusless_rows_page(500)
+        large = self._statusless_rows_page(5000)
+
+        start_time = time.perf_counter()
+        assert parse_tax_history(small) == []
+        small_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        assert parse_tax_history(large) == []
+        large_time = time.perf_counter() - start_time
+
+        print(
+            f"status-less rows: 500 in {small_time * 1000:.1f} ms, "
+            f"5000 in {large_time * 1000:.1f} ms"
+        )
+        # 10x the rows should cost roughly 10x the time, not 100x
+        assert large_time < small_time * 30
+
+    def test_faster_than_legacy_regex(self):
+        # The legacy pattern is cubic here; 100 rows already take a noticeable time
+        page = self._statusless_rows_page(100)
+
+        start_time = time.perf_counter()
+        assert parse_tax_history(page) == []
+        parser_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        assert re.findall(LEGACY_ROW_PATTERN, page, re.DOTALL | re.IGNORECASE) == []
+        legacy_time = time.perf_counter() - start_time
+
+        print(
+            f"100 status-less rows: parser {parser_time * 1000:.1f} ms, "
+            f"legacy regex {legacy_time * 1000:.1f} ms"
+        )
+        assert parser_time * 10 < legacy_time
@@ -0,0 +1,109 @@
+"""
+Results grid benchmarks
+
+Populates the model/view results grid with 1k, 10k and 100k rows and reports
+population time, first-paint time and RSS growth. Status lookups are not
+included here; see test_results_table_population.py for those.
+"""
+import gc
+import sys
+import time
+from pathlib import Path
+
+import psutil
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication, QTableView
+
+from src.gui.results_table_model import (
+    ColumnarResultStore,
+    PropertyResultsModel,
+    PropertyResultsProxyModel,
+    sample_column_widths,
+)
+
+GRID_SIZES = [1000, 10000, 100000]
+
+
+def _generate_results(count):
+    return [
+        {
+            "apn": f"{10215000 + i}",
+            "address": f"{i} W Missouri Ave",
+            "owner_name": f"OWNER {i}",
+            "property_type": "Residential",
+            "year_built": 1950 + i % 70,
+            "square_feet": 1200 + i % 2000,
+            "bedrooms": 2 + i % 4,
+            "bathrooms": 1 + (i % 3) * 0.5,
+            "market_value": 200000 + i * 7,
+            "assessed_value": 180000 + i * 5,
+            "last_sale_date": "2020-05-15",
+            "last_sale_amount": 275000,
+        }
+        for i in range(count)
+    ]
+
+
+def _rss_mb():
+    return psutil.Process().memory_info().rss / 1024 / 1024
+
+
+@pytest.mark.performance
+@pytest.mark.gui
+class TestResultsGridBenchmark:
+    """Population time and memory of the results grid by row count"""
+
+    @pytest.mark.parametrize("size", GRID_SIZES)
+    def test_populate_grid(self, qtbot, size):
+        results = _generate_results(size)
+        statuses = ["Complete"] * size
+        states = [2] * size
+        updated = ["Never"] * size
+
+        model = PropertyResultsModel()
+        proxy = PropertyResultsProxyModel()
+        proxy.setSourceModel(model)
+        view = QTableView()
+        view.setModel(proxy)
+        view.setSortingEnabled(True)
+        view.resize(1200, 600)
+        qtbot.addWidget(view)
+
+        gc.collect()
+        rss_before = _rss_mb()
+        start_time = time.perf_counter()
+
+        model.set_store(
+            ColumnarResultStore.from_results(results, statuses, states, updated)
+        )
+        widths = sample_column_widths(model, view.fontMetrics())
+        for column, width in enumerate(widths):
+            view.horizontalHeader().resizeSection(column, width)
+        populate_time = time.perf_counter() - start_time
+
+        view.show()
+        QApplication.processEvents()
+        paint_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        proxy.sort(8, Qt.DescendingOrder)
+        sort_time = time.perf_counter() - start_time
+
+        del results
+        gc.collect()
+        rss_growth = _rss_mb() - rss_before
+
+        print(
+            f"{size:>7} rows: populate {populate_time * 1000:8.1f} ms, "
+            f"first paint {paint_time * 1000:8.1f} ms, sort {sort_time * 1000:8.1f} ms, "
+            f"RSS +{rss_growth:.1f} MB"
+        )
+
+        assert model.rowCount() == size
+        assert proxy.index(0, 0).data() == f"{10215000 + size - 1}"
+        # Population must not scale with per-cell work in the view
+        assert populate_time < 0.5 + size * 20e-6
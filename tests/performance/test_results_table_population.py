@@ -0,0 +1,160 @@
+"""
+Results table population benchmarks
+
+Measures EnhancedMainWindow.populate_results_table row-population time against
+result-set size, and verifies that data collection status for the whole result
+set is fetched with a single database round trip.
+"""
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from PyQt5.QtWidgets import QLabel, QTableView
+
+from src.gui.enhanced_main_window import EnhancedMainWindow
+from src.gui.results_table_model import (
+    STATUS_COLUMN,
+    PropertyResultsModel,
+    PropertyResultsProxyModel,
+)
+
+RESULT_SET_SIZES = [10, 100, 500, 2000]
+SIMULATED_ROUND_TRIP_SECONDS = 0.0005
+
+
+class CountingDatabaseManager:
+    """Database manager stand-in that counts round trips and simulates latency"""
+
+    def __init__(self):
+        self.round_trips = 0
+
+    def _round_trip(self):
+        self.round_trips += 1
+        time.sleep(SIMULATED_ROUND_TRIP_SECONDS)
+
+    def get_collection_status_bulk(self, apns):
+        self._round_trip()
+        return {
+            apn: {
+                "apn": apn,
+                "exists": True,
+                "last_updated": None,
+                "tax_records_count": i % 3,
+                "sales_records_count": i % 2,
+                "latest_tax_year": 2024,
+                "latest_sale_date": None,
+                "collection_status": None,
+            }
+            for i, apn in enumerate(apns)
+        }
+
+    def get_tax_history(self, apn):
+        self._round_trip()
+        return []
+
+    def get_sales_history(self, apn):
+        self._round_trip()
+        return []
+
+
+class ResultsTableHost:
+    """Minimal host for the results table methods of EnhancedMainWindow"""
+
+    populate_results_table = EnhancedMainWindow.populate_results_table
+    _get_collection_status_map = EnhancedMainWindow._get_collection_status_map
+    _get_collecting_apns = EnhancedMainWindow._get_collecting_apns
+    _format_collection_status = EnhancedMainWindow._format_collection_status
+    _format_last_update_time = EnhancedMainWindow._format_last_update_time
+
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+        self.background_manager = None
+        self.results_model = PropertyResultsModel()
+        self.results_proxy = PropertyResultsProxyModel()
+        self.results_proxy.setSourceModel(self.results_model)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_proxy)
+        self.results_summary = QLabel()
+
+
+def _generate_results(count):
+    return [
+        {
+            "apn": f"{10215000 + i}",
+            "address": f"{i} W Missouri Ave",
+            "owner_name": f"OWNER {i}",
+            "property_type": "Residential",
+            "year_built": 1995,
+            "square_feet": 2100,
+            "bedrooms": 4,
+            "bathrooms": 2,
+            "market_value": 320000,
+            "assessed_value": 285000,
+            "last_sale_date": "2020-05-15",
+            "last_sale_amount": 275000,
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.mark.performance
+@pytest.mark.gui
+class TestResultsTablePopulation:
+    """Row-population time against result-set size"""
+
+    @pytest.mark.parametrize("size", RESULT_SET_SIZES)
+    def test_population_uses_single_status_query(self, qtbot, size):
+        """Status for every row comes from one bulk query"""
+        db_manager = CountingDatabaseManager()
+        host = ResultsTableHost(db_manager)
+
+        host.populate_results_table(_generate_results(size))
+
+        assert db_manager.round_trips == 1
+        model = host.results_model
+        assert model.rowCount() == size
+        assert model.index(size - 1, STATUS_COLUMN).data() in {
+            "Complete",
+            "Partial",
+            "Queued",
+        }
+
+    def test_population_time_by_result_set_size(self, qtbot):
+        """Report row-population time for each result-set size"""
+        timings = {}
+
+        for size in RESULT_SET_SIZES:
+            db_manager = CountingDatabaseManager()
+            host = ResultsTableHost(db_manager)
+            results = _generate_results(size)
+
+            start_time = time.perf_counter()
+            host.populate_results_table(results)
+            elapsed = time.perf_counter() - start_time
+
+            timings[size] = elapsed
+            print(
+                f"Result set size {size}: {elapsed:.3f}s "
+                f"({elapsed / size * 1000:.3f} ms/row, "
+                f"{db_manager.round_trips} DB round trips)"
+            )
+
+        # With a single status query, per-row cost must not include DB latency
+        largest = RESULT_SET_SIZES[-1]
+        assert timings[largest] / largest < SIMULATED_ROUND_TRIP_SECONDS * 2
+
+    def test_population_failure_clears_the_grid(self, qtbot):
+        """A failed population shows an error instead of a stale grid"""
+        host = ResultsTableHost(CountingDatabaseManager())
+        host.populate_results_table(_generate_results(10))
+
+        # Malformed status rows make formatting raise part way through
+        host._get_collection_status_map = lambda apns: {apn: 1 for apn in apns}
+        host.populate_results_table(_generate_results(5))
+
+        assert host.results_model.rowCount() == 0
+        assert host.results_summary.text().startswith("Failed to display results")
@@ -0,0 +1,251 @@
+"""
+Unit tests for the adaptive concurrency limiter and SearchMode.ADAPTIVE
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from src.adaptive_concurrency import AdaptiveConcurrencyLimiter, is_rate_limit_error
+
+
+def fill_window(limiter, latency, success=True, rate_limited=False):
+    """Hold every slot (so the window counts as saturated) and record samples"""
+    held = 0
+    while limiter.try_acquire():
+        held += 1
+    for _ in range(max(limiter.limit, limiter.min_window)):
+        limiter.record(latency, success=success, rate_limited=rate_limited)
+    for _ in range(held):
+        limiter.release()
+
+
+class FakeRateLimiter:
+    def __init__(self):
+        self.rate_limit_count = 0
+        self.decreases = []
+
+    def get_stats(self):
+        return {"rate_limit_count": self.rate_limit_count, "blocked_for_seconds": 0}
+
+    def decrease_rate(self, factor, host=None):
+        self.decreases.append(factor)
+
+
+@pytest.mark.unit
+class TestAdaptiveConcurrencyLimiter:
+    """Test suite for AdaptiveConcurrencyLimiter."""
+
+    def test_increases_additively_while_saturated_and_healthy(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=4, max_limit=6, slow_start=False
+        )
+        for _ in range(5):
+            fill_window(limiter, 0.1)
+        assert limiter.limit == 6
+        assert limiter.increases == 2
+
+    def test_slow_start_doubles_until_congested(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, backoff=0.5)
+        for _ in range(4):
+            fill_window(limiter, 0.1)
+        assert limiter.limit == 16
+
+        fill_window(limiter, 0.1, rate_limited=True)
+        fill_window(limiter, 0.1)
+        assert limiter.limit == 9
+        assert not limiter.slow_start
+
+    def test_does_not_increase_when_limit_is_not_reached(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+        for _ in range(10):
+            limiter.record(0.1)
+        assert limiter.limit == 4
+
+    def test_backs_off_on_rate_limits_errors_and_latency(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=20, backoff=0.5, slow_start=False
+        )
+        fill_window(limiter, 0.1)
+        assert limiter.limit == 21
+
+        fill_window(limiter, 0.1, success=False, rate_limited=True)
+        assert limiter.limit == 10
+
+        fill_window(limiter, 0.1, success=False)
+        assert limiter.limit == 5
+
+        # p50 well above the 100 ms baseline means requests are queueing
+        fill_window(limiter, 0.5)
+        assert limiter.limit == 2
+        assert limiter.get_stats()["decreases"] == 3
+
+    def test_reads_rate_limits_from_shared_rate_limiter(self):
+        rate_limiter = FakeRateLimiter()
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=8, backoff=0.5, rate_limiter=rate_limiter, slow_start=False
+        )
+        rate_limiter.rate_limit_count = 2
+        fill_window(limiter, 0.1)
+        assert limiter.limit == 4
+
+        # Already-seen rate limits do not count again
+        fill_window(limiter, 0.1)
+        assert limiter.limit == 5
+
+    def test_overload_slows_down_shared_rate_limiter(self):
+        rate_limiter = FakeRateLimiter()
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=8, backoff=0.5, rate_limiter=rate_limiter, slow_start=False
+        )
+        fill_window(limiter, 0.1)
+        assert rate_limiter.decreases == []
+
+        fill_window(limiter, 0.1, success=False)
+        assert rate_limiter.decreases == [0.5]
+
+        # Rate limits it recorded itself were already acted on
+        rate_limiter.rate_limit_count = 1
+        fill_window(limiter, 0.1)
+        assert rate_limiter.decreases == [0.5]
+
+    def test_acquire_blocks_at_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        assert limiter.acquire(timeout=0.1)
+        assert not limiter.acquire(timeout=0.05)
+        threading.Timer(0.05, limiter.release).start()
+        assert limiter.acquire(timeout=1.0)
+
+    def test_rate_limit_error_detection(self):
+        assert is_rate_limit_error(Exception("HTTP 429 Too Many Requests"))
+        assert is_rate_limit_error(TimeoutError("Rate limit timeout for API call"))
+        assert not is_rate_limit_error(ValueError("Property not found"))
+        assert not is_rate_limit_error(None)
+
+
+class CongestedAPIClient:
+    """Server whose latency climbs steeply past 4 concurrent requests"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+
+    def get_comprehensive_property_info(self, apn):
+        with self.lock:
+            self.active += 1
+            active = self.active
+        time.sleep(0.005 * max(1, active - 4) ** 2)
+        with self.lock:
+            self.active -= 1
+        return {"apn": apn}
+
+
+class FakeDatabaseManager:
+    def get_connection(self):
+        return object()
+
+    def save_comprehensive_property_data(self, data):
+        return True
+
+
+@pytest.mark.unit
+class TestAdaptiveSearchMode:
+    """Test suite for BatchSearchEngine in ADAPTIVE mode."""
+
+    def test_adaptive_job_backs_off_from_congestion(self):
+        from src.batch_search_engine import BatchSearchEngine, RateLimiter, SearchMode
+
+        api_client = CongestedAPIClient()
+        engine = BatchSearchEngine(
+            api_client=api_client, db_manager=FakeDatabaseManager()
+        )
+        engine.rate_limiter = RateLimiter(api_calls_per_second=1e6, burst_size=1000)
+        try:
+            apns = [f"{i:08d}" for i in range(200)]
+            job_id = engine.submit_batch_search(
+                apns, "apn", mode=SearchMode.ADAPTIVE
+            )
+            deadline = time.monotonic() + 20.0
+            while engine.get_job_status(job_id)["status"] != "completed":
+                assert time.monotonic() < deadline
+                time.sleep(0.02)
+
+            status = engine.get_job_status(job_id)
+            concurrency = status["concurrency"]
+            assert status["mode"] == "adaptive"
+            assert status["completed_requests"] == len(apns)
+            assert status["successful_requests"] == len(apns)
+            # Latency starts climbing past 4 in flight
+            assert concurrency["decreases"] >= 1
+            assert 2 <= concurrency["limit"] <= 8
+        finally:
+            engine.shutdown()
+
+    def test_rate_limiter_wait_is_not_recorded_as_latency(self):
+        from src.batch_search_engine import BatchSearchEngine, SearchMode
+
+        class SlowTokenRateLimiter:
+            def acquire_api_token(self, timeout=5.0):
+                time.sleep(0.05)
+                return True
+
+        class FastAPIClient:
+            def get_comprehensive_property_info(self, apn):
+                time.sleep(0.001)
+                return {"apn": apn}
+
+        engine = BatchSearchEngine(
+            api_client=FastAPIClient(), db_manager=FakeDatabaseManager()
+        )
+        engine.rate_limiter = SlowTokenRateLimiter()
+        try:
+            job_id = engine.submit_batch_search(
+                [f"{i:08d}" for i in range(10)], "apn", mode=SearchMode.ADAPTIVE
+            )
+            deadline = time.monotonic() + 20.0
+            while engine.get_job_status(job_id)["status"] != "completed":
+                assert time.monotonic() < deadline
+                time.sleep(0.02)
+
+            concurrency = engine.get_job_status(job_id)["concurrency"]
+            assert 0 < concurrency["p99_ms"] < 40
+        finally:
+            engine.shutdown()
+
+    def test_limit_capped_at_scheduler_budget(self):
+        from src.batch_search_engine import BatchSearchEngine, RateLimiter, SearchMode
+        from src.work_scheduler import Resource, WorkScheduler
+
+        class FastAPIClient:
+            def get_comprehensive_property_info(self, apn):
+                time.sleep(0.002)
+                return {"apn": apn}
+
+        scheduler = WorkScheduler(budgets={Resource.GENERAL: 3})
+        engine = BatchSearchEngine(
+            api_client=FastAPIClient(),
+            db_manager=FakeDatabaseManager(),
+            scheduler=scheduler,
+        )
+        engine.rate_limiter = RateLimiter(api_calls_per_second=1e6, burst_size=1000)
+        try:
+            job_id = engine.submit_batch_search(
+                [f"{i:08d}" for i in range(200)], "apn", mode=SearchMode.ADAPTIVE
+            )
+            deadline = time.monotonic() + 20.0
+            while engine.get_job_status(job_id)["status"] != "completed":
+                assert time.monotonic() < deadline
+                time.sleep(0.02)
+
+            # An uncongested server would otherwise push the limit to 32
+            concurrency = engine.get_job_status(job_id)["concurrency"]
+            assert concurrency["max_limit"] == 3
+            assert concurrency["limit"] <= 3
+        finally:
+            engine.shutdown()
+            scheduler.shutdown()
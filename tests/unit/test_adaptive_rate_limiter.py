@@ -0,0 +1,199 @@
+"""
+Unit tests for the per-host token bucket AdaptiveRateLimiter
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.api_client_unified import (
+    RECORDER_HOST,
+    TREASURER_HOST,
+    AdaptiveRateLimiter,
+    RateLimitTimeout,
+    UnifiedMaricopaAPIClient,
+    parse_retry_after,
+)
+
+
+class TestAdaptiveRateLimiter:
+    """Test suite for AdaptiveRateLimiter."""
+
+    @pytest.mark.unit
+    def test_burst_then_paced_at_rate(self):
+        limiter = AdaptiveRateLimiter(initial_rate=20.0, burst_capacity=2)
+
+        start_time = time.time()
+        for _ in range(6):
+            assert limiter.acquire(timeout=1.0) is True
+        elapsed = time.time() - start_time
+
+        # Two burst tokens, then four more at 20 req/s
+        assert 0.15 <= elapsed < 0.4
+
+    @pytest.mark.unit
+    def test_timeout_does_not_consume_token(self):
+        limiter = AdaptiveRateLimiter(initial_rate=1.0, burst_capacity=1)
+        assert limiter.acquire(timeout=0.0) is True
+
+        assert limiter.acquire(timeout=0.01) is False
+        stats = limiter.get_stats()
+        assert stats["acquired"] == 1
+        assert stats["timeouts"] == 1
+
+    @pytest.mark.unit
+    def test_hosts_have_independent_buckets(self):
+        limiter = AdaptiveRateLimiter(initial_rate=1.0, burst_capacity=1)
+        assert limiter.acquire(timeout=0.0) is True
+
+        assert limiter.acquire(timeout=0.0, host=TREASURER_HOST) is True
+        assert limiter.acquire(timeout=0.0, host=RECORDER_HOST) is True
+        assert set(limiter.get_stats()["hosts"]) >= {TREASURER_HOST, RECORDER_HOST}
+
+    @pytest.mark.unit
+    def test_retry_after_pauses_only_that_host(self):
+        limiter = AdaptiveRateLimiter(initial_rate=5.0, burst_capacity=5)
+        limiter.record_rate_limit(host=TREASURER_HOST, retry_after=0.1)
+
+        start_time = time.time()
+        assert limiter.acquire(timeout=0.0) is True
+        assert time.time() - start_time < 0.05
+
+        assert limiter.acquire(timeout=1.0, host=TREASURER_HOST) is True
+        assert time.time() - start_time >= 0.05
+
+    @pytest.mark.unit
+    def test_retry_after_longer_than_timeout_is_waited_out(self):
+        limiter = AdaptiveRateLimiter(initial_rate=5.0, burst_capacity=5)
+        limiter.record_rate_limit(retry_after=0.2)
+
+        start_time = time.time()
+        assert limiter.acquire(timeout=0.01) is True
+        assert time.time() - start_time >= 0.15
+        assert limiter.get_stats()["timeouts"] == 0
+
+    @pytest.mark.unit
+    def test_async_request_waits_out_long_retry_after(self):
+        client = UnifiedMaricopaAPIClient()
+        client.timeout = 0.01
+        client.rate_limiter = AdaptiveRateLimiter(initial_rate=5.0, burst_capacity=5)
+        client.rate_limiter.record_rate_limit(retry_after=0.2)
+        get_session = AsyncMock(side_effect=RuntimeError("no network"))
+
+        async def main():
+            start_time = time.time()
+            with patch.object(client.connection_pool, "get_session", get_session):
+                result = await client._send_async_request(
+                    "/search/property/", {"q": "10215009"}, "key"
+                )
+            return result, time.time() - start_time
+
+        try:
+            result, elapsed = asyncio.run(main())
+        finally:
+            client.close()
+
+        # The request was sent once the window had passed, not dropped
+        assert result is None
+        assert elapsed >= 0.15
+        get_session.assert_awaited_once()
+
+    @pytest.mark.unit
+    def test_rate_limit_timeout_is_raised(self):
+        client = UnifiedMaricopaAPIClient()
+        client.timeout = 0.01
+        client.rate_limiter = AdaptiveRateLimiter(initial_rate=1.0, burst_capacity=1)
+        assert client.rate_limiter.acquire(timeout=0.0) is True
+
+        try:
+            with pytest.raises(RateLimitTimeout):
+                client._send_request("/search/property/", {"q": "10215009"}, "key")
+        finally:
+            client.close()
+
+    @pytest.mark.unit
+    def test_rate_limit_decreases_rate(self):
+        limiter = AdaptiveRateLimiter(initial_rate=2.0, min_rate=0.5)
+        limiter.record_rate_limit()
+
+        assert limiter.current_rate == pytest.approx(1.6)
+        assert limiter.get_stats()["rate_limit_count"] == 1
+
+    @pytest.mark.unit
+    def test_decrease_rate_does_not_count_as_rate_limit(self):
+        limiter = AdaptiveRateLimiter(initial_rate=2.0, min_rate=0.5)
+        limiter.decrease_rate(0.5)
+        limiter.decrease_rate(0.1, host=TREASURER_HOST)
+
+        stats = limiter.get_stats()
+        assert stats["current_rate"] == pytest.approx(1.0)
+        assert stats["rate_limit_count"] == 0
+        assert stats["hosts"][TREASURER_HOST]["current_rate"] == 0.5
+
+    @pytest.mark.unit
+    def test_async_waiters_are_served_in_order_without_polling(self):
+        limiter = AdaptiveRateLimiter(initial_rate=10.0, burst_capacity=1)
+        finished = []
+
+        async def waiter(i):
+            await limiter.acquire_async(timeout=2.0)
+            finished.append(i)
+
+        async def main():
+            start_time = time.time()
+            await asyncio.gather(*(waiter(i) for i in range(5)))
+            return time.time() - start_time
+
+        elapsed = asyncio.run(main())
+        assert finished == [0, 1, 2, 3, 4]
+        assert 0.35 <= elapsed < 0.6
+
+    @pytest.mark.unit
+    def test_cancelled_waiter_returns_its_token(self):
+        limiter = AdaptiveRateLimiter(initial_rate=1.0, burst_capacity=1)
+        assert limiter.acquire(timeout=0.0) is True
+
+        async def main():
+            task = asyncio.create_task(limiter.acquire_async(timeout=5.0))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+        stats = limiter.get_stats()
+        assert stats["acquired"] == 1
+        assert stats["average_wait_time"] == 0.0
+
+    @pytest.mark.unit
+    def test_sync_requests_draw_from_the_token_bucket(self):
+        client = UnifiedMaricopaAPIClient()
+        client.rate_limiter = AdaptiveRateLimiter(initial_rate=20.0, burst_capacity=1)
+        response = Mock(status_code=200)
+        response.json.return_value = {"Results": []}
+
+        try:
+            start_time = time.time()
+            with patch.object(client.session, "get", return_value=response):
+                for apn in ("10215009", "10215010", "10215011"):
+                    client._make_request("/search/property/", {"q": apn})
+            elapsed = time.time() - start_time
+        finally:
+            client.close()
+
+        # One burst token, then two more at 20 req/s
+        assert elapsed >= 0.08
+        assert client.rate_limiter.get_stats()["acquired"] == 3
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "value, expected",
+        [("3", 3.0), ("0.5", 0.5), ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0), (None, None)],
+    )
+    def test_parse_retry_after(self, value, expected):
+        assert parse_retry_after(value) == expected
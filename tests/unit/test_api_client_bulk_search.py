@@ -0,0 +1,173 @@
+"""
+Unit tests for the async bulk APN pipeline of UnifiedMaricopaAPIClient
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.api_client_unified import (
+    AdaptiveRateLimiter,
+    RateLimitTimeout,
+    UnifiedMaricopaAPIClient,
+)
+
+
+def _search_response(apn):
+    return {"Results": [{"APN": apn, "Ownership": f"OWNER {apn}"}]}
+
+
+class TestBulkPropertySearchAsync:
+    """Test suite for bulk_property_search_async and its sync wrapper."""
+
+    @pytest.fixture
+    def api_client(self):
+        client = UnifiedMaricopaAPIClient()
+        yield client
+        client.close()
+
+    @pytest.fixture
+    def fake_request(self):
+        """Async request stand-in that tracks peak concurrency"""
+        state = {"in_flight": 0, "peak": 0, "calls": 0}
+
+        async def make_async_request(endpoint, params=None):
+            state["calls"] += 1
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            try:
+                await asyncio.sleep(0.01)
+                return _search_response(params["q"])
+            finally:
+                state["in_flight"] -= 1
+
+        return make_async_request, state
+
+    @pytest.mark.unit
+    def test_streams_every_apn_with_bounded_concurrency(self, api_client, fake_request):
+        make_async_request, state = fake_request
+        apns = [f"1021{i:04d}" for i in range(50)]
+
+        async def collect():
+            return [
+                item
+                async for item in api_client.bulk_property_search_async(
+                    apns, concurrency=8
+                )
+            ]
+
+        with patch.object(api_client, "_make_async_request", make_async_request):
+            results = asyncio.run(collect())
+
+        assert {apn for apn, _ in results} == set(apns)
+        assert all(data["apn"] == apn for apn, data in results)
+        assert 1 < state["peak"] <= 8
+
+    @pytest.mark.unit
+    def test_stopping_early_cancels_in_flight_lookups(self, api_client, fake_request):
+        make_async_request, state = fake_request
+        apns = [f"1021{i:04d}" for i in range(200)]
+
+        async def take_five():
+            partial = []
+            async for apn, data in api_client.bulk_property_search_async(
+                apns, concurrency=4
+            ):
+                partial.append(apn)
+                if len(partial) == 5:
+                    break
+            return partial
+
+        with patch.object(api_client, "_make_async_request", make_async_request):
+            partial = asyncio.run(take_five())
+
+        assert len(partial) == 5
+        assert state["in_flight"] == 0
+        assert state["calls"] < len(apns)
+
+    @pytest.mark.unit
+    def test_rate_limit_timeout_is_raised_not_yielded_as_miss(self, api_client):
+        async def make_async_request(endpoint, params=None):
+            if params["q"] == "10215010":
+                raise RateLimitTimeout("No rate limit token for /search/property/")
+            return _search_response(params["q"])
+
+        async def collect():
+            return [
+                item
+                async for item in api_client.bulk_property_search_async(
+                    ["10215009", "10215010"], concurrency=1
+                )
+            ]
+
+        with patch.object(api_client, "_make_async_request", make_async_request):
+            with pytest.raises(RateLimitTimeout):
+                asyncio.run(collect())
+
+    @pytest.mark.unit
+    def test_sync_wrapper_reuses_one_event_loop(self, api_client):
+        loops = set()
+
+        async def make_async_request(endpoint, params=None):
+            loops.add(id(asyncio.get_running_loop()))
+            return _search_response(params["q"])
+
+        with patch.object(api_client, "_make_async_request", make_async_request):
+            first = api_client.bulk_property_search(["10215009", "10215010"])
+            second = api_client.bulk_property_search(["10215011"])
+
+        assert set(first) == {"10215009", "10215010"}
+        assert set(second) == {"10215011"}
+        assert len(loops) == 1
+
+    @pytest.mark.unit
+    def test_interrupted_sync_search_returns_partial_results(self, api_client):
+        async def make_async_request(endpoint, params=None):
+            if params["q"] != "10215009":
+                await asyncio.sleep(10)
+            return _search_response(params["q"])
+
+        submit = api_client._loop_thread.submit
+
+        def interrupted_submit(coro):
+            future = submit(coro)
+
+            def result(timeout=None):
+                time.sleep(0.2)
+                raise KeyboardInterrupt
+
+            future.result = result
+            return future
+
+        with patch.object(api_client, "_make_async_request", make_async_request):
+            with patch.object(api_client._loop_thread, "submit", interrupted_submit):
+                results = api_client.bulk_property_search(
+                    ["10215009", "10215010", "10215011"]
+                )
+
+        assert set(results) == {"10215009"}
+
+    @pytest.mark.unit
+    def test_rate_limiter_wait_does_not_block_event_loop(self):
+        limiter = AdaptiveRateLimiter(initial_rate=20.0, burst_capacity=1)
+        assert limiter.acquire(timeout=0.0) is True
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.time())
+                await asyncio.sleep(0.005)
+
+        async def main():
+            tick_task = asyncio.create_task(ticker())
+            acquired = await limiter.acquire_async(timeout=1.0)
+            await tick_task
+            return acquired
+
+        assert asyncio.run(main()) is True
+        assert len(ticks) == 5
@@ -0,0 +1,292 @@
+"""
+Unit tests for the API response cache backends (memory, persistent, tiered)
+"""
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from api_response_cache import (
+    LRUResponseCache,
+    SQLiteResponseCache,
+    TieredResponseCache,
+)
+
+
+class TestLRUResponseCache:
+    """Test suite for LRUResponseCache."""
+
+    @pytest.fixture
+    def cache(self):
+        cache = LRUResponseCache(max_entries=3, max_bytes=10_000, sweep_interval=None)
+        yield cache
+        cache.close()
+
+    @pytest.mark.unit
+    def test_hit_and_miss_counters(self, cache):
+        cache.put("/search/property/:1", {"Results": []})
+
+        assert cache.get("/search/property/:1") == {"Results": []}
+        assert cache.get("/search/property/:2") is None
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    @pytest.mark.unit
+    def test_peek_leaves_counters_and_order_alone(self, cache):
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        assert cache.peek("a") == 1
+        assert cache.peek("missing") is None
+        stats = cache.get_stats()
+        assert stats["hits"] == 0 and stats["misses"] == 0
+        # "a" is still the least recently used entry
+        assert next(iter(cache._entries)) == "a"
+
+    @pytest.mark.unit
+    def test_evicts_least_recently_used_at_entry_limit(self, cache):
+        for i in range(3):
+            cache.put(f"key{i}", {"value": i})
+
+        # Touch key0 so key1 becomes least recently used
+        cache.get("key0")
+        cache.put("key3", {"value": 3})
+
+        assert "key1" not in cache
+        assert "key0" in cache
+        assert len(cache) == 3
+        assert cache.get_stats()["evictions"] == 1
+
+    @pytest.mark.unit
+    def test_byte_budget_is_enforced(self):
+        cache = LRUResponseCache(max_entries=100, max_bytes=200, sweep_interval=None)
+        payload = {"data": "x" * 80}
+
+        for i in range(5):
+            cache.put(f"key{i}", payload)
+
+        stats = cache.get_stats()
+        assert stats["bytes"] <= 200
+        assert stats["evictions"] > 0
+        assert "key4" in cache
+        cache.close()
+
+    @pytest.mark.unit
+    def test_oversized_entry_is_rejected(self):
+        cache = LRUResponseCache(max_entries=10, max_bytes=50, sweep_interval=None)
+        cache.put("small", {"a": 1})
+        cache.put("huge", {"data": "x" * 500})
+
+        assert "huge" not in cache
+        assert "small" in cache
+        assert cache.get_stats()["rejected"] == 1
+        cache.close()
+
+    @pytest.mark.unit
+    def test_per_endpoint_ttl(self):
+        cache = LRUResponseCache(
+            default_ttl=300.0,
+            endpoint_ttls={"/valuations/": 3600.0},
+            sweep_interval=None,
+        )
+
+        assert cache.resolve_ttl("/parcel/123/valuations/:0") == 3600.0
+        assert cache.resolve_ttl("/search/property/:0") == 300.0
+        cache.close()
+
+    @pytest.mark.unit
+    def test_expired_entries_are_purged(self, cache):
+        cache.put("short", {"a": 1}, ttl=0.01)
+        cache.put("long", {"b": 2}, ttl=60.0)
+        time.sleep(0.02)
+
+        assert cache.purge_expired() == 1
+        assert "short" not in cache
+        assert cache.get_stats()["expirations"] == 1
+
+    @pytest.mark.unit
+    def test_background_sweeper_removes_expired_entries(self):
+        cache = LRUResponseCache(sweep_interval=0.01)
+        cache.put("short", {"a": 1}, ttl=0.01)
+
+        deadline = time.time() + 1.0
+        while "short" in cache and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert "short" not in cache
+        cache.close()
+
+
+def _write_entries(db_path, worker_id, count):
+    """Worker process body for the concurrent-access test"""
+    cache = SQLiteResponseCache(db_path)
+    for i in range(count):
+        cache.put(f"/parcel/{worker_id}{i:04d}/valuations/:0", {"worker": worker_id, "i": i})
+    cache.close()
+
+
+class TestSQLiteResponseCache:
+    """Test suite for the persistent SQLite cache tier."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        return tmp_path / "api_cache.sqlite3"
+
+    @pytest.mark.unit
+    def test_round_trip_survives_reopen(self, db_path):
+        payload = [{"TaxYear": "2024", "FullCashValue": "285000"}]
+
+        cache = SQLiteResponseCache(db_path)
+        cache.put("/parcel/10215009/valuations/:abc", payload)
+        cache.close()
+
+        reopened = SQLiteResponseCache(db_path)
+        assert reopened.get("/parcel/10215009/valuations/:abc") == payload
+        assert reopened.get_stats()["hits"] == 1
+        reopened.close()
+
+    @pytest.mark.unit
+    def test_payloads_are_compressed(self, db_path):
+        cache = SQLiteResponseCache(db_path)
+        cache.put("/search/property/:abc", {"Results": ["x" * 100] * 100})
+
+        assert cache.inspect()["compressed_bytes"] < 10_000
+        cache.close()
+
+    @pytest.mark.unit
+    def test_per_endpoint_ttl_and_expiry(self, db_path):
+        cache = SQLiteResponseCache(
+            db_path, endpoint_ttls={"/valuations/": 3600.0, "/search/": 0.01}
+        )
+        cache.put("/search/property/:abc", {"Results": []})
+        cache.put("/parcel/1/valuations/:abc", [])
+        time.sleep(0.02)
+
+        assert cache.get("/search/property/:abc") is None
+        assert cache.get("/parcel/1/valuations/:abc") == []
+        cache.close()
+
+    @pytest.mark.unit
+    def test_purge_by_category(self, db_path):
+        cache = SQLiteResponseCache(db_path)
+        cache.put("/search/property/:abc", {"Results": []})
+        cache.put("/parcel/1/valuations/:abc", [])
+
+        assert cache.purge(category="/valuations/") == 1
+        assert cache.inspect()["categories"].keys() == {"/search/"}
+        cache.close()
+
+    @pytest.mark.unit
+    def test_sweeper_purges_expired_and_enforces_max_entries(self, db_path):
+        cache = SQLiteResponseCache(
+            db_path,
+            endpoint_ttls={"/search/": 0.01, "/valuations/": 3600.0},
+            max_entries=3,
+            sweep_interval=0.05,
+        )
+        cache.put("/search/property/:abc", {"Results": []})
+        for i in range(5):
+            cache.put(f"/parcel/{i}/valuations/:abc", [i])
+            time.sleep(0.005)
+
+        deadline = time.time() + 2.0
+        while len(cache) > 3 and time.time() < deadline:
+            time.sleep(0.01)
+
+        categories = cache.inspect()["categories"]
+        assert categories.keys() == {"/valuations/"}
+        assert categories["/valuations/"]["entries"] == 3
+        # The oldest entries were trimmed
+        assert cache.get("/parcel/0/valuations/:abc") is None
+        assert cache.get("/parcel/4/valuations/:abc") == [4]
+        stats = cache.get_stats()
+        assert stats["expirations"] == 1 and stats["evictions"] == 2
+        cache.close()
+
+    @pytest.mark.unit
+    def test_stale_read_keeps_entry_refreshed_by_another_writer(self, db_path):
+        key = "/search/property/:abc"
+        reader = SQLiteResponseCache(
+            db_path, endpoint_ttls={"/search/": 0.01}, sweep_interval=None
+        )
+        writer = SQLiteResponseCache(db_path, sweep_interval=None)
+        reader.put(key, {"Results": ["old"]})
+        time.sleep(0.02)
+
+        class RefreshAfterRead:
+            """Lets the writer refresh the entry between the read and the delete"""
+
+            def __init__(self, conn):
+                self.conn = conn
+
+            def execute(self, sql, params=()):
+                cursor = self.conn.execute(sql, params)
+                if sql.startswith("SELECT payload"):
+                    writer.put(key, {"Results": ["new"]})
+                return cursor
+
+        connection = reader._connection()
+        reader._connection = lambda: RefreshAfterRead(connection)
+        assert reader.get(key) is None
+
+        assert writer.get(key) == {"Results": ["new"]}
+        reader.close()
+        writer.close()
+
+    @pytest.mark.unit
+    def test_purge_expired_keeps_live_entries(self, db_path):
+        cache = SQLiteResponseCache(
+            db_path, endpoint_ttls={"/search/": 0.01}, sweep_interval=None
+        )
+        cache.put("/search/property/:abc", {"Results": []})
+        cache.put("/parcel/1/valuations/:abc", [])
+        time.sleep(0.02)
+
+        assert cache.purge_expired() == 1
+        assert cache.get("/parcel/1/valuations/:abc") == []
+        cache.close()
+
+    @pytest.mark.unit
+    def test_concurrent_writers_from_several_processes(self, db_path):
+        SQLiteResponseCache(db_path).close()
+
+        ctx = multiprocessing.get_context("spawn")
+        workers = [
+            ctx.Process(target=_write_entries, args=(str(db_path), worker_id, 50))
+            for worker_id in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=30)
+            assert worker.exitcode == 0
+
+        cache = SQLiteResponseCache(db_path)
+        assert len(cache) == 200
+        cache.close()
+
+
+class TestTieredResponseCache:
+    """Test suite for the memory + persistent cache combination."""
+
+    @pytest.mark.unit
+    def test_persistent_hit_is_promoted_to_memory(self, tmp_path):
+        db_path = tmp_path / "api_cache.sqlite3"
+
+        writer = SQLiteResponseCache(db_path)
+        writer.put("/parcel/1/valuations/:abc", [{"TaxYear": "2024"}])
+        writer.close()
+
+        memory = LRUResponseCache(sweep_interval=None)
+        tiered = TieredResponseCache(memory, SQLiteResponseCache(db_path))
+
+        assert tiered.get("/parcel/1/valuations/:abc") == [{"TaxYear": "2024"}]
+        assert "/parcel/1/valuations/:abc" in memory
+        assert tiered.get_stats()["persistent"]["hits"] == 1
+        tiered.close()
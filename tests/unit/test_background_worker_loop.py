@@ -0,0 +1,186 @@
+"""
+Unit tests for BackgroundDataWorker running jobs on a persistent event loop
+"""
+import asyncio
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.api_client_unified import AdaptiveRateLimiter
+from src.unified_data_collector import (
+    BackgroundDataWorker,
+    JobPriority,
+    UnifiedDataCollector,
+)
+from src.work_scheduler import Resource, WorkScheduler
+from tests.fixtures.stub_maricopa_server import StubMaricopaServer
+
+
+class StubConfig:
+    def __init__(self, base_url):
+        self.base_url = base_url
+
+    def get_api_config(self):
+        return {
+            "base_url": self.base_url,
+            "token": "stub-token",
+            "timeout": 5,
+            "max_retries": 1,
+        }
+
+
+class SlowDatabase:
+    """Database stand-in whose saves outlast the collection jobs"""
+
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.saved = []
+        self.lock = threading.Lock()
+
+    def save_comprehensive_property_data(self, property_data):
+        time.sleep(self.delay)
+        with self.lock:
+            self.saved.append(property_data)
+        return True
+
+
+class NoWebFallback:
+    """Keeps the tests offline when the stub has no sales or tax endpoints"""
+
+    async def collect_tax_data_fallback(self, apn):
+        return {}
+
+    async def collect_sales_data_fallback(self, apn):
+        return {}
+
+
+@pytest.fixture
+def stub_server():
+    with StubMaricopaServer(parcel_count=1000, latency=0.005) as server:
+        yield server
+
+
+@pytest.fixture
+def collector(stub_server):
+    config = StubConfig(stub_server.base_url)
+    collector = UnifiedDataCollector(SlowDatabase(), config)
+    collector.web_fallback = NoWebFallback()
+    # Measure the worker, not the politeness delays for the live API
+    collector.api_client.min_request_interval = 0.0
+    collector.api_client.rate_limiter = AdaptiveRateLimiter(
+        initial_rate=1000.0, max_rate=1000.0, burst_capacity=1000
+    )
+    yield collector
+    collector.api_client.close()
+
+
+def wait_until(condition, timeout=20.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+@pytest.mark.unit
+class TestBackgroundDataWorkerLoop:
+    """Test suite for BackgroundDataWorker on the client's event loop."""
+
+    def test_jobs_reuse_pooled_connections_and_saves_complete(
+        self, collector, stub_server
+    ):
+        worker = BackgroundDataWorker(collector, max_concurrent_jobs=3)
+        apns = [stub_server.parcels.apn(i * 7) for i in range(12)]
+        for apn in apns:
+            assert worker.add_job(apn, force_fresh=True)
+
+        worker.start()
+        wait_until(lambda: worker.jobs_completed_count == len(apns))
+        worker.stop_worker()
+
+        # Every save scheduled by a job finished before the worker stopped
+        assert len(collector.db_manager.saved) == len(apns)
+        assert not worker.isRunning()
+
+        pool = collector.api_client.get_performance_stats()["connection_pool"]
+        assert pool["sessions_created"] == 1
+        assert pool["connections_reused"] > pool["connections_created"]
+        max_per_host = collector.api_client.connection_pool.max_connections_per_host
+        assert pool["connections_created"] <= max_per_host
+
+    def test_semaphore_caps_concurrent_jobs_in_priority_order(self, collector):
+        state = {"running": 0, "peak": 0, "order": []}
+
+        async def fake_collect(apn, callback=None):
+            state["order"].append(apn)
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+            await asyncio.sleep(0.05)
+            state["running"] -= 1
+            return {"apn": apn}
+
+        collector.collect_property_data_progressive = fake_collect
+        worker = BackgroundDataWorker(collector, max_concurrent_jobs=2)
+        worker.add_job("low-1", JobPriority.LOW)
+        worker.add_job("normal-1", JobPriority.NORMAL)
+        worker.add_job("critical-1", JobPriority.CRITICAL)
+        for i in range(5):
+            worker.add_job(f"normal-{i + 2}", JobPriority.NORMAL)
+
+        worker.start()
+        wait_until(lambda: worker.jobs_completed_count == 8)
+        worker.stop_worker()
+
+        assert state["peak"] == 2
+        assert state["order"][0] == "critical-1"
+        assert state["order"][-1] == "low-1"
+        assert worker.get_queue_status()["in_flight_jobs"] == 0
+
+        # Results are cached complete, so their accounted size is exact
+        item = worker.cache.cache["critical-1"]
+        assert "processing_time" in item.data
+        assert item.raw_bytes == len(json.dumps(item.data)) + len("critical-1")
+
+    def test_jobs_count_against_the_general_budget(self, collector):
+        state = {"running": 0, "peak": 0}
+
+        async def fake_collect(apn, callback=None):
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+            await asyncio.sleep(0.02)
+            state["running"] -= 1
+            return {"apn": apn}
+
+        collector.collect_property_data_progressive = fake_collect
+        scheduler = WorkScheduler(budgets={Resource.GENERAL: 1})
+        worker = BackgroundDataWorker(
+            collector, max_concurrent_jobs=3, scheduler=scheduler
+        )
+        for i in range(4):
+            worker.add_job(f"apn-{i}", JobPriority.NORMAL)
+
+        worker.start()
+        wait_until(lambda: worker.jobs_completed_count == 4)
+        worker.stop_worker()
+
+        assert state["peak"] == 1
+        general = scheduler.get_stats()["resources"][Resource.GENERAL.value]
+        assert general["completed"] == 4
+        scheduler.shutdown()
+
+    def test_sync_wrapper_shares_the_persistent_loop(self, collector, stub_server):
+        for i in range(3):
+            apn = stub_server.parcels.apn(i)
+            results = collector.collect_property_data_sync(apn)
+            assert results.data.get("detailed_data_available")
+
+        assert collector.wait_for_pending_saves(timeout=5.0)
+        assert len(collector.db_manager.saved) == 3
+        pool = collector.api_client.connection_pool.get_stats()
+        assert pool["sessions_created"] == 1
+        assert pool["connections_reused"] > 0
@@ -0,0 +1,226 @@
+"""
+Unit tests for batch job checkpoints and resume_batch
+"""
+import csv
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from src.batch_checkpoint import DONE, FAILED, PENDING, BatchCheckpointStore
+
+
+class FakeAPIClient:
+    def __init__(self, on_call=None):
+        self.calls = []
+        self.on_call = on_call
+
+    def get_comprehensive_property_info(self, apn):
+        self.calls.append(apn)
+        if self.on_call:
+            self.on_call(len(self.calls))
+        return {"apn": apn, "owner_name": f"OWNER {apn}"}
+
+
+class FakeDatabaseManager:
+    def get_connection(self):
+        return object()
+
+    def save_comprehensive_property_data(self, data):
+        return True
+
+
+def make_engine(api_client, store):
+    from src.batch_search_engine import BatchSearchEngine, RateLimiter
+
+    engine = BatchSearchEngine(
+        api_client=api_client,
+        db_manager=FakeDatabaseManager(),
+        checkpoint_store=store,
+    )
+    engine.rate_limiter = RateLimiter(api_calls_per_second=1000.0, burst_size=100)
+    return engine
+
+
+def wait_for_status(engine, job_id, status, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while engine.get_job_status(job_id)["status"] != status:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+@pytest.mark.unit
+class TestBatchCheckpointStore:
+    """Test suite for BatchCheckpointStore."""
+
+    def test_updates_are_buffered_until_flush(self, tmp_path):
+        store = BatchCheckpointStore(
+            tmp_path / "jobs.db", flush_size=3, flush_interval=None
+        )
+        store.create_job("job1", "apn", ["A", "B", "C", "D"], {"mode": "sequential"})
+
+        store.record("job1", "A", DONE, result_ref=["A"])
+        store.record("job1", "B", FAILED, error="timeout", retry_count=3)
+        assert store.get_stats()["buffered_updates"] == 2
+        assert store.flushes == 0
+
+        store.record("job1", "C", DONE, result_ref=["C"])
+        assert store.flushes == 1
+        assert store.get_stats()["buffered_updates"] == 0
+        store.close()
+
+        reopened = BatchCheckpointStore(tmp_path / "jobs.db", flush_interval=None)
+        job = reopened.load_job("job1")
+        assert job["settings"] == {"mode": "sequential"}
+        assert [item["identifier"] for item in job["items"]] == ["A", "B", "C", "D"]
+        assert [item["state"] for item in job["items"]] == [DONE, FAILED, DONE, PENDING]
+        assert job["items"][0]["result_ref"] == ["A"]
+        assert job["items"][1]["error"] == "timeout"
+        assert job["items"][1]["retry_count"] == 3
+
+        jobs = reopened.list_jobs()
+        assert jobs[0]["done"] == 2 and jobs[0]["failed"] == 1 and jobs[0]["pending"] == 1
+        assert reopened.delete_job("job1")
+        assert reopened.load_job("job1") is None
+        reopened.close()
+
+
+@pytest.mark.unit
+class TestResumeBatch:
+    """Test suite for BatchSearchEngine.resume_batch."""
+
+    def test_resume_skips_completed_requests(self, tmp_path):
+        from src.batch_search_engine import SearchMode
+
+        apns = [f"1020{i:04d}" for i in range(10)]
+        db_path = tmp_path / "jobs.db"
+
+        # First run stops (as on shutdown) after four requests
+        store = BatchCheckpointStore(db_path, flush_interval=None)
+        engine = None
+
+        def stop_after_four(calls):
+            if calls == 4:
+                engine.shutdown_event.set()
+
+        first_api = FakeAPIClient(on_call=stop_after_four)
+        engine = make_engine(first_api, store)
+        job_id = engine.submit_batch_search(apns, "apn", mode=SearchMode.SEQUENTIAL)
+        engine.executor.shutdown(wait=True)
+        store.close()
+        assert first_api.calls == apns[:4]
+
+        # A new process resumes from the checkpoint file
+        resumed_store = BatchCheckpointStore(db_path, flush_interval=None)
+        second_api = FakeAPIClient()
+        resumed_engine = make_engine(second_api, resumed_store)
+        assert resumed_engine.resume_batch(job_id) == job_id
+        wait_for_status(resumed_engine, job_id, "completed")
+
+        assert second_api.calls == apns[4:]
+        status = resumed_engine.get_job_status(job_id)
+        assert status["successful_requests"] == 10
+        # Restored requests count toward the job, not this engine's totals
+        stats = resumed_engine.get_engine_statistics()
+        assert stats["total_requests_processed"] == 6
+        assert stats["total_successful_requests"] == 6
+        assert stats["success_rate_percent"] <= 100.0
+        results = resumed_engine.get_job_results(job_id)
+        assert results[0]["result"] is None and results[0]["result_ref"] == [apns[0]]
+        assert results[9]["result"]["apn"] == apns[9]
+
+        checkpoint = resumed_store.load_job(job_id)
+        assert checkpoint["status"] == "completed"
+        assert all(item["state"] == DONE for item in checkpoint["items"])
+        resumed_engine.shutdown()
+        resumed_store.close()
+
+    def test_resume_keeps_delivery_settings(self, tmp_path):
+        from src.batch_search_engine import SearchMode
+
+        apns = [f"1021{i:04d}" for i in range(6)]
+        db_path = tmp_path / "jobs.db"
+
+        store = BatchCheckpointStore(db_path, flush_interval=None)
+        engine = None
+
+        def stop_after_two(calls):
+            if calls == 2:
+                engine.shutdown_event.set()
+
+        engine = make_engine(FakeAPIClient(on_call=stop_after_two), store)
+        job_id = engine.submit_batch_search(
+            apns,
+            "apn",
+            mode=SearchMode.SEQUENTIAL,
+            stream_results=True,
+            stream_buffer=8,
+            retain_results=False,
+            progress_interval=2.0,
+        )
+        engine.executor.shutdown(wait=True)
+        store.close()
+
+        resumed_store = BatchCheckpointStore(db_path, flush_interval=None)
+        resumed_engine = make_engine(FakeAPIClient(), resumed_store)
+        resumed_engine.resume_batch(job_id)
+        job = resumed_engine.active_jobs[job_id]
+        assert job.result_stream.maxsize == 8
+        assert not job.retain_results and job.progress_interval == 2.0
+
+        streamed = list(resumed_engine.iter_job_results(job_id, timeout=5.0))
+        assert [entry["identifier"] for entry in streamed] == apns[2:]
+        wait_for_status(resumed_engine, job_id, "completed")
+        assert resumed_engine.get_job_results(job_id)[5]["result"] is None
+        resumed_engine.shutdown()
+        resumed_store.close()
+
+    def test_resume_appends_to_existing_csv(self, tmp_path):
+        from src.batch_result_sinks import CsvResultSink
+        from src.batch_search_engine import SearchMode
+
+        apns = [f"1022{i:04d}" for i in range(8)]
+        db_path = tmp_path / "jobs.db"
+        csv_path = tmp_path / "results.csv"
+
+        store = BatchCheckpointStore(db_path, flush_interval=None)
+        engine = None
+
+        def stop_after_three(calls):
+            if calls == 3:
+                engine.shutdown_event.set()
+
+        engine = make_engine(FakeAPIClient(on_call=stop_after_three), store)
+        job_id = engine.submit_batch_search(
+            apns,
+            "apn",
+            mode=SearchMode.SEQUENTIAL,
+            result_sink=CsvResultSink(csv_path),
+        )
+        engine.executor.shutdown(wait=True)
+        store.close()
+
+        resumed_store = BatchCheckpointStore(db_path, flush_interval=None)
+        resumed_engine = make_engine(FakeAPIClient(), resumed_store)
+        resumed_engine.resume_batch(job_id, result_sink=CsvResultSink(csv_path))
+        wait_for_status(resumed_engine, job_id, "completed")
+        resumed_engine.shutdown()
+        resumed_store.close()
+
+        with open(csv_path, newline="") as handle:
+            rows = list(csv.reader(handle))
+        assert rows[0] == CsvResultSink.COLUMNS
+        assert CsvResultSink.COLUMNS not in rows[1:]
+        assert [row[0] for row in rows[1:]] == apns
+
+    def test_resume_unknown_job_raises(self, tmp_path):
+        store = BatchCheckpointStore(tmp_path / "jobs.db", flush_interval=None)
+        engine = make_engine(FakeAPIClient(), store)
+        with pytest.raises(ValueError):
+            engine.resume_batch("batch_apn_missing")
+        engine.shutdown()
+        store.close()
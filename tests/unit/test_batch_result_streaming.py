@@ -0,0 +1,234 @@
+"""
+Unit tests for streamed batch results, result sinks and coalesced progress
+"""
+import csv
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from src.batch_result_sinks import CsvResultSink, JsonLinesResultSink, ResultSink
+
+
+class FakeAPIClient:
+    def __init__(self):
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def get_comprehensive_property_info(self, apn):
+        with self.lock:
+            self.calls += 1
+        return {"apn": apn, "owner_name": f"OWNER {apn}", "payload": "x" * 100}
+
+
+class FakeDatabaseManager:
+    def get_connection(self):
+        return object()
+
+    def save_comprehensive_property_data(self, data):
+        return True
+
+
+def make_engine(api_client):
+    from src.batch_search_engine import BatchSearchEngine, RateLimiter
+
+    engine = BatchSearchEngine(api_client=api_client, db_manager=FakeDatabaseManager())
+    engine.rate_limiter = RateLimiter(api_calls_per_second=10000.0, burst_size=1000)
+    return engine
+
+
+APNS = [f"3012{i:04d}" for i in range(40)]
+
+
+@pytest.mark.unit
+class TestResultStreaming:
+    """Test suite for BatchSearchEngine streaming delivery."""
+
+    def test_iter_job_results_yields_every_entry(self):
+        from src.batch_search_engine import SearchMode
+
+        engine = make_engine(FakeAPIClient())
+        job_id = engine.submit_batch_search(
+            APNS, "apn", mode=SearchMode.PARALLEL, stream_results=True
+        )
+
+        entries = list(engine.iter_job_results(job_id, timeout=5.0))
+
+        assert sorted(entry["identifier"] for entry in entries) == APNS
+        assert all(entry["success"] for entry in entries)
+        assert entries[0]["result_ref"] == [entries[0]["identifier"]]
+        engine.shutdown()
+
+    def test_bounded_buffer_holds_back_workers(self):
+        from src.batch_search_engine import SearchMode
+
+        api_client = FakeAPIClient()
+        engine = make_engine(api_client)
+        job_id = engine.submit_batch_search(
+            APNS,
+            "apn",
+            mode=SearchMode.SEQUENTIAL,
+            stream_results=True,
+            stream_buffer=4,
+        )
+
+        stream = engine.iter_job_results(job_id, timeout=5.0)
+        next(stream)
+        time.sleep(0.2)
+        # One consumed, four buffered and one blocked waiting for space
+        assert api_client.calls <= 6
+        assert len(list(stream)) == len(APNS) - 1
+        engine.shutdown()
+
+    def test_cancel_with_full_buffer_ends_the_stream(self):
+        from src.batch_search_engine import SearchMode
+
+        api_client = FakeAPIClient()
+        engine = make_engine(api_client)
+        job_id = engine.submit_batch_search(
+            APNS[:6],
+            "apn",
+            mode=SearchMode.SEQUENTIAL,
+            stream_results=True,
+            stream_buffer=2,
+        )
+        deadline = time.monotonic() + 10.0
+        while api_client.calls < 3:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+        assert engine.cancel_job(job_id)
+        # Let the job finish with nobody reading its stream
+        while job_id in engine.job_futures:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+        # Unread entries make way for the end marker instead of the marker
+        # being dropped, so the iterator finishes rather than timing out
+        entries = list(engine.iter_job_results(job_id, timeout=1.0))
+        assert len(entries) < 2
+        engine.shutdown()
+
+    def test_results_not_retained_after_delivery(self, tmp_path):
+        from src.batch_search_engine import SearchMode
+
+        engine = make_engine(FakeAPIClient())
+        sink = JsonLinesResultSink(tmp_path / "results.jsonl")
+        job_id = engine.submit_batch_search(
+            APNS,
+            "apn",
+            mode=SearchMode.SEQUENTIAL,
+            result_sink=sink,
+            retain_results=False,
+        )
+        deadline = time.monotonic() + 5.0
+        while engine.get_job_status(job_id)["status"] != "completed":
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+        results = engine.get_job_results(job_id)
+        assert all(entry["result"] is None for entry in results)
+        assert all(entry["success"] and entry["result_ref"] for entry in results)
+        assert engine.get_job_status(job_id)["successful_requests"] == len(APNS)
+
+        lines = (tmp_path / "results.jsonl").read_text().splitlines()
+        assert len(lines) == len(APNS)
+        assert json.loads(lines[0])["result"]["owner_name"] == f"OWNER {APNS[0]}"
+        assert sink._file.closed
+        engine.shutdown()
+
+    def test_progress_callbacks_are_coalesced(self):
+        from src.batch_search_engine import SearchMode
+
+        engine = make_engine(FakeAPIClient())
+        progress = []
+        done = threading.Event()
+
+        def callback(batch_job):
+            progress.append(batch_job.progress)
+            if batch_job.status == "completed":
+                done.set()
+
+        engine.submit_batch_search(
+            APNS,
+            "apn",
+            mode=SearchMode.SEQUENTIAL,
+            callback=callback,
+            progress_interval=60.0,
+        )
+        assert done.wait(5.0)
+
+        # The first update and the final one, not one per request
+        assert len(progress) == 2
+        assert progress[-1] == 100.0
+        engine.shutdown()
+
+
+@pytest.mark.unit
+class TestResultSinks:
+    """Test suite for the batch result sinks."""
+
+    def test_csv_sink_writes_status_rows(self, tmp_path):
+        sink = CsvResultSink(tmp_path / "results.csv")
+        sink.write(
+            {
+                "identifier": "10215009",
+                "search_type": "apn",
+                "success": True,
+                "error": None,
+                "retry_count": 0,
+                "completed_at": "2024-01-01T00:00:00",
+                "result_ref": ["10215009"],
+                "result": {"apn": "10215009"},
+            }
+        )
+        sink.write(
+            {
+                "identifier": "bad",
+                "search_type": "apn",
+                "success": False,
+                "error": "not found",
+                "retry_count": 3,
+            }
+        )
+        sink.close()
+
+        with open(tmp_path / "results.csv", newline="") as handle:
+            rows = list(csv.reader(handle))
+        assert rows[0] == CsvResultSink.COLUMNS
+        assert rows[1][0] == "10215009" and rows[1][-1] == "10215009"
+        assert rows[2][3] == "not found"
+        assert sink.count == 2
+
+    def test_csv_sink_appends_on_resume(self, tmp_path):
+        path = tmp_path / "results.csv"
+        for identifier in ("10215009", "10215010"):
+            sink = CsvResultSink(path)
+            sink.write({"identifier": identifier, "success": True})
+            sink.close()
+
+        with open(path, newline="") as handle:
+            rows = list(csv.reader(handle))
+        assert rows[0] == CsvResultSink.COLUMNS
+        assert [row[0] for row in rows[1:]] == ["10215009", "10215010"]
+
+    def test_sinks_must_implement_write(self):
+        class IncompleteSink(ResultSink):
+            pass
+
+        with pytest.raises(TypeError):
+            IncompleteSink()
+
+    def test_jsonl_sink_can_omit_result_payload(self, tmp_path):
+        sink = JsonLinesResultSink(tmp_path / "results.jsonl", include_result=False)
+        sink.write({"identifier": "10215009", "result": {"apn": "10215009"}})
+        sink.close()
+
+        entry = json.loads((tmp_path / "results.jsonl").read_text())
+        assert entry == {"identifier": "10215009"}
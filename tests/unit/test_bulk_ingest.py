@@ -0,0 +1,74 @@
+"""
+Unit tests for the COPY text encoding used by the bulk ingestion path
+"""
+import sys
+from datetime import date
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.database_manager_unified import (
+    BULK_INGEST_TABLES,
+    CopyTextStream,
+    UnifiedDatabaseManager,
+    copy_text_value,
+)
+
+
+class TestCopyTextEncoding:
+    """Test suite for copy_text_value and CopyTextStream."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (None, "\\N"),
+            (True, "t"),
+            (2.5, "2.5"),
+            (date(2024, 5, 1), "2024-05-01"),
+            ("SMITH\tJOHN\nJR\\", "SMITH\\tJOHN\\nJR\\\\"),
+            ({"a": 1}, '{"a": 1}'),
+        ],
+    )
+    def test_copy_text_value(self, value, expected):
+        assert copy_text_value(value) == expected
+
+    @pytest.mark.unit
+    def test_stream_reads_generator_in_fixed_batches(self):
+        columns = BULK_INGEST_TABLES["tax_history"]["key"] + ["tax_amount"]
+        rows = iter({"apn": f"1021{i:04d}", "tax_year": 2024} for i in range(5))
+
+        first = CopyTextStream(rows, columns, max_rows=3)
+        lines = first.read(7) + first.read()
+        assert first.row_count == 3
+        assert not first.exhausted
+        assert lines.splitlines()[0] == "10210000\t2024\t\\N\t1"
+
+        second = CopyTextStream(rows, columns, max_rows=3)
+        assert len(second.read().splitlines()) == 2
+        assert second.exhausted
+
+    @pytest.mark.unit
+    def test_stream_skips_rows_without_apn(self):
+        rows = iter([{"apn": "10215009"}, {"owner_name": "NO APN"}, {}])
+        stream = CopyTextStream(rows, ["apn"], max_rows=10)
+
+        assert stream.read() == "10215009\t1\n"
+        assert stream.skipped == 2
+
+
+class TestBulkIngestWrappers:
+    """Test suite for the per-table bulk_ingest_* wrappers."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("table", ["properties", "tax_history", "sales_history"])
+    def test_wrapper_passes_refresh_view_through(self, table):
+        manager = UnifiedDatabaseManager.__new__(UnifiedDatabaseManager)
+        manager.bulk_ingest = MagicMock(return_value=1)
+        rows = [{"apn": "10215009"}]
+
+        getattr(manager, f"bulk_ingest_{table}")(rows, refresh_view=False)
+        manager.bulk_ingest.assert_called_once_with(table, rows, 50000, False)
@@ -0,0 +1,319 @@
+"""
+Unit tests for the durable, database-backed collection queue
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.collection_queue import DurableCollectionQueue, retry_delay
+from src.unified_data_collector import BackgroundDataWorker, JobPriority
+
+
+class QueueDatabase:
+    """In-memory stand-in for the data_collection_status queue methods
+
+    Mirrors the SQL in DatabaseManager: one lock plays the part of the row
+    locks taken by FOR UPDATE SKIP LOCKED.
+    """
+
+    def __init__(self):
+        self.rows = {}
+        self.lock = threading.Lock()
+        self.claims = []  # (worker_id, apn), in claim order
+
+    def enqueue_collection(self, apns, priority=2):
+        now = time.monotonic()
+        queued = 0
+        with self.lock:
+            for apn in dict.fromkeys(apns):
+                row = self.rows.get(apn)
+                if row and row["status"] == "in_progress":
+                    continue
+                if row and row["status"] == "queued":
+                    row["priority"] = min(row["priority"], priority)
+                else:
+                    self.rows[apn] = {
+                        "status": "queued",
+                        "priority": priority,
+                        "attempts": 0,
+                        "available_at": now,
+                        "leased_by": None,
+                        "lease_expires_at": None,
+                        "error_message": None,
+                    }
+                queued += 1
+        return queued
+
+    def claim_collection_jobs(self, worker_id, limit, lease_seconds, max_attempts):
+        now = time.monotonic()
+        with self.lock:
+            for row in self.rows.values():
+                if (
+                    row["status"] == "in_progress"
+                    and row["lease_expires_at"] < now
+                    and row["attempts"] >= max_attempts
+                ):
+                    row.update(status="failed", leased_by=None)
+            ready = [
+                (row["priority"], row["available_at"], apn)
+                for apn, row in self.rows.items()
+                if (row["status"] == "queued" and row["available_at"] <= now)
+                or (row["status"] == "in_progress" and row["lease_expires_at"] < now)
+            ]
+            claimed = []
+            for _, _, apn in sorted(ready)[:limit]:
+                row = self.rows[apn]
+                row.update(
+                    status="in_progress",
+                    leased_by=worker_id,
+                    lease_expires_at=now + lease_seconds,
+                    attempts=row["attempts"] + 1,
+                )
+                self.claims.append((worker_id, apn))
+                claimed.append(
+                    {
+                        "apn": apn,
+                        "priority": row["priority"],
+                        "attempts": row["attempts"],
+                    }
+                )
+            return claimed
+
+    def _leased(self, apn, worker_id):
+        row = self.rows.get(apn)
+        if row and row["status"] == "in_progress" and row["leased_by"] == worker_id:
+            return row
+        return None
+
+    def extend_collection_leases(self, worker_id, apns, lease_seconds=300.0):
+        with self.lock:
+            held = [apn for apn in apns if self._leased(apn, worker_id)]
+            for apn in held:
+                self.rows[apn]["lease_expires_at"] = time.monotonic() + lease_seconds
+            return held
+
+    def complete_collection_job(self, apn, worker_id):
+        with self.lock:
+            row = self._leased(apn, worker_id)
+            if row:
+                row.update(status="completed", leased_by=None)
+            return row is not None
+
+    def fail_collection_job(self, apn, worker_id, error, retry_delay, max_attempts=5):
+        with self.lock:
+            row = self._leased(apn, worker_id)
+            if row is None:
+                return None
+            row.update(
+                status="queued" if row["attempts"] < max_attempts else "failed",
+                available_at=time.monotonic() + retry_delay,
+                leased_by=None,
+                error_message=error,
+            )
+            return row["status"]
+
+    def get_collection_queue_stats(self):
+        with self.lock:
+            statuses = [row["status"] for row in self.rows.values()]
+        return {status: statuses.count(status) for status in set(statuses)}
+
+    def expire_leases(self):
+        with self.lock:
+            for row in self.rows.values():
+                if row["status"] == "in_progress":
+                    row["lease_expires_at"] = time.monotonic() - 1
+
+    def status(self, apn):
+        return self.rows[apn]["status"]
+
+
+@pytest.fixture
+def database():
+    return QueueDatabase()
+
+
+@pytest.mark.unit
+class TestDurableCollectionQueue:
+    """Test suite for DurableCollectionQueue."""
+
+    def test_retry_delay_backs_off_exponentially_to_cap(self):
+        assert retry_delay(1, base=10, jitter=0) == 10
+        assert retry_delay(3, base=10, jitter=0) == 40
+        assert retry_delay(20, base=10, cap=60, jitter=0) == 60
+        for _ in range(50):
+            assert 8 <= retry_delay(1, base=10, jitter=0.2) <= 10
+
+    def test_claims_follow_priority_and_requeue_keeps_best(self, database):
+        queue = DurableCollectionQueue(database, worker_id="w1")
+        queue.put_many(["low", "normal"], JobPriority.NORMAL.value)
+        queue.put("low", JobPriority.LOW.value)
+        queue.put("normal", JobPriority.HIGH.value)
+        queue.put("critical", JobPriority.CRITICAL.value)
+
+        claimed = [row["apn"] for row in queue.claim(limit=3)]
+        assert claimed == ["critical", "normal", "low"]
+        # Already leased - queueing again does not hand it out twice
+        assert not queue.put("critical")
+        assert queue.claim() == []
+        queue.close()
+
+    def test_workers_never_claim_the_same_apn(self, database):
+        apns = [f"100-{i:02d}-000" for i in range(200)]
+        database.enqueue_collection(apns)
+        queues = [DurableCollectionQueue(database, f"w{i}") for i in range(4)]
+
+        def drain(queue):
+            while True:
+                rows = queue.claim(limit=3)
+                if not rows:
+                    return
+                for row in rows:
+                    assert queue.ack(row["apn"])
+
+        threads = [threading.Thread(target=drain, args=(q,)) for q in queues]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        claimed = [apn for _, apn in database.claims]
+        assert sorted(claimed) == sorted(apns)
+        assert sum(q.acked for q in queues) == len(apns)
+        assert all(database.status(apn) == "completed" for apn in apns)
+        for queue in queues:
+            queue.close()
+
+    def test_nack_retries_with_backoff_then_fails(self, database):
+        queue = DurableCollectionQueue(
+            database, "w1", max_attempts=2, retry_base=0.05, retry_cap=0.05
+        )
+        queue.put("123-45-678")
+        queue.claim()
+        assert queue.nack("123-45-678", "API timeout") == "queued"
+        # Not ready again until its backoff has passed
+        assert queue.claim() == []
+        time.sleep(0.06)
+        assert queue.claim()[0]["attempts"] == 2
+        assert queue.nack("123-45-678", "API timeout") == "failed"
+        stats = queue.get_stats()
+        assert stats["retried"] == 1 and stats["failed"] == 1
+        assert stats["queue"] == {"failed": 1}
+        queue.close()
+
+    def test_expired_lease_is_reclaimed_and_stale_worker_fenced(self, database):
+        stalled = DurableCollectionQueue(database, "stalled")
+        healthy = DurableCollectionQueue(database, "healthy")
+        stalled.put("123-45-678")
+        stalled.claim()
+
+        database.expire_leases()
+        assert [row["apn"] for row in healthy.claim()] == ["123-45-678"]
+        assert stalled.renew_leases() == ["123-45-678"]
+        assert not stalled.ack("123-45-678")
+        assert healthy.ack("123-45-678")
+        assert stalled.get_stats()["leases_lost"] == 2
+
+    def test_failed_renewal_keeps_leases(self, database, monkeypatch):
+        queue = DurableCollectionQueue(database, "w1")
+        queue.put("123-45-678")
+        queue.claim()
+
+        monkeypatch.setattr(database, "extend_collection_leases", lambda *args: None)
+        assert queue.renew_leases() == []
+        assert queue.held() == ["123-45-678"]
+        stats = queue.get_stats()
+        assert stats["renew_errors"] == 1 and stats["leases_lost"] == 0
+        assert queue.ack("123-45-678")
+        queue.close()
+
+    def test_ack_during_renewal_is_not_a_lost_lease(self, database, monkeypatch):
+        queue = DurableCollectionQueue(database, "w1")
+        queue.put_many(["123-45-678", "123-45-679"])
+        queue.claim(limit=2)
+        extend = database.extend_collection_leases
+
+        def extend_racing_ack(worker_id, apns, lease_seconds):
+            queue.ack("123-45-678")
+            return extend(worker_id, apns, lease_seconds)
+
+        monkeypatch.setattr(database, "extend_collection_leases", extend_racing_ack)
+        assert queue.renew_leases() == []
+        assert queue.held() == ["123-45-679"]
+        assert queue.get_stats()["leases_lost"] == 0
+        queue.close()
+
+    def test_heartbeat_keeps_a_long_job_leased(self, database):
+        queue = DurableCollectionQueue(database, "w1", lease_seconds=0.15)
+        other = DurableCollectionQueue(database, "w2", lease_seconds=0.15)
+        queue.put("123-45-678")
+        queue.claim()
+
+        time.sleep(0.4)  # well past the original lease
+        assert other.claim() == []
+        assert queue.ack("123-45-678")
+        queue.close()
+
+
+@pytest.mark.unit
+class TestBackgroundDataWorkerDurableQueue:
+    """Test suite for BackgroundDataWorker draining a durable queue."""
+
+    class Collector:
+        def __init__(self, fail=()):
+            self.fail = set(fail)
+            self.collected = []
+            self.api_client = self
+
+        def submit_async(self, coro):
+            # Run the job coroutine to completion on the calling thread
+            from concurrent.futures import Future
+
+            future = Future()
+            try:
+                coro.send(None)
+            except StopIteration as done:
+                future.set_result(done.value)
+            return future
+
+        async def collect_property_data_progressive(self, apn, callback=None):
+            if apn in self.fail:
+                raise ConnectionError("API down")
+            self.collected.append(apn)
+            return {"apn": apn}
+
+    def test_workers_share_one_backlog(self, database):
+        apns = [f"200-{i:02d}-000" for i in range(20)]
+        collectors, workers = [], []
+        for i in range(2):
+            collector = self.Collector(fail={apns[0]})
+            queue = DurableCollectionQueue(
+                database, f"worker-{i}", max_attempts=1, retry_base=0.01
+            )
+            worker = BackgroundDataWorker(collector, durable_queue=queue)
+            worker.POLL_INTERVAL = 0.01
+            collectors.append(collector)
+            workers.append(worker)
+
+        for apn in apns:
+            assert workers[0].add_job(apn, JobPriority.NORMAL, force_fresh=True)
+        for worker in workers:
+            worker.start()
+
+        deadline = time.monotonic() + 10
+        while any(database.status(apn) in ("queued", "in_progress") for apn in apns):
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        for worker in workers:
+            worker.stop_worker()
+            worker.durable_queue.close()
+
+        collected = collectors[0].collected + collectors[1].collected
+        assert sorted(collected) == sorted(apns[1:])
+        assert database.status(apns[0]) == "failed"
+        assert all(database.status(apn) == "completed" for apn in apns[1:])
+        assert sum(w.jobs_completed_count for w in workers) == len(apns) - 1
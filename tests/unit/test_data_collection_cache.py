@@ -0,0 +1,101 @@
+"""
+Unit tests for the memory-bounded DataCollectionCache
+"""
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.unified_data_collector import DataCollectionCache
+
+
+def result(apn, padding=500):
+    return {"apn": apn, "data": {"owner": "SMITH, JOHN", "notes": "x" * padding}}
+
+
+@pytest.mark.unit
+class TestDataCollectionCache:
+    """Test suite for DataCollectionCache."""
+
+    def test_byte_budget_evicts_least_recently_used(self):
+        cache = DataCollectionCache(max_bytes=3000, compress_after=None)
+        for apn in ("a", "b", "c", "d", "e"):
+            cache.cache_data(apn, result(apn, padding=900))  # ~1 KB each
+            if apn == "c":
+                assert cache.get_cached_data("a")  # keep "a" warm
+
+        stats = cache.get_cache_stats()
+        assert stats["cache_size_mb"] * 1024 * 1024 <= 3000
+        assert stats["evictions"] == 5 - stats["total_entries"]
+        assert sorted(cache.cache) == ["a", "d", "e"]
+        assert cache.get_cached_data("b") is None
+
+    def test_size_accounting_matches_entries(self):
+        cache = DataCollectionCache(compress_after=None)
+        for i in range(20):
+            cache.cache_data(f"apn-{i}", result(i, padding=i * 10))
+        cache.cache_data("apn-3", result(3, padding=1000))  # replace
+        assert cache.current_bytes == sum(
+            item.size_bytes for item in cache.cache.values()
+        )
+
+        cache.cache_data("huge", result("huge", padding=cache.max_bytes))
+        assert "huge" not in cache.cache
+
+    def test_cold_entries_compress_and_restore_on_hit(self):
+        cache = DataCollectionCache(compress_after=60.0)
+        for apn in ("cold-1", "cold-2", "warm"):
+            cache.cache_data(apn, result(apn, padding=5000))
+        for apn in ("cold-1", "cold-2"):
+            cache.cache[apn].last_access -= 120
+        cache.cache.move_to_end("warm")
+        size_before = cache.current_bytes
+
+        assert cache.compress_cold() == 2
+        assert cache.compress_cold() == 0  # already compressed
+        stats = cache.get_cache_stats()
+        assert stats["compressed_entries"] == 2
+        assert cache.current_bytes < size_before
+        assert cache.cache["warm"].compressed is None
+
+        assert cache.get_cached_data("cold-1") == result("cold-1", padding=5000)
+        assert cache.cache["cold-1"].compressed is None
+        assert cache.get_cache_stats()["compressed_entries"] == 1
+        assert cache.current_bytes == sum(
+            item.size_bytes for item in cache.cache.values()
+        )
+
+    def test_decompressing_hit_stays_within_budget(self):
+        cache = DataCollectionCache(max_bytes=11000, compress_after=60.0)
+        for apn in ("a", "b"):
+            cache.cache_data(apn, result(apn, padding=5000))
+            cache.cache[apn].last_access -= 120
+        assert cache.compress_cold() == 2
+        cache.cache_data("c", result("c", padding=5000))
+        cache.cache_data("d", result("d", padding=5000))
+        assert len(cache.cache) == 4
+
+        # "a" needs its full ~5 KB again, which pushes out the oldest entries
+        assert cache.get_cached_data("a") == result("a", padding=5000)
+        assert cache.current_bytes <= cache.max_bytes
+        assert sorted(cache.cache) == ["a", "d"]
+        assert cache.get_cache_stats()["evictions"] == 2
+        assert cache.current_bytes == sum(
+            item.size_bytes for item in cache.cache.values()
+        )
+
+    def test_expired_entries_are_removed(self):
+        cache = DataCollectionCache(ttl_hours=1)
+        cache.cache_data("old", result("old"))
+        cache.cache_data("new", result("new"))
+        cache.cache["old"].timestamp = time.time() - 7200
+
+        cache.clear_expired()
+        assert "old" not in cache.cache
+        assert cache.get_cached_data("new") is not None
+        stats = cache.get_cache_stats()
+        assert stats["total_entries"] == 1
+        assert stats["hit_count"] == 1
@@ -0,0 +1,152 @@
+"""
+Unit tests for FetchGraph and overlapped progressive collection
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.api_client_unified import FetchGraph
+from src.unified_data_collector import UnifiedDataCollector
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.mark.unit
+class TestFetchGraph:
+    """Test suite for FetchGraph."""
+
+    def test_independent_fetches_overlap_and_dependents_get_inputs(self):
+        started = {}
+
+        async def fetch(name, value, delay=0.05):
+            started[name] = time.perf_counter()
+            await asyncio.sleep(delay)
+            return value
+
+        async def scenario():
+            graph = FetchGraph()
+            graph.add("a", lambda: fetch("a", 1))
+            graph.add("b", lambda: fetch("b", 2))
+            graph.add("sum", lambda a, b: fetch("sum", a + b), depends_on=["a", "b"])
+            start = time.perf_counter()
+            graph.start()
+            total = await graph.result("sum")
+            return total, time.perf_counter() - start, graph
+
+        total, elapsed, graph = run(scenario())
+        assert total == 3
+        assert abs(started["a"] - started["b"]) < 0.02
+        assert started["sum"] >= max(started["a"], started["b"]) + 0.04
+        # Two levels deep, not three fetches in sequence
+        assert elapsed < 0.14
+        assert set(graph.timings) == {"a", "b", "sum"}
+
+    def test_shared_node_runs_once(self):
+        calls = []
+
+        async def search():
+            calls.append("search")
+            await asyncio.sleep(0.01)
+            return {"owner": "SMITH"}
+
+        async def scenario():
+            graph = FetchGraph()
+            graph.add("search", search)
+            graph.add("search", search)  # a second stage asking for it
+            graph.add(
+                "rental",
+                lambda search: asyncio.sleep(0, search["owner"]),
+                depends_on=["search"],
+            )
+            graph.start()
+            return await asyncio.gather(
+                graph.result("search"), graph.result("rental")
+            )
+
+        assert run(scenario()) == [{"owner": "SMITH"}, "SMITH"]
+        assert calls == ["search"]
+
+    def test_timed_out_waiter_does_not_cancel_shared_fetch(self):
+        async def scenario():
+            graph = FetchGraph()
+            graph.add("slow", lambda: asyncio.sleep(0.05, "done"))
+            graph.start()
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(graph.result("slow"), timeout=0.01)
+            return await graph.result("slow")
+
+        assert run(scenario()) == "done"
+
+    def test_errors_propagate_and_unknown_dependencies_rejected(self):
+        async def fail():
+            raise ValueError("boom")
+
+        async def scenario():
+            graph = FetchGraph()
+            graph.add("fail", fail)
+            graph.add("child", lambda fail: asyncio.sleep(0), depends_on=["fail"])
+            graph.start()
+            with pytest.raises(ValueError):
+                await graph.result("child")
+            graph.cancel_pending()
+
+        run(scenario())
+        with pytest.raises(ValueError):
+            FetchGraph().add("child", lambda parent: None, depends_on=["parent"])
+
+
+@pytest.mark.unit
+class TestOverlappedProgressiveCollection:
+    """Test suite for collect_property_data_progressive on a FetchGraph."""
+
+    ENDPOINT_DELAY = 0.1
+
+    @pytest.fixture
+    def collector(self):
+        db_manager = MagicMock()
+        collector = UnifiedDataCollector(db_manager, None)
+        calls = []
+
+        async def make_async_request(endpoint, params=None):
+            calls.append(endpoint)
+            await asyncio.sleep(self.ENDPOINT_DELAY)
+            if endpoint == "/search/property/":
+                return {"Results": [{"APN": params["q"], "Ownership": "SMITH"}]}
+            if endpoint.endswith("/valuations/"):
+                return [{"TaxYear": "2025", "FullCashValue": "450,000"}]
+            return {"endpoint": endpoint}
+
+        collector.api_client._make_async_request = make_async_request
+        collector.calls = calls
+        yield collector
+        collector.api_client.close()
+
+    def test_latency_approaches_slowest_fetch(self, collector):
+        stages = []
+        start = time.perf_counter()
+        results = collector.collect_property_data_sync(
+            "123-45-678", lambda progress: stages.append(progress.stage)
+        )
+        elapsed = time.perf_counter() - start
+
+        assert stages == ["basic", "detailed", "complete"]
+        assert results.data["basic_data_available"]
+        assert results.data["detailed_data_available"]
+        assert results.data["valuation_summary"]["latest_assessed_value"] == 450000
+        assert results.data["rental_details"]
+        assert results.data["tax_info"] and results.data["documents"]
+
+        # Rental details wait on the search: two fetches deep, where the
+        # staged version needed four (basic, search, details, extended)
+        assert elapsed < 3 * self.ENDPOINT_DELAY
+        assert collector.calls.count("/search/property/") == 1
+        assert collector.wait_for_pending_saves(timeout=5.0)
+        collector.db_manager.save_comprehensive_property_data.assert_called_once()
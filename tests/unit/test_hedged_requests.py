@@ -0,0 +1,175 @@
+"""
+Unit tests for hedged API / web scraping requests
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.hedged_requests import HEDGE, PRIMARY, HedgePolicy
+from src.unified_data_collector import UnifiedDataCollector
+
+
+def source(value, delay, log=None, name=None):
+    """Async source factory that records whether it finished or was cancelled"""
+
+    async def fetch():
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            if log is not None:
+                log.append(f"{name} cancelled")
+            raise
+        return value
+
+    return fetch
+
+
+@pytest.mark.unit
+class TestHedgePolicy:
+    """Test suite for HedgePolicy."""
+
+    def test_fast_primary_wins_without_hedging(self):
+        policy = HedgePolicy("test", initial_delay=0.1)
+        backup = MagicMock()
+        answer = asyncio.run(policy.run(source([1], 0.01), backup))
+
+        assert answer == ([1], PRIMARY)
+        backup.assert_not_called()
+        stats = policy.get_stats()
+        assert stats["hedged"] == 0 and stats["primary_wins"] == 1
+
+    def test_slow_primary_is_hedged_and_loser_cancelled(self):
+        policy = HedgePolicy("test", initial_delay=0.05)
+        log = []
+        start = time.perf_counter()
+        answer = asyncio.run(
+            policy.run(
+                source([1], 1.0, log, "primary"), source([2], 0.05, log, "backup")
+            )
+        )
+
+        assert answer == ([2], HEDGE)
+        assert time.perf_counter() - start < 0.3
+        assert log == ["primary cancelled"]
+        stats = policy.get_stats()
+        assert stats["hedge_rate_percent"] == 100.0
+        assert stats["hedge_win_rate_percent"] == 100.0
+
+    def test_cancelled_primary_is_sampled_as_lower_bound(self):
+        policy = HedgePolicy("test", initial_delay=0.05, min_samples=1)
+        for _ in range(5):
+            answer = asyncio.run(policy.run(source([1], 1.0), source([2], 0.1)))
+            assert answer == ([2], HEDGE)
+
+        # Each loser ran for the hedge delay plus the backup's 100 ms
+        assert policy.get_stats()["samples"] == 5
+        assert policy.hedge_delay() >= 0.1
+
+    def test_primary_can_still_win_the_race(self):
+        policy = HedgePolicy("test", initial_delay=0.02)
+        log = []
+        answer = asyncio.run(
+            policy.run(
+                source([1], 0.05, log, "primary"), source([2], 1.0, log, "backup")
+            )
+        )
+        assert answer == ([1], PRIMARY)
+        assert log == ["backup cancelled"]
+        assert policy.get_stats()["hedge_wins"] == 0
+
+    def test_empty_primary_falls_back_and_failures_are_reported(self):
+        policy = HedgePolicy("test", initial_delay=0.5)
+        start = time.perf_counter()
+        answer = asyncio.run(policy.run(source([], 0.01), source([2], 0.01)))
+        assert answer == ([2], HEDGE)
+        assert time.perf_counter() - start < 0.2
+
+        async def fail():
+            raise ConnectionError("scraper down")
+
+        assert asyncio.run(policy.run(source(None, 0.01), fail)) == (None, None)
+        stats = policy.get_stats()
+        assert stats["fallbacks"] == 2 and stats["fallback_wins"] == 1
+        assert stats["no_answer"] == 1
+
+    def test_timeout_cancels_both_sources(self):
+        policy = HedgePolicy("test", initial_delay=0.01)
+        log = []
+        answer = asyncio.run(
+            policy.run(
+                source([1], 1.0, log, "primary"),
+                source([2], 1.0, log, "backup"),
+                timeout=0.1,
+            )
+        )
+        assert answer == (None, None)
+        assert sorted(log) == ["backup cancelled", "primary cancelled"]
+
+    def test_hedge_delay_tracks_primary_p90(self):
+        policy = HedgePolicy("test", initial_delay=1.0, min_samples=10)
+        assert policy.hedge_delay() == 1.0
+        for latency in [0.1] * 9 + [0.3] * 1:
+            policy.record_latency(latency)
+        assert policy.hedge_delay() == pytest.approx(0.3)
+        for _ in range(200):
+            policy.record_latency(10.0)
+        assert policy.hedge_delay() == policy.max_delay
+
+
+@pytest.mark.unit
+class TestHedgedExtendedCollection:
+    """Test suite for hedged tax and sales fallbacks in the data collector."""
+
+    API_DELAY = {"tax-info": 0.9, "sales": 0.05, "documents": 0.05}
+
+    @pytest.fixture
+    def collector(self):
+        collector = UnifiedDataCollector(MagicMock(), None)
+
+        async def make_async_request(endpoint, params=None):
+            section = endpoint.rstrip("/").rsplit("/", 1)[-1]
+            await asyncio.sleep(self.API_DELAY.get(section, 0.01))
+            if section == "sales":
+                return []  # thin API data
+            if section == "property":
+                return {"Results": []}
+            return [{"endpoint": endpoint}]
+
+        class WebFallback:
+            async def collect_tax_data_fallback(self, apn):
+                await asyncio.sleep(0.1)
+                return {"tax_data_collected": True, "tax_records": [{"tax": 1}]}
+
+            async def collect_sales_data_fallback(self, apn):
+                await asyncio.sleep(0.1)
+                return {"sales_data_collected": True, "sales_records": [{"sale": 1}]}
+
+        collector.api_client._make_async_request = make_async_request
+        collector.web_fallback = WebFallback()
+        collector.tax_hedge.max_delay = 0.2
+        yield collector
+        collector.api_client.close()
+
+    def test_tax_and_sales_fallbacks_race_concurrently(self, collector):
+        start = time.perf_counter()
+        results = collector.collect_property_data_sync("123-45-678")
+        elapsed = time.perf_counter() - start
+
+        assert results.data["tax_info"] == [{"tax": 1}]
+        assert results.data["sales_history"] == [{"sale": 1}]
+        assert sorted(results.data["fallback_usage"]) == [
+            "sales_web_scraping",
+            "tax_web_scraping",
+        ]
+        # Hedged at 0.2s + 0.1s scrape, instead of the API's 0.9s + 0.1s
+        assert elapsed < 0.6
+
+        tax, sales = collector.tax_hedge.get_stats(), collector.sales_hedge.get_stats()
+        assert tax["hedged"] == 1 and tax["hedge_wins"] == 1
+        assert sales["fallbacks"] == 1 and sales["fallback_wins"] == 1
@@ -0,0 +1,143 @@
+"""
+Unit tests for the offline treasurer and recorder page parsers
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from page_parsers import (
+    load_page,
+    parse_html,
+    parse_recorder_documents,
+    parse_tax_history,
+    parse_tax_page,
+)
+
+PAGES_DIR = Path(__file__).parent.parent / "fixtures" / "pages"
+
+
+class TestTaxPageParser:
+    """Test suite for treasurer page parsing."""
+
+    @pytest.mark.unit
+    def test_html_page(self):
+        tax_data = parse_tax_page(load_page(PAGES_DIR / "treasurer_tax_10215009.html"))
+
+        assert tax_data["owner_info"] == {
+            "owner_name": "SMITH JOHN & MARY",
+            "mailing_address": "10000 W MISSOURI AVE, GLENDALE AZ 85307",
+            "property_address": "10000 W MISSOURI AVE, GLENDALE 85307",
+        }
+        assert tax_data["current_tax"] == {
+            "assessed_tax": 2145.32,
+            "tax_paid": 1072.66,
+            "total_due": 1072.66,
+            "payment_status": "UNPAID",
+        }
+        assert [row["tax_year"] for row in tax_data["tax_history"]] == [2024, 2023, 2022]
+        assert tax_data["tax_history"][0] == {
+            "tax_year": 2024,
+            "payment_status": "UNPAID",
+            "assessed_tax": 2145.32,
+            "amount_due": 1072.66,
+            "tax_paid": 0.0,
+        }
+
+    @pytest.mark.unit
+    def test_accessibility_snapshot_markup(self):
+        tax_data = parse_tax_page(
+            (PAGES_DIR / "treasurer_tax_13304014A_snapshot.html").read_text()
+        )
+
+        assert tax_data["owner_info"]["owner_name"] == "DOE JANE TR"
+        assert tax_data["owner_info"]["mailing_address"] == "PO BOX 1234, PHOENIX AZ 85001"
+        assert tax_data["current_tax"]["payment_status"] == "PAID"
+        assert tax_data["tax_history"][1]["tax_paid"] == 3298.55
+
+    @pytest.mark.unit
+    def test_missing_sections_return_empty_results(self):
+        tax_data = parse_tax_page("<html><body><p>No parcel found</p></body></html>")
+
+        assert tax_data["owner_info"] == {}
+        assert tax_data["current_tax"] == {"payment_status": "PAID"}
+        assert tax_data["tax_history"] == []
+
+    @pytest.mark.unit
+    def test_rows_without_status_are_ignored(self):
+        html = "<table>" + "<tr><td>2024</td><td>$1.00</td></tr>" * 50 + "</table>"
+
+        assert parse_tax_history(html) == []
+
+
+class TestRecorderPageParser:
+    """Test suite for recorder document page parsing."""
+
+    @pytest.mark.unit
+    def test_rows_with_recording_numbers(self):
+        documents = parse_recorder_documents(
+            load_page(PAGES_DIR / "recorder_documents_10215009.html")
+        )
+
+        assert [doc["document_number"] for doc in documents] == [
+            "2021-0456789",
+            "2021-0456790",
+            "2015-0123456",
+            "2009-0987654",
+        ]
+        assert documents[0]["document_type"] == "WARRANTY DEED"
+        assert documents[0]["description"] == "SMITH ROBERT to SMITH JOHN & MARY $345,000"
+
+    @pytest.mark.unit
+    def test_declared_charset_is_honoured(self):
+        documents = parse_recorder_documents(
+            (PAGES_DIR / "recorder_documents_10215009.html").read_bytes()
+        )
+
+        assert documents[2]["description"].startswith("MUÑOZ HOMES LLC")
+
+    @pytest.mark.unit
+    def test_generic_fallback_skips_header_row(self):
+        documents = parse_recorder_documents(
+            load_page(PAGES_DIR / "recorder_documents_generic.html"),
+            parse_date=lambda value: f"parsed:{value}",
+        )
+
+        assert [doc["document_number"] for doc in documents] == [
+            "DOC 88123",
+            "DOC 77110",
+            "DOC 66001",
+        ]
+        assert documents[0]["date"] == "parsed:1/5/2019"
+        # Unclosed cells and rows are closed by the next row
+        assert documents[1]["description"] == "Affidavit of value"
+
+    @pytest.mark.unit
+    def test_document_limit(self):
+        rows = "".join(
+            f"<tr><td>2020-{i:07d}</td><td>1/1/2020</td><td>DEED</td></tr>"
+            for i in range(80)
+        )
+
+        assert len(parse_recorder_documents(f"<table>{rows}</table>")) == 50
+
+
+class TestParseHtml:
+    """Test suite for the shared tokenizer."""
+
+    @pytest.mark.unit
+    def test_script_and_style_text_is_dropped(self):
+        page = parse_html(
+            "<head><style>td { color: red }</style><script>var x = '<td>';</script></head>"
+            "<body><p>Visible</p></body>"
+        )
+
+        assert page.root.text_lines() == ["Visible"]
+
+    @pytest.mark.unit
+    def test_parsed_page_is_reused(self):
+        page = parse_html("<p>x</p>")
+
+        assert parse_html(page) is page
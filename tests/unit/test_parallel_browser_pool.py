@@ -0,0 +1,228 @@
+"""
+Unit tests for the recycling, self-healing Selenium browser pool
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+import parallel_web_scraper
+from parallel_web_scraper import (
+    BrowserPool,
+    ParallelWebScraperManager,
+    TASK_RESOURCES,
+    ScrapingRequest,
+    ScrapingTask,
+)
+from src.work_scheduler import WorkScheduler
+
+
+class StubDriver:
+    """Stands in for a selenium Chrome driver"""
+
+    def __init__(self, rss_mb=100.0):
+        self.rss_mb = rss_mb
+        self.crashed = False
+        self.quit_called = False
+        self.cleared = 0
+
+    @property
+    def current_url(self):
+        if self.crashed:
+            raise RuntimeError("chrome not reachable")
+        return "about:blank"
+
+    def delete_all_cookies(self):
+        if self.crashed:
+            raise RuntimeError("chrome not reachable")
+        self.cleared += 1
+
+    def execute_script(self, script):
+        if self.crashed:
+            raise RuntimeError("chrome not reachable")
+
+    def quit(self):
+        self.quit_called = True
+
+
+def make_pool(**kwargs):
+    drivers = []
+
+    def factory():
+        driver = StubDriver()
+        drivers.append(driver)
+        return driver
+
+    options = {
+        "pool_size": 3,
+        "min_idle": 2,
+        "health_check_interval": None,
+        "memory_probe": lambda driver: driver.rss_mb,
+    }
+    options.update(kwargs)
+    pool = BrowserPool("unused", browser_factory=factory, **options)
+    return pool, drivers
+
+
+@pytest.mark.unit
+class TestBrowserPool:
+    """Test suite for BrowserPool recycling and health checks."""
+
+    def test_prewarms_to_idle_floor(self):
+        pool, drivers = make_pool(min_idle=2)
+        status = pool.get_pool_status()
+        assert len(drivers) == 2
+        assert status["available_browsers"] == 2
+        assert status["total_browsers"] == 2
+        pool.close_all()
+        assert all(driver.quit_called for driver in drivers)
+
+    def test_recycles_after_max_uses(self):
+        pool, drivers = make_pool(min_idle=1, max_uses_per_browser=3)
+        first = pool.acquire_browser()
+        for _ in range(2):
+            pool.release_browser(first)
+            assert pool.acquire_browser() is first
+        pool.release_browser(first)
+
+        assert first.quit_called
+        status = pool.get_pool_status()
+        assert status["recycled_browsers"] == 1
+        assert status["total_browsers"] == 0
+        assert pool.acquire_browser() is not first
+        pool.close_all()
+
+    def test_recycles_on_memory_growth(self):
+        pool, drivers = make_pool(min_idle=1, max_rss_mb=500.0)
+        browser = pool.acquire_browser()
+        browser.rss_mb = 800.0
+        pool.release_browser(browser)
+
+        assert browser.quit_called
+        assert pool.get_pool_status()["recycled_browsers"] == 1
+        pool.close_all()
+
+    def test_maintenance_replaces_crashed_idle_browsers(self):
+        pool, drivers = make_pool(min_idle=2)
+        drivers[0].crashed = True
+
+        result = pool.run_maintenance()
+
+        assert result == {"checked": 2, "replaced": 1, "created": 1}
+        status = pool.get_pool_status()
+        assert status["crashed_browsers"] == 1
+        assert status["available_browsers"] == 2
+        assert status["total_browsers"] == 2
+        pool.close_all()
+
+    def test_browser_crashing_during_use_is_discarded(self):
+        pool, drivers = make_pool(min_idle=0)
+        browser = pool.acquire_browser()
+        browser.crashed = True
+        pool.release_browser(browser)
+
+        status = pool.get_pool_status()
+        assert browser.quit_called
+        assert status["crashed_browsers"] == 1
+        assert status["total_browsers"] == 0
+        assert status["active_browsers"] == 0
+        pool.close_all()
+
+    def test_acquire_times_out_when_exhausted(self):
+        pool, drivers = make_pool(pool_size=1, min_idle=1)
+        browser = pool.acquire_browser()
+
+        with pytest.raises(TimeoutError):
+            pool.acquire_browser(timeout=0.2)
+
+        status = pool.get_pool_status()
+        assert status["acquire_timeouts"] == 1
+        assert status["utilization_percent"] == 100.0
+        pool.release_browser(browser)
+        pool.close_all()
+
+    def test_background_thread_restores_floor(self):
+        pool, drivers = make_pool(min_idle=2, health_check_interval=5.0)
+        browser = pool.acquire_browser()
+        browser.crashed = True
+        pool.release_browser(browser)
+
+        # The discard wakes the maintenance thread without waiting an interval
+        deadline = time.monotonic() + 2.0
+        while pool.get_pool_status()["available_browsers"] < 2:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        assert pool.get_pool_status()["total_browsers"] == 2
+        pool.close_all()
+
+
+class StubConfigManager:
+    def get_scraping_config(self):
+        return {"headless": True}
+
+    def get_path(self, path_type):
+        return Path("unused")
+
+
+@pytest.mark.unit
+class TestParallelWebScraperManager:
+    """Test suite for ParallelWebScraperManager scheduling."""
+
+    def test_total_scrapers_capped_across_resources(self, monkeypatch):
+        monkeypatch.setattr(
+            parallel_web_scraper,
+            "BrowserPool",
+            lambda *args, **kwargs: make_pool(
+                pool_size=kwargs["pool_size"], min_idle=0
+            )[0],
+        )
+        scheduler = WorkScheduler()
+        manager = ParallelWebScraperManager(
+            StubConfigManager(), max_concurrent_scrapers=2, scheduler=scheduler
+        )
+        manager._apply_rate_limit = lambda task_type: None
+        state = {"running": 0, "peak": 0, "slots": 0, "done": 0}
+        lock = threading.Lock()
+
+        scraped_resources = {r.value for r in TASK_RESOURCES.values()}
+
+        def scrape(browser, identifier):
+            resources = scheduler.get_stats()["resources"]
+            slots = sum(resources[r]["running"] for r in scraped_resources)
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+                state["slots"] = max(state["slots"], slots)
+            time.sleep(0.3)
+            with lock:
+                state["running"] -= 1
+                state["done"] += 1
+            return {"identifier": identifier}
+
+        manager._scrape_tax_information = scrape
+        manager._scrape_sales_history = scrape
+        manager._scrape_property_details = scrape
+        tasks = [
+            ScrapingTask.TAX_INFORMATION,
+            ScrapingTask.SALES_HISTORY,
+            ScrapingTask.PROPERTY_DETAILS,
+        ]
+        manager.submit_scraping_requests(
+            [ScrapingRequest(tasks[i % 3], f"apn-{i}") for i in range(9)]
+        )
+
+        deadline = time.monotonic() + 10.0
+        while state["done"] < 9:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        manager.shutdown()
+
+        # Three resources, but never more scrapers than the manager allows,
+        # and no site budget slots held by tasks waiting for a scraper
+        assert state["peak"] == 2
+        assert state["slots"] == 2
+        assert manager.get_scraper_statistics()["total_successful"] == 9
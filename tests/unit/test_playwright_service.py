@@ -0,0 +1,260 @@
+"""
+Unit tests for PlaywrightService throughput mode and the warm page pool
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src import playwright_service
+from src.playwright_service import BrowserPool, PlaywrightService
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type):
+        self.url = url
+        self.resource_type = resource_type
+
+
+class FakeRoute:
+    def __init__(self, url, resource_type):
+        self.request = FakeRequest(url, resource_type)
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = "aborted"
+
+    async def continue_(self):
+        self.outcome = "continued"
+
+
+class FakePage:
+    def __init__(self, context, fail_navigation=False):
+        self.context = context
+        self.fail_navigation = fail_navigation
+        self.navigations = []
+        self.screenshots = 0
+        self._closed = False
+
+    async def goto(self, url, wait_until=None):
+        await asyncio.sleep(0.01)
+        if self.fail_navigation:
+            raise RuntimeError("Target page crashed")
+        self.navigations.append((url, wait_until))
+
+    async def wait_for_selector(self, selector, timeout=None):
+        return None
+
+    async def query_selector(self, selector):
+        return None
+
+    async def query_selector_all(self, selector):
+        return []
+
+    async def evaluate(self, script):
+        return {"load_time": 120, "dom_ready": 80, "first_byte": 30, "connect_time": 5}
+
+    async def screenshot(self, **kwargs):
+        self.screenshots += 1
+
+    async def close(self):
+        self._closed = True
+
+    def is_closed(self):
+        return self._closed
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.routes = []
+        self.closed = False
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    async def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+
+    async def new_page(self):
+        page = FakePage(self, fail_navigation=self.browser.fail_next_page)
+        self.browser.fail_next_page = False
+        self.browser.pages.append(page)
+        return page
+
+    async def close(self):
+        self.closed = True
+        for page in self.browser.pages:
+            if page.context is self:
+                page._closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+        self.pages = []
+        self.fail_next_page = False
+
+    async def new_context(self, **kwargs):
+        context = FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        pass
+
+
+class FakeLauncher:
+    def __init__(self, browser):
+        self.browser = browser
+
+    async def launch(self, **kwargs):
+        return self.browser
+
+
+class FakePlaywright:
+    def __init__(self, browser):
+        self.chromium = FakeLauncher(browser)
+        self.stopped = False
+
+    async def start(self):
+        return self
+
+    async def stop(self):
+        self.stopped = True
+
+
+@pytest.fixture
+def fake_browser(monkeypatch):
+    browser = FakeBrowser()
+    driver = FakePlaywright(browser)
+    monkeypatch.setattr(playwright_service, "PLAYWRIGHT_AVAILABLE", True)
+    monkeypatch.setattr(
+        playwright_service, "async_playwright", lambda: driver, raising=False
+    )
+    return browser
+
+
+class TestBrowserPool:
+    """Test suite for the warm page pool and resource blocking."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "url,resource_type,outcome",
+        [
+            ("https://mcassessor.maricopa.gov/parcel/1021", "document", "continued"),
+            ("https://mcassessor.maricopa.gov/api/parcel", "xhr", "continued"),
+            ("https://mcassessor.maricopa.gov/logo.png", "image", "aborted"),
+            ("https://fonts.gstatic.com/roboto.woff2", "font", "aborted"),
+            ("https://www.googletagmanager.com/gtag/js", "script", "aborted"),
+        ],
+    )
+    def test_route_blocks_non_data_requests(self, url, resource_type, outcome):
+        pool = BrowserPool(block_resources=True)
+        route = FakeRoute(url, resource_type)
+
+        asyncio.run(pool._route_request(route))
+
+        assert route.outcome == outcome
+
+    @pytest.mark.unit
+    def test_concurrent_pages_are_capped(self, fake_browser):
+        pool = BrowserPool(pages_per_browser=3)
+        in_use = {"now": 0, "peak": 0}
+
+        async def borrow():
+            async with pool.page() as page:
+                in_use["now"] += 1
+                in_use["peak"] = max(in_use["peak"], in_use["now"])
+                await page.goto("https://example.test")
+                in_use["now"] -= 1
+
+        async def main():
+            await asyncio.gather(*(borrow() for _ in range(10)))
+            await pool.close_all()
+
+        asyncio.run(main())
+
+        stats = pool.get_pool_stats()
+        assert in_use["peak"] == 3
+        assert stats["pages_created"] == 3
+        assert stats["pages_reused"] == 7
+        assert stats["acquire_wait_time"] > 0
+
+
+class TestPlaywrightServiceThroughputMode:
+    """Test suite for PlaywrightService lookups through the page pool."""
+
+    @pytest.fixture
+    def service(self, fake_browser, tmp_path):
+        return PlaywrightService(screenshot_dir=str(tmp_path), throughput_mode=True)
+
+    @pytest.mark.unit
+    def test_sequential_lookups_reuse_one_page(self, service, fake_browser):
+        async def main():
+            results = [
+                await service.search_property_enhanced(f"1021500{i}") for i in range(5)
+            ]
+            await service.cleanup()
+            return results
+
+        results = asyncio.run(main())
+
+        assert all(result.success for result in results)
+        assert len(fake_browser.pages) == 1
+        assert fake_browser.pages[0].navigations[0][1] == "domcontentloaded"
+        assert len(fake_browser.contexts[0].routes) == 1
+        # No fixed sleeps: each lookup costs roughly the fake navigation time
+        assert max(result.execution_time for result in results) < 0.5
+
+    @pytest.mark.unit
+    def test_screenshots_are_off_by_default(self, service, fake_browser):
+        asyncio.run(service.search_property_enhanced("10215009"))
+
+        assert fake_browser.pages[0].screenshots == 0
+
+    @pytest.mark.unit
+    def test_failed_page_is_replaced(self, service, fake_browser):
+        fake_browser.fail_next_page = True
+
+        async def main():
+            first = await service.search_property_enhanced("10215009")
+            second = await service.search_property_enhanced("10215010")
+            return first, second
+
+        first, second = asyncio.run(main())
+
+        assert not first.success
+        assert second.success
+        assert len(fake_browser.pages) == 2
+        assert fake_browser.contexts[0].closed
+        assert service.browser_pool.get_pool_stats()["pages_discarded"] == 1
+
+    @pytest.mark.unit
+    def test_per_request_timings_are_reported(self, service):
+        async def main():
+            for i in range(4):
+                await service.search_property_enhanced(f"1021500{i}")
+
+        asyncio.run(main())
+
+        stats = service.get_performance_stats()
+        assert stats["throughput_mode"] is True
+        assert stats["successful_requests"] == 4
+        assert stats["average_response_time"] > 0
+        assert stats["timings"]["total"]["count"] == 4
+        navigation = stats["timings"]["navigation"]
+        assert navigation["p95"] >= navigation["p50"]
+        assert stats["browser_pool"]["pages_reused"] == 3
+
+    @pytest.mark.unit
+    def test_default_mode_waits_for_network_idle(self, fake_browser, tmp_path):
+        service = PlaywrightService(screenshot_dir=str(tmp_path))
+
+        asyncio.run(service.search_property_enhanced("10215009"))
+
+        assert fake_browser.pages[0].navigations[0][1] == "networkidle"
+        assert fake_browser.contexts[0].routes == []
@@ -0,0 +1,64 @@
+"""
+Unit tests for the cursor tokens and query shape of the ranked property search
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.database_manager_unified import (
+    UnifiedDatabaseManager,
+    decode_search_cursor,
+    encode_search_cursor,
+)
+
+
+class TestSearchCursor:
+    """Test suite for search cursor tokens."""
+
+    @pytest.mark.unit
+    def test_round_trip(self):
+        token = encode_search_cursor("owner", "SMITH", 0.625, "10215009")
+
+        assert decode_search_cursor(token, "owner", "SMITH") == (0.625, "10215009")
+        assert "=" not in token
+
+    @pytest.mark.unit
+    def test_cursor_from_other_search_is_rejected(self):
+        token = encode_search_cursor("owner", "SMITH", 0.5, "10215009")
+
+        with pytest.raises(ValueError):
+            decode_search_cursor(token, "owner", "JONES")
+        with pytest.raises(ValueError):
+            decode_search_cursor(token, "address", "SMITH")
+
+    @pytest.mark.unit
+    def test_garbage_cursor_is_rejected(self):
+        with pytest.raises(ValueError):
+            decode_search_cursor("not-a-cursor", "owner", "SMITH")
+
+
+class TestRankedSearchQuery:
+    """Test suite for the ranked keyset search SQL."""
+
+    @pytest.mark.unit
+    def test_first_page_uses_trigram_operator_and_ranks(self):
+        sql = UnifiedDatabaseManager._build_ranked_search_sql(
+            None, "owner_name", browse=False, paged=False
+        )
+
+        assert "%(term)s <%% owner_name" in sql
+        assert "ORDER BY match_score DESC, apn" in sql
+        assert "ILIKE" not in sql
+
+    @pytest.mark.unit
+    def test_next_page_seeks_past_cursor(self):
+        sql = UnifiedDatabaseManager._build_ranked_search_sql(
+            None, "property_address", browse=False, paged=True
+        )
+
+        assert "< %(last_score)s::real" in sql
+        assert "apn > %(last_apn)s" in sql
+        assert "OFFSET" not in sql
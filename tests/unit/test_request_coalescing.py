@@ -0,0 +1,194 @@
+"""
+Unit tests for single-flight coalescing of concurrent identical API requests
+"""
+import asyncio
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.api_client_unified import SingleFlight, UnifiedMaricopaAPIClient
+
+
+class TestSingleFlight:
+    """Test suite for SingleFlight."""
+
+    @pytest.mark.unit
+    def test_concurrent_threads_share_one_call(self):
+        flight = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def fetch():
+            calls.append(1)
+            release.wait(1.0)
+            return {"apn": "10215009"}
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(flight.do, "key", fetch) for _ in range(8)]
+            time.sleep(0.05)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert len(calls) == 1
+        assert all(result == {"apn": "10215009"} for result in results)
+        assert flight.get_stats() == {
+            "in_flight": 0,
+            "leaders": 1,
+            "coalesced_requests": 7,
+        }
+
+    @pytest.mark.unit
+    def test_leader_exception_is_shared(self):
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def fail():
+            release.wait(1.0)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(flight.do, "key", fail) for _ in range(3)]
+            time.sleep(0.05)
+            release.set()
+            for future in futures:
+                with pytest.raises(ValueError):
+                    future.result()
+
+        # Failed calls are not remembered
+        assert flight.do("key", lambda: 42) == 42
+
+    @pytest.mark.unit
+    def test_async_tasks_share_one_call(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.02)
+            return "result"
+
+        async def main():
+            return await asyncio.gather(
+                *(flight.do_async("key", fetch) for _ in range(10))
+            )
+
+        assert asyncio.run(main()) == ["result"] * 10
+        assert len(calls) == 1
+        assert flight.coalesced == 9
+
+    @pytest.mark.unit
+    def test_cancelled_waiter_does_not_cancel_shared_call(self):
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            return "result"
+
+        async def main():
+            leader = asyncio.create_task(flight.do_async("key", fetch))
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(flight.do_async("key", fetch))
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            return await leader, waiter
+
+        result, waiter = asyncio.run(main())
+        assert result == "result"
+        assert waiter.cancelled()
+
+    @pytest.mark.unit
+    def test_waiter_takes_over_when_leader_is_cancelled(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "result"
+
+        async def main():
+            leader = asyncio.create_task(flight.do_async("key", fetch))
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(flight.do_async("key", fetch))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            return await waiter
+
+        assert asyncio.run(main()) == "result"
+        assert len(calls) == 2
+
+    @pytest.mark.unit
+    def test_thread_waits_on_async_leader(self):
+        flight = SingleFlight()
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            return "from loop"
+
+        try:
+            asyncio.run_coroutine_threadsafe(flight.do_async("key", fetch), loop)
+            time.sleep(0.01)
+            assert flight.do("key", lambda: "from thread") == "from loop"
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(1.0)
+            loop.close()
+
+
+class TestClientRequestCoalescing:
+    """Test suite for request coalescing in UnifiedMaricopaAPIClient."""
+
+    @pytest.fixture
+    def api_client(self):
+        client = UnifiedMaricopaAPIClient()
+        client.rate_limiter = None
+        yield client
+        client.close()
+
+    @pytest.mark.unit
+    def test_threaded_callers_share_one_http_request(self, api_client):
+        response = Mock(status_code=200)
+        response.json.return_value = {"Results": []}
+
+        def slow_get(*args, **kwargs):
+            time.sleep(0.05)
+            return response
+
+        with patch.object(api_client.session, "get", side_effect=slow_get) as mock_get:
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                results = list(
+                    executor.map(
+                        lambda _: api_client._make_request(
+                            "/search/property/", {"q": "10215009"}
+                        ),
+                        range(5),
+                    )
+                )
+
+        assert mock_get.call_count == 1
+        assert results == [{"Results": []}] * 5
+        assert api_client.get_performance_stats()["coalesced_requests"] == 4
+
+    @pytest.mark.unit
+    def test_uncached_request_counts_one_miss(self, api_client):
+        response = Mock(status_code=200)
+        response.json.return_value = {"Results": []}
+
+        with patch.object(api_client.session, "get", return_value=response):
+            api_client._make_request("/search/property/", {"q": "10215009"})
+            api_client._make_request("/search/property/", {"q": "10215009"})
+
+        stats = api_client.get_performance_stats()
+        assert stats["cache_misses"] == 1 and stats["cache_hits"] == 1
+        cache_stats = stats["response_cache"]
+        assert cache_stats["misses"] == 1 and cache_stats["hits"] == 1
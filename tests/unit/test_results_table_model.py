@@ -0,0 +1,179 @@
+"""
+Unit tests for the search results model/view backing
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QTableView
+
+from src.gui.results_table_model import (
+    STATUS_COLORS,
+    STATUS_COLUMN,
+    ColumnarResultStore,
+    PropertyResultsModel,
+    PropertyResultsProxyModel,
+    sample_column_widths,
+)
+
+RESULTS = [
+    {
+        "apn": "10215009",
+        "address": "10000 W Missouri Ave",
+        "owner_name": "SMITH JOHN",
+        "year_built": 1995,
+        "market_value": 320000,
+        "bathrooms": 2.5,
+    },
+    {
+        "apn": "10215010",
+        "address": "10002 W Missouri Ave",
+        "owner_name": "JONES MARY",
+        "year_built": None,
+        "market_value": 95000,
+        "bathrooms": 2,
+    },
+    {
+        "apn": "10215011",
+        "address": "55 E Main St",
+        "owner_name": "SMITHSON LLC",
+        "year_built": 2010,
+        "market_value": "1,250,000",
+        "bathrooms": "",
+    },
+]
+
+
+@pytest.fixture
+def model(qtbot):
+    model = PropertyResultsModel()
+    model.set_store(
+        ColumnarResultStore.from_results(
+            RESULTS, ["Complete", "Queued", "Partial"], [2, 1, 0], ["", "", ""]
+        )
+    )
+    return model
+
+
+class TestPropertyResultsModel:
+    """Test suite for PropertyResultsModel."""
+
+    @pytest.mark.unit
+    @pytest.mark.gui
+    def test_cells_are_formatted_for_display(self, model):
+        assert model.rowCount() == 3
+        assert model.index(0, 0).data() == "10215009"
+        assert model.index(0, 4).data() == "1995"
+        assert model.index(1, 4).data() == ""
+        assert model.index(0, 7).data() == "2.5"
+        assert model.index(0, 8).data() == "$320,000"
+        assert model.index(2, 8).data() == "$1,250,000"
+        assert model.headerData(8, Qt.Horizontal) == "Market Value"
+
+    @pytest.mark.unit
+    @pytest.mark.gui
+    def test_status_cell_colors(self, model):
+        assert (
+            model.index(0, STATUS_COLUMN).data(Qt.BackgroundRole)
+            == STATUS_COLORS["complete"]
+        )
+        assert (
+            model.index(1, STATUS_COLUMN).data(Qt.BackgroundRole)
+            == STATUS_COLORS["collecting"]
+        )
+        assert (
+            model.index(2, STATUS_COLUMN).data(Qt.BackgroundRole)
+            == STATUS_COLORS["missing"]
+        )
+
+    @pytest.mark.unit
+    @pytest.mark.gui
+    def test_update_status_changes_one_row(self, model, qtbot):
+        with qtbot.waitSignal(model.dataChanged):
+            model.update_status(2, "Complete", 2, "Just now")
+
+        assert model.index(2, STATUS_COLUMN).data() == "Complete"
+        assert model.index(2, STATUS_COLUMN + 1).data() == "Just now"
+
+    @pytest.mark.unit
+    @pytest.mark.gui
+    def test_row_for_apn_follows_sorting(self, model):
+        assert model.row_for_apn("10215011") == 2
+        model.sort(8, Qt.DescendingOrder)
+        assert model.row_for_apn("10215011") == 0
+        assert model.row_for_apn("99999999") is None
+
+
+class TestPropertyResultsProxyModel:
+    """Test suite for sorting and filtering through the proxy model."""
+
+    @pytest.fixture
+    def proxy(self, model):
+        proxy = PropertyResultsProxyModel()
+        proxy.setSourceModel(model)
+        return proxy
+
+    @pytest.mark.unit
+    @pytest.mark.gui
+    def test_currency_sorts_numerically(self, proxy):
+        proxy.sort(8, Qt.DescendingOrder)
+
+        assert [proxy.apn_at(row) for row in range(3)] == [
+            "10215011",
+            "10215009",
+            "10215010",
+        ]
+
+    @pytest.mark.unit
+    @pytest.mark.gui
+    def test_missing_numbers_sort_first_ascending(self, proxy):
+        proxy.sort(4, Qt.AscendingOrder)
+
+        assert proxy.apn_at(0) == "10215010"
+
+    @pytest.mark.unit
+    @pytest.mark.gui
+    def test_selection_follows_record_through_sort(self, proxy, qtbot):
+        view = QTableView()
+        qtbot.addWidget(view)
+        view.setModel(proxy)
+        view.selectRow(1)
+
+        proxy.sort(0, Qt.DescendingOrder)
+
+        selected = view.selectionModel().selectedRows()
+        assert [proxy.apn_at(index.row()) for index in selected] == ["10215010"]
+
+    @pytest.mark.unit
+    @pytest.mark.gui
+    def test_filter_matches_apn_address_and_owner(self, proxy):
+        proxy.set_filter_text("smith")
+        assert proxy.rowCount() == 2
+
+        proxy.set_filter_text("main st")
+        assert proxy.rowCount() == 1
+        assert proxy.apn_at(0) == "10215011"
+
+        proxy.set_filter_text("")
+        assert proxy.rowCount() == 3
+
+
+class TestSampledColumnWidths:
+    """Test suite for sample_column_widths."""
+
+    @pytest.mark.unit
+    @pytest.mark.gui
+    def test_widths_fit_header_and_content(self, model, qtbot):
+        view = QTableView()
+        qtbot.addWidget(view)
+        metrics = view.fontMetrics()
+
+        widths = sample_column_widths(model, metrics, padding=0)
+
+        assert widths[1] >= metrics.horizontalAdvance("10002 W Missouri Ave")
+        assert widths[8] >= metrics.horizontalAdvance("Market Value")
+        assert all(width <= 400 for width in widths)
@@ -0,0 +1,133 @@
+"""
+Unit tests for the server-side cursor streaming reads of UnifiedDatabaseManager
+"""
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.database_manager_unified import StreamRecord, UnifiedDatabaseManager
+
+
+class FakeNamedCursor:
+    """Named cursor stand-in that records how it was used"""
+
+    def __init__(self, name, rows, columns):
+        self.name = name
+        self.rows = rows
+        self.description = [(column,) for column in columns]
+        self.itersize = None
+        self.executed = None
+        self.closed = False
+        self.yielded = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.closed = True
+
+    def execute(self, sql, params=None):
+        self.executed = (sql, params)
+
+    def __iter__(self):
+        for row in self.rows:
+            self.yielded += 1
+            yield row
+
+
+class FakeConnection:
+    def __init__(self, rows, columns):
+        self.rows = rows
+        self.columns = columns
+        self.cursors = []
+
+    def cursor(self, name=None, cursor_factory=None):
+        cursor = FakeNamedCursor(name, self.rows, self.columns)
+        self.cursors.append(cursor)
+        return cursor
+
+
+class TestStreamingReads:
+    """Test suite for iter_properties / iter_tax_history."""
+
+    @pytest.fixture
+    def make_manager(self):
+        def make(rows, columns):
+            manager = UnifiedDatabaseManager.__new__(UnifiedDatabaseManager)
+            manager._stats_lock = Lock()
+            manager._operation_stats = {
+                "selects": {"count": 0, "total_time": 0.0, "errors": 0}
+            }
+            manager.connection = FakeConnection(rows, columns)
+            manager.checked_out = 0
+
+            @contextmanager
+            def get_connection():
+                manager.checked_out += 1
+                try:
+                    yield manager.connection
+                finally:
+                    manager.checked_out -= 1
+
+            manager.get_connection = get_connection
+            return manager
+
+        return make
+
+    @pytest.mark.unit
+    def test_iter_properties_uses_named_cursor_and_slots_records(self, make_manager):
+        rows = [(f"1021{i:04d}", f"OWNER {i}") for i in range(10)]
+        manager = make_manager(rows, ["apn", "owner_name"])
+
+        records = list(manager.iter_properties({"land_use_code": "R1"}, batch_size=3))
+
+        cursor = manager.connection.cursors[0]
+        assert cursor.name.startswith("iter_properties_")
+        assert cursor.itersize == 3
+        assert "land_use_code = %s" in cursor.executed[0]
+        assert cursor.executed[1] == ["R1"]
+
+        assert len(records) == 10
+        assert isinstance(records[0], StreamRecord)
+        assert records[0].apn == "10210000"
+        assert records[0]["owner_name"] == "OWNER 0"
+        assert not hasattr(records[0], "__dict__")
+        assert manager._operation_stats["selects"]["count"] == 1
+
+    @pytest.mark.unit
+    def test_records_work_with_validate_property_data(self, make_manager):
+        manager = make_manager([("10215009", "abc")], ["apn", "year_built"])
+        record = next(manager.iter_properties())
+
+        is_valid, errors = manager.validate_property_data(record)
+        assert not is_valid
+        assert "year_built" in errors[0]
+
+    @pytest.mark.unit
+    def test_stopping_early_releases_connection(self, make_manager):
+        rows = [(f"1021{i:04d}", 2024) for i in range(1000)]
+        manager = make_manager(rows, ["apn", "tax_year"])
+
+        stream = manager.iter_tax_history(["10210000", "10210001"])
+        first = [next(stream) for _ in range(5)]
+        assert manager.checked_out == 1
+
+        stream.close()
+        cursor = manager.connection.cursors[0]
+        assert len(first) == 5
+        assert cursor.yielded == 5
+        assert cursor.closed
+        assert manager.checked_out == 0
+        assert cursor.executed[1] == (["10210000", "10210001"],)
+
+    @pytest.mark.unit
+    def test_unknown_filter_column_is_rejected(self, make_manager):
+        manager = make_manager([], ["apn"])
+
+        with pytest.raises(ValueError):
+            manager.iter_properties({"apn; DROP TABLE properties": "x"})
@@ -0,0 +1,105 @@
+"""
+Unit tests for the stub Maricopa API server used in load tests
+"""
+import sys
+import time
+from pathlib import Path
+
+import pytest
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from tests.fixtures.stub_maricopa_server import (
+    StubMaricopaServer,
+    SyntheticParcels,
+    parse_latency,
+)
+
+
+@pytest.mark.unit
+class TestSyntheticParcels:
+    """Test suite for SyntheticParcels."""
+
+    def test_apn_round_trips_and_records_are_deterministic(self):
+        parcels = SyntheticParcels(parcel_count=1_000_000, seed=7)
+        for index in (0, 999, 1000, 89_999, 90_000, 999_999):
+            assert parcels.index_for(parcels.apn(index)) == index
+        assert parcels.index_for("999-99-999") is None
+
+        again = SyntheticParcels(parcel_count=1_000_000, seed=7)
+        assert parcels.search_result(12345) == again.search_result(12345)
+        assert parcels.valuations(12345) == again.valuations(12345)
+
+    def test_parse_latency(self):
+        import random
+
+        rng = random.Random(0)
+        assert parse_latency("fixed:0.05")(rng) == 0.05
+        assert 0.02 <= parse_latency("uniform:0.02:0.2")(rng) <= 0.2
+        assert parse_latency("lognormal:0.08:0.5")(rng) > 0
+        with pytest.raises(ValueError):
+            parse_latency("bimodal:1")
+
+
+@pytest.mark.unit
+class TestStubMaricopaServer:
+    """Test suite for StubMaricopaServer."""
+
+    def test_serves_search_and_parcel_endpoints(self):
+        with StubMaricopaServer(parcel_count=5000) as server:
+            apn = server.parcels.apn(4321)
+            root = server.base_url.rsplit("/api", 1)[0]
+
+            search = requests.get(
+                f"{server.base_url}/search/property/", params={"q": apn}
+            )
+            assert search.status_code == 200
+            assert search.json()["Results"][0]["APN"] == apn
+
+            # Served without the /api prefix as well
+            valuations = requests.get(f"{root}/parcel/{apn}/valuations/")
+            assert valuations.status_code == 200
+            assert len(valuations.json()) == 5
+
+            details = requests.get(f"{root}/parcel/{apn}/residential-details/")
+            assert "ConstructionYear" in details.json()
+
+            missing = requests.get(f"{root}/parcel/999-99-999/valuations/")
+            assert missing.status_code == 404
+
+            owners = requests.get(f"{root}/search/property/", params={"q": "SMITH"})
+            assert owners.json() == requests.get(
+                f"{root}/search/property/", params={"q": "smith"}
+            ).json()
+
+        assert server.stats["ok"] == 5 and server.stats["not_found"] == 1
+
+    def test_injects_latency_errors_and_rate_limits(self):
+        with StubMaricopaServer(
+            parcel_count=100, latency=0.05, rate_limit_rate=1.0, retry_after=3
+        ) as server:
+            start = time.monotonic()
+            response = requests.get(
+                f"{server.base_url}/search/property/", params={"q": "100-10-001"}
+            )
+            assert time.monotonic() - start >= 0.05
+            assert response.status_code == 429
+            assert response.headers["Retry-After"] == "3"
+
+        with StubMaricopaServer(parcel_count=100, error_rate=1.0) as server:
+            response = requests.get(f"{server.base_url}/parcel/100-10-001/mapids/")
+            assert response.status_code == 500
+            assert server.stats["errors"] == 1
+
+    def test_max_rps_throttles_bursts(self):
+        with StubMaricopaServer(parcel_count=100, max_rps=5) as server:
+            statuses = [
+                requests.get(
+                    f"{server.base_url}/parcel/100-10-001/sketches/"
+                ).status_code
+                for _ in range(10)
+            ]
+        assert statuses[:5] == [200] * 5
+        assert 429 in statuses[5:]
+        assert server.stats["rate_limited"] == statuses.count(429)
@@ -0,0 +1,302 @@
+"""
+Unit tests for the browser-free treasurer tax lookup fast path
+"""
+import sys
+import time
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from tax_scraper import TreasurerHttpClient, TreasurerRateLimited, extract_form_state
+
+PAGES_DIR = Path(__file__).parent.parent / "fixtures" / "pages"
+FORM_PAGE = (PAGES_DIR / "treasurer_parcel_form.html").read_bytes()
+TAX_PAGE = (PAGES_DIR / "treasurer_tax_10215009.html").read_bytes()
+EMPTY_PAGE = b"<html><body><p>No parcel found</p></body></html>"
+
+
+class FakeResponse:
+    def __init__(self, content, status_code=200, headers=None):
+        self.content = content
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+
+class FakeSession:
+    """Records requests and serves the parcel form and canned result pages"""
+
+    def __init__(self, result_pages):
+        self.result_pages = list(result_pages)
+        self.gets = []
+        self.posts = []
+
+    def get(self, url, timeout=None):
+        self.gets.append(url)
+        return FakeResponse(FORM_PAGE)
+
+    def post(self, url, data=None, timeout=None):
+        self.posts.append(data)
+        # The last page is served for every remaining request
+        if len(self.result_pages) > 1:
+            page = self.result_pages.pop(0)
+        else:
+            page = self.result_pages[0]
+        if isinstance(page, Exception):
+            raise page
+        if isinstance(page, FakeResponse):
+            return page
+        return FakeResponse(page)
+
+
+class SlowSession(FakeSession):
+    """FakeSession whose requests take delay seconds, or time out first"""
+
+    def __init__(self, result_pages, delay):
+        super().__init__(result_pages)
+        self.delay = delay
+        self.timeouts = []
+
+    def _wait(self, timeout):
+        self.timeouts.append(timeout)
+        time.sleep(min(self.delay, timeout))
+        if self.delay > timeout:
+            raise requests.Timeout("read timed out")
+
+    def get(self, url, timeout=None):
+        self._wait(timeout)
+        return super().get(url, timeout)
+
+    def post(self, url, data=None, timeout=None):
+        self._wait(timeout)
+        return super().post(url, data, timeout)
+
+
+class TestTreasurerHttpClient:
+    """Test suite for TreasurerHttpClient."""
+
+    @pytest.mark.unit
+    def test_form_state_uses_server_field_names(self):
+        form_state = extract_form_state(FORM_PAGE)
+
+        assert form_state["hidden"]["__VIEWSTATE"] == "dDwtMTA4NzEzOTY4Mjs7Pg=="
+        assert form_state["parcel_fields"] == [
+            "ctl00$cphMainContent$txtParcelNumBook",
+            "ctl00$cphMainContent$txtParcelNumMap",
+            "ctl00$cphMainContent$txtParcelNumItem",
+            "ctl00$cphMainContent$txtParcelNumSplit",
+        ]
+        assert form_state["submit_target"] == "ctl00$cphMainContent$btnSubmit"
+
+    @pytest.mark.unit
+    def test_lookup_posts_parcel_segments_with_view_state(self):
+        session = FakeSession([TAX_PAGE])
+        client = TreasurerHttpClient(session=session)
+
+        tax_data = client.fetch_tax_data("133-04-014A")
+
+        payload = session.posts[0]
+        assert payload["ctl00$cphMainContent$txtParcelNumBook"] == "133"
+        assert payload["ctl00$cphMainContent$txtParcelNumMap"] == "04"
+        assert payload["ctl00$cphMainContent$txtParcelNumItem"] == "014"
+        assert payload["ctl00$cphMainContent$txtParcelNumSplit"] == "A"
+        assert payload["__EVENTTARGET"] == "ctl00$cphMainContent$btnSubmit"
+        assert payload["__EVENTVALIDATION"] == "/wEdAAbLQ1jR3m1v"
+
+        assert tax_data["apn"] == "133-04-014A"
+        assert tax_data["scrape_method"] == "http"
+        assert tax_data["owner_info"]["owner_name"] == "SMITH JOHN & MARY"
+        assert len(tax_data["tax_history"]) == 3
+
+    @pytest.mark.unit
+    def test_form_state_is_fetched_once(self):
+        session = FakeSession([TAX_PAGE])
+        client = TreasurerHttpClient(session=session)
+
+        for apn in ("10215009", "10215010", "10215011"):
+            assert client.fetch_tax_data(apn)
+
+        assert len(session.gets) == 1
+        assert len(session.posts) == 3
+
+    @pytest.mark.unit
+    def test_empty_result_refreshes_form_state_once(self):
+        session = FakeSession([EMPTY_PAGE])
+        client = TreasurerHttpClient(session=session)
+
+        assert client.fetch_tax_data("10215009") is None
+        assert len(session.gets) == 2
+        assert len(session.posts) == 2
+
+    @pytest.mark.unit
+    def test_http_errors_return_none(self):
+        session = FakeSession([requests.ConnectionError("connection reset")])
+        client = TreasurerHttpClient(session=session)
+
+        assert client.fetch_tax_data("10215009") is None
+
+    @pytest.mark.unit
+    def test_http_errors_raised_on_request(self):
+        session = FakeSession([requests.ConnectionError("connection reset")])
+        client = TreasurerHttpClient(session=session)
+
+        with pytest.raises(requests.ConnectionError):
+            client.fetch_tax_data("10215009", raise_errors=True)
+
+    @pytest.mark.unit
+    def test_rate_limit_raised_with_retry_after(self):
+        session = FakeSession([FakeResponse(b"", 429, {"Retry-After": "5"})])
+        client = TreasurerHttpClient(session=session)
+
+        with pytest.raises(TreasurerRateLimited) as excinfo:
+            client.fetch_tax_data("10215009")
+        assert excinfo.value.retry_after == "5"
+        assert len(session.posts) == 1
+
+    @pytest.mark.unit
+    def test_max_duration_bounds_the_whole_lookup(self):
+        # Form GET, POST, refresh GET and POST at 0.2s each would take 0.8s
+        session = SlowSession([EMPTY_PAGE], delay=0.2)
+        client = TreasurerHttpClient(session=session, timeout=1.0)
+
+        start = time.monotonic()
+        assert client.fetch_tax_data("10215009", max_duration=0.5) is None
+        assert time.monotonic() - start < 0.6
+        assert all(timeout <= 0.5 for timeout in session.timeouts)
+        assert len(session.posts) < 2
+
+    @pytest.mark.unit
+    def test_unparseable_apn_skips_the_request(self):
+        session = FakeSession([TAX_PAGE])
+        client = TreasurerHttpClient(session=session)
+
+        assert client.fetch_tax_data("123") is None
+        assert session.gets == []
+
+
+class TestTaxScrapePathSelection:
+    """Test suite for the HTTP-first tax scraping in the API client."""
+
+    @pytest.fixture
+    def api_client(self):
+        from src.api_client_unified import UnifiedMaricopaAPIClient
+
+        client = UnifiedMaricopaAPIClient()
+        client.rate_limiter = None
+        yield client
+        client.close()
+
+    @pytest.mark.unit
+    def test_fast_path_skips_browser(self, api_client):
+        api_client._tax_http = TreasurerHttpClient(session=FakeSession([TAX_PAGE]))
+
+        with patch.object(api_client, "_scrape_tax_data_browser") as browser:
+            tax_data = api_client._scrape_tax_data_sync("10215009")
+
+        browser.assert_not_called()
+        assert tax_data["scrape_method"] == "http"
+        paths = api_client.get_performance_stats()["tax_scrape_paths"]
+        assert paths["http"]["successes"] == 1
+
+    @pytest.mark.unit
+    def test_falls_back_to_browser(self, api_client):
+        api_client._tax_http = TreasurerHttpClient(session=FakeSession([EMPTY_PAGE]))
+
+        with patch.object(
+            api_client,
+            "_scrape_tax_data_browser",
+            return_value={"apn": "10215009", "scrape_method": "browser"},
+        ) as browser:
+            tax_data = api_client._scrape_tax_data_sync("10215009")
+
+        browser.assert_called_once_with("10215009")
+        assert tax_data["scrape_method"] == "browser"
+        paths = api_client.get_performance_stats()["tax_scrape_paths"]
+        assert paths["http"]["attempts"] == 1
+        assert paths["http"]["successes"] == 0
+
+    @pytest.mark.unit
+    def test_outcomes_feed_the_treasurer_bucket(self, api_client):
+        from src.api_client_unified import TREASURER_HOST, AdaptiveRateLimiter
+
+        api_client.rate_limiter = AdaptiveRateLimiter()
+        api_client._tax_http = TreasurerHttpClient(session=FakeSession([TAX_PAGE]))
+
+        assert api_client._scrape_tax_data_sync("10215009")
+
+        stats = api_client.rate_limiter.get_stats()
+        assert stats["hosts"][TREASURER_HOST]["success_count"] == 1
+        assert stats["success_count"] == 0
+
+    @pytest.mark.unit
+    def test_rate_limit_pauses_treasurer_and_skips_browser(self, api_client):
+        from src.api_client_unified import TREASURER_HOST, AdaptiveRateLimiter
+
+        api_client.rate_limiter = AdaptiveRateLimiter()
+        api_client._tax_http = TreasurerHttpClient(
+            session=FakeSession([FakeResponse(b"", 429, {"Retry-After": "30"})])
+        )
+
+        with patch.object(api_client, "_scrape_tax_data_browser") as browser:
+            assert api_client._scrape_tax_data_sync("10215009") is None
+
+        browser.assert_not_called()
+        treasurer = api_client.rate_limiter.get_stats()["hosts"][TREASURER_HOST]
+        assert treasurer["rate_limit_count"] == 1
+        assert treasurer["blocked_for_seconds"] > 25
+
+
+class TestWebFallbackTaxClient:
+    """Test suite for the treasurer HTTP lookups of WebScrapingFallback."""
+
+    @pytest.fixture
+    def api_client(self):
+        from src.api_client_unified import AdaptiveRateLimiter, UnifiedMaricopaAPIClient
+
+        client = UnifiedMaricopaAPIClient()
+        client.rate_limiter = AdaptiveRateLimiter()
+        yield client
+        client.close()
+
+    @pytest.mark.unit
+    def test_lookups_share_the_api_client_path(self, api_client):
+        from src.api_client_unified import TREASURER_HOST
+        from src.unified_data_collector import WebScrapingFallback
+
+        session = FakeSession([TAX_PAGE])
+        api_client._tax_http = TreasurerHttpClient(session=session)
+        fallback = WebScrapingFallback(api_client)
+
+        tax_records = fallback._fetch_tax_records_http("10215009")
+
+        assert len(tax_records) == 3
+        assert len(session.posts) == 1
+        assert fallback.path_stats is api_client._tax_path_stats
+        treasurer = api_client.rate_limiter.get_stats()["hosts"][TREASURER_HOST]
+        assert treasurer["acquired"] == 1
+        assert treasurer["success_count"] == 1
+
+    @pytest.mark.unit
+    def test_paused_treasurer_bucket_sends_nothing(self, api_client):
+        from src.api_client_unified import TREASURER_HOST
+        from src.unified_data_collector import WebScrapingFallback
+
+        session = FakeSession([TAX_PAGE])
+        api_client._tax_http = TreasurerHttpClient(session=session)
+        api_client.rate_limiter = Mock(wraps=api_client.rate_limiter)
+        api_client.rate_limiter.acquire.return_value = False
+        fallback = WebScrapingFallback(api_client)
+
+        assert fallback._fetch_tax_records_http("10215009") == []
+        assert session.posts == []
+        api_client.rate_limiter.acquire.assert_called_once_with(
+            timeout=fallback.http_timeout, host=TREASURER_HOST
+        )
@@ -0,0 +1,262 @@
+"""
+Unit tests for the shared work scheduler
+"""
+import sys
+import threading
+import time
+from enum import Enum
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from src.work_scheduler import (
+    CRITICAL,
+    HIGH,
+    LOW,
+    NORMAL,
+    Resource,
+    WorkScheduler,
+    priority_class,
+    priority_from_level,
+)
+
+
+class Gate:
+    """Tasks that block until released, recording how many ran at once"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+        self.order = []
+
+    def task(self, name=None):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            self.order.append(name)
+        self.release.wait(5.0)
+        with self.lock:
+            self.running -= 1
+        return name
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+@pytest.mark.unit
+class TestWorkScheduler:
+    """Test suite for WorkScheduler."""
+
+    def test_resource_budget_caps_concurrency(self):
+        scheduler = WorkScheduler(budgets={Resource.TREASURER: 2})
+        gate = Gate()
+        futures = [
+            scheduler.submit(gate.task, i, resource=Resource.TREASURER)
+            for i in range(6)
+        ]
+        wait_until(lambda: gate.running == 2)
+        time.sleep(0.05)
+
+        stats = scheduler.get_stats()["resources"]["treasurer"]
+        assert stats["running"] == 2 and stats["queued"] == 4
+
+        gate.release.set()
+        assert [future.result(5.0) for future in futures] == list(range(6))
+        assert gate.peak == 2
+        scheduler.shutdown()
+
+    def test_saturated_resource_does_not_block_others(self):
+        scheduler = WorkScheduler(budgets={Resource.RECORDER: 1})
+        gate = Gate()
+        blocked = [
+            scheduler.submit(gate.task, resource=Resource.RECORDER) for _ in range(3)
+        ]
+        other = scheduler.submit(lambda: "done", resource=Resource.ASSESSOR_API)
+
+        assert other.result(2.0) == "done"
+        gate.release.set()
+        for future in blocked:
+            future.result(5.0)
+        scheduler.shutdown()
+
+    def test_higher_priority_runs_first(self):
+        scheduler = WorkScheduler(budgets={Resource.DATABASE: 1})
+        gate = Gate()
+        first = scheduler.submit(gate.task, "first", resource=Resource.DATABASE)
+        wait_until(lambda: gate.running == 1)
+
+        queued = [("low", LOW), ("normal", NORMAL), ("critical", CRITICAL)]
+        for name, priority in queued:
+            scheduler.submit(
+                gate.task, name, resource=Resource.DATABASE, priority=priority
+            )
+        gate.release.set()
+        first.result(5.0)
+        wait_until(lambda: len(gate.order) == 4)
+
+        assert gate.order == ["first", "critical", "normal", "low"]
+        scheduler.shutdown()
+
+    def test_jobs_share_a_priority_class_round_robin(self):
+        scheduler = WorkScheduler(budgets={Resource.ASSESSOR_API: 1})
+        gate = Gate()
+        scheduler.submit(gate.task, "blocker", resource=Resource.ASSESSOR_API)
+        wait_until(lambda: gate.running == 1)
+
+        # A large job queued ahead of a small one does not hold it back
+        for i in range(4):
+            scheduler.submit(
+                gate.task, f"big{i}", resource=Resource.ASSESSOR_API, job_id="big"
+            )
+        for i in range(2):
+            scheduler.submit(
+                gate.task, f"small{i}", resource=Resource.ASSESSOR_API, job_id="small"
+            )
+        assert (
+            scheduler.get_stats()["resources"]["assessor_api"]["queued_jobs"] == 2
+        )
+        gate.release.set()
+        wait_until(lambda: len(gate.order) == 7)
+
+        assert gate.order[1:] == ["big0", "small0", "big1", "small1", "big2", "big3"]
+        scheduler.shutdown()
+
+    def test_stats_report_wait_times_and_failures(self):
+        scheduler = WorkScheduler()
+
+        def fail():
+            raise ValueError("boom")
+
+        assert scheduler.submit(lambda: 1).result(2.0) == 1
+        with pytest.raises(ValueError):
+            scheduler.submit(fail).result(2.0)
+        wait_until(
+            lambda: scheduler.get_stats()["resources"]["general"]["completed"] == 2
+        )
+
+        stats = scheduler.get_stats()["resources"]["general"]
+        assert stats["submitted"] == 2 and stats["failed"] == 1
+        assert stats["max_wait_ms"] >= stats["avg_wait_ms"] >= 0.0
+        scheduler.shutdown()
+        with pytest.raises(RuntimeError):
+            scheduler.submit(lambda: None)
+
+    def test_priority_mapping(self):
+        class BatchPriority(Enum):
+            URGENT = 1
+            HIGH = 2
+            NORMAL = 3
+            LOW = 4
+
+        assert priority_class(BatchPriority.URGENT) == CRITICAL
+        assert priority_class(BatchPriority.LOW) == LOW
+        assert priority_class(None) == NORMAL
+        assert priority_class(9) == LOW
+        assert [priority_from_level(level) for level in (1, 3, 5, 10)] == [
+            CRITICAL,
+            HIGH,
+            NORMAL,
+            LOW,
+        ]
+
+
+@pytest.mark.unit
+class TestSchedulerExecutor:
+    """Test suite for SchedulerExecutor."""
+
+    def test_max_workers_caps_executor_within_budget(self):
+        scheduler = WorkScheduler(budgets={Resource.GENERAL: 8})
+        gate = Gate()
+        with scheduler.executor_for(Resource.GENERAL, max_workers=3) as executor:
+            futures = [executor.submit(gate.task, i) for i in range(10)]
+            wait_until(lambda: gate.running == 3)
+            time.sleep(0.05)
+            assert gate.running == 3
+            gate.release.set()
+
+        assert all(future.done() for future in futures)
+        assert gate.peak == 3
+        scheduler.shutdown()
+
+    def test_shutdown_waits_only_for_own_tasks(self):
+        scheduler = WorkScheduler()
+        gate = Gate()
+        other = scheduler.submit(gate.task, resource=Resource.GENERAL)
+        executor = scheduler.executor_for(Resource.GENERAL, priority=HIGH)
+        future = executor.submit(lambda: "mine")
+
+        executor.shutdown(wait=True)
+        assert future.result() == "mine"
+        assert not other.done()
+        with pytest.raises(RuntimeError):
+            executor.submit(lambda: None)
+
+        gate.release.set()
+        other.result(5.0)
+        scheduler.shutdown()
+
+    def test_nested_waits_on_another_resource_complete(self):
+        scheduler = WorkScheduler(
+            budgets={Resource.GENERAL: 2, Resource.ASSESSOR_API: 2}
+        )
+        api = scheduler.executor_for(Resource.ASSESSOR_API)
+
+        def composite(i):
+            calls = [api.submit(lambda j=j: i * 10 + j) for j in range(3)]
+            return sum(call.result(5.0) for call in calls)
+
+        with scheduler.executor_for(Resource.GENERAL) as executor:
+            futures = [executor.submit(composite, i) for i in range(6)]
+        assert [future.result() for future in futures] == [
+            i * 30 + 3 for i in range(6)
+        ]
+        scheduler.shutdown()
+
+
+@pytest.mark.unit
+class TestBatchRequestSubmission:
+    """Test suite for batch API requests on the GENERAL budget."""
+
+    def test_batches_run_on_the_scheduler_in_priority_order(self):
+        from src.api_client_unified import BatchAPIRequest, UnifiedMaricopaAPIClient
+
+        scheduler = WorkScheduler(budgets={Resource.GENERAL: 1})
+        client = UnifiedMaricopaAPIClient(scheduler=scheduler)
+        gate = Gate()
+        client.search_by_apn = gate.task
+        try:
+            first = client.submit_batch_requests(
+                [BatchAPIRequest("blocker", "search_by_apn", "blocker")]
+            )
+            wait_until(lambda: gate.running == 1)
+            second = client.submit_batch_requests(
+                [
+                    BatchAPIRequest(apn, "search_by_apn", apn, priority=priority)
+                    for apn, priority in (("low", 9), ("high", 1), ("mid", 5))
+                ]
+            )
+            assert client.get_request_status("high")["status"] == "queued"
+            assert client.get_performance_stats()["pending_requests"] == 3
+            # No queue processor thread per submitted batch
+            assert not [
+                thread
+                for thread in threading.enumerate()
+                if thread.name == "MaricopaAPIQueue"
+            ]
+
+            gate.release.set()
+            completion = client.wait_for_batch_completion(first + second, 5.0)
+            assert completion["completed"] == 4
+            assert gate.order == ["blocker", "high", "mid", "low"]
+        finally:
+            client.close()
+            scheduler.shutdown()